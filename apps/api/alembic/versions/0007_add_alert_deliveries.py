@@ -0,0 +1,68 @@
+"""add alert_deliveries table
+
+Revision ID: 0007_add_alert_deliveries
+Revises: 0006_add_price_fields_and_history
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision = "0007_add_alert_deliveries"
+down_revision = "0006_add_price_fields_and_history"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    tables = set(inspector.get_table_names())
+    if "alert_deliveries" in tables:
+        return
+
+    op.create_table(
+        "alert_deliveries",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column(
+            "alert_id",
+            sa.Integer(),
+            sa.ForeignKey("alerts.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "broadcast_slot_id",
+            sa.Integer(),
+            sa.ForeignKey("broadcast_slots.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("destination_hash", sa.String(length=64), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("SENT", "FAILED", name="delivery_status"),
+            nullable=False,
+        ),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("last_error", sa.String(length=500), nullable=True),
+        sa.Column("next_retry_at", sa.DateTime(), nullable=True),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint(
+            "alert_id", "broadcast_slot_id", "destination_hash", name="uq_alert_deliveries_key"
+        ),
+    )
+    op.create_index(
+        "ix_alert_deliveries_broadcast_slot_id", "alert_deliveries", ["broadcast_slot_id"]
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    tables = set(inspector.get_table_names())
+    if "alert_deliveries" in tables:
+        op.drop_index("ix_alert_deliveries_broadcast_slot_id", table_name="alert_deliveries")
+        op.drop_table("alert_deliveries")
@@ -0,0 +1,42 @@
+"""add job_leases table
+
+Revision ID: 0008_add_job_leases
+Revises: 0007_add_alert_deliveries
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision = "0008_add_job_leases"
+down_revision = "0007_add_alert_deliveries"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    if "job_leases" in set(inspector.get_table_names()):
+        return
+
+    op.create_table(
+        "job_leases",
+        # utf8mb4 인덱스 길이 제한(767 bytes)을 고려해 191자로 제한
+        sa.Column("name", sa.String(length=191), primary_key=True),
+        sa.Column("owner", sa.String(length=100), nullable=False),
+        sa.Column("acquired_at", sa.DateTime(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_job_leases_expires_at", "job_leases", ["expires_at"])
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    if "job_leases" in set(inspector.get_table_names()):
+        op.drop_index("ix_job_leases_expires_at", table_name="job_leases")
+        op.drop_table("job_leases")
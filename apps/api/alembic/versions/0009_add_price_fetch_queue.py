@@ -0,0 +1,59 @@
+"""add price_fetch_queue table
+
+Revision ID: 0009_add_price_fetch_queue
+Revises: 0008_add_job_leases
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision = "0009_add_price_fetch_queue"
+down_revision = "0008_add_job_leases"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    if "price_fetch_queue" in set(inspector.get_table_names()):
+        return
+
+    op.create_table(
+        "price_fetch_queue",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("url_hash", sa.String(length=64), nullable=False),
+        sa.Column("url", sa.String(length=1000), nullable=False),
+        sa.Column("goodscode", sa.String(length=30), nullable=True),
+        sa.Column("priority_at", sa.DateTime(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("PENDING", "DONE", "FAILED", name="price_fetch_status"),
+            nullable=False,
+        ),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("last_error", sa.String(length=500), nullable=True),
+        sa.Column("locked_by", sa.String(length=100), nullable=True),
+        sa.Column("locked_until", sa.DateTime(), nullable=True),
+        sa.Column("original_price", sa.Integer(), nullable=True),
+        sa.Column("sale_price", sa.Integer(), nullable=True),
+        sa.Column("fetched_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint("url_hash", name="uq_price_fetch_queue_url_hash"),
+    )
+    op.create_index("ix_price_fetch_queue_priority_at", "price_fetch_queue", ["priority_at"])
+    op.create_index("ix_price_fetch_queue_status", "price_fetch_queue", ["status"])
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    if "price_fetch_queue" in set(inspector.get_table_names()):
+        op.drop_index("ix_price_fetch_queue_status", table_name="price_fetch_queue")
+        op.drop_index("ix_price_fetch_queue_priority_at", table_name="price_fetch_queue")
+        op.drop_table("price_fetch_queue")
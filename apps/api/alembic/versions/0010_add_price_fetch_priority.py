@@ -0,0 +1,41 @@
+"""add priority columns to price_fetch_queue
+
+Revision ID: 0010_add_price_fetch_priority
+Revises: 0009_add_price_fetch_queue
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision = "0010_add_price_fetch_priority"
+down_revision = "0009_add_price_fetch_queue"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    columns = {col["name"] for col in inspector.get_columns("price_fetch_queue")}
+
+    if "air_end_at" not in columns:
+        op.add_column("price_fetch_queue", sa.Column("air_end_at", sa.DateTime(), nullable=True))
+    if "fetch_cost" not in columns:
+        op.add_column(
+            "price_fetch_queue",
+            sa.Column("fetch_cost", sa.Float(), server_default="1", nullable=False),
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    columns = {col["name"] for col in inspector.get_columns("price_fetch_queue")}
+
+    if "fetch_cost" in columns:
+        op.drop_column("price_fetch_queue", "fetch_cost")
+    if "air_end_at" in columns:
+        op.drop_column("price_fetch_queue", "air_end_at")
@@ -0,0 +1,74 @@
+"""add products table and broadcast_slots.product_id
+
+Revision ID: 0011_add_products
+Revises: 0010_add_price_fetch_priority
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision = "0011_add_products"
+down_revision = "0010_add_price_fetch_priority"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    if "products" not in set(inspector.get_table_names()):
+        op.create_table(
+            "products",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column("product_key", sa.String(length=80), nullable=False),
+            sa.Column("goodscode", sa.String(length=30), nullable=True),
+            sa.Column("normalized_title", sa.String(length=255), nullable=False),
+            sa.Column("category", sa.String(length=50), nullable=True),
+            sa.Column("title_simhash", sa.String(length=16), nullable=False),
+            sa.Column("simhash_band0", sa.Integer(), nullable=False),
+            sa.Column("simhash_band1", sa.Integer(), nullable=False),
+            sa.Column("simhash_band2", sa.Integer(), nullable=False),
+            sa.Column("simhash_band3", sa.Integer(), nullable=False),
+            sa.Column("sale_price", sa.Integer(), nullable=True),
+            sa.Column("original_price", sa.Integer(), nullable=True),
+            sa.Column("discount_rate", sa.Float(), nullable=True),
+            sa.Column("price_updated_at", sa.DateTime(), nullable=True),
+            sa.Column("first_seen_at", sa.DateTime(), nullable=False),
+            sa.Column("last_seen_at", sa.DateTime(), nullable=False),
+            sa.Column("broadcast_count", sa.Integer(), server_default="0", nullable=False),
+            sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+            sa.UniqueConstraint("product_key", name="uq_products_product_key"),
+        )
+        op.create_index("ix_products_goodscode", "products", ["goodscode"])
+        for band in range(4):
+            op.create_index(f"ix_products_simhash_band{band}", "products", [f"simhash_band{band}"])
+
+    columns = {col["name"] for col in inspector.get_columns("broadcast_slots")}
+    if "product_id" not in columns:
+        op.add_column("broadcast_slots", sa.Column("product_id", sa.Integer(), nullable=True))
+        op.create_foreign_key(
+            "fk_broadcast_slots_product_id", "broadcast_slots", "products", ["product_id"], ["id"]
+        )
+        op.create_index("ix_broadcast_slots_product_id", "broadcast_slots", ["product_id"])
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    columns = {col["name"] for col in inspector.get_columns("broadcast_slots")}
+    if "product_id" in columns:
+        op.drop_index("ix_broadcast_slots_product_id", table_name="broadcast_slots")
+        op.drop_constraint("fk_broadcast_slots_product_id", "broadcast_slots", type_="foreignkey")
+        op.drop_column("broadcast_slots", "product_id")
+
+    if "products" in set(inspector.get_table_names()):
+        for band in range(4):
+            op.drop_index(f"ix_products_simhash_band{band}", table_name="products")
+        op.drop_index("ix_products_goodscode", table_name="products")
+        op.drop_table("products")
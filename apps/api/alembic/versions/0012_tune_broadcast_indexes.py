@@ -0,0 +1,74 @@
+"""tune broadcast_slots / broadcast_price_history indexes for list and alert queries
+
+Revision ID: 0012_tune_broadcast_indexes
+Revises: 0011_add_products
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+from sqlalchemy import inspect
+
+
+revision = "0012_tune_broadcast_indexes"
+down_revision = "0011_add_products"
+branch_labels = None
+depends_on = None
+
+
+# 새 인덱스: (테이블, 이름, 컬럼)
+# - 목록 조회는 날짜(start_at 범위) + 카테고리/상태 필터 후 start_at 정렬이므로 필터 컬럼을 앞에 둔다.
+# - apply_fetched_prices는 end_at >= now(아직 끝나지 않은 방송)로 좁힌 뒤 product_url을 비교한다.
+# - 가격 이력은 슬롯별 시간순 조회 컬럼을 모두 담아 테이블을 읽지 않게 한다(covering).
+NEW_INDEXES = [
+    ("broadcast_slots", "ix_broadcast_slots_category_start", ["category", "start_at"]),
+    ("broadcast_slots", "ix_broadcast_slots_status_start", ["status", "start_at"]),
+    ("broadcast_slots", "ix_broadcast_slots_end_at", ["end_at"]),
+    (
+        "broadcast_price_history",
+        "ix_price_history_slot_time_cover",
+        ["broadcast_slot_id", "collected_at", "sale_price", "original_price", "discount_rate"],
+    ),
+    ("broadcast_price_history", "ix_price_history_collected_at", ["collected_at"]),
+]
+
+# 새 인덱스(또는 기존 복합 인덱스)의 앞부분과 같아 중복인 인덱스: (테이블, 이름, 컬럼)
+# - FK 컬럼 인덱스는 같은 컬럼으로 시작하는 복합 인덱스가 대신한다.
+REDUNDANT_INDEXES = [
+    ("broadcast_slots", "ix_broadcast_slots_channel_id", ["channel_id"]),
+    ("broadcast_slots", "idx_broadcast_category", ["category"]),
+    ("broadcast_price_history", "idx_price_history_slot_time", ["broadcast_slot_id", "collected_at"]),
+    ("broadcast_price_history", "ix_broadcast_price_history_broadcast_slot_id", ["broadcast_slot_id"]),
+]
+
+
+def _index_names(inspector, table: str) -> set[str]:
+    return {index["name"] for index in inspector.get_indexes(table)}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    # 새 인덱스를 먼저 만들어야 FK가 기대는 인덱스를 지울 수 있다.
+    for table, name, columns in NEW_INDEXES:
+        if name not in _index_names(inspector, table):
+            op.create_index(name, table, columns)
+
+    inspector = inspect(bind)
+    for table, name, _ in REDUNDANT_INDEXES:
+        if name in _index_names(inspector, table):
+            op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    for table, name, columns in REDUNDANT_INDEXES:
+        if name not in _index_names(inspector, table):
+            op.create_index(name, table, columns)
+
+    inspector = inspect(bind)
+    for table, name, _ in reversed(NEW_INDEXES):
+        if name in _index_names(inspector, table):
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,90 @@
+"""partition broadcast_price_history by month (MySQL)
+
+Revision ID: 0013_partition_price_history
+Revises: 0012_tune_broadcast_indexes
+Create Date: 2026-10-19
+
+- 가격 이력은 계속 쌓이기만 하고 조회/보관은 수집 시각 범위 단위이므로 collected_at 월 단위 RANGE 파티션으로 나눈다.
+- MySQL 파티션 테이블은 외래 키를 가질 수 없고, 모든 유니크 키에 파티션 컬럼이 있어야 하므로
+  FK(broadcast_slot_id → broadcast_slots.id)를 없애고 PK를 (id, collected_at)으로 바꾼다.
+- broadcast_slots는 파티션하지 않는다: slot_hash 유니크에 start_at을 넣을 수 없고(중복 판정 의미가 바뀜),
+  가격 이력/알림 발송이 FK로 참조하고 채널/상품 FK도 가지는데 파티션 테이블은 FK를 가질 수도, 참조될 수도 없다.
+- 다음 달 이후 파티션은 보관 작업이 미리 만들며, 그 전까지는 pmax(MAXVALUE)가 받는다.
+"""
+
+from datetime import date
+
+from alembic import op
+from sqlalchemy import inspect, text
+
+
+revision = "0013_partition_price_history"
+down_revision = "0012_tune_broadcast_indexes"
+branch_labels = None
+depends_on = None
+
+TABLE = "broadcast_price_history"
+FK_NAME = "fk_broadcast_price_history_slot_id"
+# 마이그레이션 시점 기준으로 미리 만들어 둘 미래 월 수
+FUTURE_MONTHS = 12
+
+
+def _is_partitioned(bind) -> bool:
+    count = bind.execute(
+        text(
+            "SELECT COUNT(*) FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND PARTITION_NAME IS NOT NULL"
+        ),
+        {"table": TABLE},
+    ).scalar()
+    return bool(count)
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def monthly_partitions(first_month: date, last_month: date) -> list[str]:
+    """[first_month, last_month] 월별 파티션 정의 + pmax."""
+
+    definitions = []
+    month = first_month
+    while month <= last_month:
+        upper = _add_months(month, 1)
+        definitions.append(f"PARTITION p{month:%Y%m} VALUES LESS THAN ('{upper:%Y-%m-%d}')")
+        month = upper
+    definitions.append("PARTITION pmax VALUES LESS THAN (MAXVALUE)")
+    return definitions
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "mysql" or _is_partitioned(bind):
+        return
+
+    inspector = inspect(bind)
+    for foreign_key in inspector.get_foreign_keys(TABLE):
+        op.drop_constraint(foreign_key["name"], TABLE, type_="foreignkey")
+
+    oldest = bind.execute(text(f"SELECT MIN(collected_at) FROM {TABLE}")).scalar()
+    this_month = date.today().replace(day=1)
+    first_month = oldest.date().replace(day=1) if oldest else this_month
+    partitions = monthly_partitions(first_month, _add_months(this_month, FUTURE_MONTHS))
+
+    op.execute(f"ALTER TABLE {TABLE} DROP PRIMARY KEY, ADD PRIMARY KEY (id, collected_at)")
+    op.execute(
+        f"ALTER TABLE {TABLE} PARTITION BY RANGE COLUMNS(collected_at) ("
+        + ", ".join(partitions)
+        + ")"
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "mysql" or not _is_partitioned(bind):
+        return
+
+    op.execute(f"ALTER TABLE {TABLE} REMOVE PARTITIONING")
+    op.execute(f"ALTER TABLE {TABLE} DROP PRIMARY KEY, ADD PRIMARY KEY (id)")
+    op.create_foreign_key(FK_NAME, TABLE, "broadcast_slots", ["broadcast_slot_id"], ["id"])
@@ -0,0 +1,97 @@
+"""add archive tables for ended broadcast slots and their price history
+
+Revision ID: 0014_add_broadcast_archive
+Revises: 0013_partition_price_history
+Create Date: 2026-10-19
+
+- 보관 작업(batch archive)이 오래 전에 끝난 슬롯과 가격 이력을 옮겨 담는 테이블.
+- 원본 id를 그대로 기본키로 써서 API가 같은 id로 보관 슬롯/가격 이력을 찾을 수 있게 한다.
+- 원본 테이블이 지워진 뒤에도 남아야 하므로 FK/유니크 제약은 두지 않는다.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision = "0014_add_broadcast_archive"
+down_revision = "0013_partition_price_history"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    tables = set(inspect(bind).get_table_names())
+
+    if "broadcast_slots_archive" not in tables:
+        op.create_table(
+            "broadcast_slots_archive",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+            sa.Column("channel_id", sa.Integer(), nullable=False),
+            sa.Column("source_code", sa.String(length=100), nullable=False),
+            sa.Column("start_at", sa.DateTime(), nullable=False),
+            sa.Column("end_at", sa.DateTime(), nullable=False),
+            sa.Column("raw_title", sa.Text(), nullable=False),
+            sa.Column("normalized_title", sa.String(length=255), nullable=False),
+            sa.Column("category", sa.String(length=50), nullable=True),
+            sa.Column("product_url", sa.String(length=500), nullable=True),
+            sa.Column("live_url", sa.String(length=500), nullable=True),
+            sa.Column("sale_price", sa.Integer(), nullable=True),
+            sa.Column("original_price", sa.Integer(), nullable=True),
+            sa.Column("discount_rate", sa.Float(), nullable=True),
+            sa.Column("price_text", sa.String(length=100), nullable=True),
+            sa.Column("image_url", sa.String(length=500), nullable=True),
+            sa.Column(
+                "status",
+                sa.Enum("SCHEDULED", "LIVE", "ENDED", name="broadcast_status"),
+                nullable=False,
+            ),
+            sa.Column("slot_hash", sa.String(length=64), nullable=False),
+            sa.Column("product_id", sa.Integer(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+            sa.Column("archived_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        )
+        op.create_index("ix_broadcast_slots_archive_start_at", "broadcast_slots_archive", ["start_at"])
+        op.create_index(
+            "ix_broadcast_slots_archive_channel_start",
+            "broadcast_slots_archive",
+            ["channel_id", "start_at"],
+        )
+        # 상품 상세가 보관된 방송도 product_id로 찾는다.
+        op.create_index(
+            "ix_broadcast_slots_archive_product_start",
+            "broadcast_slots_archive",
+            ["product_id", "start_at"],
+        )
+
+    if "broadcast_price_history_archive" not in tables:
+        op.create_table(
+            "broadcast_price_history_archive",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=False),
+            sa.Column("broadcast_slot_id", sa.Integer(), nullable=False),
+            sa.Column("collected_at", sa.DateTime(), nullable=False),
+            sa.Column("sale_price", sa.Integer(), nullable=True),
+            sa.Column("original_price", sa.Integer(), nullable=True),
+            sa.Column("discount_rate", sa.Float(), nullable=True),
+        )
+        op.create_index(
+            "ix_price_history_archive_slot_time",
+            "broadcast_price_history_archive",
+            ["broadcast_slot_id", "collected_at"],
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    tables = set(inspect(bind).get_table_names())
+
+    if "broadcast_price_history_archive" in tables:
+        op.drop_index("ix_price_history_archive_slot_time", table_name="broadcast_price_history_archive")
+        op.drop_table("broadcast_price_history_archive")
+    if "broadcast_slots_archive" in tables:
+        op.drop_index("ix_broadcast_slots_archive_product_start", table_name="broadcast_slots_archive")
+        op.drop_index("ix_broadcast_slots_archive_channel_start", table_name="broadcast_slots_archive")
+        op.drop_index("ix_broadcast_slots_archive_start_at", table_name="broadcast_slots_archive")
+        op.drop_table("broadcast_slots_archive")
@@ -0,0 +1,156 @@
+# why: 큰 목록 응답(타임라인/추세)을 Accept-Encoding에 맞춰 brotli/gzip으로 압축해 모바일 대역폭을 줄이기 위한 미들웨어
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# 스트리밍 이벤트와 자체 압축 형식(Parquet)은 다시 압축하지 않는다.
+_SKIP_CONTENT_TYPES = ("text/event-stream", "application/vnd.apache.parquet")
+
+
+def _brotli():
+    # brotli는 선택 의존성: 설치되어 있을 때만 br 인코딩을 제공
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+class _GzipCompressor:
+    encoding = "gzip"
+
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliCompressor:
+    encoding = "br"
+
+    def __init__(self, brotli, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class CompressionMiddleware:
+    """응답 압축 미들웨어.
+
+    - 클라이언트가 br을 받으면 brotli(설치된 경우), 아니면 gzip을 쓴다.
+    - minimum_size보다 작은 단일 본문, 이미 인코딩된 응답, 스트리밍 이벤트/Parquet은 그대로 보낸다.
+    - 여러 조각으로 나뉜 스트리밍 응답도 조각 단위로 압축해 메모리를 늘리지 않는다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        brotli_enabled: bool = True,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.brotli = _brotli() if brotli_enabled else None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accepted = _accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+        if self.brotli is not None and "br" in accepted:
+            factory = lambda: _BrotliCompressor(self.brotli, self.brotli_quality)  # noqa: E731
+        elif "gzip" in accepted:
+            factory = lambda: _GzipCompressor(self.gzip_level)  # noqa: E731
+        else:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(send, factory, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, send: Send, factory, minimum_size: int) -> None:
+        self._send = send
+        self._factory = factory
+        self.minimum_size = minimum_size
+        self._start: Message | None = None
+        self._compressor = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # 본문 첫 조각을 보고 압축 여부를 정하므로 시작 메시지는 잠시 보관
+            self._start = message
+            headers = Headers(raw=message["headers"])
+            self._passthrough = "content-encoding" in headers or headers.get(
+                "content-type", ""
+            ).startswith(_SKIP_CONTENT_TYPES)
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        if self._passthrough:
+            await self._flush_start()
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self._compressor is None:
+            if not more_body and len(body) < self.minimum_size:
+                self._passthrough = True
+                await self._flush_start()
+                await self._send(message)
+                return
+
+            self._compressor = self._factory()
+            headers = MutableHeaders(raw=self._start["headers"])
+            headers["Content-Encoding"] = self._compressor.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                compressed = self._compressor.compress(body) + self._compressor.finish()
+                headers["Content-Length"] = str(len(compressed))
+                await self._flush_start()
+                await self._send({"type": "http.response.body", "body": compressed})
+                return
+            await self._flush_start()
+
+        chunk = self._compressor.compress(body)
+        if not more_body:
+            chunk += self._compressor.finish()
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    async def _flush_start(self) -> None:
+        if self._start is not None:
+            await self._send(self._start)
+            self._start = None
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    accepted = set()
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0"):
+            continue
+        if name:
+            accepted.add(name.strip().lower())
+    return accepted
@@ -0,0 +1,21 @@
+# why: 수천 건 목록 응답을 행마다 pydantic 검증을 거치지 않고 orjson으로 바로 직렬화하기 위한 응답 유틸
+from typing import Sequence
+
+import orjson
+from fastapi import Response
+
+from app.schemas.common import ResponseMeta
+
+
+def rows_response(columns: Sequence[str], rows: Sequence[Sequence], meta: ResponseMeta) -> Response:
+    """튜플 행을 {data, meta} 봉투 JSON으로 직렬화한 Response.
+
+    - columns 순서가 응답 스키마 필드 순서와 같아야 pydantic 경로와 같은 JSON이 나온다.
+    - datetime은 ISO 8601(타임존 없는 UTC 그대로), Enum은 값으로 직렬화된다.
+    """
+
+    payload = {
+        "data": [dict(zip(columns, row)) for row in rows],
+        "meta": meta.model_dump(),
+    }
+    return Response(content=orjson.dumps(payload), media_type="application/json")
@@ -0,0 +1,108 @@
+# why: 내부 분석용 클라이언트가 Accept 헤더로 msgpack/Arrow 같은 압축 바이너리 목록을 받을 수 있게 하기 위한 협상 유틸
+from datetime import date, datetime
+import enum
+import io
+from typing import Sequence
+
+from fastapi import Response
+
+from app.core.fast_json import rows_response
+from app.schemas.common import ResponseMeta
+
+
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# OpenAPI에 목록 엔드포인트가 낼 수 있는 추가 형식을 표시하기 위한 responses 값
+BINARY_LIST_RESPONSES = {
+    200: {
+        "content": {
+            MSGPACK_MEDIA_TYPE: {
+                "schema": {
+                    "description": "{data: {columns: [...], rows: [[...]]}, meta} (msgpack 설치 시)"
+                }
+            },
+            ARROW_MEDIA_TYPE: {
+                "schema": {"description": "Arrow IPC 스트림, meta는 스키마 메타데이터 (pyarrow 설치 시)"}
+            },
+        }
+    }
+}
+
+
+def negotiated_rows_response(
+    accept: str | None,
+    columns: Sequence[str],
+    rows: Sequence[Sequence],
+    meta: ResponseMeta,
+) -> Response:
+    """Accept 헤더에 맞는 형식으로 튜플 행을 직렬화.
+
+    - msgpack/pyarrow는 선택 의존성이라, 설치되지 않았거나 요청하지 않으면 JSON 봉투로 응답한다.
+    - 바이너리 형식은 행마다 키를 반복하지 않도록 컬럼 이름을 한 번만 보낸다(열 지향).
+    """
+
+    media_type = preferred_media_type(accept)
+    if media_type == ARROW_MEDIA_TYPE:
+        response = _arrow_response(columns, rows, meta)
+    elif media_type == MSGPACK_MEDIA_TYPE:
+        response = _msgpack_response(columns, rows, meta)
+    else:
+        response = None
+
+    if response is None:
+        response = rows_response(columns, rows, meta)
+    response.headers["Vary"] = "Accept"
+    return response
+
+
+def preferred_media_type(accept: str | None) -> str | None:
+    """Accept에서 먼저 나온 바이너리 형식. JSON(또는 */*)이 먼저면 None."""
+
+    for part in (accept or "").split(","):
+        media_type = part.split(";", 1)[0].strip().lower()
+        if media_type in (ARROW_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, "application/msgpack"):
+            return ARROW_MEDIA_TYPE if media_type == ARROW_MEDIA_TYPE else MSGPACK_MEDIA_TYPE
+        if media_type in ("application/json", "*/*"):
+            return None
+    return None
+
+
+def _msgpack_response(columns, rows, meta: ResponseMeta) -> Response | None:
+    try:
+        import msgpack
+    except ImportError:
+        return None
+
+    payload = {
+        "data": {"columns": list(columns), "rows": [list(row) for row in rows]},
+        "meta": meta.model_dump(),
+    }
+    content = msgpack.packb(payload, default=_msgpack_default, use_bin_type=True)
+    return Response(content=content, media_type=MSGPACK_MEDIA_TYPE)
+
+
+def _msgpack_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    raise TypeError(f"msgpack으로 직렬화할 수 없는 값: {type(value)!r}")
+
+
+def _arrow_response(columns, rows, meta: ResponseMeta) -> Response | None:
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return None
+
+    values_by_column = list(zip(*rows)) if rows else [()] * len(columns)
+    arrays = {
+        name: [value.value if isinstance(value, enum.Enum) else value for value in values]
+        for name, values in zip(columns, values_by_column)
+    }
+    table = pa.table(arrays).replace_schema_metadata({"meta": meta.model_dump_json()})
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return Response(content=sink.getvalue(), media_type=ARROW_MEDIA_TYPE)
@@ -0,0 +1,226 @@
+# why: 느린 필터/라우트를 찾고 캐시 효과를 확인하기 위해 요청 지연/응답 크기/요청당 DB 쿼리를 모아 Prometheus 텍스트로 노출
+from __future__ import annotations
+
+import bisect
+from contextvars import ContextVar
+from dataclasses import dataclass
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# 매칭되는 라우트가 없는 요청(404 스캔 등)은 경로별로 나누지 않아 시계열 수가 늘지 않게 한다.
+UNMATCHED_ROUTE = "unmatched"
+
+
+class Histogram:
+    """고정 버킷 누적 히스토그램 (Prometheus histogram 형식)."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def lines(self, name: str, labels: str) -> list[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{_number(bound)}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {self.count}')
+        lines.append(f"{name}_sum{{{labels}}} {_number(self.sum)}")
+        lines.append(f"{name}_count{{{labels}}} {self.count}")
+        return lines
+
+
+@dataclass
+class RequestStats:
+    """요청 하나에서 실행된 DB 쿼리 수/시간 (SQLAlchemy 이벤트가 채움)."""
+
+    queries: int = 0
+    db_seconds: float = 0.0
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar("api_request_stats", default=None)
+
+
+class MetricsRegistry:
+    """라우트별 요청 지표 저장소.
+
+    - 라벨은 method + 라우트 경로 템플릿(/api/v1/broadcasts/{broadcast_id})이라 id마다 시계열이 생기지 않는다.
+    - 프로세스 메모리에 쌓이므로 워커가 여러 개면 워커별 값이다(Prometheus에서 합산).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests: dict[tuple[str, str, str], int] = {}
+        self.latency: dict[tuple[str, str], Histogram] = {}
+        self.response_bytes: dict[tuple[str, str], Histogram] = {}
+        self.db_queries: dict[tuple[str, str], Histogram] = {}
+        self.db_seconds: dict[tuple[str, str], Histogram] = {}
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        seconds: float,
+        size: int,
+        stats: RequestStats,
+    ) -> None:
+        key = (method, route)
+        with self._lock:
+            status_key = (method, route, str(status))
+            self.requests[status_key] = self.requests.get(status_key, 0) + 1
+            self.latency.setdefault(key, Histogram(LATENCY_BUCKETS)).observe(seconds)
+            self.response_bytes.setdefault(key, Histogram(SIZE_BUCKETS)).observe(size)
+            self.db_queries.setdefault(key, Histogram(QUERY_COUNT_BUCKETS)).observe(stats.queries)
+            self.db_seconds.setdefault(key, Histogram(LATENCY_BUCKETS)).observe(stats.db_seconds)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            lines = [
+                "# HELP api_requests_total 라우트/상태 코드별 요청 수",
+                "# TYPE api_requests_total counter",
+            ]
+            for (method, route, status), value in sorted(self.requests.items()):
+                lines.append(
+                    f'api_requests_total{{method="{method}",route="{_label(route)}",status="{status}"}} {value}'
+                )
+            for name, help_text, histograms in (
+                ("api_request_duration_seconds", "요청 처리 시간(응답 전송 완료까지)", self.latency),
+                ("api_response_size_bytes", "응답 본문 크기(압축 후)", self.response_bytes),
+                ("api_request_db_queries", "요청당 DB 쿼리 수", self.db_queries),
+                ("api_request_db_duration_seconds", "요청당 DB 쿼리 시간 합", self.db_seconds),
+            ):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for (method, route), histogram in sorted(histograms.items()):
+                    lines.extend(histogram.lines(name, f'method="{method}",route="{_label(route)}"'))
+        return lines
+
+
+registry = MetricsRegistry()
+
+
+class MetricsMiddleware:
+    """요청 지연/응답 크기/DB 쿼리 수를 라우트별로 기록하는 미들웨어.
+
+    - 압축 미들웨어보다 바깥에 두어 실제로 보낸 바이트와 압축 시간까지 잰다.
+    - 스트리밍 응답은 마지막 조각을 보낼 때까지를 한 요청으로 본다.
+    """
+
+    def __init__(self, app: ASGIApp, exclude_paths: tuple[str, ...] = ("/metrics",)) -> None:
+        self.app = app
+        self.exclude_paths = exclude_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+        status = 500
+        size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_stats.reset(token)
+            route = scope.get("route")
+            registry.observe(
+                scope["method"],
+                getattr(route, "path", UNMATCHED_ROUTE),
+                status,
+                time.perf_counter() - started,
+                size,
+                stats,
+            )
+
+
+def instrument_engine(engine: Engine) -> None:
+    """엔진의 쿼리 수/시간을 현재 요청 지표에 더한다 (요청 밖의 쿼리는 무시)."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany) -> None:
+        if _request_stats.get() is not None:
+            conn.info.setdefault("metrics_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany) -> None:
+        stats = _request_stats.get()
+        started = conn.info.get("metrics_started")
+        if stats is None or not started:
+            return
+        stats.queries += 1
+        stats.db_seconds += time.perf_counter() - started.pop()
+
+
+def pool_metric_lines(pools: dict[str, dict]) -> list[str]:
+    """pool_stats() 결과를 엔진 라벨이 붙은 지표로 변환 (QueuePool이 아니면 생략)."""
+
+    # 누적 횟수는 counter(_total), 현재 상태/대기 시간은 gauge
+    fields = (
+        ("size", "gauge"),
+        ("checked_out", "gauge"),
+        ("overflow", "gauge"),
+        ("wait_avg_ms", "gauge"),
+        ("wait_max_ms", "gauge"),
+        ("checkouts", "counter"),
+        ("timeouts", "counter"),
+        ("disconnects", "counter"),
+    )
+    lines = []
+    for field, kind in fields:
+        values = [(engine, stats[field]) for engine, stats in pools.items() if field in stats]
+        if not values:
+            continue
+        name = f"api_db_pool_{field}_total" if kind == "counter" else f"api_db_pool_{field}"
+        lines.append(f"# HELP {name} 커넥션 풀 {field}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.extend(f'{name}{{engine="{engine}"}} {_number(value)}' for engine, value in values)
+    return lines
+
+
+def cache_metric_lines(caches: dict[str, tuple[int, int]]) -> list[str]:
+    """캐시 이름 → (hits, misses)를 counter로 변환 (적중률은 hits / (hits + misses))."""
+
+    lines = []
+    for name, index in (("api_cache_hits_total", 0), ("api_cache_misses_total", 1)):
+        lines.append(f"# HELP {name} 프로세스 캐시 {'적중' if index == 0 else '재조회'} 수")
+        lines.append(f"# TYPE {name} counter")
+        lines.extend(f'{name}{{cache="{cache}"}} {counts[index]}' for cache, counts in caches.items())
+    return lines
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(round(float(value), 6))
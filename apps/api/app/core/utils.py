@@ -1,6 +1,10 @@
 # why: 모듈 역할과 책임을 명확히 하기 위한 진입 주석
 import hashlib
-from datetime import datetime
+from datetime import date, datetime, timezone
+from zoneinfo import ZoneInfo
+
+
+KST = ZoneInfo("Asia/Seoul")
 
 
 def make_slot_hash(channel_id: int, start_at: datetime, normalized_title: str) -> str:
@@ -12,3 +16,13 @@ def make_slot_hash(channel_id: int, start_at: datetime, normalized_title: str) -
 
     base = f"{channel_id}|{start_at.isoformat()}|{normalized_title}".lower()
     return hashlib.sha256(base.encode("utf-8")).hexdigest()
+
+
+def kst_day_start_utc(target_date: date) -> datetime:
+    """KST 날짜 0시를 DB 저장 기준(타임존 없는 UTC)으로 변환.
+
+    - why: DB는 UTC로 저장하지만, 사용자는 KST 날짜를 기준으로 조회하므로 9시간 보정을 적용
+    """
+
+    start_kst = datetime.combine(target_date, datetime.min.time(), tzinfo=KST)
+    return start_kst.astimezone(timezone.utc).replace(tzinfo=None)
@@ -1,20 +1,110 @@
 # why: 모듈 역할과 책임을 명확히 하기 위한 진입 주석
-from sqlalchemy import create_engine
+import logging
+import threading
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import Settings, get_settings
+from app.core.metrics import instrument_engine
 
-from app.core.config import get_settings
 
+logger = logging.getLogger("api.db")
 
 settings = get_settings()
 
+
+class TimedQueuePool(QueuePool):
+    """커넥션을 얻기까지 기다린 시간과 타임아웃 횟수를 세는 QueuePool.
+
+    - why: 풀 크기/오버플로를 조정하려면 요청이 커넥션을 얼마나 기다리는지 알아야 한다.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.disconnects = 0
+        self.wait_total_sec = 0.0
+        self.wait_max_sec = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._stats_lock:
+                self.checkouts += 1
+                self.wait_total_sec += waited
+                self.wait_max_sec = max(self.wait_max_sec, waited)
+
+    def recreate(self) -> "TimedQueuePool":
+        # dispose 등으로 풀이 다시 만들어져도 누적 통계는 이어간다.
+        pool = super().recreate()
+        pool.checkouts = self.checkouts
+        pool.timeouts = self.timeouts
+        pool.disconnects = self.disconnects
+        pool.wait_total_sec = self.wait_total_sec
+        pool.wait_max_sec = self.wait_max_sec
+        return pool
+
+
+def _create_engine(url: str, config: Settings) -> Engine:
+    if url.startswith("sqlite"):
+        # 로컬/테스트용 sqlite는 기본 풀을 그대로 사용
+        engine = create_engine(url)
+        instrument_engine(engine)
+        return engine
+
+    engine = create_engine(
+        url,
+        poolclass=TimedQueuePool,
+        pool_size=config.db_pool_size,
+        max_overflow=config.db_max_overflow,
+        pool_timeout=config.db_pool_timeout_sec,
+        # MySQL wait_timeout/프록시 유휴 종료보다 먼저 커넥션을 교체해 끊긴 커넥션을 거의 만나지 않게 함
+        pool_recycle=config.db_pool_recycle_sec,
+        # 체크아웃마다 SELECT 1을 보내는 대신, 끊김은 쿼리 오류 시점에 감지한다(기본 꺼짐).
+        pool_pre_ping=config.db_pool_pre_ping,
+        pool_use_lifo=True,
+    )
+
+    @event.listens_for(engine, "handle_error")
+    def _on_error(context) -> None:
+        # SQLAlchemy는 끊김을 감지하면 그 시점 이전에 만든 커넥션을 모두 무효화해 다음 체크아웃부터 새로 연결한다.
+        if context.is_disconnect:
+            pool = engine.pool
+            if isinstance(pool, TimedQueuePool):
+                with pool._stats_lock:
+                    pool.disconnects += 1
+            logger.warning("DB 연결 끊김 감지, 기존 커넥션을 폐기합니다: %s", context.original_exception)
+
+    # 요청당 쿼리 수/시간을 /metrics에 남긴다
+    instrument_engine(engine)
+    return engine
+
+
 # MySQL은 기본적으로 자동 커밋이 없으므로, 명시적 커밋/롤백 흐름을 사용.
-engine = create_engine(
-    settings.database_url,
-    pool_pre_ping=True,
-    pool_recycle=3600,
+engine = _create_engine(settings.database_url, settings)
+# 읽기 전용 조회는 복제본으로 보내 배치 쓰기와 경쟁하지 않게 한다 (없으면 기본 DB).
+read_engine = (
+    _create_engine(settings.database_read_url, settings)
+    if settings.database_read_url
+    else engine
 )
 
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+ReadSessionLocal = sessionmaker(bind=read_engine, autocommit=False, autoflush=False)
 
 
 def get_db():
@@ -28,3 +118,47 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_read_db():
+    """읽기 전용 요청 세션 (복제본이 설정되어 있으면 복제본).
+
+    - 복제 지연이 있으므로 쓰기 직후 같은 데이터를 다시 읽어야 하는 경로에는 get_db를 쓴다.
+    """
+
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def pool_stats() -> dict[str, dict]:
+    """엔진별 커넥션 풀 상태."""
+
+    engines = {"primary": engine}
+    if read_engine is not engine:
+        engines["replica"] = read_engine
+
+    stats = {}
+    for name, target in engines.items():
+        pool = target.pool
+        if not isinstance(pool, TimedQueuePool):
+            stats[name] = {"pool": type(pool).__name__}
+            continue
+        stats[name] = {
+            "pool": type(pool).__name__,
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(0, pool.overflow()),
+            "max_overflow": settings.db_max_overflow,
+            "checkouts": pool.checkouts,
+            "timeouts": pool.timeouts,
+            "disconnects": pool.disconnects,
+            "wait_avg_ms": round(pool.wait_total_sec / pool.checkouts * 1000, 3)
+            if pool.checkouts
+            else 0.0,
+            "wait_max_ms": round(pool.wait_max_sec * 1000, 3),
+        }
+    return stats
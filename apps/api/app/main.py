@@ -2,13 +2,25 @@
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
+from app.core.compression import CompressionMiddleware
 from app.core.config import get_settings
 from app.core.errors import AppError
+from app.core.metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    MetricsMiddleware,
+    cache_metric_lines,
+    pool_metric_lines,
+    registry,
+)
+from app.db.session import pool_stats
+from app.repositories.channel_repo import channel_cache_counts
 from app.routes.alert_routes import router as alert_router
 from app.routes.broadcast_routes import router as broadcast_router
 from app.routes.channel_routes import router as channel_router
+from app.routes.export_routes import router as export_router
+from app.routes.product_routes import router as product_router
 
 
 settings = get_settings()
@@ -24,6 +36,19 @@ app.add_middleware(
     allow_headers=["*"] ,
 )
 
+# 큰 목록 응답은 brotli(설치 시)/gzip으로 압축, 작은 응답은 압축 비용이 더 크므로 그대로 보냄
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    gzip_level=settings.gzip_level,
+    brotli_quality=settings.brotli_quality,
+    brotli_enabled=settings.brotli_enabled,
+)
+
+# 압축 바깥(가장 마지막에 추가)에 두어 전송 바이트와 압축 시간까지 라우트별로 잰다
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
 
 @app.exception_handler(AppError)
 def handle_app_error(request: Request, exc: AppError):
@@ -78,6 +103,27 @@ def health_check():
     return {"data": {"status": "ok"}, "meta": {"time_policy": settings.time_policy}}
 
 
+@app.get("/api/v1/health/db-pool")
+def db_pool_health():
+    # 풀 크기/오버플로 조정을 위해 엔진별 대여 중 커넥션 수와 대기 시간을 노출
+    return {"data": pool_stats(), "meta": {"time_policy": settings.time_policy}}
+
+
+if settings.metrics_enabled:
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        # Prometheus 스크레이프용 텍스트 (워커 프로세스별 값)
+        lines = [
+            *registry.render(),
+            *pool_metric_lines(pool_stats()),
+            *cache_metric_lines({"channel": channel_cache_counts()}),
+        ]
+        return PlainTextResponse("\n".join(lines) + "\n", media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 app.include_router(channel_router)
 app.include_router(broadcast_router)
 app.include_router(alert_router)
+app.include_router(product_router)
+app.include_router(export_router)
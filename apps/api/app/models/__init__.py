@@ -1,16 +1,29 @@
 # why: 모델 심볼을 한 곳에서 노출해 import 경로를 단순화하기 위한 모듈
 from app.models.alert import Alert, DestinationType
+from app.models.alert_delivery import AlertDelivery, DeliveryStatus
+from app.models.broadcast_archive import BroadcastPriceHistoryArchive, BroadcastSlotArchive
 from app.models.broadcast_price_history import BroadcastPriceHistory
 from app.models.broadcast_slot import BroadcastSlot, BroadcastStatus
 from app.models.channel import Channel
+from app.models.job_lease import JobLease
+from app.models.price_fetch_task import PriceFetchStatus, PriceFetchTask
+from app.models.product import Product
 from app.models.source_page import SourcePage
 
 __all__ = [
     "Alert",
     "DestinationType",
+    "AlertDelivery",
+    "DeliveryStatus",
     "BroadcastSlot",
+    "BroadcastSlotArchive",
     "BroadcastPriceHistory",
+    "BroadcastPriceHistoryArchive",
     "BroadcastStatus",
     "Channel",
+    "JobLease",
+    "PriceFetchStatus",
+    "PriceFetchTask",
+    "Product",
     "SourcePage",
 ]
@@ -0,0 +1,46 @@
+# why: 알림 발송 이력을 남겨 같은 방송에 대한 중복 발송을 막기 위한 모델
+import enum
+from datetime import datetime
+from sqlalchemy import DateTime, Enum, ForeignKey, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.models.base import TimestampMixin
+
+
+class DeliveryStatus(str, enum.Enum):
+    """알림 발송 상태.
+
+    - SENT는 다시 보내지 않고, FAILED는 next_retry_at 이후 재시도 대상이 된다.
+    """
+
+    SENT = "SENT"
+    FAILED = "FAILED"
+
+
+class AlertDelivery(Base, TimestampMixin):
+    """알림 발송 로그.
+
+    - why: (알림, 슬롯, 목적지) 단위로 한 번만 발송되도록 배치가 실행 전에 일괄 조회.
+    """
+
+    __tablename__ = "alert_deliveries"
+    __table_args__ = (
+        UniqueConstraint(
+            "alert_id", "broadcast_slot_id", "destination_hash", name="uq_alert_deliveries_key"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    alert_id: Mapped[int] = mapped_column(ForeignKey("alerts.id", ondelete="CASCADE"))
+    broadcast_slot_id: Mapped[int] = mapped_column(
+        ForeignKey("broadcast_slots.id", ondelete="CASCADE"), index=True
+    )
+    # 복호화된 목적지 값의 sha256 (목적지 원문은 저장하지 않음)
+    destination_hash: Mapped[str] = mapped_column(String(64))
+
+    status: Mapped[DeliveryStatus] = mapped_column(Enum(DeliveryStatus, name="delivery_status"))
+    attempts: Mapped[int] = mapped_column(default=0)
+    last_error: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    next_retry_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
@@ -0,0 +1,83 @@
+# why: 보관 작업이 옮긴 오래된 방송 슬롯/가격 이력을 필요할 때 조회하기 위한 모델
+from datetime import datetime
+from sqlalchemy import DateTime, Enum, Index, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base import Base
+from app.models.broadcast_slot import BroadcastStatus
+
+
+class BroadcastSlotArchive(Base):
+    """보관된 방송 슬롯.
+
+    - 원본 id를 그대로 쓰고, 원본이 지워진 뒤에도 남아야 하므로 FK/유니크 제약은 없다.
+    - 응답 스키마가 같도록 BroadcastSlot과 같은 컬럼/채널 속성을 가진다.
+    """
+
+    __tablename__ = "broadcast_slots_archive"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    channel_id: Mapped[int] = mapped_column()
+    source_code: Mapped[str] = mapped_column(String(100))
+    start_at: Mapped[datetime] = mapped_column(DateTime, index=True)
+    end_at: Mapped[datetime] = mapped_column(DateTime)
+    raw_title: Mapped[str] = mapped_column(Text)
+    normalized_title: Mapped[str] = mapped_column(String(255))
+    category: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    product_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    live_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    sale_price: Mapped[int | None] = mapped_column(nullable=True)
+    original_price: Mapped[int | None] = mapped_column(nullable=True)
+    discount_rate: Mapped[float | None] = mapped_column(nullable=True)
+    price_text: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    image_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    status: Mapped[BroadcastStatus] = mapped_column(Enum(BroadcastStatus, name="broadcast_status"))
+    slot_hash: Mapped[str] = mapped_column(String(64))
+    product_id: Mapped[int | None] = mapped_column(nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime)
+    updated_at: Mapped[datetime] = mapped_column(DateTime)
+    archived_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+
+    channel = relationship(
+        "Channel",
+        primaryjoin="foreign(BroadcastSlotArchive.channel_id) == Channel.id",
+        viewonly=True,
+    )
+
+    @property
+    def channel_code(self) -> str | None:
+        return self.channel.channel_code if self.channel else None
+
+    @property
+    def channel_name(self) -> str | None:
+        return self.channel.channel_name if self.channel else None
+
+
+class BroadcastPriceHistoryArchive(Base):
+    """보관된 가격 변동 이력."""
+
+    __tablename__ = "broadcast_price_history_archive"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    broadcast_slot_id: Mapped[int] = mapped_column()
+    collected_at: Mapped[datetime] = mapped_column(DateTime)
+    sale_price: Mapped[int | None] = mapped_column(nullable=True)
+    original_price: Mapped[int | None] = mapped_column(nullable=True)
+    discount_rate: Mapped[float | None] = mapped_column(nullable=True)
+
+
+Index(
+    "ix_broadcast_slots_archive_channel_start",
+    BroadcastSlotArchive.channel_id,
+    BroadcastSlotArchive.start_at,
+)
+Index(
+    "ix_broadcast_slots_archive_product_start",
+    BroadcastSlotArchive.product_id,
+    BroadcastSlotArchive.start_at,
+)
+Index(
+    "ix_price_history_archive_slot_time",
+    BroadcastPriceHistoryArchive.broadcast_slot_id,
+    BroadcastPriceHistoryArchive.collected_at,
+)
@@ -1,19 +1,35 @@
 # why: 방송 가격 변동 이력을 저장하기 위한 모델
 from datetime import datetime
-from sqlalchemy import DateTime, ForeignKey, Integer, Float
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Float
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
 
 
 class BroadcastPriceHistory(Base):
+    """방송 가격 변동 이력.
+
+    - MySQL에서는 collected_at 월 단위 RANGE 파티션 테이블이다(0013 마이그레이션).
+      파티션 테이블은 FK를 가질 수 없어 DB에는 broadcast_slot_id FK가 없고 PK는 (id, collected_at)이다.
+    """
+
     __tablename__ = "broadcast_price_history"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    broadcast_slot_id: Mapped[int] = mapped_column(
-        ForeignKey("broadcast_slots.id"), index=True
-    )
+    broadcast_slot_id: Mapped[int] = mapped_column(ForeignKey("broadcast_slots.id"))
     collected_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     sale_price: Mapped[int | None] = mapped_column(Integer, nullable=True)
     original_price: Mapped[int | None] = mapped_column(Integer, nullable=True)
     discount_rate: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+
+# 슬롯별 가격 타임라인 조회 컬럼을 모두 담은 covering 인덱스, 수집 시각 범위(내보내기/보관)용 인덱스
+Index(
+    "ix_price_history_slot_time_cover",
+    BroadcastPriceHistory.broadcast_slot_id,
+    BroadcastPriceHistory.collected_at,
+    BroadcastPriceHistory.sale_price,
+    BroadcastPriceHistory.original_price,
+    BroadcastPriceHistory.discount_rate,
+)
+Index("ix_price_history_collected_at", BroadcastPriceHistory.collected_at)
@@ -28,7 +28,8 @@ class BroadcastSlot(Base, TimestampMixin):
     __tablename__ = "broadcast_slots"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    channel_id: Mapped[int] = mapped_column(ForeignKey("channels.id"), index=True)
+    # channel_id 단독 인덱스는 (channel_id, start_at) 복합 인덱스가 대신한다.
+    channel_id: Mapped[int] = mapped_column(ForeignKey("channels.id"))
     source_code: Mapped[str] = mapped_column(String(100))
 
     start_at: Mapped[datetime] = mapped_column(DateTime, index=True)
@@ -37,7 +38,7 @@ class BroadcastSlot(Base, TimestampMixin):
     raw_title: Mapped[str] = mapped_column(Text)
     # MySQL에서 인덱스가 가능하도록 길이를 제한한 문자열로 저장
     normalized_title: Mapped[str] = mapped_column(String(255), index=True)
-    category: Mapped[str | None] = mapped_column(String(50), nullable=True, index=True)
+    category: Mapped[str | None] = mapped_column(String(50), nullable=True)
 
     product_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     live_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
@@ -50,10 +51,13 @@ class BroadcastSlot(Base, TimestampMixin):
     status: Mapped[BroadcastStatus] = mapped_column(
         Enum(BroadcastStatus, name="broadcast_status"),
         default=BroadcastStatus.SCHEDULED,
-        index=True,
     )
 
     slot_hash: Mapped[str] = mapped_column(String(64), unique=True, index=True)
+    # 날짜/채널이 달라도 같은 상품이면 같은 products 행을 가리킨다.
+    product_id: Mapped[int | None] = mapped_column(
+        ForeignKey("products.id"), nullable=True, index=True
+    )
 
     channel = relationship("Channel")
 
@@ -72,7 +76,9 @@ class BroadcastSlot(Base, TimestampMixin):
         return self.channel.channel_name
 
 
+# 목록 조회(날짜 범위 + 채널/카테고리/상태 필터, start_at 정렬)와 가격 반영(end_at >= now)용 인덱스
+# (start_at/normalized_title 단독 인덱스는 컬럼의 index=True로 만든다. status 단독 인덱스는 (status, start_at)이 대신한다)
 Index("idx_broadcast_channel_start", BroadcastSlot.channel_id, BroadcastSlot.start_at)
-Index("idx_broadcast_start", BroadcastSlot.start_at)
-Index("idx_broadcast_norm_title", BroadcastSlot.normalized_title)
-Index("idx_broadcast_category", BroadcastSlot.category)
+Index("ix_broadcast_slots_category_start", BroadcastSlot.category, BroadcastSlot.start_at)
+Index("ix_broadcast_slots_status_start", BroadcastSlot.status, BroadcastSlot.start_at)
+Index("ix_broadcast_slots_end_at", BroadcastSlot.end_at)
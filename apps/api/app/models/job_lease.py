@@ -0,0 +1,22 @@
+# why: 여러 배치 워커가 같은 잡/샤드를 중복 실행하지 않도록 임대(lease) 상태를 저장하는 모델
+from datetime import datetime
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class JobLease(Base):
+    """배치 잡/샤드 임대 테이블.
+
+    - why: 만료 시각이 지난 임대는 다른 워커가 가져갈 수 있어 죽은 워커의 작업도 이어받는다.
+    - completed_at이 채워진 샤드 임대는 같은 수집 주기에 다시 실행되지 않는다.
+    """
+
+    __tablename__ = "job_leases"
+
+    name: Mapped[str] = mapped_column(String(191), primary_key=True)
+    owner: Mapped[str] = mapped_column(String(100))
+    acquired_at: Mapped[datetime] = mapped_column(DateTime)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, index=True)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
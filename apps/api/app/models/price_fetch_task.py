@@ -0,0 +1,53 @@
+# why: 상품 가격 크롤링 대상을 영속 큐로 관리해 타임아웃/실패 URL이 다음 주기로 이어지도록 하기 위한 모델
+import enum
+from datetime import datetime
+from sqlalchemy import DateTime, Enum, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.models.base import TimestampMixin
+
+
+class PriceFetchStatus(str, enum.Enum):
+    """가격 수집 작업 상태.
+
+    - PENDING은 next_attempt_at 이후 워커가 가져가고, FAILED는 재시도 횟수를 모두 쓴 상태.
+    """
+
+    PENDING = "PENDING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+
+
+class PriceFetchTask(Base, TimestampMixin):
+    """상품 가격 수집 큐.
+
+    - why: 방송 시작이 가까운 상품부터 가격을 채우고, 실패는 지수 백오프로 재시도한다.
+    """
+
+    __tablename__ = "price_fetch_queue"
+    __table_args__ = (UniqueConstraint("url_hash", name="uq_price_fetch_queue_url_hash"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    # URL 원문은 인덱스 길이 제한을 넘을 수 있어 sha256으로 유일성을 보장
+    url_hash: Mapped[str] = mapped_column(String(64))
+    url: Mapped[str] = mapped_column(String(1000))
+    goodscode: Mapped[str | None] = mapped_column(String(30), nullable=True)
+    # 현재/다음 방송 시작·종료 시각 (우선순위)
+    priority_at: Mapped[datetime] = mapped_column(DateTime, index=True)
+    air_end_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    status: Mapped[PriceFetchStatus] = mapped_column(
+        Enum(PriceFetchStatus, name="price_fetch_status"), index=True
+    )
+    attempts: Mapped[int] = mapped_column(default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime)
+    last_error: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    locked_by: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    original_price: Mapped[int | None] = mapped_column(nullable=True)
+    sale_price: Mapped[int | None] = mapped_column(nullable=True)
+    fetched_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    # 수집 비용 이동평균 (HTTP 성공 = 1, 브라우저가 필요하면 더 큼)
+    fetch_cost: Mapped[float] = mapped_column(default=1.0)
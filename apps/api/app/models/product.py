@@ -0,0 +1,41 @@
+# why: 여러 날짜/채널에 편성된 같은 상품을 하나로 묶어 가격/카테고리/이력을 공유하기 위한 모델
+from datetime import datetime
+from sqlalchemy import DateTime, Float, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.models.base import TimestampMixin
+
+
+class Product(Base, TimestampMixin):
+    """방송 상품 식별 테이블.
+
+    - product_key: 상품 코드가 있으면 `gc:<goodscode>`, 없으면 정규화 상품명 SimHash `fp:<hex>`.
+    - 상품 코드가 없는 슬롯은 SimHash 16비트 밴드 4개 중 하나라도 같은 후보를 찾아
+      해밍 거리가 임계치 이하이면 같은 상품으로 본다(표기만 조금 다른 상품명 묶기).
+    """
+
+    __tablename__ = "products"
+    __table_args__ = (UniqueConstraint("product_key", name="uq_products_product_key"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    product_key: Mapped[str] = mapped_column(String(80))
+    goodscode: Mapped[str | None] = mapped_column(String(30), nullable=True, index=True)
+    normalized_title: Mapped[str] = mapped_column(String(255))
+    category: Mapped[str | None] = mapped_column(String(50), nullable=True)
+
+    title_simhash: Mapped[str] = mapped_column(String(16))
+    simhash_band0: Mapped[int] = mapped_column(Integer, index=True)
+    simhash_band1: Mapped[int] = mapped_column(Integer, index=True)
+    simhash_band2: Mapped[int] = mapped_column(Integer, index=True)
+    simhash_band3: Mapped[int] = mapped_column(Integer, index=True)
+
+    # 가장 최근에 확인한 가격 (슬롯/가격 큐에서 공유)
+    sale_price: Mapped[int | None] = mapped_column(nullable=True)
+    original_price: Mapped[int | None] = mapped_column(nullable=True)
+    discount_rate: Mapped[float | None] = mapped_column(Float, nullable=True)
+    price_updated_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    first_seen_at: Mapped[datetime] = mapped_column(DateTime)
+    last_seen_at: Mapped[datetime] = mapped_column(DateTime)
+    broadcast_count: Mapped[int] = mapped_column(default=0)
@@ -1,17 +1,29 @@
 # why: 모듈 역할과 책임을 명확히 하기 위한 진입 주석
-from datetime import date, datetime, timedelta, timezone
-from zoneinfo import ZoneInfo
-from sqlalchemy import and_
+from datetime import date, timedelta
+import heapq
+from operator import attrgetter, itemgetter
+from sqlalchemy import Row, and_, select
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm import Session
 
+from app.core.utils import kst_day_start_utc
+from app.models.broadcast_archive import BroadcastPriceHistoryArchive, BroadcastSlotArchive
 from app.models.broadcast_slot import BroadcastSlot, BroadcastStatus
 from app.models.broadcast_price_history import BroadcastPriceHistory
+from app.models.channel import Channel
+from app.repositories.channel_repo import ChannelRepository
+
+
+# 목록 행 조회에서 채널 테이블 조인으로 채우는 컬럼
+_CHANNEL_COLUMNS = {"channel_code", "channel_name"}
 
 
 class BroadcastRepository:
     """방송 슬롯 데이터 접근 계층."""
 
+    def __init__(self) -> None:
+        self.channels = ChannelRepository()
+
     def list_broadcasts(
         self,
         db: Session,
@@ -20,52 +32,143 @@ class BroadcastRepository:
         keyword: str | None = None,
         categories: list[str] | None = None,
         status: BroadcastStatus | None = None,
-    ) -> list[BroadcastSlot]:
-        query = db.query(BroadcastSlot).options(selectinload(BroadcastSlot.channel))
+        with_channel: bool = True,
+        include_archived: bool = False,
+    ) -> list[BroadcastSlot | BroadcastSlotArchive]:
+        """조건에 맞는 슬롯 (start_at 순).
 
-        if channel_code:
-            # 채널 코드는 Channel 테이블을 조인해 필터링
-            from app.models.channel import Channel
+        - include_archived: 보관 테이블도 같은 조건으로 조회해 start_at 순으로 합친다.
+        """
+
+        models = [BroadcastSlot, BroadcastSlotArchive] if include_archived else [BroadcastSlot]
+        results = []
+        for model in models:
+            conditions = self._conditions(
+                db, target_date, channel_code, keyword, categories, status, model
+            )
+            if conditions is None:
+                return []
+
+            query = db.query(model)
+            if with_channel:
+                # 정규화 응답은 채널을 캐시에서 따로 붙이므로 채널 조회 쿼리를 생략한다.
+                query = query.options(selectinload(model.channel))
+            results.append(query.filter(*conditions).order_by(model.start_at.asc()).all())
+        if len(results) == 1:
+            return results[0]
+        return list(heapq.merge(*results, key=attrgetter("start_at")))
 
-            query = query.join(Channel).filter(Channel.channel_code == channel_code)
+    def list_broadcast_rows(
+        self,
+        db: Session,
+        columns: list[str],
+        target_date: date | None = None,
+        channel_code: str | None = None,
+        keyword: str | None = None,
+        categories: list[str] | None = None,
+        status: BroadcastStatus | None = None,
+        include_archived: bool = False,
+    ) -> list[Row]:
+        """ORM 객체 대신 필요한 컬럼만 튜플로 조회 (빠른 직렬화 경로용).
+
+        - columns: BroadcastSlot 컬럼명, channel_code/channel_name은 채널 조인 컬럼
+        - include_archived: 보관 테이블 행도 start_at 순으로 합친다 (columns에 start_at 필요)
+        """
+
+        models = [BroadcastSlot, BroadcastSlotArchive] if include_archived else [BroadcastSlot]
+        results = []
+        for model in models:
+            conditions = self._conditions(
+                db, target_date, channel_code, keyword, categories, status, model
+            )
+            if conditions is None:
+                return []
+
+            selected = [
+                getattr(Channel, name) if name in _CHANNEL_COLUMNS else getattr(model, name)
+                for name in columns
+            ]
+            statement = select(*selected).select_from(model)
+            if _CHANNEL_COLUMNS.intersection(columns):
+                statement = statement.outerjoin(Channel, Channel.id == model.channel_id)
+            statement = statement.where(*conditions).order_by(model.start_at.asc())
+            results.append(db.execute(statement).all())
+        if len(results) == 1:
+            return results[0]
+        return list(heapq.merge(*results, key=itemgetter(columns.index("start_at"))))
+
+    def _conditions(
+        self,
+        db: Session,
+        target_date: date | None,
+        channel_code: str | None,
+        keyword: str | None,
+        categories: list[str] | None,
+        status: BroadcastStatus | None,
+        model: type[BroadcastSlot] | type[BroadcastSlotArchive] = BroadcastSlot,
+    ) -> list | None:
+        """목록 필터 조건 (model: 원본 또는 보관 슬롯). 알 수 없는 채널 코드면 결과가 없으므로 None."""
+
+        conditions = []
+        if channel_code:
+            # 채널 코드는 캐시된 채널 사전에서 id로 바꿔 조인 없이 필터링
+            channel = self.channels.get_by_code(db, channel_code)
+            if channel is None:
+                return None
+            conditions.append(model.channel_id == channel.id)
 
         if keyword:
-            query = query.filter(BroadcastSlot.normalized_title.ilike(f"%{keyword}%"))
+            conditions.append(model.normalized_title.ilike(f"%{keyword}%"))
 
         if categories:
-            query = query.filter(BroadcastSlot.category.in_(categories))
+            conditions.append(model.category.in_(categories))
 
         if status:
-            query = query.filter(BroadcastSlot.status == status)
+            conditions.append(model.status == status)
 
         if target_date:
             # KST(UTC+9) 기준 날짜를 UTC 범위로 변환해 필터링
-            # why: DB는 UTC로 저장하지만, 사용자는 KST 날짜를 기준으로 조회하므로 9시간 보정을 적용
-            kst = ZoneInfo("Asia/Seoul")
-            start_kst = datetime.combine(target_date, datetime.min.time(), tzinfo=kst)
-            end_kst = start_kst + timedelta(days=1)
-            start_dt = start_kst.astimezone(timezone.utc).replace(tzinfo=None)
-            end_dt = end_kst.astimezone(timezone.utc).replace(tzinfo=None)
-            query = query.filter(
-                and_(BroadcastSlot.start_at >= start_dt, BroadcastSlot.start_at < end_dt)
+            start_dt = kst_day_start_utc(target_date)
+            end_dt = start_dt + timedelta(days=1)
+            conditions.append(
+                and_(model.start_at >= start_dt, model.start_at < end_dt)
             )
+        return conditions
 
-        return query.order_by(BroadcastSlot.start_at.asc()).all()
+    def get_broadcast(
+        self, db: Session, broadcast_id: int, include_archived: bool = False
+    ) -> BroadcastSlot | BroadcastSlotArchive | None:
+        """슬롯 상세. include_archived면 원본에 없을 때 보관 테이블에서 찾는다."""
 
-    def get_broadcast(self, db: Session, broadcast_id: int) -> BroadcastSlot | None:
-        return (
-            db.query(BroadcastSlot)
-            .options(selectinload(BroadcastSlot.channel))
-            .filter(BroadcastSlot.id == broadcast_id)
-            .first()
-        )
+        models = [BroadcastSlot, BroadcastSlotArchive] if include_archived else [BroadcastSlot]
+        for model in models:
+            broadcast = (
+                db.query(model)
+                .options(selectinload(model.channel))
+                .filter(model.id == broadcast_id)
+                .first()
+            )
+            if broadcast is not None:
+                return broadcast
+        return None
 
     def list_price_history(
-        self, db: Session, broadcast_id: int
-    ) -> list[BroadcastPriceHistory]:
+        self, db: Session, broadcast_id: int, archived: bool = False
+    ) -> list[BroadcastPriceHistory | BroadcastPriceHistoryArchive]:
+        model = BroadcastPriceHistoryArchive if archived else BroadcastPriceHistory
         return (
-            db.query(BroadcastPriceHistory)
-            .filter(BroadcastPriceHistory.broadcast_slot_id == broadcast_id)
-            .order_by(BroadcastPriceHistory.collected_at.asc())
+            db.query(model)
+            .filter(model.broadcast_slot_id == broadcast_id)
+            .order_by(model.collected_at.asc())
             .all()
         )
+
+    def list_price_history_rows(
+        self, db: Session, broadcast_id: int, columns: list[str], archived: bool = False
+    ) -> list[Row]:
+        model = BroadcastPriceHistoryArchive if archived else BroadcastPriceHistory
+        return db.execute(
+            select(*[getattr(model, name) for name in columns])
+            .where(model.broadcast_slot_id == broadcast_id)
+            .order_by(model.collected_at.asc())
+        ).all()
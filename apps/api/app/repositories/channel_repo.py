@@ -1,13 +1,138 @@
 # why: 모듈 역할과 책임을 명확히 하기 위한 진입 주석
+import hashlib
+import threading
+import time
+from typing import Iterable
+
 from sqlalchemy.orm import Session
+from app.core.config import get_settings
 from app.models.channel import Channel
 
 
+class ChannelCache:
+    """채널 목록 프로세스 캐시.
+
+    - why: 채널은 수십 개이고 배치가 가끔 바꾸므로, 요청마다 조회하지 않고 메모리 사전으로 찾는다.
+    - 배치가 다른 프로세스에서 채널을 바꾸므로 ttl_sec이 지나면 다시 읽고, invalidate()로 즉시 비울 수 있다.
+    - 캐시에 없는 코드/id를 찾으면 TTL 전이라도 다시 읽어 새 채널을 바로 반영한다.
+      없는 코드로 반복 요청해도 DB를 두드리지 않도록 이 재조회는 miss_reload_sec에 한 번으로 제한한다.
+    - version은 채널 내용의 지문이라 다시 읽어도 내용이 같으면 바뀌지 않는다(ETag로 사용).
+    - 캐시한 Channel은 세션에서 분리(expunge)된 읽기 전용 객체로 취급한다.
+    - hits/misses는 조회 중 캐시로 답한 횟수와 DB를 다시 읽은 횟수(/metrics 적중률)다.
+    """
+
+    def __init__(self, ttl_sec: float, miss_reload_sec: float = 1.0) -> None:
+        self.ttl_sec = ttl_sec
+        self.miss_reload_sec = miss_reload_sec
+        self.version = ""
+        self._lock = threading.Lock()
+        self._channels: list[Channel] | None = None
+        self._by_code: dict[str, Channel] = {}
+        self._by_id: dict[int, Channel] = {}
+        self._loaded_at = 0.0
+        self._miss_reloaded_at: float | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def channels(self, db: Session) -> list[Channel]:
+        with self._lock:
+            if self._channels is None or time.monotonic() - self._loaded_at >= self.ttl_sec:
+                self._load(db)
+            else:
+                self.hits += 1
+            return self._channels
+
+    def by_code(self, db: Session, channel_code: str) -> Channel | None:
+        """코드 → Channel. 캐시에 없는 코드면 TTL 전이라도 한 번 다시 읽는다(새 채널 반영)."""
+
+        self.channels(db)
+        if channel_code not in self._by_code:
+            self._reload_on_miss(db)
+        return self._by_code.get(channel_code)
+
+    def by_ids(self, db: Session, channel_ids: Iterable[int]) -> dict[int, Channel]:
+        """id → Channel. 캐시에 없는 id가 있으면 TTL 전이라도 한 번 다시 읽는다(새 채널 반영)."""
+
+        wanted = set(channel_ids)
+        self.channels(db)
+        if not wanted.issubset(self._by_id):
+            self._reload_on_miss(db)
+        return {channel_id: self._by_id[channel_id] for channel_id in wanted if channel_id in self._by_id}
+
+    def _reload_on_miss(self, db: Session) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self._miss_reloaded_at is not None and now - self._miss_reloaded_at < self.miss_reload_sec:
+                return
+            self._miss_reloaded_at = now
+            self._load(db)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._channels = None
+            self._by_code = {}
+            self._by_id = {}
+
+    def _load(self, db: Session) -> None:
+        self.misses += 1
+        channels = db.query(Channel).order_by(Channel.channel_name.asc()).all()
+        for channel in channels:
+            db.expunge(channel)
+        self._channels = channels
+        self._by_code = {channel.channel_code: channel for channel in channels}
+        self._by_id = {channel.id: channel for channel in channels}
+        self._loaded_at = time.monotonic()
+        self.version = _fingerprint(channels)
+
+
+def _fingerprint(channels: list[Channel]) -> str:
+    digest = hashlib.sha1()
+    for channel in channels:
+        digest.update(
+            repr(
+                (
+                    channel.id,
+                    channel.channel_code,
+                    channel.channel_name,
+                    channel.channel_logo_url,
+                    channel.channel_live_url,
+                    channel.channel_stream_url,
+                )
+            ).encode("utf-8")
+        )
+    return digest.hexdigest()[:16]
+
+
+_channel_cache = ChannelCache(get_settings().channel_cache_ttl_sec)
+
+
+def channel_cache_counts() -> tuple[int, int]:
+    """프로세스 채널 캐시의 (hits, misses)."""
+
+    return _channel_cache.hits, _channel_cache.misses
+
+
 class ChannelRepository:
     """채널 데이터 접근 계층.
 
     - why: 서비스 계층에서 SQLAlchemy 세부 구현을 숨기기 위해.
     """
 
+    def __init__(self, cache: ChannelCache | None = None) -> None:
+        self.cache = cache or _channel_cache
+
     def list_channels(self, db: Session) -> list[Channel]:
-        return db.query(Channel).order_by(Channel.channel_name.asc()).all()
+        return self.cache.channels(db)
+
+    def get_by_code(self, db: Session, channel_code: str) -> Channel | None:
+        return self.cache.by_code(db, channel_code)
+
+    def get_by_ids(self, db: Session, channel_ids: Iterable[int]) -> dict[int, Channel]:
+        return self.cache.by_ids(db, channel_ids)
+
+    def version(self, db: Session) -> str:
+        self.cache.channels(db)
+        return self.cache.version
+
+    def invalidate(self) -> None:
+        self.cache.invalidate()
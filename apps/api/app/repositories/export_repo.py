@@ -0,0 +1,78 @@
+# why: 대량 내보내기를 서버 측 커서로 배치 단위 조회해 범위가 커져도 API 메모리가 늘지 않게 하기 위한 데이터 접근 계층
+from datetime import date, timedelta
+from typing import Iterator
+
+from sqlalchemy import Row, select
+from sqlalchemy.orm import Session
+
+from app.core.utils import kst_day_start_utc
+from app.models.broadcast_price_history import BroadcastPriceHistory
+from app.models.broadcast_slot import BroadcastSlot
+from app.models.channel import Channel
+
+
+class ExportRepository:
+    """내보내기 조회.
+
+    - id 오름차순 키셋(after_id)으로 이어받기를 지원한다.
+    - stream_results + yield_per로 MySQL 서버 측 커서를 써서 batch_size 행씩만 메모리에 올린다.
+    """
+
+    def iter_broadcast_rows(
+        self,
+        db: Session,
+        columns: list[str],
+        date_from: date | None,
+        date_to: date | None,
+        after_id: int | None,
+        batch_size: int,
+    ) -> Iterator[list[Row]]:
+        selected = [
+            Channel.channel_code if name == "channel_code" else getattr(BroadcastSlot, name)
+            for name in columns
+        ]
+        statement = (
+            select(*selected)
+            .select_from(BroadcastSlot)
+            .outerjoin(Channel, Channel.id == BroadcastSlot.channel_id)
+            .where(*_range(BroadcastSlot.start_at, date_from, date_to))
+        )
+        if after_id:
+            statement = statement.where(BroadcastSlot.id > after_id)
+        yield from self._partitions(db, statement.order_by(BroadcastSlot.id.asc()), batch_size)
+
+    def iter_price_history_rows(
+        self,
+        db: Session,
+        columns: list[str],
+        date_from: date | None,
+        date_to: date | None,
+        after_id: int | None,
+        batch_size: int,
+    ) -> Iterator[list[Row]]:
+        statement = select(*[getattr(BroadcastPriceHistory, name) for name in columns]).where(
+            *_range(BroadcastPriceHistory.collected_at, date_from, date_to)
+        )
+        if after_id:
+            statement = statement.where(BroadcastPriceHistory.id > after_id)
+        yield from self._partitions(
+            db, statement.order_by(BroadcastPriceHistory.id.asc()), batch_size
+        )
+
+    @staticmethod
+    def _partitions(db: Session, statement, batch_size: int) -> Iterator[list[Row]]:
+        result = db.execute(statement.execution_options(stream_results=True, yield_per=batch_size))
+        try:
+            yield from result.partitions()
+        finally:
+            result.close()
+
+
+def _range(column, date_from: date | None, date_to: date | None) -> list:
+    # KST 날짜 기준 [date_from 0시, date_to 다음날 0시)
+    conditions = []
+    if date_from:
+        conditions.append(column >= kst_day_start_utc(date_from))
+    if date_to:
+        conditions.append(column < kst_day_start_utc(date_to + timedelta(days=1)))
+    return conditions
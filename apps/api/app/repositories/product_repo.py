@@ -0,0 +1,54 @@
+# why: 상품과 상품에 연결된 방송/가격 이력을 조회하기 위한 데이터 접근 계층
+import heapq
+from operator import attrgetter
+
+from sqlalchemy.orm import Session, selectinload
+
+from app.models.broadcast_archive import BroadcastPriceHistoryArchive, BroadcastSlotArchive
+from app.models.broadcast_price_history import BroadcastPriceHistory
+from app.models.broadcast_slot import BroadcastSlot
+from app.models.product import Product
+
+
+class ProductRepository:
+    """상품 데이터 접근 계층.
+
+    - 방송/가격 이력은 보관 테이블까지 합쳐 읽는다. `products.broadcast_count`는 보관 후에도 줄지 않는
+      누적 편성 수이므로, 목록도 보관된 방송을 포함해야 수가 맞는다.
+    """
+
+    def get_product(self, db: Session, product_id: int) -> Product | None:
+        return db.query(Product).filter(Product.id == product_id).first()
+
+    def list_broadcasts(
+        self, db: Session, product_id: int
+    ) -> list[BroadcastSlot | BroadcastSlotArchive]:
+        """상품의 원본/보관 슬롯을 start_at 순으로 합쳐 반환."""
+
+        results = [
+            db.query(model)
+            .options(selectinload(model.channel))
+            .filter(model.product_id == product_id)
+            .order_by(model.start_at.asc())
+            .all()
+            for model in (BroadcastSlot, BroadcastSlotArchive)
+        ]
+        return list(heapq.merge(*results, key=attrgetter("start_at")))
+
+    def list_price_history(
+        self, db: Session, product_id: int
+    ) -> list[BroadcastPriceHistory | BroadcastPriceHistoryArchive]:
+        """상품의 원본/보관 가격 이력을 collected_at 순으로 합쳐 반환."""
+
+        results = [
+            db.query(history)
+            .join(slot, slot.id == history.broadcast_slot_id)
+            .filter(slot.product_id == product_id)
+            .order_by(history.collected_at.asc())
+            .all()
+            for slot, history in (
+                (BroadcastSlot, BroadcastPriceHistory),
+                (BroadcastSlotArchive, BroadcastPriceHistoryArchive),
+            )
+        ]
+        return list(heapq.merge(*results, key=attrgetter("collected_at")))
@@ -1,14 +1,27 @@
 # why: 모듈 역할과 책임을 명확히 하기 위한 진입 주석
 from datetime import date
-from fastapi import APIRouter, Depends, Query
+from typing import Literal
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
-from app.db.session import get_db
+from app.core.formats import BINARY_LIST_RESPONSES, negotiated_rows_response, preferred_media_type
+from app.db.session import get_read_db
 from app.models.broadcast_slot import BroadcastStatus
-from app.schemas.broadcast import BroadcastDetailOut, BroadcastOut, PriceHistoryOut
+from app.schemas.broadcast import (
+    BroadcastCompactOut,
+    BroadcastDetailOut,
+    BroadcastListOut,
+    BroadcastOut,
+    PriceHistoryOut,
+)
+from app.schemas.channel import ChannelOut
 from app.schemas.common import ApiResponse, ResponseMeta
-from app.services.broadcast_service import BroadcastService
+from app.services.broadcast_service import (
+    BROADCAST_COLUMNS,
+    PRICE_HISTORY_COLUMNS,
+    BroadcastService,
+)
 
 
 router = APIRouter(prefix="/api/v1/broadcasts", tags=["broadcasts"])
@@ -16,16 +29,60 @@ service = BroadcastService()
 settings = get_settings()
 
 
-@router.get("", response_model=ApiResponse[list[BroadcastOut]])
+@router.get(
+    "",
+    response_model=ApiResponse[list[BroadcastOut]] | ApiResponse[BroadcastListOut],
+    responses=BINARY_LIST_RESPONSES,
+)
 def list_broadcasts(
+    request: Request,
     date_param: date | None = Query(default=None, alias="date"),
     channel_code: str | None = Query(default=None, alias="channelCode"),
     keyword: str | None = Query(default=None),
     category: str | None = Query(default=None),
     status: BroadcastStatus | None = Query(default=None),
-    db: Session = Depends(get_db),
+    shape: Literal["flat", "normalized"] = Query(
+        default="flat",
+        description="normalized: 슬롯에는 channel_id만 두고 채널은 channels 사전으로 한 번만 보냄",
+    ),
+    include_archived: bool = Query(
+        default=False,
+        alias="includeArchived",
+        description="true: 보관 작업이 옮긴 오래된 방송도 함께 조회",
+    ),
+    db: Session = Depends(get_read_db),
 ):
-    broadcasts = service.list_broadcasts(db, date_param, channel_code, keyword, category, status)
+    if shape == "normalized":
+        broadcasts, channels = service.list_broadcasts_normalized(
+            db, date_param, channel_code, keyword, category, status, include_archived
+        )
+        return ApiResponse(
+            data=BroadcastListOut(
+                broadcasts=[BroadcastCompactOut.model_validate(item) for item in broadcasts],
+                channels={
+                    channel_id: ChannelOut.model_validate(channel)
+                    for channel_id, channel in channels.items()
+                },
+            ),
+            meta=ResponseMeta(count=len(broadcasts), time_policy=settings.time_policy),
+        )
+
+    accept = request.headers.get("accept")
+    if settings.api_fast_json or preferred_media_type(accept):
+        # 응답 스키마(OpenAPI)는 그대로 두고, 직렬화만 튜플 행 + orjson(또는 요청한 바이너리 형식)으로 처리
+        rows = service.list_broadcast_rows(
+            db, date_param, channel_code, keyword, category, status, include_archived
+        )
+        return negotiated_rows_response(
+            accept,
+            BROADCAST_COLUMNS,
+            rows,
+            ResponseMeta(count=len(rows), time_policy=settings.time_policy),
+        )
+
+    broadcasts = service.list_broadcasts(
+        db, date_param, channel_code, keyword, category, status, include_archived
+    )
     return ApiResponse(
         data=broadcasts,
         meta=ResponseMeta(count=len(broadcasts), time_policy=settings.time_policy),
@@ -33,17 +90,40 @@ def list_broadcasts(
 
 
 @router.get("/{broadcast_id}", response_model=ApiResponse[BroadcastDetailOut])
-def get_broadcast(broadcast_id: int, db: Session = Depends(get_db)):
-    broadcast = service.get_broadcast(db, broadcast_id)
+def get_broadcast(
+    broadcast_id: int,
+    include_archived: bool = Query(default=False, alias="includeArchived"),
+    db: Session = Depends(get_read_db),
+):
+    broadcast = service.get_broadcast(db, broadcast_id, include_archived)
     return ApiResponse(
         data=broadcast,
         meta=ResponseMeta(time_policy=settings.time_policy),
     )
 
 
-@router.get("/{broadcast_id}/price-history", response_model=ApiResponse[list[PriceHistoryOut]])
-def get_price_history(broadcast_id: int, db: Session = Depends(get_db)):
-    history = service.list_price_history(db, broadcast_id)
+@router.get(
+    "/{broadcast_id}/price-history",
+    response_model=ApiResponse[list[PriceHistoryOut]],
+    responses=BINARY_LIST_RESPONSES,
+)
+def get_price_history(
+    broadcast_id: int,
+    request: Request,
+    include_archived: bool = Query(default=False, alias="includeArchived"),
+    db: Session = Depends(get_read_db),
+):
+    accept = request.headers.get("accept")
+    if preferred_media_type(accept):
+        rows = service.list_price_history_rows(db, broadcast_id, include_archived)
+        return negotiated_rows_response(
+            accept,
+            PRICE_HISTORY_COLUMNS,
+            rows,
+            ResponseMeta(count=len(rows), time_policy=settings.time_policy),
+        )
+
+    history = service.list_price_history(db, broadcast_id, include_archived)
     return ApiResponse(
         data=history,
         meta=ResponseMeta(count=len(history), time_policy=settings.time_policy),
@@ -1,9 +1,9 @@
 # why: 모듈 역할과 책임을 명확히 하기 위한 진입 주석
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
-from app.db.session import get_db
+from app.db.session import get_read_db
 from app.schemas.channel import ChannelOut
 from app.schemas.common import ApiResponse, ResponseMeta
 from app.services.channel_service import ChannelService
@@ -15,8 +15,13 @@ settings = get_settings()
 
 
 @router.get("", response_model=ApiResponse[list[ChannelOut]])
-def list_channels(db: Session = Depends(get_db)):
+def list_channels(request: Request, response: Response, db: Session = Depends(get_read_db)):
     channels = service.list_channels(db)
+    # 캐시 버전(채널 내용 지문)을 ETag로 내려 프론트가 바뀌지 않은 목록을 다시 받지 않게 한다.
+    etag = f'"{service.channel_version(db)}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return ApiResponse(
         data=channels,
         meta=ResponseMeta(count=len(channels), time_policy=settings.time_policy),
@@ -0,0 +1,47 @@
+# why: 분석팀이 JSON 페이지 조회나 DB 직접 접속 없이 대량 데이터를 스트리밍으로 받기 위한 내보내기 API
+from datetime import date
+
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+
+from app.core.config import get_settings
+from app.services.export_service import MEDIA_TYPES, ExportFormat, ExportService
+
+
+router = APIRouter(prefix="/api/v1/export", tags=["export"])
+service = ExportService()
+settings = get_settings()
+
+
+def _response(stream, fmt: ExportFormat, name: str) -> StreamingResponse:
+    return StreamingResponse(
+        stream,
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{fmt}"'},
+    )
+
+
+@router.get("/broadcasts")
+def export_broadcasts(
+    fmt: ExportFormat = Query(default="ndjson", alias="format"),
+    date_from: date | None = Query(default=None, alias="dateFrom", description="KST 방송 시작일 (포함)"),
+    date_to: date | None = Query(default=None, alias="dateTo", description="KST 방송 시작일 (포함)"),
+    after_id: int | None = Query(default=None, alias="afterId", description="이어받기: 마지막으로 받은 id"),
+):
+    stream = service.stream_broadcasts(
+        fmt, date_from, date_to, after_id, settings.export_batch_size
+    )
+    return _response(stream, fmt, "broadcasts")
+
+
+@router.get("/price-history")
+def export_price_history(
+    fmt: ExportFormat = Query(default="ndjson", alias="format"),
+    date_from: date | None = Query(default=None, alias="dateFrom", description="KST 수집일 (포함)"),
+    date_to: date | None = Query(default=None, alias="dateTo", description="KST 수집일 (포함)"),
+    after_id: int | None = Query(default=None, alias="afterId", description="이어받기: 마지막으로 받은 id"),
+):
+    stream = service.stream_price_history(
+        fmt, date_from, date_to, after_id, settings.export_batch_size
+    )
+    return _response(stream, fmt, "price_history")
@@ -0,0 +1,23 @@
+# why: 여러 방송에 걸친 같은 상품의 편성/가격 흐름을 조회하는 API
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.session import get_read_db
+from app.schemas.common import ApiResponse, ResponseMeta
+from app.schemas.product import ProductDetailOut
+from app.services.product_service import ProductService
+
+
+router = APIRouter(prefix="/api/v1/products", tags=["products"])
+service = ProductService()
+settings = get_settings()
+
+
+@router.get("/{product_id}", response_model=ApiResponse[ProductDetailOut])
+def get_product(product_id: int, db: Session = Depends(get_read_db)):
+    product = service.get_product(db, product_id)
+    return ApiResponse(
+        data=product,
+        meta=ResponseMeta(count=len(product.broadcasts), time_policy=settings.time_policy),
+    )
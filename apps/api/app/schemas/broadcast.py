@@ -2,16 +2,15 @@
 from datetime import datetime
 from pydantic import BaseModel
 from app.models.broadcast_slot import BroadcastStatus
+from app.schemas.channel import ChannelOut
 from app.schemas.common import TimestampSchema
 
 
-class BroadcastOut(TimestampSchema):
-    """방송 슬롯 응답 스키마."""
+class BroadcastCompactOut(TimestampSchema):
+    """채널 정보 없이 channel_id만 담는 방송 슬롯 스키마 (정규화 응답용)."""
 
     id: int
     channel_id: int
-    channel_code: str | None = None
-    channel_name: str | None = None
     source_code: str
     start_at: datetime
     end_at: datetime
@@ -27,11 +26,29 @@ class BroadcastOut(TimestampSchema):
     image_url: str | None = None
     status: BroadcastStatus
     slot_hash: str
+    product_id: int | None = None
 
     class Config:
         from_attributes = True
 
 
+class BroadcastOut(BroadcastCompactOut):
+    """방송 슬롯 응답 스키마."""
+
+    channel_code: str | None = None
+    channel_name: str | None = None
+
+
+class BroadcastListOut(BaseModel):
+    """정규화 목록 응답.
+
+    - why: 수천 개 슬롯에 같은 채널 정보를 반복하지 않고, 등장한 채널을 id 사전으로 한 번만 보낸다.
+    """
+
+    broadcasts: list[BroadcastCompactOut]
+    channels: dict[int, ChannelOut]
+
+
 class BroadcastDetailOut(BroadcastOut):
     """상세 응답 스키마. MVP에서는 BroadcastOut과 동일하지만 확장을 고려해 분리."""
 
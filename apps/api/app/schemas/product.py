@@ -0,0 +1,45 @@
+# why: 상품 단위(여러 방송을 묶은) 조회 응답 스키마
+from datetime import datetime
+from pydantic import BaseModel
+from app.schemas.broadcast import BroadcastOut
+from app.schemas.common import TimestampSchema
+
+
+class ProductOut(TimestampSchema):
+    """상품 응답 스키마."""
+
+    id: int
+    product_key: str
+    goodscode: str | None = None
+    normalized_title: str
+    category: str | None = None
+    sale_price: int | None = None
+    original_price: int | None = None
+    discount_rate: float | None = None
+    price_updated_at: datetime | None = None
+    first_seen_at: datetime
+    last_seen_at: datetime
+    broadcast_count: int
+
+    class Config:
+        from_attributes = True
+
+
+class ProductPricePointOut(BaseModel):
+    """상품 가격 타임라인의 한 점 (어느 방송에서 수집했는지 포함)."""
+
+    broadcast_slot_id: int
+    collected_at: datetime
+    sale_price: int | None = None
+    original_price: int | None = None
+    discount_rate: float | None = None
+
+    class Config:
+        from_attributes = True
+
+
+class ProductDetailOut(ProductOut):
+    """상품 상세: 편성된 방송 목록과 가격 타임라인."""
+
+    broadcasts: list[BroadcastOut] = []
+    price_history: list[ProductPricePointOut] = []
@@ -1,7 +1,7 @@
 # why: 모듈 역할과 책임을 명확히 하기 위한 진입 주석
 from sqlalchemy.orm import Session
 
-from app.core.crypto import decrypt_value, is_invalid_token
+from app.core.crypto import decrypt_value, decrypt_values, is_invalid_token
 from app.core.errors import AppError
 from app.repositories.alert_repo import AlertRepository
 from app.schemas.alert import AlertCreate, AlertUpdate
@@ -15,7 +15,11 @@ class AlertService:
 
     def list_alerts(self, db: Session):
         alerts = self.repo.list_alerts(db)
-        return [self._decrypt_alert(alert) for alert in alerts]
+        # why: 목록은 매 요청 전체 행을 복호화하므로 키 확인/캐시 조회를 한 번에 처리
+        decrypted = decrypt_values([alert.destination_value for alert in alerts])
+        for alert, value in zip(alerts, decrypted):
+            alert.destination_value = value
+        return alerts
 
     def create_alert(self, db: Session, payload: AlertCreate):
         alert = self.repo.create_alert(db, payload)
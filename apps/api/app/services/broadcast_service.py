@@ -3,8 +3,16 @@ from datetime import date
 from sqlalchemy.orm import Session
 
 from app.core.errors import AppError
+from app.models.broadcast_archive import BroadcastSlotArchive
 from app.models.broadcast_slot import BroadcastStatus
 from app.repositories.broadcast_repo import BroadcastRepository
+from app.repositories.channel_repo import ChannelRepository
+from app.schemas.broadcast import BroadcastOut, PriceHistoryOut
+
+
+# 빠른 직렬화 경로에서 조회할 컬럼 (응답 스키마 필드 순서 그대로)
+BROADCAST_COLUMNS = list(BroadcastOut.model_fields)
+PRICE_HISTORY_COLUMNS = list(PriceHistoryOut.model_fields)
 
 
 class BroadcastService:
@@ -12,6 +20,7 @@ class BroadcastService:
 
     def __init__(self) -> None:
         self.repo = BroadcastRepository()
+        self.channels = ChannelRepository()
 
     def list_broadcasts(
         self,
@@ -21,22 +30,94 @@ class BroadcastService:
         keyword: str | None,
         category: str | None,
         status: BroadcastStatus | None,
+        include_archived: bool = False,
     ):
-        categories = None
-        if category:
-            categories = [item for item in category.split(",") if item]
         return self.repo.list_broadcasts(
-            db, target_date, channel_code, keyword, categories, status
+            db,
+            target_date,
+            channel_code,
+            keyword,
+            _split_categories(category),
+            status,
+            include_archived=include_archived,
         )
 
-    def get_broadcast(self, db: Session, broadcast_id: int):
-        broadcast = self.repo.get_broadcast(db, broadcast_id)
+    def list_broadcast_rows(
+        self,
+        db: Session,
+        target_date: date | None,
+        channel_code: str | None,
+        keyword: str | None,
+        category: str | None,
+        status: BroadcastStatus | None,
+        include_archived: bool = False,
+    ):
+        """BroadcastOut과 같은 필드 순서의 튜플 행 (ORM 객체/스키마 검증 없이 직렬화용)."""
+
+        return self.repo.list_broadcast_rows(
+            db,
+            BROADCAST_COLUMNS,
+            target_date,
+            channel_code,
+            keyword,
+            _split_categories(category),
+            status,
+            include_archived=include_archived,
+        )
+
+    def list_broadcasts_normalized(
+        self,
+        db: Session,
+        target_date: date | None,
+        channel_code: str | None,
+        keyword: str | None,
+        category: str | None,
+        status: BroadcastStatus | None,
+        include_archived: bool = False,
+    ):
+        """슬롯에는 channel_id만 두고, 등장한 채널은 캐시에서 한 번만 붙인다.
+
+        - return: (슬롯 목록, channel_id → Channel)
+        """
+
+        broadcasts = self.repo.list_broadcasts(
+            db,
+            target_date,
+            channel_code,
+            keyword,
+            _split_categories(category),
+            status,
+            with_channel=False,
+            include_archived=include_archived,
+        )
+        channels = self.channels.get_by_ids(db, {item.channel_id for item in broadcasts})
+        return broadcasts, channels
+
+    def get_broadcast(self, db: Session, broadcast_id: int, include_archived: bool = False):
+        broadcast = self.repo.get_broadcast(db, broadcast_id, include_archived)
         if not broadcast:
             raise AppError(status_code=404, message="방송 정보를 찾을 수 없습니다.", code="NOT_FOUND")
         return broadcast
 
-    def list_price_history(self, db: Session, broadcast_id: int):
-        broadcast = self.repo.get_broadcast(db, broadcast_id)
-        if not broadcast:
-            raise AppError(status_code=404, message="방송 정보를 찾을 수 없습니다.", code="NOT_FOUND")
-        return self.repo.list_price_history(db, broadcast_id)
+    def list_price_history(self, db: Session, broadcast_id: int, include_archived: bool = False):
+        broadcast = self.get_broadcast(db, broadcast_id, include_archived)
+        return self.repo.list_price_history(
+            db, broadcast_id, archived=isinstance(broadcast, BroadcastSlotArchive)
+        )
+
+    def list_price_history_rows(
+        self, db: Session, broadcast_id: int, include_archived: bool = False
+    ):
+        broadcast = self.get_broadcast(db, broadcast_id, include_archived)
+        return self.repo.list_price_history_rows(
+            db,
+            broadcast_id,
+            PRICE_HISTORY_COLUMNS,
+            archived=isinstance(broadcast, BroadcastSlotArchive),
+        )
+
+
+def _split_categories(category: str | None) -> list[str] | None:
+    if not category:
+        return None
+    return [item for item in category.split(",") if item]
@@ -11,3 +11,6 @@ class ChannelService:
 
     def list_channels(self, db: Session):
         return self.repo.list_channels(db)
+
+    def channel_version(self, db: Session) -> str:
+        return self.repo.version(db)
@@ -0,0 +1,219 @@
+# why: 슬롯/가격 이력 내보내기를 NDJSON/CSV/Parquet 바이트 스트림으로 만드는 서비스 계층
+import csv
+from datetime import date, datetime
+import enum
+import io
+from typing import Callable, Iterator, Literal
+
+import orjson
+from sqlalchemy.orm import Session
+
+from app.core.errors import AppError
+from app.db.session import ReadSessionLocal
+from app.repositories.export_repo import ExportRepository
+
+
+ExportFormat = Literal["ndjson", "csv", "parquet"]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# 컬럼 → Parquet(Arrow) 타입. 첫 배치가 전부 NULL이어도 스키마가 흔들리지 않도록 고정한다.
+BROADCAST_EXPORT_COLUMNS = {
+    "id": "int64",
+    "channel_id": "int64",
+    "channel_code": "string",
+    "source_code": "string",
+    "start_at": "timestamp[us]",
+    "end_at": "timestamp[us]",
+    "raw_title": "string",
+    "normalized_title": "string",
+    "category": "string",
+    "product_url": "string",
+    "sale_price": "int64",
+    "original_price": "int64",
+    "discount_rate": "double",
+    "status": "string",
+    "product_id": "int64",
+}
+PRICE_HISTORY_EXPORT_COLUMNS = {
+    "id": "int64",
+    "broadcast_slot_id": "int64",
+    "collected_at": "timestamp[us]",
+    "sale_price": "int64",
+    "original_price": "int64",
+    "discount_rate": "double",
+}
+
+
+class ExportService:
+    """내보내기 서비스.
+
+    - 스트리밍 응답은 요청 의존성(get_db) 세션이 먼저 닫히므로, 스트림마다 세션을 직접 열고 닫는다.
+    - 배치(batch_size 행) 하나를 인코딩해 바로 내보내므로 메모리는 범위 크기와 무관하다.
+    - 각 행에 id가 있으므로, 끊기면 마지막으로 받은 id를 afterId로 넘겨 이어받는다.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = ReadSessionLocal) -> None:
+        self.session_factory = session_factory
+        self.repo = ExportRepository()
+
+    def stream_broadcasts(
+        self,
+        fmt: ExportFormat,
+        date_from: date | None,
+        date_to: date | None,
+        after_id: int | None,
+        batch_size: int,
+    ) -> Iterator[bytes]:
+        return self._stream(
+            self.repo.iter_broadcast_rows,
+            BROADCAST_EXPORT_COLUMNS,
+            fmt,
+            date_from,
+            date_to,
+            after_id,
+            batch_size,
+        )
+
+    def stream_price_history(
+        self,
+        fmt: ExportFormat,
+        date_from: date | None,
+        date_to: date | None,
+        after_id: int | None,
+        batch_size: int,
+    ) -> Iterator[bytes]:
+        return self._stream(
+            self.repo.iter_price_history_rows,
+            PRICE_HISTORY_EXPORT_COLUMNS,
+            fmt,
+            date_from,
+            date_to,
+            after_id,
+            batch_size,
+        )
+
+    def _stream(self, fetch, column_types, fmt, date_from, date_to, after_id, batch_size):
+        if date_from and date_to and date_from > date_to:
+            raise AppError(status_code=400, message="dateFrom이 dateTo보다 늦습니다.", code="INVALID_RANGE")
+        encoder = _ENCODERS[fmt]
+        # 스트림을 시작하기 전에 형식 지원 여부를 확인해 오류를 JSON으로 돌려준다.
+        encoder.check()
+        columns = list(column_types)
+
+        def generate() -> Iterator[bytes]:
+            db = self.session_factory()
+            try:
+                batches = fetch(db, columns, date_from, date_to, after_id, batch_size)
+                yield from encoder.encode(column_types, batches)
+            finally:
+                db.close()
+
+        return generate()
+
+
+def _plain(value):
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+class _NdjsonEncoder:
+    @staticmethod
+    def check() -> None:
+        return None
+
+    @staticmethod
+    def encode(column_types: dict[str, str], batches) -> Iterator[bytes]:
+        columns = list(column_types)
+        for rows in batches:
+            yield b"".join(
+                orjson.dumps(dict(zip(columns, row))) + b"\n" for row in rows
+            )
+
+
+class _CsvEncoder:
+    @staticmethod
+    def check() -> None:
+        return None
+
+    @staticmethod
+    def encode(column_types: dict[str, str], batches) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(column_types)
+        for rows in batches:
+            writer.writerows(
+                [
+                    value.isoformat() if isinstance(value, datetime) else _plain(value)
+                    for value in row
+                ]
+                for row in rows
+            )
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """ParquetWriter가 쓴 바이트를 모아 두었다가 배치마다 꺼내는 쓰기 전용 파일."""
+
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+class _ParquetEncoder:
+    @staticmethod
+    def check() -> None:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise AppError(
+                status_code=406,
+                message="Parquet 내보내기에는 pyarrow가 필요합니다.",
+                code="UNSUPPORTED_FORMAT",
+            )
+
+    @staticmethod
+    def encode(column_types: dict[str, str], batches) -> Iterator[bytes]:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.schema([(name, pa.type_for_alias(alias)) for name, alias in column_types.items()])
+        sink = _ChunkSink()
+        # 배치 하나가 row group 하나가 되며, 파일 끝(footer)은 마지막에 기록된다.
+        with pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema) as writer:
+            for rows in batches:
+                columns = list(zip(*rows))
+                writer.write_table(
+                    pa.table(
+                        [
+                            pa.array([_plain(value) for value in values], type=field.type)
+                            for values, field in zip(columns, schema)
+                        ],
+                        schema=schema,
+                    )
+                )
+                yield sink.drain()
+        yield sink.drain()
+
+
+_ENCODERS = {"ndjson": _NdjsonEncoder, "csv": _CsvEncoder, "parquet": _ParquetEncoder}
@@ -0,0 +1,29 @@
+# why: 상품 상세(방송 목록 + 가격 타임라인) 조합을 담당하는 서비스 계층
+from sqlalchemy.orm import Session
+
+from app.core.errors import AppError
+from app.repositories.product_repo import ProductRepository
+from app.schemas.broadcast import BroadcastOut
+from app.schemas.product import ProductDetailOut, ProductPricePointOut
+
+
+class ProductService:
+    """상품 서비스 계층."""
+
+    def __init__(self) -> None:
+        self.repo = ProductRepository()
+
+    def get_product(self, db: Session, product_id: int) -> ProductDetailOut:
+        product = self.repo.get_product(db, product_id)
+        if not product:
+            raise AppError(status_code=404, message="상품 정보를 찾을 수 없습니다.", code="NOT_FOUND")
+
+        detail = ProductDetailOut.model_validate(product)
+        detail.broadcasts = [
+            BroadcastOut.model_validate(slot) for slot in self.repo.list_broadcasts(db, product_id)
+        ]
+        detail.price_history = [
+            ProductPricePointOut.model_validate(point)
+            for point in self.repo.list_price_history(db, product_id)
+        ]
+        return detail
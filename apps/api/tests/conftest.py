@@ -0,0 +1,21 @@
+# why: API 테스트가 같은 메모리 sqlite 세션 준비 코드를 복사하지 않도록 공유 fixture를 둔다
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401 - 모델을 Base.metadata에 등록
+from app.db.base import Base
+
+
+@pytest.fixture
+def db_session():
+    """전체 API 스키마를 만든 메모리 sqlite 세션 (테스트마다 새 DB)."""
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        yield db
+    finally:
+        db.close()
+        engine.dispose()
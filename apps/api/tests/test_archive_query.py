@@ -0,0 +1,71 @@
+# why: includeArchived 조회가 원본/보관 슬롯을 start_at 순으로 합치고, 보관 슬롯의 가격 이력을 찾는지 sqlite로 검증
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.models import (
+    BroadcastPriceHistoryArchive,
+    BroadcastSlot,
+    BroadcastSlotArchive,
+    BroadcastStatus,
+    Channel,
+)
+from app.repositories.channel_repo import ChannelCache, ChannelRepository
+from app.services.broadcast_service import BroadcastService
+
+
+START = datetime(2026, 2, 2, 16, 0)  # 2026-02-03 01:00 KST
+
+
+def _slot_values(channel_id: int, idx: int) -> dict:
+    start_at = START + timedelta(hours=idx)
+    return {
+        "channel_id": channel_id,
+        "source_code": "gmarket_schedule",
+        "start_at": start_at,
+        "end_at": start_at + timedelta(hours=1),
+        "raw_title": f"상품 {idx}",
+        "normalized_title": f"상품 {idx}",
+        "status": BroadcastStatus.ENDED,
+        "slot_hash": f"hash-{idx}",
+    }
+
+
+def test_include_archived_merges_live_and_archived_slots():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    lotte = Channel(channel_code="lotte", channel_name="롯데홈쇼핑")
+    db.add(lotte)
+    db.flush()
+    # 보관 슬롯(0, 2시)과 원본 슬롯(1, 3시)이 번갈아 오도록 배치
+    for idx in (0, 2):
+        db.add(
+            BroadcastSlotArchive(
+                id=100 + idx, created_at=START, updated_at=START, **_slot_values(lotte.id, idx)
+            )
+        )
+    for idx in (1, 3):
+        db.add(BroadcastSlot(**_slot_values(lotte.id, idx)))
+    db.add(BroadcastPriceHistoryArchive(id=1, broadcast_slot_id=100, collected_at=START, sale_price=900))
+    db.commit()
+
+    service = BroadcastService()
+    cache = ChannelCache(ttl_sec=60)
+    service.repo.channels = ChannelRepository(cache)
+    target = date(2026, 2, 3)
+
+    live = service.list_broadcasts(db, target, "lotte", None, None, None)
+    assert [item.normalized_title for item in live] == ["상품 1", "상품 3"]
+
+    merged = service.list_broadcasts(db, target, "lotte", None, None, None, include_archived=True)
+    assert [item.normalized_title for item in merged] == ["상품 0", "상품 1", "상품 2", "상품 3"]
+    assert merged[0].channel_code == "lotte"
+
+    rows = service.list_broadcast_rows(db, target, None, None, None, None, include_archived=True)
+    assert [row.id for row in rows] == [100, live[0].id, 102, live[1].id]
+
+    history = service.list_price_history(db, 100, include_archived=True)
+    assert [item.sale_price for item in history] == [900]
@@ -0,0 +1,55 @@
+# why: 채널 캐시가 TTL 안에서는 다시 조회하지 않고, 새 채널 코드/invalidate 후에는 새 채널을 읽는지 sqlite로 검증
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.models import Channel
+from app.repositories.channel_repo import ChannelCache, ChannelRepository
+
+
+def test_channel_cache_serves_from_memory_until_invalidated():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    db.add(Channel(channel_code="lotte", channel_name="롯데홈쇼핑"))
+    db.commit()
+
+    repo = ChannelRepository(ChannelCache(ttl_sec=300, miss_reload_sec=60))
+    assert [channel.channel_code for channel in repo.list_channels(db)] == ["lotte"]
+
+    db.add(Channel(channel_code="gsshop", channel_name="GS SHOP"))
+    db.commit()
+    # 목록은 TTL 동안 캐시 그대로지만, 모르는 코드는 한 번 다시 읽어 새 채널을 바로 찾는다.
+    assert [channel.channel_code for channel in repo.list_channels(db)] == ["lotte"]
+    assert repo.get_by_code(db, "gsshop").channel_name == "GS SHOP"
+    assert [channel.channel_code for channel in repo.list_channels(db)] == ["gsshop", "lotte"]
+
+    # 없는 코드로 반복 조회해도 miss_reload_sec 안에서는 다시 읽지 않는다.
+    misses = repo.cache.misses
+    assert repo.get_by_code(db, "nope") is None
+    assert repo.get_by_code(db, "nope") is None
+    assert repo.cache.misses == misses
+
+    db.add(Channel(channel_code="cjonstyle", channel_name="CJ온스타일"))
+    db.commit()
+    repo.invalidate()
+    assert repo.get_by_code(db, "cjonstyle").channel_name == "CJ온스타일"
+
+
+def test_channel_version_changes_only_when_channel_content_changes():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    db.add(Channel(channel_code="lotte", channel_name="롯데홈쇼핑"))
+    db.commit()
+
+    repo = ChannelRepository(ChannelCache(ttl_sec=0))
+    version = repo.version(db)
+    assert repo.version(db) == version
+
+    channel = db.query(Channel).one()
+    channel.channel_live_url = "https://live/lotte"
+    db.commit()
+    assert repo.version(db) != version
+    # 캐시에 없는 채널 id는 TTL과 관계없이 다시 읽어 찾아 준다.
+    assert set(ChannelRepository(ChannelCache(ttl_sec=300)).get_by_ids(db, [channel.id, 999])) == {channel.id}
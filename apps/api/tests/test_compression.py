@@ -0,0 +1,64 @@
+# why: 압축 미들웨어(크기 임계치/스트리밍)와 목록 형식 협상(JSON 대체)을 ASGI 수준에서 검증
+import asyncio
+import gzip
+import json
+
+from app.core.compression import CompressionMiddleware
+from app.core.formats import MSGPACK_MEDIA_TYPE, negotiated_rows_response
+from app.schemas.common import ResponseMeta
+
+
+def _app(chunks: list[bytes]):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+        for idx, chunk in enumerate(chunks):
+            await send({"type": "http.response.body", "body": chunk, "more_body": idx < len(chunks) - 1})
+
+    return app
+
+
+def _call(app, accept_encoding: str):
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "headers": [(b"accept-encoding", accept_encoding.encode())]}
+    asyncio.run(app(scope, receive, send))
+    headers = dict(messages[0]["headers"])
+    return headers, b"".join(message.get("body", b"") for message in messages[1:])
+
+
+def test_compresses_large_and_streamed_bodies_only():
+    large = b'{"data":"' + b"x" * 4096 + b'"}'
+    headers, body = _call(CompressionMiddleware(_app([large]), brotli_enabled=False), "gzip, deflate")
+    assert headers[b"content-encoding"] == b"gzip"
+    assert gzip.decompress(body) == large
+
+    headers, body = _call(CompressionMiddleware(_app([b"{}"]), brotli_enabled=False), "gzip")
+    assert b"content-encoding" not in headers and body == b"{}"
+
+    # 스트리밍 응답은 작은 조각이어도 조각 단위로 압축한다.
+    headers, body = _call(CompressionMiddleware(_app([b"a\n", b"b\n"]), brotli_enabled=False), "gzip")
+    assert headers[b"content-encoding"] == b"gzip" and gzip.decompress(body) == b"a\nb\n"
+
+    headers, body = _call(CompressionMiddleware(_app([large]), brotli_enabled=False), "identity")
+    assert b"content-encoding" not in headers and body == large
+
+
+def test_negotiation_falls_back_to_json_envelope():
+    meta = ResponseMeta(count=1, time_policy="UTC")
+    response = negotiated_rows_response("application/json, */*", ["id"], [(1,)], meta)
+    assert json.loads(response.body)["data"] == [{"id": 1}]
+
+    response = negotiated_rows_response(MSGPACK_MEDIA_TYPE, ["id"], [(1,)], meta)
+    if response.media_type == MSGPACK_MEDIA_TYPE:
+        import msgpack
+
+        assert msgpack.unpackb(response.body)["data"] == {"columns": ["id"], "rows": [[1]]}
+    else:
+        # msgpack 미설치 환경에서는 JSON 봉투로 응답
+        assert json.loads(response.body)["meta"]["count"] == 1
@@ -0,0 +1,37 @@
+# why: 복호화 캐시/일괄 복호화가 기존 단건 복호화와 같은 결과를 내는지 검증
+from cryptography.fernet import Fernet
+
+from app.core import crypto
+from app.core.config import get_settings
+
+
+def _use_key(monkeypatch, key: str) -> None:
+    monkeypatch.setenv("ENCRYPTION_KEY", key)
+    get_settings.cache_clear()
+    crypto._decrypt_cached.cache_clear()
+
+
+def test_decrypt_values_handles_plaintext_and_none(monkeypatch):
+    _use_key(monkeypatch, Fernet.generate_key().decode("utf-8"))
+    token = crypto.encrypt_value("https://hooks.slack.com/services/a")
+
+    values = crypto.decrypt_values([token, "legacy-plain@example.com", None, token])
+
+    assert values == [
+        "https://hooks.slack.com/services/a",
+        "legacy-plain@example.com",
+        None,
+        "https://hooks.slack.com/services/a",
+    ]
+    assert crypto._decrypt_cached.cache_info().hits == 1
+    get_settings.cache_clear()
+
+
+def test_decrypt_cache_is_scoped_by_key(monkeypatch):
+    _use_key(monkeypatch, Fernet.generate_key().decode("utf-8"))
+    token = crypto.encrypt_value("secret")
+    assert crypto.decrypt_value(token) == "secret"
+
+    _use_key(monkeypatch, Fernet.generate_key().decode("utf-8"))
+    assert crypto.decrypt_values([token]) == [token]
+    get_settings.cache_clear()
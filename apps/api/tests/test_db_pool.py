@@ -0,0 +1,31 @@
+# why: 커넥션 풀 지표(대기 시간/타임아웃)가 실제 대여 흐름대로 누적되는지 검증
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.db.session import TimedQueuePool
+
+
+def test_timed_pool_counts_checkouts_and_timeouts(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=TimedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    pool = engine.pool
+
+    held = engine.connect()
+    held.execute(text("SELECT 1"))
+    assert pool.checkedout() == 1
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+    held.close()
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    assert pool.checkouts == 3
+    assert pool.timeouts == 1
+    assert pool.wait_max_sec >= 0.05
@@ -0,0 +1,181 @@
+# why: 목록/알림/가격 반영 쿼리가 풀스캔 없이 의도한 인덱스를 타는지 실제 MySQL 실행 계획으로 확인
+import os
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, func, insert, select, text
+from sqlalchemy.orm import Session
+
+from app.core.utils import kst_day_start_utc
+from app.models.broadcast_price_history import BroadcastPriceHistory
+from app.models.broadcast_slot import BroadcastSlot, BroadcastStatus
+from app.models.channel import Channel
+from app.repositories.broadcast_repo import BroadcastRepository
+
+
+# 마이그레이션(alembic upgrade head)을 마친 MySQL에서만 실행한다. 예: mysql+pymysql://user:pw@host/db
+EXPLAIN_DATABASE_URL = os.getenv("EXPLAIN_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not (EXPLAIN_DATABASE_URL or "").startswith("mysql"),
+    reason="EXPLAIN_DATABASE_URL(MySQL)이 설정된 경우에만 실행",
+)
+
+SEED_SOURCE = "explain_seed"
+SEED_CHANNEL = "EXPLAIN"
+SEED_SLOTS = 50_000
+SEED_DAYS = 60
+CATEGORIES = ["가전", "식품", "패션", "뷰티", "리빙", "여행", "건강", "유아", "스포츠", "기타"]
+TARGET_DAY = date(2026, 1, 15)
+
+
+@pytest.fixture(scope="module")
+def db():
+    engine = create_engine(EXPLAIN_DATABASE_URL)
+    with Session(engine) as session:
+        _seed(session)
+        yield session
+    engine.dispose()
+
+
+def _seed(db: Session) -> None:
+    seeded = db.scalar(
+        select(func.count()).select_from(BroadcastSlot).where(BroadcastSlot.source_code == SEED_SOURCE)
+    )
+    if seeded:
+        return
+
+    channel_id = db.scalar(select(Channel.id).where(Channel.channel_code == SEED_CHANNEL))
+    if channel_id is None:
+        db.execute(insert(Channel).values(channel_code=SEED_CHANNEL, channel_name="실행 계획 확인"))
+        channel_id = db.scalar(select(Channel.id).where(Channel.channel_code == SEED_CHANNEL))
+
+    first_start = kst_day_start_utc(TARGET_DAY) - timedelta(days=SEED_DAYS // 2)
+    step = timedelta(days=SEED_DAYS) / SEED_SLOTS
+    statuses = list(BroadcastStatus)
+    slots = []
+    for index in range(SEED_SLOTS):
+        start_at = first_start + step * index
+        slots.append(
+            {
+                "channel_id": channel_id,
+                "source_code": SEED_SOURCE,
+                "start_at": start_at,
+                "end_at": start_at + timedelta(hours=1),
+                "raw_title": f"실행 계획 확인용 상품 {index}",
+                "normalized_title": f"실행 계획 확인용 상품 {index}",
+                "category": CATEGORIES[index % len(CATEGORIES)],
+                "product_url": f"https://example.com/explain/{index}",
+                "status": statuses[index % len(statuses)],
+                "slot_hash": f"{SEED_SOURCE}-{index}",
+            }
+        )
+    db.execute(insert(BroadcastSlot), slots)
+
+    slot_ids = db.scalars(
+        select(BroadcastSlot.id).where(BroadcastSlot.source_code == SEED_SOURCE).limit(5_000)
+    ).all()
+    collected_at = datetime.combine(TARGET_DAY, datetime.min.time())
+    db.execute(
+        insert(BroadcastPriceHistory),
+        [
+            {
+                "broadcast_slot_id": slot_id,
+                "collected_at": collected_at + timedelta(minutes=10 * round_),
+                "sale_price": 10_000 + round_,
+                "original_price": 20_000,
+                "discount_rate": 50.0,
+            }
+            for slot_id in slot_ids
+            for round_ in range(4)
+        ],
+    )
+    db.commit()
+
+    db.execute(text("ANALYZE TABLE broadcast_slots, broadcast_price_history"))
+
+
+def _explain(db: Session, statement) -> list[dict]:
+    sql = statement.compile(dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True})
+    return [dict(row) for row in db.execute(text(f"EXPLAIN {sql}")).mappings()]
+
+
+def _assert_uses(plan: list[dict], table: str, expected_keys: set[str]) -> dict:
+    row = next(item for item in plan if item["table"] == table)
+    assert row["type"] != "ALL", f"{table} 풀스캔: {row}"
+    assert row["key"] in expected_keys, f"{table} 예상 밖 인덱스: {row}"
+    return row
+
+
+def _list_statement(db: Session, **filters):
+    repo = BroadcastRepository()
+    conditions = repo._conditions(
+        db,
+        filters.get("target_date", TARGET_DAY),
+        filters.get("channel_code"),
+        None,
+        filters.get("categories"),
+        filters.get("status"),
+    )
+    return select(BroadcastSlot).where(*conditions).order_by(BroadcastSlot.start_at.asc())
+
+
+def test_list_by_date_uses_start_index(db):
+    plan = _explain(db, _list_statement(db))
+    _assert_uses(plan, "broadcast_slots", {"ix_broadcast_slots_start_at"})
+
+
+def test_list_by_date_and_category_uses_category_start(db):
+    plan = _explain(db, _list_statement(db, categories=["가전"]))
+    _assert_uses(
+        plan, "broadcast_slots", {"ix_broadcast_slots_category_start", "ix_broadcast_slots_start_at"}
+    )
+
+
+def test_list_by_date_and_status_uses_status_start(db):
+    plan = _explain(db, _list_statement(db, status=BroadcastStatus.LIVE))
+    _assert_uses(
+        plan, "broadcast_slots", {"ix_broadcast_slots_status_start", "ix_broadcast_slots_start_at"}
+    )
+
+
+def test_list_by_date_and_channel_uses_channel_start(db):
+    plan = _explain(db, _list_statement(db, channel_code=SEED_CHANNEL))
+    _assert_uses(
+        plan, "broadcast_slots", {"idx_broadcast_channel_start", "ix_broadcast_slots_start_at"}
+    )
+
+
+def test_alert_window_uses_start_index(db):
+    # 배치 send_alerts의 다가오는 방송 조회와 같은 형태
+    window_start = kst_day_start_utc(TARGET_DAY)
+    statement = (
+        select(BroadcastSlot.id, BroadcastSlot.channel_id, BroadcastSlot.start_at, BroadcastSlot.raw_title)
+        .where(BroadcastSlot.start_at >= window_start)
+        .where(BroadcastSlot.start_at <= window_start + timedelta(minutes=30))
+    )
+    _assert_uses(_explain(db, statement), "broadcast_slots", {"ix_broadcast_slots_start_at"})
+
+
+def test_price_history_is_covered_by_index(db):
+    slot_id = db.scalar(select(BroadcastPriceHistory.broadcast_slot_id).limit(1))
+    columns = ["collected_at", "sale_price", "original_price", "discount_rate"]
+    statement = (
+        select(*[getattr(BroadcastPriceHistory, name) for name in columns])
+        .where(BroadcastPriceHistory.broadcast_slot_id == slot_id)
+        .order_by(BroadcastPriceHistory.collected_at.asc())
+    )
+    row = _assert_uses(
+        _explain(db, statement), "broadcast_price_history", {"ix_price_history_slot_time_cover"}
+    )
+    assert "Using index" in (row["Extra"] or "")
+
+
+def test_apply_fetched_prices_uses_end_index(db):
+    # 배치 apply_fetched_prices와 같은 형태: 아직 끝나지 않은 방송 중 상품 URL 일치
+    statement = (
+        select(BroadcastSlot)
+        .where(BroadcastSlot.product_url.in_([f"https://example.com/explain/{i}" for i in range(50)]))
+        .where(BroadcastSlot.end_at >= kst_day_start_utc(TARGET_DAY) + timedelta(days=SEED_DAYS // 2 - 1))
+    )
+    _assert_uses(_explain(db, statement), "broadcast_slots", {"ix_broadcast_slots_end_at"})
@@ -0,0 +1,67 @@
+# why: 내보내기 스트림이 배치 단위로 나뉘어 나오고 afterId/날짜 범위로 이어받을 수 있는지 sqlite로 검증
+from datetime import date, datetime, timedelta
+import csv
+import io
+import json
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.models import BroadcastSlot, BroadcastStatus, Channel
+from app.services.export_service import ExportService
+
+
+# KST 2026-02-03 09:00
+START = datetime(2026, 2, 3, 0, 0, 0)
+
+
+def _service() -> ExportService:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    db = factory()
+    lotte = Channel(channel_code="lotte", channel_name="롯데홈쇼핑")
+    db.add(lotte)
+    db.flush()
+    for idx in range(5):
+        start_at = START + timedelta(days=idx)
+        db.add(
+            BroadcastSlot(
+                channel_id=lotte.id,
+                source_code="gmarket_schedule",
+                start_at=start_at,
+                end_at=start_at + timedelta(hours=1),
+                raw_title=f"상품 {idx}",
+                normalized_title=f"상품 {idx}",
+                status=BroadcastStatus.ENDED,
+                slot_hash=f"hash-{idx}",
+            )
+        )
+    db.commit()
+    db.close()
+    return ExportService(session_factory=factory)
+
+
+def test_ndjson_export_streams_batches_and_resumes_after_id():
+    service = _service()
+
+    chunks = list(service.stream_broadcasts("ndjson", None, None, None, batch_size=2))
+    assert len(chunks) == 3
+    rows = [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+    assert [row["id"] for row in rows] == [1, 2, 3, 4, 5]
+    assert rows[0]["channel_code"] == "lotte" and rows[0]["status"] == "ENDED"
+
+    resumed = b"".join(service.stream_broadcasts("ndjson", None, None, rows[2]["id"], batch_size=2))
+    assert [json.loads(line)["id"] for line in resumed.splitlines()] == [4, 5]
+
+
+def test_csv_export_filters_by_kst_date_range():
+    service = _service()
+
+    body = b"".join(
+        service.stream_broadcasts("csv", date(2026, 2, 4), date(2026, 2, 5), None, batch_size=10)
+    )
+    rows = list(csv.DictReader(io.StringIO(body.decode("utf-8"))))
+    assert [row["id"] for row in rows] == ["2", "3"]
+    assert rows[0]["start_at"] == "2026-02-04T00:00:00"
@@ -0,0 +1,56 @@
+# why: 튜플 행 + orjson 직렬화가 ORM + pydantic 경로와 같은 JSON을 만드는지 sqlite로 검증
+from datetime import datetime, timedelta
+import json
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.fast_json import rows_response
+from app.db.base import Base
+from app.models import BroadcastSlot, BroadcastStatus, Channel
+from app.schemas.broadcast import BroadcastOut
+from app.schemas.common import ApiResponse, ResponseMeta
+from app.services.broadcast_service import BROADCAST_COLUMNS, BroadcastService
+
+
+START = datetime(2026, 2, 3, 0, 30, 0, 123456)
+
+
+def test_fast_rows_match_pydantic_response():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    lotte = Channel(channel_code="lotte", channel_name="롯데홈쇼핑")
+    db.add(lotte)
+    db.flush()
+    for idx, status in enumerate(BroadcastStatus):
+        start_at = START + timedelta(hours=idx)
+        db.add(
+            BroadcastSlot(
+                channel_id=lotte.id,
+                source_code="gmarket_schedule",
+                start_at=start_at,
+                end_at=start_at + timedelta(hours=1),
+                raw_title=f"[특가] 한우 세트 {idx}",
+                normalized_title=f"한우 세트 {idx}",
+                category="식품" if idx else None,
+                sale_price=39900 if idx else None,
+                discount_rate=12.5 if idx else None,
+                status=status,
+                slot_hash=f"hash-{idx}",
+            )
+        )
+    db.commit()
+
+    service = BroadcastService()
+    args = (START.date(), "lotte", None, None, None)
+    meta = ResponseMeta(count=3, time_policy="UTC")
+    rows = service.list_broadcast_rows(db, *args)
+    slots = service.list_broadcasts(db, *args)
+
+    fast = json.loads(rows_response(BROADCAST_COLUMNS, rows, meta).body)
+    expected = ApiResponse[list[BroadcastOut]](
+        data=[BroadcastOut.model_validate(slot) for slot in slots], meta=meta
+    ).model_dump(mode="json")
+    assert len(rows) == 3
+    assert fast == expected
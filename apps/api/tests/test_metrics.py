@@ -0,0 +1,78 @@
+# why: 요청 지표가 라우트 템플릿 단위로 모이고, 스레드풀에서 실행된 쿼리도 요청당 DB 쿼리 수로 잡히는지 ASGI 수준에서 검증
+import asyncio
+
+from fastapi import FastAPI
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.core.metrics import MetricsMiddleware, cache_metric_lines, instrument_engine, registry
+from app.db.base import Base
+from app.models import Channel
+from app.repositories.channel_repo import ChannelCache
+
+
+def _call(app, path: str) -> int:
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [],
+        "root_path": "",
+    }
+    asyncio.run(app(scope, receive, send))
+    return messages[0]["status"]
+
+
+def test_records_route_template_and_db_queries_per_request():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics-test/{item_id}")
+    def item(item_id: int):
+        # 동기 엔드포인트는 스레드풀에서 실행된다
+        with engine.connect() as conn:
+            for _ in range(3):
+                conn.execute(text("SELECT 1"))
+        return {"id": item_id}
+
+    assert _call(app, "/metrics-test/1") == 200
+    assert _call(app, "/metrics-test/2") == 200
+    assert _call(app, "/metrics-test/missing/x") == 404
+
+    lines = registry.render()
+    labels = 'method="GET",route="/metrics-test/{item_id}"'
+    assert f'api_requests_total{{{labels},status="200"}} 2' in lines
+    assert f"api_request_db_queries_sum{{{labels}}} 6" in lines
+    assert f"api_request_duration_seconds_count{{{labels}}} 2" in lines
+    assert f'api_request_db_queries_bucket{{{labels},le="3"}} 2' in lines
+    assert not any("/metrics-test/1" in line for line in lines)
+
+
+def test_channel_cache_hits_and_misses():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    db.add(Channel(channel_code="lotte", channel_name="롯데홈쇼핑"))
+    db.commit()
+
+    cache = ChannelCache(ttl_sec=60)
+    cache.by_code(db, "lotte")
+    cache.by_code(db, "lotte")
+    cache.channels(db)
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    lines = cache_metric_lines({"channel": (cache.hits, cache.misses)})
+    assert 'api_cache_hits_total{cache="channel"} 2' in lines
+    assert 'api_cache_misses_total{cache="channel"} 1' in lines
@@ -0,0 +1,137 @@
+# why: 상품 상세가 여러 방송과 가격 이력을 시간순으로 묶어 반환하는지 sqlite로 검증
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.errors import AppError
+from app.models import (
+    BroadcastPriceHistory,
+    BroadcastPriceHistoryArchive,
+    BroadcastSlot,
+    BroadcastSlotArchive,
+    BroadcastStatus,
+    Channel,
+    Product,
+)
+from app.services.product_service import ProductService
+
+
+START = datetime(2026, 2, 3, 9, 0, 0)
+
+
+def _slot(channel: Channel, product: Product, start_at: datetime, sale_price: int) -> BroadcastSlot:
+    return BroadcastSlot(
+        channel=channel,
+        source_code="gmarket_schedule",
+        start_at=start_at,
+        end_at=start_at + timedelta(hours=1),
+        raw_title="다이슨 무선 청소기",
+        normalized_title="다이슨 무선 청소기",
+        status=BroadcastStatus.ENDED,
+        slot_hash=f"hash-{channel.channel_code}-{start_at.isoformat()}",
+        product_id=product.id,
+        sale_price=sale_price,
+    )
+
+
+def test_product_detail_lists_broadcasts_and_price_timeline(db_session):
+    db = db_session
+    product = Product(
+        product_key="gc:123",
+        goodscode="123",
+        normalized_title="다이슨 무선 청소기",
+        title_simhash="0" * 16,
+        simhash_band0=0,
+        simhash_band1=0,
+        simhash_band2=0,
+        simhash_band3=0,
+        first_seen_at=START,
+        last_seen_at=START + timedelta(days=1),
+        broadcast_count=2,
+    )
+    lotte = Channel(channel_code="lotte", channel_name="롯데홈쇼핑")
+    gs = Channel(channel_code="gs", channel_name="GS SHOP")
+    db.add_all([product, lotte, gs])
+    db.flush()
+    later = _slot(gs, product, START + timedelta(days=1), 649000)
+    earlier = _slot(lotte, product, START, 699000)
+    db.add_all([later, earlier])
+    db.flush()
+    db.add_all(
+        [
+            BroadcastPriceHistory(broadcast_slot_id=later.id, collected_at=START + timedelta(days=1), sale_price=649000),
+            BroadcastPriceHistory(broadcast_slot_id=earlier.id, collected_at=START, sale_price=699000),
+        ]
+    )
+    db.commit()
+
+    detail = ProductService().get_product(db, product.id)
+
+    assert [(item.channel_code, item.sale_price) for item in detail.broadcasts] == [
+        ("lotte", 699000),
+        ("gs", 649000),
+    ]
+    assert [(point.broadcast_slot_id, point.sale_price) for point in detail.price_history] == [
+        (earlier.id, 699000),
+        (later.id, 649000),
+    ]
+    with pytest.raises(AppError):
+        ProductService().get_product(db, product.id + 1)
+
+
+def test_product_detail_includes_archived_broadcasts(db_session):
+    db = db_session
+    product = Product(
+        product_key="gc:123",
+        goodscode="123",
+        normalized_title="다이슨 무선 청소기",
+        title_simhash="0" * 16,
+        simhash_band0=0,
+        simhash_band1=0,
+        simhash_band2=0,
+        simhash_band3=0,
+        first_seen_at=START - timedelta(days=200),
+        last_seen_at=START,
+        broadcast_count=2,
+    )
+    lotte = Channel(channel_code="lotte", channel_name="롯데홈쇼핑")
+    db.add_all([product, lotte])
+    db.flush()
+    live = _slot(lotte, product, START, 699000)
+    db.add(live)
+    db.flush()
+    # 보관 작업이 옮긴 예전 방송 (원본 id를 그대로 쓴다)
+    archived_at = START - timedelta(days=200)
+    db.add(
+        BroadcastSlotArchive(
+            id=live.id + 100,
+            channel_id=lotte.id,
+            source_code="gmarket_schedule",
+            start_at=archived_at,
+            end_at=archived_at + timedelta(hours=1),
+            raw_title="다이슨 무선 청소기",
+            normalized_title="다이슨 무선 청소기",
+            status=BroadcastStatus.ENDED,
+            slot_hash="hash-archived",
+            product_id=product.id,
+            sale_price=749000,
+            created_at=archived_at,
+            updated_at=archived_at,
+        )
+    )
+    db.add_all(
+        [
+            BroadcastPriceHistory(broadcast_slot_id=live.id, collected_at=START, sale_price=699000),
+            BroadcastPriceHistoryArchive(
+                id=1, broadcast_slot_id=live.id + 100, collected_at=archived_at, sale_price=749000
+            ),
+        ]
+    )
+    db.commit()
+
+    detail = ProductService().get_product(db, product.id)
+
+    # broadcast_count는 보관 후에도 줄지 않는 누적 편성 수라 목록 길이와 같다.
+    assert len(detail.broadcasts) == detail.broadcast_count == 2
+    assert [item.sale_price for item in detail.broadcasts] == [749000, 699000]
+    assert [point.broadcast_slot_id for point in detail.price_history] == [live.id + 100, live.id]
@@ -1,8 +1,16 @@
 # why: 모듈 역할과 책임을 명확히 하기 위한 진입 주석
 import argparse
 import logging
+from pathlib import Path
 
+from common.config import get_batch_settings
+from common.profiling import PROFILERS, profiled
+from common.run_report import reported
+from jobs.alert_evaluator import evaluate_alerts_job
+from jobs.archive_job import archive_job
+from jobs.drain_price_queue_job import drain_price_queue_job
 from jobs.fetch_schedule_job import fetch_schedule_job
+from jobs.reclassify_categories_job import reclassify_categories_job
 from jobs.send_alerts_job import send_alerts_job
 
 
@@ -14,26 +22,69 @@ def setup_logging():
     )
 
 
+def sync_live_streams():
+    # why: playwright 의존성을 사용하는 작업이므로 필요할 때만 import
+    from jobs.sync_live_streams_job import sync_live_streams_job
+
+    sync_live_streams_job()
+
+
+JOBS = {
+    "fetch_schedule": fetch_schedule_job,
+    "send_alerts": send_alerts_job,
+    "evaluate_alerts": evaluate_alerts_job,
+    "drain_price_queue": drain_price_queue_job,
+    "reclassify_categories": reclassify_categories_job,
+    "sync_live_streams": sync_live_streams,
+    "archive": archive_job,
+}
+
+
 def main():
     setup_logging()
 
     parser = argparse.ArgumentParser(description="BroadcastBoard Batch Runner")
     parser.add_argument(
         "job",
-        choices=["fetch_schedule", "send_alerts", "sync_live_streams"],
-        help="실행할 배치 작업 이름",
+        choices=[*JOBS, "daemon"],
+        help="실행할 배치 작업 이름 (daemon: 설정된 스케줄로 상주 실행)",
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=None,
+        help="편성표 수집 샤드 수 (2 이상이면 여러 워커가 채널을 나눠 수집)",
+    )
+    parser.add_argument("--worker-id", default=None, help="임대 소유자로 기록할 워커 ID")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="cprofile",
+        choices=PROFILERS,
+        default=None,
+        help="단발 실행을 프로파일링해 실행 리포트 디렉터리에 저장 (기본 cprofile)",
     )
     args = parser.parse_args()
+    if args.profile and args.job == "daemon":
+        parser.error("--profile은 단발 실행에서만 사용할 수 있습니다.")
+
+    settings = get_batch_settings()
+    if args.shards is not None:
+        settings.batch_shard_count = args.shards
+    if args.worker_id:
+        settings.batch_worker_id = args.worker_id
+
+    # why: 모든 실행이 단계별 지표를 run_report_<job>.json으로 남기도록 잡을 감싼다
+    jobs = {name: reported(name, job, settings) for name, job in JOBS.items()}
+
+    if args.job == "daemon":
+        from common.scheduler import run_daemon
 
-    if args.job == "fetch_schedule":
-        fetch_schedule_job()
-    elif args.job == "send_alerts":
-        send_alerts_job()
-    elif args.job == "sync_live_streams":
-        # why: playwright 의존성을 사용하는 작업이므로 필요할 때만 import
-        from jobs.sync_live_streams_job import sync_live_streams_job
+        run_daemon(settings, jobs)
+        return
 
-        sync_live_streams_job()
+    with profiled(args.profile, Path(settings.run_report_dir), args.job):
+        jobs[args.job]()
 
 
 if __name__ == "__main__":
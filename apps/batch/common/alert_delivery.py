@@ -0,0 +1,100 @@
+# why: 알림 발송 로그(alert_deliveries)로 중복 발송을 막고 실패 건을 재시도하기 위한 유틸
+from datetime import datetime, timedelta
+import hashlib
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from common.models import AlertDelivery, DeliveryStatus
+
+
+DeliveryKey = tuple[int, int, str]
+
+
+def destination_hash(destination_value: str) -> str:
+    """목적지 원문 대신 저장할 고정 길이 해시."""
+
+    return hashlib.sha256(destination_value.strip().encode("utf-8")).hexdigest()
+
+
+def load_deliveries(
+    db: Session, alert_ids: set[int], slot_ids: set[int]
+) -> dict[DeliveryKey, AlertDelivery]:
+    """후보 (알림, 슬롯) 조합의 발송 로그를 한 번에 조회."""
+
+    if not alert_ids or not slot_ids:
+        return {}
+
+    rows = db.execute(
+        select(AlertDelivery)
+        .where(AlertDelivery.alert_id.in_(alert_ids))
+        .where(AlertDelivery.broadcast_slot_id.in_(slot_ids))
+    ).scalars()
+    return {
+        (row.alert_id, row.broadcast_slot_id, row.destination_hash): row for row in rows
+    }
+
+
+def is_deliverable(
+    delivery: AlertDelivery | None, now: datetime, max_attempts: int
+) -> bool:
+    """발송 로그 기준으로 이번 실행에서 보내야 하는지 판단."""
+
+    if delivery is None:
+        return True
+    if delivery.status == DeliveryStatus.SENT:
+        return False
+    if delivery.attempts >= max_attempts:
+        return False
+    return delivery.next_retry_at is None or delivery.next_retry_at <= now
+
+
+def record_success(
+    db: Session,
+    deliveries: dict[DeliveryKey, AlertDelivery],
+    key: DeliveryKey,
+    now: datetime,
+) -> AlertDelivery:
+    delivery = _get_or_create(db, deliveries, key)
+    delivery.status = DeliveryStatus.SENT
+    delivery.attempts += 1
+    delivery.sent_at = now
+    delivery.next_retry_at = None
+    delivery.last_error = None
+    return delivery
+
+
+def record_failure(
+    db: Session,
+    deliveries: dict[DeliveryKey, AlertDelivery],
+    key: DeliveryKey,
+    now: datetime,
+    error: str,
+    retry_base_sec: int,
+) -> AlertDelivery:
+    delivery = _get_or_create(db, deliveries, key)
+    delivery.status = DeliveryStatus.FAILED
+    delivery.attempts += 1
+    delivery.last_error = error[:500]
+    # why: 웹훅 레이트리밋/일시 장애가 이어질 때 재시도 간격을 지수적으로 늘린다.
+    delay = retry_base_sec * (2 ** (delivery.attempts - 1))
+    delivery.next_retry_at = now + timedelta(seconds=delay)
+    return delivery
+
+
+def _get_or_create(
+    db: Session, deliveries: dict[DeliveryKey, AlertDelivery], key: DeliveryKey
+) -> AlertDelivery:
+    delivery = deliveries.get(key)
+    if delivery is None:
+        alert_id, slot_id, dest_hash = key
+        delivery = AlertDelivery(
+            alert_id=alert_id,
+            broadcast_slot_id=slot_id,
+            destination_hash=dest_hash,
+            status=DeliveryStatus.FAILED,
+            attempts=0,
+        )
+        db.add(delivery)
+        deliveries[key] = delivery
+    return delivery
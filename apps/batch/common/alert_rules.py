@@ -0,0 +1,113 @@
+# why: 알림 규칙을 채널/키워드 기준으로 미리 색인하고, 발송 시각을 타이머 휠로 관리하기 위한 모듈
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Iterable
+
+from common.models import Alert, DestinationType
+
+
+@dataclass(frozen=True)
+class AlertRule:
+    id: int
+    alert_name: str
+    channel_codes: tuple[str, ...]
+    keywords: tuple[str, ...]
+    notify_before_minutes: int
+    destination_type: DestinationType
+    # 암호문 그대로 보관하고 발송 직전에 복호화한다.
+    destination_value: str
+
+    @classmethod
+    def from_alert(cls, alert: Alert) -> "AlertRule":
+        return cls(
+            id=alert.id,
+            alert_name=alert.alert_name,
+            channel_codes=tuple(dict.fromkeys(alert.target_channel_codes or [])),
+            keywords=tuple(
+                dict.fromkeys(keyword.lower() for keyword in alert.keyword_list or [] if keyword)
+            ),
+            notify_before_minutes=alert.notify_before_minutes,
+            destination_type=alert.destination_type,
+            destination_value=alert.destination_value,
+        )
+
+
+class AlertRuleIndex:
+    """채널 코드 → 키워드 → 규칙 목록 색인.
+
+    - why: 새로 들어온 슬롯 하나를 모든 규칙과 비교하지 않고, 해당 채널의 키워드만 검사.
+    """
+
+    def __init__(self, rules: Iterable[AlertRule]) -> None:
+        self._by_channel: dict[str, dict[str, list[AlertRule]]] = {}
+        self.rule_count = 0
+        for rule in rules:
+            self.rule_count += 1
+            for code in rule.channel_codes:
+                keyword_map = self._by_channel.setdefault(code, {})
+                for keyword in rule.keywords:
+                    keyword_map.setdefault(keyword, []).append(rule)
+
+    def match(self, channel_code: str, title: str) -> list[AlertRule]:
+        keyword_map = self._by_channel.get(channel_code)
+        if not keyword_map:
+            return []
+
+        lowered = title.lower()
+        matched: dict[int, AlertRule] = {}
+        for keyword, rules in keyword_map.items():
+            if keyword in lowered:
+                for rule in rules:
+                    matched.setdefault(rule.id, rule)
+        return list(matched.values())
+
+
+class TimerWheel:
+    """해시드 타이머 휠.
+
+    - tick 단위 버킷에 항목을 넣고, 바퀴 수(rounds)로 먼 미래 항목을 구분한다.
+    - why: 수천 건의 예약 알림을 매번 정렬/스캔하지 않고 O(1)로 예약·만료 처리.
+    """
+
+    def __init__(self, start: datetime, tick: timedelta = timedelta(minutes=1), size: int = 512):
+        self.tick = tick
+        self.size = size
+        self._buckets: list[list[list[Any]]] = [[] for _ in range(size)]
+        self._cursor = 0
+        # 다음에 처리할 틱의 시작 시각
+        self._cursor_time = start
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def schedule(self, fire_at: datetime, item: Any) -> None:
+        ticks = max(0, math.ceil((fire_at - self._cursor_time) / self.tick))
+        bucket = (self._cursor + ticks) % self.size
+        rounds = ticks // self.size
+        self._buckets[bucket].append([rounds, fire_at, item])
+        self._count += 1
+
+    def advance(self, now: datetime) -> list[Any]:
+        """now 시각까지 지난 틱을 돌며 만료된 항목을 예약 시각 순으로 반환."""
+
+        due: list[tuple[datetime, Any]] = []
+        while self._cursor_time <= now:
+            bucket = self._buckets[self._cursor]
+            pending: list[list[Any]] = []
+            for entry in bucket:
+                if entry[0] <= 0:
+                    due.append((entry[1], entry[2]))
+                else:
+                    entry[0] -= 1
+                    pending.append(entry)
+            self._buckets[self._cursor] = pending
+            self._cursor = (self._cursor + 1) % self.size
+            self._cursor_time += self.tick
+
+        self._count -= len(due)
+        due.sort(key=lambda pair: pair[0])
+        return [item for _, item in due]
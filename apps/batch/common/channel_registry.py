@@ -0,0 +1,109 @@
+# why: 채널을 한 번에 읽어 코드별로 들고 있다가, 바뀐 채널만 한 트랜잭션으로 저장하기 위한 레지스트리
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from common.models import Channel
+
+
+logger = logging.getLogger("batch.channels")
+
+
+@dataclass(frozen=True)
+class ChannelSpec:
+    """수집 소스에서 확인한 채널 정보 (None인 URL은 기존 값을 유지)."""
+
+    code: str
+    name: str
+    logo_url: str | None = None
+    live_url: str | None = None
+    stream_url: str | None = None
+
+
+class ChannelRegistry:
+    """채널 코드 → Channel 사전.
+
+    - 생성 시 channels 전체를 한 번 읽고, 이후 조회는 메모리에서 처리한다.
+    - 동기화는 메모리에서 URL 변경 여부를 비교해 새 채널/바뀐 채널만 모아 한 번 커밋한다.
+    """
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+        self._by_code: dict[str, Channel] = {
+            channel.channel_code: channel for channel in db.execute(select(Channel)).scalars()
+        }
+
+    def get(self, channel_code: str) -> Channel | None:
+        return self._by_code.get(channel_code)
+
+    def channels(self) -> list[Channel]:
+        return list(self._by_code.values())
+
+    def code_by_name(self) -> dict[str, str]:
+        return {
+            channel.channel_name: code
+            for code, channel in self._by_code.items()
+            if channel.channel_name
+        }
+
+    def sync(self, specs: Iterable[ChannelSpec]) -> dict[str, Channel]:
+        """채널이 없으면 만들고 URL이 바뀐 채널만 갱신.
+
+        - return: 코드 → Channel (id가 채워진 상태)
+        """
+
+        created = 0
+        changed = 0
+        result: dict[str, Channel] = {}
+        for spec in specs:
+            channel = self._by_code.get(spec.code)
+            if channel is None:
+                channel = Channel(
+                    channel_code=spec.code,
+                    channel_name=spec.name,
+                    channel_logo_url=spec.logo_url,
+                    channel_live_url=spec.live_url,
+                    channel_stream_url=spec.stream_url,
+                )
+                self.db.add(channel)
+                self._by_code[spec.code] = channel
+                created += 1
+            elif self._apply(channel, spec):
+                changed += 1
+            result[spec.code] = channel
+
+        if created or changed:
+            self.db.commit()
+            logger.info("채널 동기화. created=%s updated=%s", created, changed)
+        return result
+
+    def update_stream_urls(self, stream_urls: dict[str, str]) -> int:
+        """코드 → 스트림 URL을 반영하고 바뀐 채널 수를 반환 (알 수 없는 코드는 무시)."""
+
+        changed = 0
+        for channel_code, stream_url in stream_urls.items():
+            channel = self._by_code.get(channel_code)
+            if channel is not None and channel.channel_stream_url != stream_url:
+                channel.channel_stream_url = stream_url
+                changed += 1
+        if changed:
+            self.db.commit()
+        return changed
+
+    @staticmethod
+    def _apply(channel: Channel, spec: ChannelSpec) -> bool:
+        changed = False
+        for attr, value in (
+            ("channel_live_url", spec.live_url),
+            ("channel_stream_url", spec.stream_url),
+            ("channel_logo_url", spec.logo_url),
+        ):
+            if value and getattr(channel, attr) != value:
+                setattr(channel, attr, value)
+                changed = True
+        return changed
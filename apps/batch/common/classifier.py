@@ -0,0 +1,181 @@
+# why: 카테고리 룰을 코드 대신 파일(가중치 키워드/두 단어 구문)로 관리하고, 상품명을 한 번만 훑어 분류하기 위한 분류기
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import re
+import threading
+
+from common.config import BatchSettings
+from common.normalize import CATEGORY_RULES
+
+
+logger = logging.getLogger("batch.classifier")
+
+DEFAULT_CATEGORY = "기타"
+
+# 분류 방식: first = 선언 순서상 먼저 매칭된 카테고리(infer_category와 같음), score = 가중치 합 최대
+CLASSIFY_MODES = ("first", "score")
+
+
+@dataclass(frozen=True)
+class CategoryRule:
+    category: str
+    # 한 단어 키워드 또는 공백으로 구분한 두 단어 구문(예: "무선 청소기")
+    keyword: str
+    weight: float = 1.0
+
+
+class CategoryClassifier:
+    """룰 기반 카테고리 분류기.
+
+    - mode="score": 시작 시 키워드 → (카테고리, 가중치) 색인과 전체 키워드 정규식(긴 키워드 우선)을 한 번 만든다.
+      분류는 정규화된 상품명을 한 번 스캔하며 매칭된 키워드의 가중치를 카테고리별로 합산하고,
+      최고 점수 카테고리를 고른다(동점이면 룰 파일에 먼저 나온 카테고리).
+      긴 키워드를 먼저 매칭하므로 "청소기"는 "청소"(리빙)보다 가전으로 잡힌다.
+    - mode="first": 선언 순서대로 키워드가 하나라도 들어 있는 첫 카테고리를 고른다.
+      infer_category와 같은 결과를 내도록 키워드는 선언한 그대로 찾는다(가중치/min_score는 쓰지 않음).
+    """
+
+    def __init__(
+        self,
+        rules: list[CategoryRule],
+        default: str = DEFAULT_CATEGORY,
+        min_score: float = 0.0,
+        mode: str = "score",
+    ) -> None:
+        if mode not in CLASSIFY_MODES:
+            raise ValueError(f"알 수 없는 분류 방식: {mode}")
+        self.rules = rules
+        self.default = default
+        self.min_score = min_score
+        self.mode = mode
+        self.categories: list[str] = []
+        self._index: dict[str, list[tuple[int, float]]] = {}
+
+        positions: dict[str, int] = {}
+        for rule in rules:
+            keyword = _normalize_keyword(rule.keyword)
+            if not keyword:
+                continue
+            position = positions.get(rule.category)
+            if position is None:
+                position = positions[rule.category] = len(self.categories)
+                self.categories.append(rule.category)
+            self._index.setdefault(keyword, []).append((position, rule.weight))
+
+        keywords = sorted(self._index, key=len, reverse=True)
+        self._pattern = re.compile("|".join(map(re.escape, keywords))) if keywords else None
+
+        declared: dict[str, list[str]] = {}
+        for rule in rules:
+            if rule.keyword:
+                declared.setdefault(rule.category, []).append(rule.keyword)
+        self._ordered = [
+            (category, re.compile("|".join(map(re.escape, category_keywords))))
+            for category, category_keywords in declared.items()
+        ]
+
+        self.fingerprint = hashlib.sha1(
+            json.dumps(
+                [default, min_score, mode, [asdict(rule) for rule in rules]], ensure_ascii=False
+            ).encode("utf-8")
+        ).hexdigest()[:12]
+
+    @classmethod
+    def from_category_rules(cls, rules: dict[str, list[str]] = CATEGORY_RULES) -> CategoryClassifier:
+        """코드에 있는 CATEGORY_RULES로 만든 기본 분류기 (infer_category와 같은 선언 순서 우선)."""
+
+        return cls(
+            [
+                CategoryRule(category=category, keyword=keyword)
+                for category, keywords in rules.items()
+                for keyword in keywords
+            ],
+            mode="first",
+        )
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> CategoryClassifier:
+        """JSON 룰 파일 로드.
+
+        - 형식: {"mode": "score", "default": "기타", "min_score": 0,
+                 "rules": [{"category": "가전", "keyword": "청소기", "weight": 2}]}
+        - mode를 생략하면 score(가중치 합)로 분류한다.
+        """
+
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(
+            [CategoryRule(**entry) for entry in payload["rules"]],
+            default=payload.get("default", DEFAULT_CATEGORY),
+            min_score=payload.get("min_score", 0.0),
+            mode=payload.get("mode", "score"),
+        )
+
+    def classify(self, normalized_title: str) -> str:
+        if self.mode == "first":
+            for category, pattern in self._ordered:
+                if pattern.search(normalized_title):
+                    return category
+            return self.default
+
+        if self._pattern is None or not normalized_title:
+            return self.default
+
+        scores = [0.0] * len(self.categories)
+        for match in self._pattern.finditer(normalized_title):
+            for position, weight in self._index[match.group()]:
+                scores[position] += weight
+
+        best = max(range(len(scores)), key=scores.__getitem__)
+        if scores[best] <= self.min_score:
+            return self.default
+        return self.categories[best]
+
+
+def _normalize_keyword(keyword: str) -> str:
+    # 상품명은 소문자/단일 공백으로 정규화되어 있으므로 키워드도 같은 형태로 맞춘다.
+    return " ".join(keyword.lower().split())
+
+
+_classifier: CategoryClassifier | None = None
+_classifier_key: tuple[str | None, float] | None = None
+_classifier_lock = threading.Lock()
+
+
+def get_classifier(settings: BatchSettings) -> CategoryClassifier:
+    """프로세스 단위 공유 분류기.
+
+    - 룰 파일이 바뀌면(수정 시각 기준) 다시 로드해 상주 실행도 재시작 없이 새 룰을 쓴다.
+    - 파일이 없거나 읽지 못하면 CATEGORY_RULES 기본 룰(infer_category와 같은 결과)을 사용한다.
+    """
+
+    global _classifier, _classifier_key
+    path = settings.category_rules_path
+    expanded = os.path.expanduser(path) if path else None
+    mtime = os.path.getmtime(expanded) if expanded and os.path.exists(expanded) else 0.0
+    key = (expanded, mtime)
+
+    with _classifier_lock:
+        if _classifier is not None and _classifier_key == key:
+            return _classifier
+
+        classifier = None
+        if mtime:
+            try:
+                classifier = CategoryClassifier.from_file(expanded)
+            except (OSError, ValueError, KeyError, TypeError):
+                logger.exception("카테고리 룰 파일을 읽지 못해 기본 룰을 사용합니다: %s", expanded)
+        if classifier is None:
+            classifier = CategoryClassifier.from_category_rules()
+
+        logger.info(
+            "카테고리 분류기 로드. rules=%s version=%s", len(classifier.rules), classifier.fingerprint
+        )
+        _classifier = classifier
+        _classifier_key = key
+        return classifier
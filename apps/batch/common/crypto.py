@@ -1,21 +1,57 @@
 # why: 알림 목적지 값을 DB에서 읽을 때 복호화하기 위한 유틸
+from functools import lru_cache
+
 from cryptography.fernet import Fernet, InvalidToken
 
 from common.config import get_batch_settings
 
 
-def _get_fernet() -> Fernet:
+# 복호화 결과 캐시 크기 (암호문 → 평문). 알림 규칙 수보다 넉넉하면 충분하다.
+DECRYPT_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=4)
+def _fernet_for_key(key: str) -> Fernet:
+    # why: 매분 실행되는 알림 잡에서 키 파싱을 반복하지 않도록 키별로 캐시
+    return Fernet(key.encode("utf-8"))
+
+
+def _get_encryption_key() -> str:
     settings = get_batch_settings()
     if not settings.encryption_key:
         raise ValueError("ENCRYPTION_KEY가 설정되지 않았습니다.")
-    return Fernet(settings.encryption_key.encode("utf-8"))
+    return settings.encryption_key
+
+
+@lru_cache(maxsize=DECRYPT_CACHE_SIZE)
+def _decrypt_cached(key: str, value: str) -> str:
+    # why: 같은 암호문은 항상 같은 평문이므로 HMAC 검증/복호화를 반복하지 않는다.
+    return _fernet_for_key(key).decrypt(value.encode("utf-8")).decode("utf-8")
 
 
 def decrypt_value(value: str) -> str:
     if value is None:
         return value
-    fernet = _get_fernet()
-    return fernet.decrypt(value.encode("utf-8")).decode("utf-8")
+    return _decrypt_cached(_get_encryption_key(), value)
+
+
+def decrypt_values(values: list[str | None]) -> list[str | None]:
+    """여러 값을 한 번에 복호화.
+
+    - 키는 한 번만 확인하고, 평문으로 저장된 기존 값(InvalidToken)은 그대로 돌려준다.
+    """
+
+    key = _get_encryption_key()
+    results: list[str | None] = []
+    for value in values:
+        if value is None:
+            results.append(value)
+            continue
+        try:
+            results.append(_decrypt_cached(key, value))
+        except InvalidToken:
+            results.append(value)
+    return results
 
 
 def is_invalid_token(exc: Exception) -> bool:
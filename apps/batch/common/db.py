@@ -7,11 +7,23 @@ from common.config import get_batch_settings
 
 settings = get_batch_settings()
 
-engine = create_engine(
-    settings.database_url,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-)
+
+def _engine_options() -> dict:
+    if settings.database_url.startswith("sqlite"):
+        return {}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_sec,
+        # MySQL wait_timeout보다 먼저 커넥션을 교체하고, 체크아웃마다 보내는 SELECT 1(pre-ping)은 기본으로 끈다.
+        # 끊김은 쿼리 오류 시점에 SQLAlchemy가 감지해 기존 커넥션을 모두 무효화한다.
+        "pool_recycle": settings.db_pool_recycle_sec,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_use_lifo": True,
+    }
+
+
+engine = create_engine(settings.database_url, **_engine_options())
 
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
@@ -2,16 +2,13 @@
 import smtplib
 from email.message import EmailMessage
 
-from common.config import get_batch_settings
+from common.config import BatchSettings, get_batch_settings
 
 
-def send_email_message(to_address: str, subject: str, body: str) -> None:
-    """SMTP로 이메일 발송.
-
-    - why: MVP에서 외부 이메일 서비스에 의존하지 않고도 동작하도록 기본 SMTP 지원
-    """
-
-    settings = get_batch_settings()
+def build_email_message(
+    settings: BatchSettings, to_address: str, subject: str, body: str
+) -> EmailMessage:
+    """SMTP 설정을 검증하고 발송용 메시지를 만든다."""
 
     if not settings.smtp_host:
         raise ValueError("SMTP_HOST가 설정되지 않았습니다.")
@@ -25,6 +22,20 @@ def send_email_message(to_address: str, subject: str, body: str) -> None:
     message["From"] = f"{settings.smtp_from_name} <{from_email}>"
     message["To"] = to_address
     message.set_content(body)
+    return message
+
+
+def send_email_message(
+    to_address: str, subject: str, body: str, settings: BatchSettings | None = None
+) -> None:
+    """SMTP로 이메일 발송.
+
+    - why: MVP에서 외부 이메일 서비스에 의존하지 않고도 동작하도록 기본 SMTP 지원
+    - 여러 건을 보낼 때는 세션을 재사용하는 `common.notify.NotificationDispatcher`를 사용.
+    """
+
+    settings = settings or get_batch_settings()
+    message = build_email_message(settings, to_address, subject, body)
 
     if settings.smtp_use_ssl:
         with smtplib.SMTP_SSL(settings.smtp_host, settings.smtp_port) as server:
@@ -0,0 +1,31 @@
+# why: 배치 전체에서 HTTP 연결 풀(keep-alive)을 재사용하기 위한 공유 클라이언트
+import threading
+
+import httpx
+
+
+_client: httpx.Client | None = None
+_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """프로세스 공용 동기 HTTP 클라이언트.
+
+    - why: 요청마다 Client를 만들면 TCP/TLS 연결을 매번 새로 맺는다.
+      상주 실행에서는 잡 실행 간에도 연결 풀이 유지된다.
+    - 타임아웃/헤더는 요청 단위로 지정한다.
+    """
+
+    global _client
+    with _lock:
+        if _client is None or _client.is_closed:
+            _client = httpx.Client(timeout=10.0)
+        return _client
+
+
+def close_http_client() -> None:
+    global _client
+    with _lock:
+        if _client is not None:
+            _client.close()
+            _client = None
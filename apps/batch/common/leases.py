@@ -0,0 +1,291 @@
+# why: 여러 배치 워커가 같은 잡을 중복 실행하지 않고, 샤드 단위로 수집을 나눠 가지도록 하는 임대(lease) 유틸
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+import functools
+import hashlib
+import logging
+import os
+import socket
+import threading
+import uuid
+from typing import Callable, Iterator, Sequence, TypeVar
+
+from sqlalchemy import delete, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from common.models import JobLease
+
+
+logger = logging.getLogger("batch.leases")
+
+T = TypeVar("T")
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def run_owner(worker_id: str) -> str:
+    """잡 실행 한 번을 구분하는 임대 소유자 (worker_id:난수).
+
+    - why: 상주 실행에서는 여러 잡이 같은 프로세스(같은 worker_id)의 스레드로 돌기 때문에,
+      worker_id만 쓰면 같은 이름의 임대를 두 잡이 함께 잡고 먼저 끝난 쪽이 상대 임대까지 반납한다.
+    - 샤드 임대는 작업 훔치기 순서를 정하는 데 worker_id를 그대로 쓴다.
+    """
+
+    # owner 컬럼이 100자라 긴 호스트 이름은 잘라서 난수 자리를 남긴다.
+    return f"{worker_id[:80]}:{uuid.uuid4().hex[:16]}"
+
+
+def acquire_lease(db: Session, name: str, owner: str, ttl_sec: int, now: datetime | None = None) -> bool:
+    """임대 획득 시도.
+
+    - 만료된 임대(죽은 워커)는 가져오고, 자기 임대는 연장한다. 완료 표시된 임대는 가져오지 않는다.
+    - 두 워커가 동시에 INSERT하면 PK 충돌로 한쪽만 성공한다.
+    """
+
+    now = now or datetime.utcnow()
+    expires_at = now + timedelta(seconds=ttl_sec)
+    result = db.execute(
+        update(JobLease)
+        .where(JobLease.name == name)
+        .where(JobLease.completed_at.is_(None))
+        .where(or_(JobLease.expires_at < now, JobLease.owner == owner))
+        .values(owner=owner, acquired_at=now, expires_at=expires_at)
+    )
+    if result.rowcount:
+        db.commit()
+        return True
+
+    try:
+        db.add(JobLease(name=name, owner=owner, acquired_at=now, expires_at=expires_at))
+        db.commit()
+        return True
+    except IntegrityError:
+        db.rollback()
+        return False
+
+
+def renew_lease(db: Session, name: str, owner: str, ttl_sec: int) -> bool:
+    """보유 중인 임대 만료 시각을 연장. 이미 다른 워커가 가져갔으면 False."""
+
+    result = db.execute(
+        update(JobLease)
+        .where(JobLease.name == name, JobLease.owner == owner)
+        .values(expires_at=datetime.utcnow() + timedelta(seconds=ttl_sec))
+    )
+    db.commit()
+    return bool(result.rowcount)
+
+
+def release_lease(db: Session, name: str, owner: str, completed: bool = False) -> None:
+    """임대 반납.
+
+    - completed=True면 완료로 표시해 같은 주기에 다시 실행되지 않게 하고,
+      아니면 즉시 만료시켜 다른 워커가 바로 가져갈 수 있게 한다.
+    """
+
+    now = datetime.utcnow()
+    values = {"expires_at": now}
+    if completed:
+        values["completed_at"] = now
+    db.execute(update(JobLease).where(JobLease.name == name, JobLease.owner == owner).values(**values))
+    db.commit()
+
+
+def purge_stale_leases(db: Session, older_than: timedelta = timedelta(days=1)) -> int:
+    """지난 수집 주기의 샤드 임대 정리."""
+
+    result = db.execute(delete(JobLease).where(JobLease.expires_at < datetime.utcnow() - older_than))
+    db.commit()
+    return result.rowcount or 0
+
+
+class LeaseKeeper:
+    """임대를 잡고 있는 동안 백그라운드 스레드로 주기적으로 연장.
+
+    - why: 수집이 TTL보다 길어져도 다른 워커가 임대를 가져가지 않도록 한다.
+      워커가 죽으면 연장이 멈추고 TTL 뒤 다른 워커가 이어받는다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        name: str,
+        owner: str,
+        ttl_sec: int,
+    ) -> None:
+        self.session_factory = session_factory
+        self.name = name
+        self.owner = owner
+        self.ttl_sec = ttl_sec
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name=f"lease-{self.name}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        interval = max(1.0, self.ttl_sec / 3)
+        while not self._stop.wait(interval):
+            db = self.session_factory()
+            try:
+                if not renew_lease(db, self.name, self.owner, self.ttl_sec):
+                    self.lost = True
+                    logger.warning("임대를 잃었습니다. name=%s owner=%s", self.name, self.owner)
+                    return
+            except Exception:
+                logger.exception("임대 연장 실패. name=%s", self.name)
+            finally:
+                db.close()
+
+
+@contextmanager
+def job_lease(
+    session_factory: Callable[[], Session],
+    name: str,
+    owner: str,
+    ttl_sec: int,
+) -> Iterator[bool]:
+    """임대를 잡은 동안만 블록을 실행하도록 하는 컨텍스트.
+
+    - yield 값이 False면 다른 워커(또는 같은 프로세스의 다른 잡)가 실행 중이므로 호출 측이 건너뛴다.
+    - owner(worker_id)에 실행마다 난수를 붙여 임대를 잡으므로 같은 프로세스의 실행끼리도 배타적이다.
+    - 블록 동안 별도 세션으로 임대를 연장하고, 끝나면 반납한다.
+    """
+
+    owner = run_owner(owner)
+    db = session_factory()
+    try:
+        acquired = acquire_lease(db, name, owner, ttl_sec)
+        if not acquired:
+            yield False
+            return
+
+        keeper = LeaseKeeper(session_factory, name, owner, ttl_sec)
+        keeper.start()
+        try:
+            yield True
+        finally:
+            keeper.stop()
+            release_lease(db, name, owner)
+    finally:
+        db.close()
+
+
+def exclusive_job(name: str) -> Callable[[Callable[..., T]], Callable[..., T | None]]:
+    """잡 함수를 `job:<name>` 임대 안에서만 실행하도록 감싸는 데코레이터.
+
+    - why: 여러 머신에서 같은 잡을 띄워도 한 워커만 실행하고 나머지는 건너뛴다.
+    """
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T | None]:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # why: DB 엔진은 실행 시점에만 만들도록 지연 import
+            from common.config import get_batch_settings
+            from common.db import get_db_session
+
+            settings = get_batch_settings()
+            owner = settings.batch_worker_id or default_worker_id()
+            with job_lease(get_db_session, f"job:{name}", owner, settings.batch_lease_ttl_sec) as acquired:
+                if not acquired:
+                    logger.info("다른 워커가 실행 중이라 건너뜁니다. job=%s", name)
+                    return None
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def shard_of(key: str, shard_count: int) -> int:
+    """키를 샤드 번호로 매핑.
+
+    - why: 내장 hash()는 프로세스마다 달라지므로 워커 간에 같은 결과가 나오는 sha1을 사용.
+    """
+
+    digest = hashlib.sha1(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % shard_count
+
+
+def partition(items: Sequence[T], key: Callable[[T], str], shard_count: int) -> list[list[T]]:
+    shards: list[list[T]] = [[] for _ in range(shard_count)]
+    for item in items:
+        shards[shard_of(key(item), shard_count)].append(item)
+    return shards
+
+
+def shard_claim_order(worker_id: str, shard_count: int) -> list[int]:
+    """워커가 샤드를 시도할 순서.
+
+    - 자기 샤드부터 시작해 한 바퀴 돌며, 비어 있거나 만료된 샤드를 가져간다(work stealing).
+    """
+
+    start = shard_of(worker_id, shard_count)
+    return [(start + offset) % shard_count for offset in range(shard_count)]
+
+
+def cycle_key(now: datetime, cycle_minutes: int) -> str:
+    """같은 수집 주기의 워커들이 같은 샤드 임대 이름을 쓰도록 시각을 주기 단위로 내림."""
+
+    # naive UTC 기준으로 계산해 워커의 로컬 시간대와 무관하게 같은 값을 얻는다.
+    epoch_minutes = int((now - datetime(1970, 1, 1)).total_seconds() // 60)
+    return str(epoch_minutes - epoch_minutes % max(1, cycle_minutes))
+
+
+def claim_shards(
+    session_factory: Callable[[], Session],
+    job_name: str,
+    worker_id: str,
+    shard_count: int,
+    ttl_sec: int,
+    cycle_minutes: int,
+    now: datetime | None = None,
+) -> Iterator[int]:
+    """이번 주기에 처리할 샤드 번호를 하나씩 임대해 yield.
+
+    - 호출 측이 샤드 처리를 마치고 다음 값을 요청하면 완료로 표시하고,
+      처리 중 예외가 나거나 순회를 중단하면 임대를 즉시 만료시켜 다른 워커가 재시도하게 한다.
+    """
+
+    cycle = cycle_key(now or datetime.utcnow(), cycle_minutes)
+    db = session_factory()
+    try:
+        purge_stale_leases(db)
+    except Exception:
+        db.rollback()
+        logger.exception("지난 임대 정리 실패")
+    finally:
+        db.close()
+
+    for shard in shard_claim_order(worker_id, shard_count):
+        name = f"{job_name}:{cycle}:shard:{shard}"
+        db = session_factory()
+        try:
+            if not acquire_lease(db, name, worker_id, ttl_sec):
+                continue
+
+            keeper = LeaseKeeper(session_factory, name, worker_id, ttl_sec)
+            keeper.start()
+            completed = False
+            try:
+                yield shard
+                completed = True
+            finally:
+                keeper.stop()
+                release_lease(db, name, worker_id, completed=completed)
+        finally:
+            db.close()
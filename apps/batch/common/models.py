@@ -1,7 +1,7 @@
 # why: 모듈 역할과 책임을 명확히 하기 위한 진입 주석
 import enum
 from datetime import datetime
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, String, Text
+from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, String, Text, UniqueConstraint, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.types import JSON
 
@@ -21,6 +21,17 @@ class DestinationType(str, enum.Enum):
     EMAIL = "EMAIL"
 
 
+class DeliveryStatus(str, enum.Enum):
+    SENT = "SENT"
+    FAILED = "FAILED"
+
+
+class PriceFetchStatus(str, enum.Enum):
+    PENDING = "PENDING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+
+
 class Channel(Base):
     __tablename__ = "channels"
 
@@ -36,7 +47,7 @@ class BroadcastSlot(Base):
     __tablename__ = "broadcast_slots"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    channel_id: Mapped[int] = mapped_column(ForeignKey("channels.id"), index=True)
+    channel_id: Mapped[int] = mapped_column(ForeignKey("channels.id"))
     source_code: Mapped[str] = mapped_column(String(100))
     start_at: Mapped[datetime] = mapped_column(DateTime)
     end_at: Mapped[datetime] = mapped_column(DateTime)
@@ -55,6 +66,12 @@ class BroadcastSlot(Base):
         Enum(BroadcastStatus, name="broadcast_status")
     )
     slot_hash: Mapped[str] = mapped_column(String(64), unique=True, index=True)
+    product_id: Mapped[int | None] = mapped_column(
+        ForeignKey("products.id"), nullable=True, index=True
+    )
+    # 보관 테이블로 그대로 옮기기 위해 매핑 (값은 DB 기본값으로 채워진다)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
 
 class Alert(Base):
@@ -77,8 +94,127 @@ class BroadcastPriceHistory(Base):
     __tablename__ = "broadcast_price_history"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    broadcast_slot_id: Mapped[int] = mapped_column(ForeignKey("broadcast_slots.id"), index=True)
+    broadcast_slot_id: Mapped[int] = mapped_column(ForeignKey("broadcast_slots.id"))
     collected_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     sale_price: Mapped[int | None] = mapped_column(nullable=True)
     original_price: Mapped[int | None] = mapped_column(nullable=True)
     discount_rate: Mapped[float | None] = mapped_column(nullable=True)
+
+
+class BroadcastSlotArchive(Base):
+    """보관 작업이 옮긴 방송 슬롯 (원본 id 유지, FK/유니크 없음)."""
+
+    __tablename__ = "broadcast_slots_archive"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    channel_id: Mapped[int] = mapped_column()
+    source_code: Mapped[str] = mapped_column(String(100))
+    start_at: Mapped[datetime] = mapped_column(DateTime)
+    end_at: Mapped[datetime] = mapped_column(DateTime)
+    raw_title: Mapped[str] = mapped_column(Text)
+    normalized_title: Mapped[str] = mapped_column(String(255))
+    category: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    product_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    live_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    sale_price: Mapped[int | None] = mapped_column(nullable=True)
+    original_price: Mapped[int | None] = mapped_column(nullable=True)
+    discount_rate: Mapped[float | None] = mapped_column(nullable=True)
+    price_text: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    image_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    status: Mapped[BroadcastStatus] = mapped_column(
+        Enum(BroadcastStatus, name="broadcast_status")
+    )
+    slot_hash: Mapped[str] = mapped_column(String(64))
+    product_id: Mapped[int | None] = mapped_column(nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    archived_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+
+
+class BroadcastPriceHistoryArchive(Base):
+    __tablename__ = "broadcast_price_history_archive"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    broadcast_slot_id: Mapped[int] = mapped_column(index=True)
+    collected_at: Mapped[datetime] = mapped_column(DateTime)
+    sale_price: Mapped[int | None] = mapped_column(nullable=True)
+    original_price: Mapped[int | None] = mapped_column(nullable=True)
+    discount_rate: Mapped[float | None] = mapped_column(nullable=True)
+
+
+class AlertDelivery(Base):
+    __tablename__ = "alert_deliveries"
+    __table_args__ = (
+        UniqueConstraint(
+            "alert_id", "broadcast_slot_id", "destination_hash", name="uq_alert_deliveries_key"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    alert_id: Mapped[int] = mapped_column(ForeignKey("alerts.id", ondelete="CASCADE"))
+    broadcast_slot_id: Mapped[int] = mapped_column(
+        ForeignKey("broadcast_slots.id", ondelete="CASCADE"), index=True
+    )
+    destination_hash: Mapped[str] = mapped_column(String(64))
+    status: Mapped[DeliveryStatus] = mapped_column(Enum(DeliveryStatus, name="delivery_status"))
+    attempts: Mapped[int] = mapped_column(default=0)
+    last_error: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    next_retry_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+
+class JobLease(Base):
+    __tablename__ = "job_leases"
+
+    name: Mapped[str] = mapped_column(String(191), primary_key=True)
+    owner: Mapped[str] = mapped_column(String(100))
+    acquired_at: Mapped[datetime] = mapped_column(DateTime)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, index=True)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+
+class PriceFetchTask(Base):
+    __tablename__ = "price_fetch_queue"
+    __table_args__ = (UniqueConstraint("url_hash", name="uq_price_fetch_queue_url_hash"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    url_hash: Mapped[str] = mapped_column(String(64))
+    url: Mapped[str] = mapped_column(String(1000))
+    goodscode: Mapped[str | None] = mapped_column(String(30), nullable=True)
+    priority_at: Mapped[datetime] = mapped_column(DateTime, index=True)
+    air_end_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    status: Mapped[PriceFetchStatus] = mapped_column(
+        Enum(PriceFetchStatus, name="price_fetch_status"), index=True
+    )
+    attempts: Mapped[int] = mapped_column(default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime)
+    last_error: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    locked_by: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    original_price: Mapped[int | None] = mapped_column(nullable=True)
+    sale_price: Mapped[int | None] = mapped_column(nullable=True)
+    fetched_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    fetch_cost: Mapped[float] = mapped_column(default=1.0)
+
+
+class Product(Base):
+    __tablename__ = "products"
+    __table_args__ = (UniqueConstraint("product_key", name="uq_products_product_key"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    product_key: Mapped[str] = mapped_column(String(80))
+    goodscode: Mapped[str | None] = mapped_column(String(30), nullable=True, index=True)
+    normalized_title: Mapped[str] = mapped_column(String(255))
+    category: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    title_simhash: Mapped[str] = mapped_column(String(16))
+    simhash_band0: Mapped[int] = mapped_column(index=True)
+    simhash_band1: Mapped[int] = mapped_column(index=True)
+    simhash_band2: Mapped[int] = mapped_column(index=True)
+    simhash_band3: Mapped[int] = mapped_column(index=True)
+    sale_price: Mapped[int | None] = mapped_column(nullable=True)
+    original_price: Mapped[int | None] = mapped_column(nullable=True)
+    discount_rate: Mapped[float | None] = mapped_column(nullable=True)
+    price_updated_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    first_seen_at: Mapped[datetime] = mapped_column(DateTime)
+    last_seen_at: Mapped[datetime] = mapped_column(DateTime)
+    broadcast_count: Mapped[int] = mapped_column(default=0)
@@ -1,7 +1,9 @@
 # why: 모듈 역할과 책임을 명확히 하기 위한 진입 주석
+from dataclasses import dataclass
 import hashlib
 import re
 from datetime import datetime
+from typing import Callable
 
 
 UNWANTED_KEYWORDS = [
@@ -114,6 +116,36 @@ CATEGORY_RULES: dict[str, list[str]] = {
 }
 
 
+_UNWANTED_PATTERN = re.compile("|".join(map(re.escape, UNWANTED_KEYWORDS)))
+# 특수문자/공백 묶음: 특수문자를 공백으로 바꾼 뒤 연속 공백을 줄이는 두 단계를 한 번에 처리
+_NON_WORD_RUN = re.compile(r"[^0-9A-Za-z가-힣]+")
+_PRICE_TEXT = re.compile(r"\d[\d,]*(?:\\.\\d+)?")
+_PRICE_NUMBERS = re.compile(r"\d[\d,]*")
+
+
+def _compile_category_rules(
+    rules: dict[str, list[str]]
+) -> list[tuple[str, re.Pattern[str]]]:
+    # 카테고리 순서(우선순위)를 유지한 채 키워드 목록을 하나의 정규식으로 컴파일
+    return [
+        (category, re.compile("|".join(map(re.escape, keywords))))
+        for category, keywords in rules.items()
+        if keywords
+    ]
+
+
+_CATEGORY_PATTERNS = _compile_category_rules(CATEGORY_RULES)
+
+
+@dataclass(frozen=True)
+class NormalizedSlot:
+    title: str
+    category: str
+    original_price: int | None
+    sale_price: int | None
+    discount_rate: float | None
+
+
 def normalize_product_title(raw_title: str) -> str:
     """상품명 정규화.
 
@@ -125,13 +157,14 @@ def normalize_product_title(raw_title: str) -> str:
         return ""
 
     title = raw_title
-    for keyword in UNWANTED_KEYWORDS:
-        title = title.replace(keyword, "")
+    # 대부분의 상품명에는 불필요 키워드가 없으므로 한 번 검색해 보고 있을 때만 순서대로 제거
+    # (키워드 제거로 새 키워드가 생기는 경우까지 기존 결과와 같게 유지)
+    if _UNWANTED_PATTERN.search(title):
+        for keyword in UNWANTED_KEYWORDS:
+            title = title.replace(keyword, "")
 
-    # 특수문자를 공백으로 치환해 단어 단위 비교가 가능하도록 처리
-    title = re.sub(r"[^0-9A-Za-z가-힣\s]", " ", title)
-    # 연속 공백은 하나로 줄여 비교/검색을 안정화
-    title = re.sub(r"\s+", " ", title)
+    # 특수문자를 공백으로 치환하고 연속 공백은 하나로 줄여 단어 단위 비교/검색을 안정화
+    title = _NON_WORD_RUN.sub(" ", title)
 
     return title.strip().lower()
 
@@ -145,7 +178,7 @@ def parse_price_text(price_text: str | None) -> int | None:
     if not price_text:
         return None
 
-    match = re.search(r"\d[\d,]*(?:\\.\\d+)?", price_text)
+    match = _PRICE_TEXT.search(price_text)
     if not match:
         return None
 
@@ -173,7 +206,7 @@ def parse_price_info(price_text: str | None) -> tuple[int | None, int | None, fl
     if not price_text:
         return None, None, None
 
-    numbers = re.findall(r"\d[\d,]*", price_text)
+    numbers = _PRICE_NUMBERS.findall(price_text)
     if not numbers:
         return None, None, None
 
@@ -198,13 +231,40 @@ def infer_category(raw_title: str) -> str:
     - why: 상세 페이지 크롤링 없이도 최소한의 필터링 경험 제공
     """
 
-    normalized = normalize_product_title(raw_title)
-    for category, keywords in CATEGORY_RULES.items():
-        if any(keyword in normalized for keyword in keywords):
+    return match_category(normalize_product_title(raw_title))
+
+
+def match_category(normalized_title: str) -> str:
+    """정규화된 상품명으로 카테고리 추정 (CATEGORY_RULES 순서가 우선순위)."""
+
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(normalized_title):
             return category
     return "기타"
 
 
+def normalize_slot(
+    raw_title: str,
+    price_text: str | None,
+    classify: Callable[[str], str] | None = None,
+) -> NormalizedSlot:
+    """편성표 항목 하나의 상품명/카테고리/가격 정보를 한 번에 정규화.
+
+    - why: 상품명 정규화를 카테고리 추정과 공유해 슬롯마다 한 번만 수행하기 위해.
+    - classify: 정규화된 상품명 → 카테고리 (기본값은 CATEGORY_RULES 순서 매칭)
+    """
+
+    title = normalize_product_title(raw_title)
+    original_price, sale_price, discount_rate = parse_price_info(price_text)
+    return NormalizedSlot(
+        title=title,
+        category=(classify or match_category)(title),
+        original_price=original_price,
+        sale_price=sale_price,
+        discount_rate=discount_rate,
+    )
+
+
 def make_slot_hash(channel_id: int, start_at: datetime, normalized_title: str) -> str:
     """슬롯 중복 방지를 위한 해시."""
 
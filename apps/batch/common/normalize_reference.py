@@ -0,0 +1,40 @@
+# why: 정규식 컴파일 전 정규화 구현을 테스트(결과 일치)와 벤치마크(속도 비교)가 같은 기준으로 쓰기 위한 모듈
+import random
+import re
+
+from common.normalize import CATEGORY_RULES, UNWANTED_KEYWORDS
+
+
+def legacy_normalize_product_title(raw_title: str) -> str:
+    """컴파일 전 normalize_product_title (키워드마다 replace, 매번 re.sub)."""
+
+    if not raw_title:
+        return ""
+    title = raw_title
+    for keyword in UNWANTED_KEYWORDS:
+        title = title.replace(keyword, "")
+    title = re.sub(r"[^0-9A-Za-z가-힣\s]", " ", title)
+    title = re.sub(r"\s+", " ", title)
+    return title.strip().lower()
+
+
+def legacy_infer_category(raw_title: str) -> str:
+    """컴파일 전 infer_category (룰 순서대로 키워드 포함 여부 확인)."""
+
+    normalized = legacy_normalize_product_title(raw_title)
+    for category, keywords in CATEGORY_RULES.items():
+        if any(keyword in normalized for keyword in keywords):
+            return category
+    return "기타"
+
+
+def sample_titles(count: int, seed: int = 7) -> list[str]:
+    """룰 키워드/불필요 키워드/특수문자를 섞은 편성표 상품명 샘플."""
+
+    rng = random.Random(seed)
+    vocab = [keyword for keywords in CATEGORY_RULES.values() for keyword in keywords]
+    vocab += UNWANTED_KEYWORDS + ["프리미엄", "세트", "1+1", "[방송]", "(최대", "구성)", "!!", "%"]
+    vocab += ["♥", "★", "TV", "Tv", "\t", "\u3000", "kg", "정품", "대용량", "특단독가", "Ｂ"]
+    return [
+        " ".join(rng.choice(vocab) for _ in range(rng.randint(1, 10))) for _ in range(count)
+    ]
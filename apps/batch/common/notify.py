@@ -0,0 +1,218 @@
+# why: 알림을 큐에 모아 목적지별로 묶고, 연결을 재사용하며 병렬로 발송하기 위한 디스패처
+from __future__ import annotations
+
+import asyncio
+import logging
+import smtplib
+from dataclasses import dataclass, field
+from email.message import EmailMessage
+from typing import Any, Callable
+
+import httpx
+
+from common.config import BatchSettings, get_batch_settings
+from common.email import build_email_message
+from common.models import DestinationType
+
+
+logger = logging.getLogger("batch.notify")
+
+
+@dataclass
+class Notification:
+    destination_type: DestinationType
+    destination_value: str
+    subject: str
+    body: str
+    # 호출 측 식별자 (예: 발송 로그 키). 결과와 함께 그대로 돌려준다.
+    key: Any = None
+
+
+@dataclass
+class DispatchResult:
+    destination_type: DestinationType
+    destination_value: str
+    keys: list[Any] = field(default_factory=list)
+    ok: bool = False
+    error: str | None = None
+    message_count: int = 0
+
+
+class _SmtpSession:
+    """SMTP 호스트별로 한 번만 접속/로그인하고 재사용하는 세션.
+
+    - why: 메시지마다 TLS 핸드셰이크와 로그인을 반복하면 발송이 느리고 차단 위험이 커진다.
+    """
+
+    def __init__(self, settings: BatchSettings) -> None:
+        self.settings = settings
+        self.lock = asyncio.Lock()
+        self._server: smtplib.SMTP | None = None
+        self.login_count = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        settings = self.settings
+        if settings.smtp_use_ssl:
+            server: smtplib.SMTP = smtplib.SMTP_SSL(settings.smtp_host, settings.smtp_port)
+        else:
+            server = smtplib.SMTP(settings.smtp_host, settings.smtp_port)
+            if settings.smtp_use_tls:
+                server.starttls()
+        server.login(settings.smtp_user, settings.smtp_password)
+        self.login_count += 1
+        return server
+
+    def send(self, message: EmailMessage) -> None:
+        if self._server is None:
+            self._server = self._connect()
+        try:
+            self._server.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            # 유휴 시간 초과로 끊긴 세션은 한 번만 재접속해 다시 보낸다.
+            self._server = self._connect()
+            self._server.send_message(message)
+
+    def close(self) -> None:
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except smtplib.SMTPException:
+            pass
+        finally:
+            self._server = None
+
+
+class NotificationDispatcher:
+    """Slack/Email 알림 비동기 디스패처.
+
+    - 같은 목적지로 가는 알림은 하나의 다이제스트 메시지로 합친다.
+    - Slack은 하나의 HTTP 클라이언트를, 이메일은 SMTP 호스트별 세션 하나를 재사용한다.
+    - 동시 발송 수를 제한하고 Slack 429 응답의 Retry-After를 따른다.
+    """
+
+    def __init__(
+        self,
+        settings: BatchSettings | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self.settings = settings or get_batch_settings()
+        self._queue: list[Notification] = []
+        self._http_client = http_client
+        self._smtp_sessions: dict[str, _SmtpSession] = {}
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def add(self, notification: Notification) -> None:
+        self._queue.append(notification)
+
+    async def dispatch(
+        self, on_result: Callable[[DispatchResult], None] | None = None
+    ) -> list[DispatchResult]:
+        """큐의 알림을 목적지별 다이제스트로 묶어 발송하고 결과를 반환."""
+
+        groups: dict[tuple[DestinationType, str], list[Notification]] = {}
+        for notification in self._queue:
+            destination = (notification.destination_type, notification.destination_value.strip())
+            groups.setdefault(destination, []).append(notification)
+        self._queue = []
+
+        if not groups:
+            return []
+
+        sem = asyncio.Semaphore(max(1, self.settings.notify_concurrency))
+        owns_client = self._http_client is None
+        client = self._http_client or httpx.AsyncClient(timeout=10.0)
+
+        async def send_group(
+            destination: tuple[DestinationType, str], items: list[Notification]
+        ) -> DispatchResult:
+            destination_type, destination_value = destination
+            result = DispatchResult(
+                destination_type=destination_type,
+                destination_value=destination_value,
+                keys=[item.key for item in items],
+                message_count=len(items),
+            )
+            subject, body = _build_digest(items)
+            async with sem:
+                try:
+                    if destination_type == DestinationType.SLACK:
+                        await self._send_slack(client, destination_value, body)
+                    elif destination_type == DestinationType.EMAIL:
+                        await self._send_email(destination_value, subject, body)
+                    else:
+                        raise ValueError(f"지원하지 않는 목적지 타입: {destination_type}")
+                    result.ok = True
+                except Exception as exc:
+                    logger.warning("알림 발송 실패: %s (%s)", destination_type, exc)
+                    result.error = str(exc) or exc.__class__.__name__
+            if on_result:
+                on_result(result)
+            return result
+
+        try:
+            return list(
+                await asyncio.gather(
+                    *(send_group(destination, items) for destination, items in groups.items())
+                )
+            )
+        finally:
+            if owns_client:
+                await client.aclose()
+            await asyncio.gather(
+                *(asyncio.to_thread(session.close) for session in self._smtp_sessions.values())
+            )
+            self._smtp_sessions = {}
+
+    def dispatch_sync(
+        self, on_result: Callable[[DispatchResult], None] | None = None
+    ) -> list[DispatchResult]:
+        return asyncio.run(self.dispatch(on_result))
+
+    async def _send_slack(self, client: httpx.AsyncClient, webhook_url: str, text: str) -> None:
+        if not webhook_url:
+            raise ValueError("Slack webhook URL이 비어 있습니다.")
+
+        retries = 0
+        while True:
+            response = await client.post(webhook_url, json={"text": text})
+            if response.status_code == 429 and retries < self.settings.notify_slack_max_retries:
+                retries += 1
+                await asyncio.sleep(self._retry_after(response))
+                continue
+            response.raise_for_status()
+            return
+
+    def _retry_after(self, response: httpx.Response) -> float:
+        raw = response.headers.get("Retry-After")
+        try:
+            delay = float(raw) if raw is not None else 1.0
+        except ValueError:
+            delay = 1.0
+        return max(0.0, min(delay, float(self.settings.notify_retry_after_max_sec)))
+
+    async def _send_email(self, to_address: str, subject: str, body: str) -> None:
+        settings = self.settings
+        message = build_email_message(settings, to_address, subject, body)
+
+        session = self._smtp_sessions.get(settings.smtp_host)
+        if session is None:
+            session = _SmtpSession(settings)
+            self._smtp_sessions[settings.smtp_host] = session
+
+        # SMTP 세션은 동시에 하나의 트랜잭션만 처리할 수 있어 호스트 단위로 직렬화한다.
+        async with session.lock:
+            await asyncio.to_thread(session.send, message)
+
+
+def _build_digest(items: list[Notification]) -> tuple[str, str]:
+    if len(items) == 1:
+        return items[0].subject, items[0].body
+
+    subjects = list(dict.fromkeys(item.subject for item in items))
+    subject = subjects[0] if len(subjects) == 1 else f"[BroadcastBoard] 알림 {len(items)}건"
+    body = f"곧 시작하는 방송 {len(items)}건\n\n" + "\n\n".join(item.body for item in items)
+    return subject, body
+
@@ -0,0 +1,67 @@
+# why: 가격 수집 예산을 화면에 곧 노출될 방송부터 쓰도록 큐 작업의 우선순위 점수를 계산하는 모듈
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from common.config import BatchSettings
+
+
+# 수집 경로별 상대 비용 (HTTP 1회 = 1)
+HTTP_COST = 1.0
+# 비용 이동평균 가중치 (최근 관측 비중)
+COST_EWMA_ALPHA = 0.3
+
+
+@dataclass(frozen=True)
+class PriorityWeights:
+    horizon_minutes: float
+    live_weight: float
+    ended_weight: float
+    refresh_minutes: float
+
+    @classmethod
+    def from_settings(cls, settings: BatchSettings) -> "PriorityWeights":
+        return cls(
+            horizon_minutes=settings.price_priority_horizon_minutes,
+            live_weight=settings.price_priority_live_weight,
+            ended_weight=settings.price_priority_ended_weight,
+            refresh_minutes=settings.price_queue_refresh_minutes,
+        )
+
+
+def priority_score(
+    priority_at: datetime,
+    air_end_at: datetime | None,
+    fetched_at: datetime | None,
+    fetch_cost: float | None,
+    now: datetime,
+    weights: PriorityWeights,
+) -> float:
+    """가격 수집 1단위 비용당 가치 점수. 클수록 먼저 처리한다.
+
+    - 방송 중(LIVE)이면 가장 높고, 방송 전이면 시작까지 남은 시간이 짧을수록 높다.
+    - 한 번도 수집하지 않았거나 오래된 가격일수록 높고, 과거 수집 비용(브라우저 필요 등)이 클수록 낮다.
+    """
+
+    if priority_at <= now and air_end_at is not None and now < air_end_at:
+        urgency = weights.live_weight
+    elif priority_at > now:
+        minutes_to_air = (priority_at - now).total_seconds() / 60
+        urgency = 1 / (1 + minutes_to_air / weights.horizon_minutes)
+    else:
+        urgency = weights.ended_weight
+
+    if fetched_at is None:
+        staleness = 1.0
+    else:
+        age_minutes = (now - fetched_at).total_seconds() / 60
+        staleness = 0.5 + 0.5 * min(1.0, age_minutes / max(1.0, weights.refresh_minutes))
+
+    return urgency * staleness / max(HTTP_COST, fetch_cost or HTTP_COST)
+
+
+def update_cost(previous: float | None, observed: float) -> float:
+    if previous is None:
+        return observed
+    return previous + COST_EWMA_ALPHA * (observed - previous)
@@ -0,0 +1,232 @@
+# why: 상품 가격 수집 대상을 DB 큐에 쌓고, 우선순위/재시도 규칙에 따라 워커가 나눠 가져가도록 하는 유틸
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import hashlib
+import heapq
+import logging
+import uuid
+from typing import Iterable
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from common.models import PriceFetchStatus, PriceFetchTask
+from common.price_priority import HTTP_COST, PriorityWeights, priority_score, update_cost
+from sources.product_price import extract_goodscode
+
+
+logger = logging.getLogger("batch.price_queue")
+
+Prices = tuple[int | None, int | None]
+
+
+def url_hash(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def enqueue_price_urls(
+    db: Session,
+    air_windows: dict[str, tuple[datetime, datetime]],
+    refresh_after: timedelta,
+    now: datetime | None = None,
+) -> int:
+    """URL별 현재/다음 방송 (시작, 종료) 시각을 우선순위 정보로 큐에 넣는다.
+
+    - 이미 있는 URL은 방송 시각만 갱신하고, 완료/포기한 지 refresh_after가 지난 URL은 다시 대기열로 돌린다.
+    - return: 새로 대기 상태가 된 URL 수
+    """
+
+    if not air_windows:
+        return 0
+
+    now = now or datetime.utcnow()
+    hashes = {url_hash(url): url for url in air_windows}
+    existing = {
+        task.url_hash: task
+        for task in db.execute(
+            select(PriceFetchTask).where(PriceFetchTask.url_hash.in_(list(hashes)))
+        ).scalars()
+    }
+
+    queued = 0
+    for digest, url in hashes.items():
+        priority_at, air_end_at = air_windows[url]
+        task = existing.get(digest)
+        if task is None:
+            db.add(
+                PriceFetchTask(
+                    url_hash=digest,
+                    url=url,
+                    goodscode=extract_goodscode(url),
+                    priority_at=priority_at,
+                    air_end_at=air_end_at,
+                    status=PriceFetchStatus.PENDING,
+                    attempts=0,
+                    next_attempt_at=now,
+                    fetch_cost=HTTP_COST,
+                )
+            )
+            queued += 1
+            continue
+
+        task.priority_at = priority_at
+        task.air_end_at = air_end_at
+        if task.status != PriceFetchStatus.PENDING and _is_stale(task, now, refresh_after):
+            task.status = PriceFetchStatus.PENDING
+            task.attempts = 0
+            task.next_attempt_at = now
+            queued += 1
+
+    try:
+        db.commit()
+    except IntegrityError:
+        # 다른 워커가 같은 URL을 먼저 넣은 경우: 다음 주기에 다시 반영되므로 이번 삽입만 포기
+        db.rollback()
+        logger.warning("가격 큐 동시 삽입 충돌로 일부 URL 등록을 건너뜁니다.")
+        return 0
+    return queued
+
+
+def _is_stale(task: PriceFetchTask, now: datetime, refresh_after: timedelta) -> bool:
+    # 완료는 수집 시각, 포기는 마지막 시도 시각 기준으로 refresh_after가 지났는지 판단
+    last = task.fetched_at if task.status == PriceFetchStatus.DONE else task.next_attempt_at
+    return last is None or last <= now - refresh_after
+
+
+def claim_tasks(
+    db: Session,
+    worker_id: str,
+    limit: int,
+    lock_sec: int,
+    weights: PriorityWeights,
+    now: datetime | None = None,
+) -> list[PriceFetchTask]:
+    """처리할 작업을 우선순위 점수 순으로 잠가서 가져온다.
+
+    - 대기 중인 작업의 점수 계산용 컬럼만 읽어 파이썬에서 순위를 매긴다.
+      (하루 편성 상품 수 규모라 전체를 읽어도 가볍고, SQL로는 점수식을 표현하기 어렵다)
+    - 잠금은 조건부 UPDATE로 잡아 여러 워커가 같은 작업을 동시에 가져가지 않는다.
+      워커가 죽으면 locked_until 이후 다른 워커가 다시 가져간다.
+    - locked_by에는 호출마다 새 토큰(worker_id:난수)을 써서, 같은 프로세스의 다른 스레드
+      (상주 실행의 수집 잡과 큐 drain 잡)가 잠근 작업을 자기 것으로 읽지 않는다.
+    """
+
+    now = now or datetime.utcnow()
+    available = or_(PriceFetchTask.locked_until.is_(None), PriceFetchTask.locked_until < now)
+    candidates = db.execute(
+        select(
+            PriceFetchTask.id,
+            PriceFetchTask.priority_at,
+            PriceFetchTask.air_end_at,
+            PriceFetchTask.fetched_at,
+            PriceFetchTask.fetch_cost,
+        )
+        .where(PriceFetchTask.status == PriceFetchStatus.PENDING)
+        .where(PriceFetchTask.next_attempt_at <= now)
+        .where(available)
+    ).all()
+    if not candidates:
+        return []
+
+    scores = {
+        row.id: priority_score(
+            row.priority_at, row.air_end_at, row.fetched_at, row.fetch_cost, now, weights
+        )
+        for row in candidates
+    }
+    candidate_ids = heapq.nlargest(limit, scores, key=scores.__getitem__)
+    # locked_by는 100자라 긴 호스트 이름은 잘라서 토큰 자리를 남긴다.
+    token = f"{worker_id[:80]}:{uuid.uuid4().hex[:16]}"
+
+    db.execute(
+        update(PriceFetchTask)
+        .where(PriceFetchTask.id.in_(candidate_ids))
+        .where(available)
+        .values(locked_by=token, locked_until=now + timedelta(seconds=lock_sec))
+    )
+    db.commit()
+
+    tasks = db.execute(
+        select(PriceFetchTask)
+        .where(PriceFetchTask.id.in_(candidate_ids))
+        .where(PriceFetchTask.locked_by == token)
+        .execution_options(populate_existing=True)
+    ).scalars()
+    return sorted(tasks, key=lambda task: scores[task.id], reverse=True)
+
+
+def complete_task(task: PriceFetchTask, prices: Prices, now: datetime, cost: float) -> None:
+    task.status = PriceFetchStatus.DONE
+    task.fetch_cost = update_cost(task.fetch_cost, cost)
+    task.original_price, task.sale_price = prices
+    task.fetched_at = now
+    task.last_error = None
+    task.locked_by = None
+    task.locked_until = None
+
+
+def fail_task(
+    task: PriceFetchTask,
+    error: str,
+    now: datetime,
+    max_attempts: int,
+    retry_base_sec: int,
+    cost: float,
+) -> None:
+    """실패 기록. base * 2^(시도-1)초 뒤 재시도하고, 최대 횟수를 넘기면 FAILED로 포기."""
+
+    task.attempts = (task.attempts or 0) + 1
+    task.fetch_cost = update_cost(task.fetch_cost, cost)
+    task.last_error = error[:500]
+    task.locked_by = None
+    task.locked_until = None
+    if task.attempts >= max_attempts:
+        task.status = PriceFetchStatus.FAILED
+        task.next_attempt_at = now
+        return
+    task.next_attempt_at = now + timedelta(seconds=retry_base_sec * 2 ** (task.attempts - 1))
+
+
+def release_task(task: PriceFetchTask) -> None:
+    """시간 예산 안에 처리하지 못한 작업은 시도 횟수를 늘리지 않고 다음 주기로 넘긴다."""
+
+    task.locked_by = None
+    task.locked_until = None
+
+
+def defer_task(task: PriceFetchTask, until: datetime) -> None:
+    """차단기가 열려 요청하지 못한 작업은 시도 횟수를 늘리지 않고 차단기가 다시 열리는 시각으로 미룬다."""
+
+    task.locked_by = None
+    task.locked_until = None
+    task.next_attempt_at = until
+
+
+def load_fetched_prices(db: Session, urls: Iterable[str]) -> dict[str, Prices]:
+    return {url: prices for url, (prices, _) in load_fetched_price_entries(db, urls).items()}
+
+
+def load_fetched_price_entries(
+    db: Session, urls: Iterable[str]
+) -> dict[str, tuple[Prices, datetime | None]]:
+    """수집을 마친 URL → ((정가, 할인가), 실제로 수집한 시각).
+
+    - 수집 시각을 함께 넘겨 재사용한 가격을 지금 확인한 가격처럼 취급하지 않게 한다.
+    """
+
+    hashes = [url_hash(url) for url in urls]
+    if not hashes:
+        return {}
+    rows = db.execute(
+        select(
+            PriceFetchTask.url,
+            PriceFetchTask.original_price,
+            PriceFetchTask.sale_price,
+            PriceFetchTask.fetched_at,
+        )
+        .where(PriceFetchTask.url_hash.in_(hashes))
+        .where(PriceFetchTask.status == PriceFetchStatus.DONE)
+    ).all()
+    return {url: ((original, sale), fetched_at) for url, original, sale, fetched_at in rows}
@@ -0,0 +1,211 @@
+# why: 날짜/채널이 달라도 같은 상품인 방송 슬롯을 하나의 products 행으로 묶어 가격/카테고리를 공유하기 위한 유틸
+from __future__ import annotations
+
+from datetime import datetime
+import hashlib
+from typing import Iterable
+
+from sqlalchemy import or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from common.models import Product
+
+
+Prices = tuple[int | None, int | None]
+
+SIMHASH_BITS = 64
+BAND_BITS = 16
+BAND_COUNT = SIMHASH_BITS // BAND_BITS
+_BAND_MASK = (1 << BAND_BITS) - 1
+
+
+def simhash(text: str) -> int:
+    """정규화 상품명의 64비트 SimHash.
+
+    - 공백을 뺀 글자 3-gram을 특징으로 써서 띄어쓰기/조사만 다른 상품명도 가까운 값이 나온다.
+    """
+
+    compact = text.replace(" ", "")
+    if not compact:
+        return 0
+    if len(compact) < 3:
+        shingles = [compact]
+    else:
+        shingles = [compact[idx : idx + 3] for idx in range(len(compact) - 2)]
+
+    weights = [0] * SIMHASH_BITS
+    for shingle in shingles:
+        value = int.from_bytes(
+            hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming(left: int, right: int) -> int:
+    return (left ^ right).bit_count()
+
+
+def bands(fingerprint: int) -> list[int]:
+    """16비트 밴드 4개. 해밍 거리 3 이하인 두 값은 비둘기집 원리로 최소 한 밴드가 같다."""
+
+    return [fingerprint >> (BAND_BITS * idx) & _BAND_MASK for idx in range(BAND_COUNT)]
+
+
+def product_key(goodscode: str | None, fingerprint: int) -> str:
+    return f"gc:{goodscode}" if goodscode else f"fp:{fingerprint:016x}"
+
+
+class ProductResolver:
+    """편성표 항목을 products 행에 연결.
+
+    - 상품 코드가 있으면 코드로만 찾는다(코드가 다르면 상품명이 비슷해도 다른 상품).
+    - 코드가 없으면 SimHash 밴드가 하나라도 같은 후보 중 해밍 거리가 max_distance 이하인 상품을 쓴다.
+    - 한 실행 안에서는 키별로 캐시해 같은 상품을 반복 조회하지 않는다.
+    """
+
+    def __init__(self, db: Session, max_distance: int) -> None:
+        self.db = db
+        # 밴드가 하나라도 같다는 후보 조건은 거리 BAND_COUNT - 1까지만 빠짐없이 찾는다.
+        self.max_distance = min(max_distance, BAND_COUNT - 1)
+        self._cache: dict[str, Product] = {}
+
+    def resolve(
+        self,
+        goodscode: str | None,
+        normalized_title: str,
+        category: str | None,
+        aired_at: datetime,
+    ) -> Product | None:
+        if not goodscode and not normalized_title:
+            return None
+
+        fingerprint = simhash(normalized_title)
+        key = product_key(goodscode, fingerprint)
+        product = self._cache.get(key)
+        if product is None:
+            if goodscode:
+                product = self._by_key(key)
+            else:
+                product = self._find_similar(fingerprint)
+            if product is None:
+                product = self._create(key, goodscode, normalized_title, category, fingerprint, aired_at)
+            self._cache[key] = product
+
+        if aired_at < product.first_seen_at:
+            product.first_seen_at = aired_at
+        if aired_at > product.last_seen_at:
+            product.last_seen_at = aired_at
+            product.normalized_title = normalized_title
+        if category:
+            product.category = category
+        return product
+
+    def _by_key(self, key: str) -> Product | None:
+        return self.db.execute(
+            select(Product).where(Product.product_key == key)
+        ).scalar_one_or_none()
+
+    def _find_similar(self, fingerprint: int) -> Product | None:
+        band_values = bands(fingerprint)
+        candidates = self.db.execute(
+            select(Product).where(
+                or_(
+                    Product.simhash_band0 == band_values[0],
+                    Product.simhash_band1 == band_values[1],
+                    Product.simhash_band2 == band_values[2],
+                    Product.simhash_band3 == band_values[3],
+                )
+            )
+        ).scalars()
+
+        best: Product | None = None
+        best_distance = self.max_distance + 1
+        for candidate in candidates:
+            distance = hamming(fingerprint, int(candidate.title_simhash, 16))
+            if distance < best_distance:
+                best, best_distance = candidate, distance
+        return best
+
+    def _create(
+        self,
+        key: str,
+        goodscode: str | None,
+        normalized_title: str,
+        category: str | None,
+        fingerprint: int,
+        aired_at: datetime,
+    ) -> Product:
+        band_values = bands(fingerprint)
+        product = Product(
+            product_key=key,
+            goodscode=goodscode,
+            normalized_title=normalized_title,
+            category=category,
+            title_simhash=f"{fingerprint:016x}",
+            simhash_band0=band_values[0],
+            simhash_band1=band_values[1],
+            simhash_band2=band_values[2],
+            simhash_band3=band_values[3],
+            first_seen_at=aired_at,
+            last_seen_at=aired_at,
+            broadcast_count=0,
+        )
+        try:
+            with self.db.begin_nested():
+                self.db.add(product)
+        except IntegrityError:
+            # 다른 워커(샤드)가 같은 상품을 먼저 만든 경우
+            existing = self._by_key(key)
+            if existing is None:
+                raise
+            return existing
+        return product
+
+
+def record_product_price(
+    product: Product,
+    original_price: int | None,
+    sale_price: int | None,
+    discount_rate: float | None,
+    now: datetime,
+) -> None:
+    """슬롯에서 확인한 최신 가격을 상품에 반영 (가격이 없으면 기존 값 유지).
+
+    - now는 가격을 실제로 수집한 시각이다. 이미 더 최근에 확인한 가격이 있으면 덮어쓰지 않는다.
+    """
+
+    if original_price is None and sale_price is None:
+        return
+    if product.price_updated_at is not None and product.price_updated_at >= now:
+        return
+    product.original_price = original_price
+    product.sale_price = sale_price
+    product.discount_rate = discount_rate
+    product.price_updated_at = now
+
+
+def fresh_product_prices(
+    db: Session, goodscodes: Iterable[str], fresh_after: datetime
+) -> dict[str, Prices]:
+    """fresh_after 이후 가격이 확인된 상품의 상품 코드 → (정가, 할인가).
+
+    - why: 같은 상품이 다른 날짜/채널에 다시 편성돼도 가격을 다시 수집하지 않도록 한다.
+    """
+
+    codes = list(set(goodscodes))
+    if not codes:
+        return {}
+    rows = db.execute(
+        select(Product.goodscode, Product.original_price, Product.sale_price)
+        .where(Product.goodscode.in_(codes))
+        .where(Product.price_updated_at >= fresh_after)
+    ).all()
+    return {goodscode: (original, sale) for goodscode, original, sale in rows}
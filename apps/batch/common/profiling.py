@@ -0,0 +1,62 @@
+# why: 배치 잡 한 번 실행을 cProfile/pyinstrument로 프로파일링해 느린 구간을 파일로 남기기 위한 유틸
+from contextlib import contextmanager
+import cProfile
+from datetime import datetime
+import io
+import logging
+from pathlib import Path
+import pstats
+from typing import Iterator
+
+
+logger = logging.getLogger("batch.profile")
+
+PROFILERS = ("cprofile", "pyinstrument")
+
+
+@contextmanager
+def profiled(kind: str | None, directory: Path, label: str) -> Iterator[None]:
+    """블록 실행을 프로파일링해 directory에 결과를 저장 (kind가 None이면 그대로 실행).
+
+    - cprofile: profile_<label>_<시각>.prof(pstats/snakeviz용) + 누적 시간 상위 함수 .txt
+    - pyinstrument: 같은 이름의 .html/.txt (선택 의존성, 없으면 cProfile로 대신)
+    - 호출한 스레드만 측정한다. 단발 실행은 가격 수집 코루틴도 같은 스레드(asyncio.run)에서 돈다.
+    """
+
+    if kind is None:
+        yield
+        return
+
+    if kind == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            logger.warning("pyinstrument가 설치되지 않아 cProfile로 프로파일링합니다.")
+            kind = "cprofile"
+
+    directory.mkdir(parents=True, exist_ok=True)
+    base = directory / f"profile_{label}_{datetime.utcnow():%Y%m%dT%H%M%S}"
+
+    if kind == "pyinstrument":
+        profiler = Profiler()
+        profiler.start()
+        try:
+            yield
+        finally:
+            profiler.stop()
+            base.with_suffix(".html").write_text(profiler.output_html(), encoding="utf-8")
+            base.with_suffix(".txt").write_text(profiler.output_text(), encoding="utf-8")
+            logger.info("프로파일 저장: %s.html", base)
+        return
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(base.with_suffix(".prof"))
+        summary = io.StringIO()
+        pstats.Stats(profiler, stream=summary).sort_stats("cumulative").print_stats(40)
+        base.with_suffix(".txt").write_text(summary.getvalue(), encoding="utf-8")
+        logger.info("프로파일 저장: %s.prof", base)
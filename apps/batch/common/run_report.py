@@ -0,0 +1,238 @@
+# why: 배치 실행의 단계별 소요 시간/건수/바이트/재시도·차단 수를 모아 JSON 실행 리포트와 Prometheus 텍스트로 남기기 위한 유틸
+from __future__ import annotations
+
+from contextlib import contextmanager
+import contextvars
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime
+import functools
+import json
+import logging
+from pathlib import Path
+import threading
+import time
+from typing import Callable, Iterator
+
+from common.config import BatchSettings
+
+
+logger = logging.getLogger("batch.report")
+
+# 가격 수집 HostGuard 이름 → 단계 이름
+_GUARD_STAGES = {"http": "price_http", "browser": "price_browser"}
+
+
+@dataclass
+class StageMetrics:
+    """단계 누적 지표.
+
+    - calls/seconds: 단계 구간에 들어간 횟수와 누적 시간 (중첩 단계는 바깥 단계 시간에도 포함)
+    - items/success: 처리 대상 수와 성공 수, bytes: 받은 응답 본문 크기
+    - retries/blocked/errors: 재시도, 차단(403/429/차단 페이지), 오류/타임아웃 수
+    """
+
+    calls: int = 0
+    seconds: float = 0.0
+    items: int = 0
+    success: int = 0
+    bytes: int = 0
+    retries: int = 0
+    blocked: int = 0
+    errors: int = 0
+
+
+class RunReport:
+    """잡 1회 실행의 리포트.
+
+    - 가격 수집 코루틴은 상주 루프 스레드에서도 기록하므로 갱신은 잠금으로 보호한다.
+    """
+
+    def __init__(self, job: str) -> None:
+        self.job = job
+        self.started_at = datetime.utcnow()
+        self.finished_at: datetime | None = None
+        self.status = "running"
+        self.duration_sec = 0.0
+        self.stages: dict[str, StageMetrics] = {}
+        self.counters: dict[str, int] = {}
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, **values: int | float) -> None:
+        with self._lock:
+            metrics = self.stages.setdefault(stage, StageMetrics())
+            for name, value in values.items():
+                setattr(metrics, name, getattr(metrics, name) + value)
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def finish(self, status: str) -> None:
+        self.status = status
+        self.finished_at = datetime.utcnow()
+        self.duration_sec = round(time.perf_counter() - self._started, 3)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            stages = {
+                name: {**asdict(metrics), "seconds": round(metrics.seconds, 3)}
+                for name, metrics in self.stages.items()
+            }
+            counters = dict(self.counters)
+        return {
+            "job": self.job,
+            "status": self.status,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "duration_sec": self.duration_sec,
+            "stages": stages,
+            "counters": counters,
+        }
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 형식 (node_exporter textfile collector용, 마지막 실행 값 gauge)."""
+
+        data = self.to_dict()
+        job = _label(self.job)
+        lines = [
+            "# HELP batch_run_duration_seconds 마지막 실행 소요 시간",
+            "# TYPE batch_run_duration_seconds gauge",
+            f'batch_run_duration_seconds{{job="{job}"}} {data["duration_sec"]}',
+            "# HELP batch_run_success 마지막 실행 성공 여부 (1/0)",
+            "# TYPE batch_run_success gauge",
+            f'batch_run_success{{job="{job}"}} {1 if self.status == "ok" else 0}',
+            "# HELP batch_run_finished_timestamp_seconds 마지막 실행 종료 시각 (unix)",
+            "# TYPE batch_run_finished_timestamp_seconds gauge",
+            f'batch_run_finished_timestamp_seconds{{job="{job}"}} '
+            f"{(self.finished_at or datetime.utcnow()).timestamp():.0f}",
+        ]
+        for field in fields(StageMetrics):
+            metric = f"batch_run_stage_{field.name}"
+            lines.append(f"# HELP {metric} 마지막 실행의 단계별 {field.name}")
+            lines.append(f"# TYPE {metric} gauge")
+            for stage, values in data["stages"].items():
+                lines.append(f'{metric}{{job="{job}",stage="{_label(stage)}"}} {values[field.name]}')
+        if data["counters"]:
+            lines.append("# HELP batch_run_counter 마지막 실행의 잡별 카운터")
+            lines.append("# TYPE batch_run_counter gauge")
+            for name, value in data["counters"].items():
+                lines.append(f'batch_run_counter{{job="{job}",name="{_label(name)}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, directory: Path, prometheus: bool) -> None:
+        """run_report_<job>.json(및 .prom)을 원자적으로 교체 저장."""
+
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            _write_atomic(
+                directory / f"run_report_{self.job}.json",
+                json.dumps(self.to_dict(), ensure_ascii=False, indent=2),
+            )
+            if prometheus:
+                _write_atomic(directory / f"run_report_{self.job}.prom", self.to_prometheus())
+        except OSError:
+            logger.exception("실행 리포트 저장 실패: %s", directory)
+
+    def log_summary(self) -> None:
+        with self._lock:
+            stages = " ".join(
+                f"{name}={metrics.seconds:.2f}s/{metrics.items}"
+                for name, metrics in self.stages.items()
+            )
+        logger.info(
+            "실행 리포트: job=%s status=%s duration=%.3fs %s",
+            self.job,
+            self.status,
+            self.duration_sec,
+            stages,
+        )
+
+
+_current: contextvars.ContextVar[RunReport | None] = contextvars.ContextVar(
+    "batch_run_report", default=None
+)
+
+
+def current_report() -> RunReport | None:
+    return _current.get()
+
+
+@contextmanager
+def run_report(job: str, settings: BatchSettings) -> Iterator[RunReport]:
+    """이 블록(같은 컨텍스트)에서 기록되는 단계 지표를 잡 리포트로 모으고 끝나면 파일로 남긴다."""
+
+    report = RunReport(job)
+    token = _current.set(report)
+    status = "failed"
+    try:
+        yield report
+        status = "ok"
+    finally:
+        _current.reset(token)
+        report.finish(status)
+        report.write(Path(settings.run_report_dir), settings.run_report_prometheus)
+        report.log_summary()
+
+
+def reported(job: str, func: Callable[[], object], settings: BatchSettings) -> Callable[[], None]:
+    """잡 함수를 실행 리포트 안에서 실행하도록 감싼다."""
+
+    @functools.wraps(func)
+    def wrapper():
+        with run_report(job, settings):
+            func()
+
+    return wrapper
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """단계 구간 시간 측정 (실행 리포트가 없으면 아무것도 하지 않음)."""
+
+    report = _current.get()
+    if report is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        report.add(name, calls=1, seconds=time.perf_counter() - started)
+
+
+def add(name: str, **values: int) -> None:
+    """단계 지표 누적 (items/success/bytes/retries/blocked/errors)."""
+
+    report = _current.get()
+    if report is not None:
+        report.add(name, **values)
+
+
+def count(name: str, value: int = 1) -> None:
+    report = _current.get()
+    if report is not None:
+        report.count(name, value)
+
+
+def record_outcome(guard: str, outcome: str) -> None:
+    """HostGuard 요청 결과를 해당 가격 수집 단계의 차단/오류 수로 반영."""
+
+    report = _current.get()
+    if report is None:
+        return
+    stage_name = _GUARD_STAGES.get(guard, guard)
+    if outcome == "BLOCKED":
+        report.add(stage_name, blocked=1)
+    elif outcome in ("TIMEOUT", "ERROR"):
+        report.add(stage_name, errors=1)
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    tmp_path.replace(path)
@@ -0,0 +1,125 @@
+# why: 상주 실행(daemon)에서 이벤트 루프와 Playwright 브라우저를 재사용하기 위한 런타임 유틸
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import threading
+from typing import Any, Coroutine, TypeVar
+
+from common.config import BatchSettings
+
+
+logger = logging.getLogger("batch.runtime")
+
+T = TypeVar("T")
+
+_loop: asyncio.AbstractEventLoop | None = None
+_thread: threading.Thread | None = None
+_playwright: Any = None
+_browser: Any = None
+_browser_lock: asyncio.Lock | None = None
+
+
+def start_background_loop() -> None:
+    """상주 이벤트 루프를 별도 스레드에서 시작.
+
+    - why: asyncio.run은 호출마다 루프를 새로 만들어, 루프에 묶인 브라우저를 재사용할 수 없다.
+    """
+
+    global _loop, _thread, _browser_lock
+    if _loop is not None:
+        return
+
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="batch-async-loop", daemon=True)
+    thread.start()
+    _loop, _thread = loop, thread
+    _browser_lock = asyncio.run_coroutine_threadsafe(_make_lock(), loop).result()
+
+
+async def _make_lock() -> asyncio.Lock:
+    return asyncio.Lock()
+
+
+def stop_background_loop() -> None:
+    """공유 브라우저를 닫고 상주 루프를 종료."""
+
+    global _loop, _thread, _browser_lock
+    if _loop is None:
+        return
+
+    try:
+        asyncio.run_coroutine_threadsafe(_close_shared_browser(), _loop).result(timeout=30)
+    except Exception:
+        logger.exception("공유 브라우저 종료 실패")
+    _loop.call_soon_threadsafe(_loop.stop)
+    if _thread is not None:
+        _thread.join(timeout=10)
+    _loop.close()
+    _loop, _thread, _browser_lock = None, None, None
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """코루틴 실행 헬퍼.
+
+    - 상주 루프가 있으면 그 루프에서 실행해 공유 리소스(브라우저 등)를 재사용하고,
+      없으면 기존처럼 asyncio.run으로 한 번 실행한다.
+    """
+
+    if _loop is not None:
+        # 호출한 스레드의 contextvars(실행 리포트 등)를 상주 루프의 태스크에서도 보이게 한다.
+        context = contextvars.copy_context()
+        return asyncio.run_coroutine_threadsafe(_in_context(context, coro), _loop).result()
+    return asyncio.run(coro)
+
+
+async def _in_context(context: contextvars.Context, coro: Coroutine[Any, Any, T]) -> T:
+    # 태스크는 자기 컨텍스트 사본에서 실행되므로 여기서 설정한 값은 이 태스크(와 하위 태스크)에만 보인다.
+    for var, value in context.items():
+        var.set(value)
+    return await coro
+
+
+async def get_shared_browser(settings: BatchSettings) -> Any | None:
+    """상주 루프에서 실행 중이면 재사용 가능한 Chromium 브라우저를 반환.
+
+    - 단발 실행에서는 None을 반환하므로 호출 측이 직접 브라우저를 띄우고 닫는다.
+    """
+
+    global _playwright, _browser
+    if _loop is None or _browser_lock is None:
+        return None
+    try:
+        if asyncio.get_running_loop() is not _loop:
+            return None
+    except RuntimeError:
+        return None
+
+    async with _browser_lock:
+        if _browser is not None and _browser.is_connected():
+            return _browser
+
+        try:
+            from playwright.async_api import async_playwright
+        except Exception:
+            return None
+
+        if _playwright is None:
+            _playwright = await async_playwright().start()
+        _browser = await _playwright.chromium.launch(
+            headless=not settings.product_price_playwright_headful,
+            args=["--disable-blink-features=AutomationControlled"],
+        )
+        logger.info("공유 브라우저 시작")
+        return _browser
+
+
+async def _close_shared_browser() -> None:
+    global _playwright, _browser
+    if _browser is not None:
+        await _browser.close()
+        _browser = None
+    if _playwright is not None:
+        await _playwright.stop()
+        _playwright = None
@@ -0,0 +1,301 @@
+# why: 잡마다 프로세스를 새로 띄우지 않고 DB 엔진/HTTP 클라이언트/브라우저를 유지한 채 주기 실행하기 위한 상주 스케줄러
+from __future__ import annotations
+
+import json
+import logging
+import random
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable
+from zoneinfo import ZoneInfo
+
+from common.config import BatchSettings
+
+
+logger = logging.getLogger("batch.scheduler")
+
+
+class CronSchedule:
+    """5필드 cron 표현식 (분 시 일 월 요일).
+
+    - 지원: `*`, `*/n`, `a-b`, `a-b/n`, `a,b,c` / 요일은 0(일)~6(토), 7도 일요일로 취급.
+    """
+
+    _RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+    def __init__(self, expression: str, tz: ZoneInfo) -> None:
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron 표현식은 5개 필드여야 합니다: {expression}")
+        self.expression = expression
+        self.tz = tz
+        parsed = [self._parse_field(value, lo, hi) for value, (lo, hi) in zip(fields, self._RANGES)]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        self.weekdays = {0 if day == 7 else day for day in weekdays}
+        self._day_restricted = fields[2] != "*"
+        self._weekday_restricted = fields[4] != "*"
+
+    @staticmethod
+    def _parse_field(value: str, lo: int, hi: int) -> set[int]:
+        result: set[int] = set()
+        for part in value.split(","):
+            step = 1
+            if "/" in part:
+                part, step_text = part.split("/", 1)
+                step = int(step_text)
+                if step <= 0:
+                    raise ValueError(f"cron step은 1 이상이어야 합니다: {value}")
+            if part == "*":
+                start, end = lo, hi
+            elif "-" in part:
+                start_text, end_text = part.split("-", 1)
+                start, end = int(start_text), int(end_text)
+            else:
+                start = int(part)
+                end = hi if step > 1 else start
+            if start < lo or end > hi or start > end:
+                raise ValueError(f"cron 값 범위를 벗어났습니다: {value}")
+            result.update(range(start, end + 1, step))
+        return result
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        # datetime.weekday(): 월=0 → cron: 일=0
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self._day_restricted and self._weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, after: datetime) -> datetime:
+        """after(UTC naive) 이후 첫 실행 시각(UTC naive)."""
+
+        local = after.replace(tzinfo=timezone.utc).astimezone(self.tz)
+        moment = local.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment + timedelta(days=366 * 5)
+        while moment < limit:
+            if moment.month not in self.months:
+                year = moment.year + (moment.month // 12)
+                month = moment.month % 12 + 1
+                moment = moment.replace(year=year, month=month, day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(moment):
+                moment = (moment + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if moment.hour not in self.hours:
+                moment = (moment + timedelta(hours=1)).replace(minute=0)
+                continue
+            if moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+                continue
+            return moment.astimezone(timezone.utc).replace(tzinfo=None)
+        raise ValueError(f"다음 실행 시각을 찾을 수 없습니다: {self.expression}")
+
+
+class IntervalSchedule:
+    """`@every 60s`, `@every 5m`, `@every 1h` 형태의 고정 주기."""
+
+    _UNITS = {"s": 1, "m": 60, "h": 3600}
+
+    def __init__(self, expression: str) -> None:
+        value = expression.removeprefix("@every").strip()
+        unit = value[-1:] if value[-1:] in self._UNITS else "s"
+        number = value[:-1] if value[-1:] in self._UNITS else value
+        self.seconds = int(number) * self._UNITS[unit]
+        if self.seconds <= 0:
+            raise ValueError(f"주기는 1초 이상이어야 합니다: {expression}")
+        self.expression = expression
+
+    def next_after(self, after: datetime) -> datetime:
+        return after + timedelta(seconds=self.seconds)
+
+
+def parse_schedule(expression: str, tz: ZoneInfo) -> CronSchedule | IntervalSchedule:
+    expression = expression.strip()
+    if expression.startswith("@every"):
+        return IntervalSchedule(expression)
+    return CronSchedule(expression, tz)
+
+
+@dataclass
+class ScheduledJob:
+    name: str
+    func: Callable[[], None]
+    schedule: CronSchedule | IntervalSchedule
+    jitter_sec: float = 0.0
+    next_run_at: datetime | None = None
+    running: bool = False
+    run_count: int = 0
+    failure_count: int = 0
+    skipped_overlap_count: int = 0
+    last_started_at: datetime | None = None
+    last_duration_sec: float | None = None
+    last_success_at: datetime | None = None
+    last_error: str | None = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def plan_next(self, after: datetime) -> None:
+        jitter = random.uniform(0, self.jitter_sec) if self.jitter_sec > 0 else 0.0
+        self.next_run_at = self.schedule.next_after(after) + timedelta(seconds=jitter)
+
+    def try_start(self) -> bool:
+        """이미 실행 중이면 False (같은 잡의 중복 실행 방지)."""
+
+        with self._lock:
+            if self.running:
+                self.skipped_overlap_count += 1
+                return False
+            self.running = True
+            return True
+
+    def run(self) -> None:
+        started = time.monotonic()
+        self.last_started_at = datetime.utcnow()
+        try:
+            self.func()
+            self.last_success_at = datetime.utcnow()
+            self.last_error = None
+        except Exception as exc:
+            self.failure_count += 1
+            self.last_error = str(exc) or exc.__class__.__name__
+            logger.exception("잡 실행 실패: %s", self.name)
+        finally:
+            self.last_duration_sec = round(time.monotonic() - started, 3)
+            self.run_count += 1
+            with self._lock:
+                self.running = False
+            logger.info(
+                "잡 실행 종료: job=%s duration=%.3fs ok=%s",
+                self.name,
+                self.last_duration_sec,
+                self.last_error is None,
+            )
+
+    def status(self) -> dict:
+        def iso(value: datetime | None) -> str | None:
+            return value.isoformat() if value else None
+
+        return {
+            "schedule": self.schedule.expression,
+            "running": self.running,
+            "next_run_at": iso(self.next_run_at),
+            "run_count": self.run_count,
+            "failure_count": self.failure_count,
+            "skipped_overlap_count": self.skipped_overlap_count,
+            "last_started_at": iso(self.last_started_at),
+            "last_duration_sec": self.last_duration_sec,
+            "last_success_at": iso(self.last_success_at),
+            "last_error": self.last_error,
+        }
+
+
+class BatchDaemon:
+    """잡을 cron/주기 스케줄로 실행하는 상주 프로세스.
+
+    - 같은 잡은 겹쳐 실행하지 않고(실행 중이면 이번 회차 스킵), 서로 다른 잡은 병렬 실행.
+    - SIGTERM/SIGINT를 받으면 새 잡 시작을 멈추고 실행 중인 잡이 끝나길 기다린 뒤 종료.
+    - 잡별 소요 시간/마지막 성공 시각을 상태 JSON 파일로 남겨 모니터링에 사용.
+    """
+
+    def __init__(self, settings: BatchSettings, jobs: dict[str, Callable[[], None]]) -> None:
+        self.settings = settings
+        tz = ZoneInfo(settings.daemon_timezone)
+        self.jobs: list[ScheduledJob] = []
+        for name, expression in settings.daemon_schedules.items():
+            if name not in jobs:
+                raise ValueError(f"알 수 없는 잡 이름: {name}")
+            self.jobs.append(
+                ScheduledJob(
+                    name=name,
+                    func=jobs[name],
+                    schedule=parse_schedule(expression, tz),
+                    jitter_sec=settings.daemon_jitter_sec,
+                )
+            )
+        self.stop_event = threading.Event()
+        self.status_path = Path(settings.daemon_status_path)
+        # 잡이 끝날 때마다 풀 스레드에서 상태 파일을 쓰므로, 같은 임시 파일을 동시에 쓰지 않게 막는다.
+        self._status_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, len(self.jobs)), thread_name_prefix="batch-job"
+        )
+
+    def install_signal_handlers(self) -> None:
+        def handle(signum, _frame):
+            logger.info("종료 신호 수신(%s). 실행 중인 잡이 끝나면 종료합니다.", signum)
+            self.stop_event.set()
+
+        signal.signal(signal.SIGTERM, handle)
+        signal.signal(signal.SIGINT, handle)
+
+    def tick(self, now: datetime) -> list[str]:
+        """실행 시각이 된 잡을 시작하고 시작한 잡 이름을 반환."""
+
+        started: list[str] = []
+        for job in self.jobs:
+            if job.next_run_at is None or job.next_run_at > now:
+                continue
+            job.plan_next(now)
+            if not job.try_start():
+                logger.warning("이전 실행이 끝나지 않아 스킵: %s", job.name)
+                continue
+            future = self._executor.submit(job.run)
+            future.add_done_callback(lambda _f: self.write_status())
+            started.append(job.name)
+        return started
+
+    def run_forever(self) -> None:
+        now = datetime.utcnow()
+        for job in self.jobs:
+            job.plan_next(now)
+            logger.info("잡 등록: %s (%s) next=%s", job.name, job.schedule.expression, job.next_run_at)
+        self.write_status()
+
+        while not self.stop_event.is_set():
+            now = datetime.utcnow()
+            self.tick(now)
+            next_times = [job.next_run_at for job in self.jobs if job.next_run_at]
+            wait = 1.0
+            if next_times:
+                wait = min(max((min(next_times) - now).total_seconds(), 0.1), 30.0)
+            self.stop_event.wait(wait)
+
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+        self.write_status()
+        logger.info("배치 데몬 종료")
+
+    def write_status(self) -> None:
+        with self._status_lock:
+            payload = {
+                "updated_at": datetime.utcnow().isoformat(),
+                "jobs": {job.name: job.status() for job in self.jobs},
+            }
+            try:
+                self.status_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.status_path.with_suffix(".tmp")
+                tmp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+                tmp_path.replace(self.status_path)
+            except OSError:
+                logger.exception("데몬 상태 파일 저장 실패: %s", self.status_path)
+
+
+def run_daemon(settings: BatchSettings, jobs: dict[str, Callable[[], None]]) -> None:
+    from common.http import close_http_client
+    from common.runtime import start_background_loop, stop_background_loop
+
+    daemon = BatchDaemon(settings, jobs)
+    daemon.install_signal_handlers()
+    if settings.daemon_warm_browser:
+        start_background_loop()
+    try:
+        daemon.run_forever()
+    finally:
+        stop_background_loop()
+        close_http_client()
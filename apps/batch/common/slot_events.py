@@ -0,0 +1,53 @@
+# why: 슬롯 업서트 결과를 알림 평가기로 넘기기 위한 프로세스 내 이벤트 큐
+import enum
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+
+
+class SlotEventType(str, enum.Enum):
+    CREATED = "CREATED"
+    CHANGED = "CHANGED"
+
+
+@dataclass
+class SlotEvent:
+    event_type: SlotEventType
+    id: int
+    channel_code: str
+    start_at: datetime
+    raw_title: str
+    normalized_title: str
+    price_text: str | None = None
+
+
+class SlotEventQueue:
+    """업서트 중 생성/변경된 슬롯 이벤트를 모아두는 큐.
+
+    - why: 전체 편성표를 다시 훑지 않고, 이번 수집에서 바뀐 슬롯만 알림 규칙과 매칭하기 위해.
+    - 같은 슬롯이 여러 번 바뀌면 마지막 이벤트만 남긴다.
+    """
+
+    def __init__(self) -> None:
+        self._events: deque[SlotEvent] = deque()
+        self._latest: dict[int, SlotEvent] = {}
+
+    def __len__(self) -> int:
+        return len(self._latest)
+
+    def publish(self, event: SlotEvent) -> None:
+        previous = self._latest.get(event.id)
+        if previous is not None and previous.event_type == SlotEventType.CREATED:
+            # 생성 직후 변경된 슬롯은 여전히 신규 슬롯으로 취급
+            event.event_type = SlotEventType.CREATED
+        self._latest[event.id] = event
+        self._events.append(event)
+
+    def drain(self) -> list[SlotEvent]:
+        drained: list[SlotEvent] = []
+        while self._events:
+            event = self._events.popleft()
+            if self._latest.get(event.id) is event:
+                drained.append(event)
+                del self._latest[event.id]
+        return drained
@@ -0,0 +1,213 @@
+# why: 슬롯 업서트 이벤트만으로 알림 규칙을 증분 매칭하고 발송 시각에 맞춰 알림을 보내기 위한 평가기
+from datetime import datetime, timedelta
+import logging
+import threading
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from common.alert_rules import AlertRule, AlertRuleIndex, TimerWheel
+from common.config import BatchSettings, get_batch_settings
+from common.db import get_db_session
+from common.leases import exclusive_job
+from common.models import Alert, BroadcastSlot, Channel
+from common.slot_events import SlotEvent, SlotEventType
+from jobs.send_alerts_job import DeliveryStats, deliver_alert_matches
+
+
+logger = logging.getLogger("batch.alert_evaluator")
+
+# 슬롯별 최신 이벤트 중 이미 시작한 방송을 정리하는 주기
+_PRUNE_INTERVAL = timedelta(hours=1)
+
+
+def _same_slot(a: SlotEvent, b: SlotEvent) -> bool:
+    return (a.channel_code, a.start_at, a.raw_title, a.normalized_title, a.price_text) == (
+        b.channel_code,
+        b.start_at,
+        b.raw_title,
+        b.normalized_title,
+        b.price_text,
+    )
+
+
+class AlertEvaluator:
+    """신규/변경 슬롯을 알림 규칙 색인과 매칭해 `start_at - notify_before_minutes`에 발송.
+
+    - 프로세스당 하나를 두고(get_alert_evaluator) `send_alerts` 임대를 잡은 실행에서만 tick한다.
+    - tick마다 발송 구간(지금 ~ 가장 긴 notify_before_minutes)의 슬롯을 DB에서 다시 읽어,
+      다른 워커가 수집한 슬롯도 놓치지 않는다. 처음 보거나 바뀐 슬롯만 규칙과 매칭해 휠에 예약한다.
+    - 실패한 발송은 발송 로그의 다음 재시도 시각에 다시 예약한다.
+    - 발송 로그(alert_deliveries)를 공유하므로 정기 잡과 중복 발송되지 않는다.
+    """
+
+    def __init__(self, settings: BatchSettings | None = None, now: datetime | None = None) -> None:
+        self.settings = settings or get_batch_settings()
+        self.index = AlertRuleIndex([])
+        self.wheel = TimerWheel(now or datetime.utcnow())
+        self._rules: frozenset[AlertRule] = frozenset()
+        self._horizon = timedelta(0)
+        # 슬롯별 마지막으로 예약한 이벤트. 휠에 남은 이전 이벤트(변경 전 제목/시각)는 발송하지 않는다.
+        self._latest: dict[int, SlotEvent] = {}
+        self._pruned_at = now or datetime.utcnow()
+        # 수집 잡과 상주 tick이 서로 다른 스레드에서 호출한다.
+        self._lock = threading.Lock()
+
+    def refresh_rules(self, db: Session, now: datetime) -> None:
+        """활성 알림 규칙을 다시 읽고, 바뀌었으면 색인과 예약을 새로 만든다 (예약은 reload_window가 채움)."""
+
+        alerts = db.execute(select(Alert).where(Alert.is_active == True)).scalars().all()
+        rules = frozenset(AlertRule.from_alert(alert) for alert in alerts if alert.destination_value)
+        if rules == self._rules:
+            return
+        self._rules = rules
+        self.index = AlertRuleIndex(rules)
+        self._horizon = timedelta(
+            minutes=max((rule.notify_before_minutes for rule in rules), default=0)
+        )
+        self.wheel = TimerWheel(now)
+        self._latest = {}
+
+    def reload_window(self, db: Session, now: datetime) -> int:
+        """발송 구간에 든 슬롯을 DB에서 다시 읽어 처음 보거나 바뀐 슬롯만 예약하고 예약 건수를 반환."""
+
+        if not self.index.rule_count:
+            return 0
+
+        rows = db.execute(
+            select(
+                BroadcastSlot.id,
+                Channel.channel_code,
+                BroadcastSlot.start_at,
+                BroadcastSlot.raw_title,
+                BroadcastSlot.normalized_title,
+                BroadcastSlot.price_text,
+            )
+            .join(Channel, Channel.id == BroadcastSlot.channel_id)
+            .where(BroadcastSlot.start_at >= now)
+            .where(BroadcastSlot.start_at <= now + self._horizon)
+        ).all()
+        return self.handle_events([SlotEvent(SlotEventType.CREATED, *row) for row in rows], now)
+
+    def handle_events(self, events: list[SlotEvent], now: datetime) -> int:
+        """이벤트를 규칙과 매칭해 타이머 휠에 예약하고 예약 건수를 반환."""
+
+        scheduled = 0
+        for event in events:
+            if event.start_at < now:
+                continue
+            previous = self._latest.get(event.id)
+            if previous is not None and _same_slot(previous, event):
+                continue
+            self._latest[event.id] = event
+            for rule in self.index.match(event.channel_code, event.normalized_title):
+                fire_at = event.start_at - timedelta(minutes=rule.notify_before_minutes)
+                self.wheel.schedule(fire_at, (rule, event))
+                scheduled += 1
+        return scheduled
+
+    def fire_due(self, db: Session, now: datetime) -> DeliveryStats:
+        """발송 시각이 된 예약 알림을 보낸다.
+
+        - 이미 시작한 방송, 바뀐 슬롯/규칙의 예약은 버린다.
+        - 실패해 재시도가 남은 건은 다음 재시도 시각에 다시 예약한다.
+        """
+
+        grouped: dict[int, tuple[AlertRule, list[SlotEvent]]] = {}
+        fired: dict[tuple[int, int], tuple[AlertRule, SlotEvent]] = {}
+        for rule, event in self.wheel.advance(now):
+            if event.start_at < now or rule not in self._rules:
+                continue
+            if self._latest.get(event.id) is not event:
+                continue
+            grouped.setdefault(rule.id, (rule, []))[1].append(event)
+            fired[(rule.id, event.id)] = (rule, event)
+
+        if now - self._pruned_at >= _PRUNE_INTERVAL:
+            self._latest = {
+                slot_id: event for slot_id, event in self._latest.items() if event.start_at >= now
+            }
+            self._pruned_at = now
+
+        stats = deliver_alert_matches(db, self.settings, list(grouped.values()), now)
+        for (alert_id, slot_id, _), retry_at in stats.retry_at.items():
+            entry = fired.get((alert_id, slot_id))
+            if entry is not None and retry_at < entry[1].start_at:
+                self.wheel.schedule(retry_at, entry)
+        return stats
+
+    def tick(
+        self, db: Session, now: datetime, events: list[SlotEvent] | None = None
+    ) -> tuple[int, DeliveryStats]:
+        """규칙 갱신 → 이벤트/발송 구간 슬롯 예약 → 발송 시각이 된 예약 발송.
+
+        - 여러 워커가 동시에 발송하지 않도록 `send_alerts` 임대 안에서만 호출한다.
+        - return: (이번 tick에 새로 예약한 건수, 발송 통계)
+        """
+
+        with self._lock:
+            self.refresh_rules(db, now)
+            scheduled = self.handle_events(events or [], now)
+            scheduled += self.reload_window(db, now)
+            return scheduled, self.fire_due(db, now)
+
+
+_evaluator: AlertEvaluator | None = None
+_evaluator_lock = threading.Lock()
+
+
+def get_alert_evaluator() -> AlertEvaluator:
+    """프로세스 단위로 공유되는 평가기.
+
+    - why: 상주 실행의 tick들이 예약과 규칙 색인을 이어받아 바뀐 슬롯만 다시 매칭하기 위해.
+    """
+
+    global _evaluator
+    with _evaluator_lock:
+        if _evaluator is None:
+            _evaluator = AlertEvaluator()
+        return _evaluator
+
+
+@exclusive_job("send_alerts")
+def _evaluate_alerts(events: list[SlotEvent]) -> None:
+    db = get_db_session()
+    # why: 발송 건마다 커밋하므로, 커밋 후 알림/로그 객체를 다시 SELECT 하지 않도록 만료를 끈다.
+    db.expire_on_commit = False
+    try:
+        evaluator = get_alert_evaluator()
+        scheduled, stats = evaluator.tick(db, datetime.utcnow(), events)
+        if events or scheduled or stats.sent or stats.failed:
+            logger.info(
+                "알림 평가 완료. events=%s scheduled=%s sent=%s failed=%s skipped=%s pending=%s",
+                len(events),
+                scheduled,
+                stats.sent,
+                stats.failed,
+                stats.skipped,
+                len(evaluator.wheel),
+            )
+    finally:
+        db.close()
+
+
+def evaluate_slot_events(events: list[SlotEvent]) -> None:
+    """수집 직후: 이번 수집에서 바뀐 슬롯을 바로 매칭해 발송 구간에 든 알림을 보낸다.
+
+    - 다른 워커가 발송 중이라 임대를 못 잡으면 건너뛴다. 발송 구간에 든 슬롯은 그 워커의 tick이 DB에서 다시 읽는다.
+    - 단발 실행은 프로세스가 끝나면 예약이 사라지므로 이후 알림은 정기 `send_alerts`가 보낸다.
+    """
+
+    if events:
+        _evaluate_alerts(events)
+
+
+def evaluate_alerts_job():
+    """상주 실행용 알림 tick.
+
+    - 전체 편성표를 다시 훑는 `send_alerts` 대신, 발송 구간 슬롯 중 처음 보거나 바뀐 슬롯만 매칭하고
+      타이머 휠에서 발송 시각이 된 예약을 보낸다.
+    - `send_alerts`와 같은 임대를 써서 여러 워커 중 한 곳만 발송한다.
+    """
+
+    _evaluate_alerts([])
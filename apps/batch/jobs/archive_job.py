@@ -0,0 +1,30 @@
+# why: 끝난 지 오래된 방송과 가격 이력을 보관 테이블로 옮기고 가격 이력 파티션을 관리하는 잡
+from datetime import datetime, timedelta
+
+from common.config import get_batch_settings
+from common.db import get_db_session
+from common.leases import exclusive_job
+from pipelines.archive_pipeline import (
+    ArchiveResult,
+    archive_ended_slots,
+    maintain_price_history_partitions,
+)
+
+
+@exclusive_job("archive")
+def archive_job() -> ArchiveResult:
+    """보관 잡 (하루 한 번, 트래픽이 적은 시간에 실행)."""
+
+    settings = get_batch_settings()
+    cutoff = datetime.utcnow() - timedelta(days=settings.archive_after_days)
+    db = get_db_session()
+    try:
+        result = archive_ended_slots(
+            db, cutoff, settings.archive_chunk_size, settings.archive_sleep_sec
+        )
+        result.added_partitions, result.dropped_partitions = maintain_price_history_partitions(
+            db, cutoff, settings.archive_partition_months_ahead
+        )
+        return result
+    finally:
+        db.close()
@@ -0,0 +1,32 @@
+# why: 편성표 수집 중 처리하지 못한 가격 수집 작업을 주기적으로 이어서 처리하기 위한 잡
+import logging
+
+from common.config import get_batch_settings
+from common.db import get_db_session
+from common.leases import default_worker_id
+from pipelines.price_queue_pipeline import drain_price_queue
+from pipelines.schedule_pipeline import apply_fetched_prices
+
+
+logger = logging.getLogger("batch.price_queue")
+
+
+def drain_price_queue_job():
+    """가격 수집 큐 처리 잡.
+
+    - 작업 단위로 잠금을 잡으므로 여러 워커가 동시에 실행해도 같은 URL을 중복 처리하지 않는다.
+    - 확보한 가격은 아직 끝나지 않은 슬롯에 바로 반영한다.
+    """
+
+    settings = get_batch_settings()
+    if not settings.product_price_fetch_enabled:
+        return
+
+    db = get_db_session()
+    try:
+        worker_id = settings.batch_worker_id or default_worker_id()
+        results = drain_price_queue(db, settings, worker_id, settings.price_queue_job_budget_sec)
+        updated = apply_fetched_prices(db, results)
+        logger.info("가격 큐 반영 완료. fetched=%s updated_slots=%s", len(results), updated)
+    finally:
+        db.close()
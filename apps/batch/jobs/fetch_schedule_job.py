@@ -1,18 +1,51 @@
 # why: 모듈 역할과 책임을 명확히 하기 위한 진입 주석
 import logging
 
+from common.config import get_batch_settings
 from common.db import get_db_session
-from pipelines.schedule_pipeline import run_schedule_pipeline
+from common.leases import default_worker_id, exclusive_job
+from common.slot_events import SlotEventQueue
+from jobs.alert_evaluator import evaluate_slot_events
+from pipelines.schedule_pipeline import run_schedule_pipeline, run_sharded_schedule_pipeline
 
 
 logger = logging.getLogger("batch.fetch")
 
 
 def fetch_schedule_job():
-    """편성표 수집 잡."""
+    """편성표 수집 잡.
 
+    - 수집 직후 생성/변경된 슬롯만 알림 규칙과 매칭해, 시작 임박 방송을 바로 알린다.
+    - batch_shard_count > 1이면 채널 샤드를 임대해 여러 워커가 나눠 수집하고,
+      아니면 잡 임대로 한 워커만 실행한다.
+    """
+
+    settings = get_batch_settings()
+    if settings.batch_shard_count > 1:
+        _run_fetch_schedule(sharded=True)
+    else:
+        _run_exclusive_fetch_schedule()
+
+
+@exclusive_job("fetch_schedule")
+def _run_exclusive_fetch_schedule():
+    _run_fetch_schedule(sharded=False)
+
+
+def _run_fetch_schedule(sharded: bool):
+    settings = get_batch_settings()
     db = get_db_session()
+    events = SlotEventQueue()
     try:
-        run_schedule_pipeline(db)
+        if sharded:
+            worker_id = settings.batch_worker_id or default_worker_id()
+            run_sharded_schedule_pipeline(db, get_db_session, worker_id, events)
+        else:
+            run_schedule_pipeline(db, events)
+        try:
+            evaluate_slot_events(events.drain())
+        except Exception:
+            # why: 알림 평가 실패가 수집 결과 반영을 되돌리지 않도록 분리
+            logger.exception("이벤트 기반 알림 평가 실패")
     finally:
         db.close()
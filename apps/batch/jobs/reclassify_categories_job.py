@@ -0,0 +1,18 @@
+# why: 카테고리 룰 파일을 바꾼 뒤 과거 슬롯의 카테고리를 새 룰로 맞추기 위한 잡
+from common.classifier import get_classifier
+from common.config import get_batch_settings
+from common.db import get_db_session
+from common.leases import exclusive_job
+from pipelines.category_pipeline import reclassify_slots
+
+
+@exclusive_job("reclassify_categories")
+def reclassify_categories_job():
+    """카테고리 재분류 잡 (룰 변경 후 수동 실행)."""
+
+    settings = get_batch_settings()
+    db = get_db_session()
+    try:
+        reclassify_slots(db, get_classifier(settings), settings.category_reclassify_batch_size)
+    finally:
+        db.close()
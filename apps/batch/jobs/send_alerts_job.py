@@ -1,94 +1,246 @@
 # why: 모듈 역할과 책임을 명확히 하기 위한 진입 주석
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import logging
+from typing import Any
 
 from sqlalchemy import select
-
-from common.config import get_batch_settings
+from sqlalchemy.orm import Session
+
+from common.alert_delivery import (
+    DeliveryKey,
+    destination_hash,
+    is_deliverable,
+    load_deliveries,
+    record_failure,
+    record_success,
+)
+from common.config import BatchSettings, get_batch_settings
 from common.db import get_db_session
-from common.crypto import decrypt_value, is_invalid_token
-from common.models import Alert, BroadcastSlot, Channel, DestinationType
-from common.email import send_email_message
-from common.slack import send_slack_message
+from common.leases import exclusive_job
+from common.crypto import decrypt_values
+from common.models import Alert, BroadcastSlot, Channel, DeliveryStatus, DestinationType
+from common.notify import DispatchResult, Notification, NotificationDispatcher
 
 
 logger = logging.getLogger("batch.alerts")
 
 
+@dataclass
+class UpcomingSlot:
+    id: int
+    channel_code: str
+    start_at: datetime
+    raw_title: str
+    normalized_title: str
+    price_text: str | None
+
+
+class UpcomingSlotIndex:
+    """채널 코드별로 시작 시각 순 정렬된 예정 슬롯 인덱스.
+
+    - why: 알림마다 DB를 다시 조회하지 않고, 한 번 읽은 슬롯을 메모리에서 구간 검색하기 위해.
+    """
+
+    def __init__(self, slots: list[UpcomingSlot]) -> None:
+        self._slots: dict[str, list[UpcomingSlot]] = {}
+        for slot in sorted(slots, key=lambda item: item.start_at):
+            self._slots.setdefault(slot.channel_code, []).append(slot)
+        self._starts = {
+            code: [slot.start_at for slot in items] for code, items in self._slots.items()
+        }
+
+    def __len__(self) -> int:
+        return sum(len(items) for items in self._slots.values())
+
+    def find(
+        self, channel_codes: list[str], window_start: datetime, window_end: datetime
+    ) -> list[UpcomingSlot]:
+        """채널 목록의 [window_start, window_end] 구간 슬롯을 시작 시각 순으로 반환."""
+
+        found: list[UpcomingSlot] = []
+        for code in dict.fromkeys(channel_codes or []):
+            starts = self._starts.get(code)
+            if not starts:
+                continue
+            lo = bisect_left(starts, window_start)
+            hi = bisect_right(starts, window_end)
+            found.extend(self._slots[code][lo:hi])
+        found.sort(key=lambda item: item.start_at)
+        return found
+
+
+def load_upcoming_slots(db, window_start: datetime, window_end: datetime) -> UpcomingSlotIndex:
+    """알림 전체의 합집합 구간 슬롯을 채널 코드와 함께 한 번에 조회."""
+
+    rows = db.execute(
+        select(
+            BroadcastSlot.id,
+            Channel.channel_code,
+            BroadcastSlot.start_at,
+            BroadcastSlot.raw_title,
+            BroadcastSlot.normalized_title,
+            BroadcastSlot.price_text,
+        )
+        .join(Channel, Channel.id == BroadcastSlot.channel_id)
+        .where(BroadcastSlot.start_at >= window_start)
+        .where(BroadcastSlot.start_at <= window_end)
+    ).all()
+    return UpcomingSlotIndex([UpcomingSlot(*row) for row in rows])
+
+
 def _match_keywords(title: str, keywords: list[str]) -> bool:
     # why: 키워드 매칭을 단순화하여 빠른 MVP 구현을 보장
     lowered = title.lower()
     return any(keyword.lower() in lowered for keyword in keywords)
 
 
+@dataclass
+class DeliveryStats:
+    sent: int = 0
+    failed: int = 0
+    skipped: int = 0
+    # 실패했지만 아직 재시도할 수 있는 건 → 다음 시도 시각 (이번 실패 + 재시도 대기 중이라 건너뛴 건)
+    retry_at: dict[DeliveryKey, datetime] = field(default_factory=dict)
+
+
+def deliver_alert_matches(
+    db: Session,
+    settings: BatchSettings,
+    matched: list[tuple[Any, list[Any]]],
+    now: datetime,
+) -> DeliveryStats:
+    """매칭된 (알림, 슬롯 목록)을 발송 로그로 거른 뒤 디스패처로 발송.
+
+    - 알림은 id/alert_name/destination_type/destination_value(암호문)를,
+      슬롯은 id/raw_title/start_at/price_text를 가진 객체면 된다.
+    - why: 정기 잡과 이벤트 기반 평가기가 같은 중복 방지/기록 규칙을 공유하기 위해.
+    """
+
+    stats = DeliveryStats()
+    if not matched:
+        return stats
+
+    # 기존 평문 데이터(InvalidToken)는 그대로 사용된다.
+    destinations = decrypt_values([alert.destination_value for alert, _ in matched])
+    matches = [
+        (alert, destination_value, broadcast)
+        for (alert, broadcasts), destination_value in zip(matched, destinations)
+        for broadcast in broadcasts
+    ]
+
+    deliveries = load_deliveries(
+        db,
+        {alert.id for alert, _, _ in matches},
+        {broadcast.id for _, _, broadcast in matches},
+    )
+
+    dispatcher = NotificationDispatcher(settings)
+    queued: set[DeliveryKey] = set()
+    for alert, destination_value, broadcast in matches:
+        if alert.destination_type not in (DestinationType.SLACK, DestinationType.EMAIL):
+            continue
+        key = (alert.id, broadcast.id, destination_hash(destination_value))
+        delivery = deliveries.get(key)
+        if key in queued or not is_deliverable(delivery, now, settings.alert_delivery_max_attempts):
+            stats.skipped += 1
+            if (
+                delivery is not None
+                and delivery.status == DeliveryStatus.FAILED
+                and delivery.attempts < settings.alert_delivery_max_attempts
+                and delivery.next_retry_at is not None
+            ):
+                stats.retry_at[key] = delivery.next_retry_at
+            continue
+        queued.add(key)
+
+        dispatcher.add(
+            Notification(
+                destination_type=alert.destination_type,
+                destination_value=destination_value,
+                subject=f"[BroadcastBoard] {alert.alert_name}",
+                body=(
+                    f"[{alert.alert_name}] 곧 시작하는 방송: {broadcast.raw_title}\n"
+                    f"시작: {broadcast.start_at.isoformat()} (UTC)\n"
+                    f"가격: {broadcast.price_text or '정보없음'}"
+                ),
+                key=key,
+            )
+        )
+
+    def handle_result(result: DispatchResult) -> None:
+        for key in result.keys:
+            if result.ok:
+                record_success(db, deliveries, key, now)
+                stats.sent += 1
+            else:
+                delivery = record_failure(
+                    db,
+                    deliveries,
+                    key,
+                    now,
+                    result.error or "unknown",
+                    settings.alert_delivery_retry_base_sec,
+                )
+                stats.failed += 1
+                if delivery.attempts < settings.alert_delivery_max_attempts:
+                    stats.retry_at[key] = delivery.next_retry_at
+        # why: 목적지별 발송 직후 기록해야 잡이 중간에 죽어도 이미 보낸 건을 다시 보내지 않는다.
+        db.commit()
+
+    dispatcher.dispatch_sync(handle_result)
+    return stats
+
+
+@exclusive_job("send_alerts")
 def send_alerts_job():
     """알림 발송 잡.
 
     - 오늘 편성표 중 키워드 매칭 & 시작 전 N분 조건을 만족하면 Slack/Email로 발송.
+    - 알림 수와 무관하게 DB 조회는 알림 목록 1회 + 예정 슬롯 1회로 고정한다.
+    - 발송 로그를 일괄 조회해 이미 보낸 (알림, 슬롯, 목적지)는 건너뛴다.
+    - 여러 워커에서 실행돼도 잡 임대를 잡은 한 워커만 발송한다.
     """
 
     settings = get_batch_settings()
     db = get_db_session()
+    # why: 발송 건마다 커밋하므로, 커밋 후 알림/로그 객체를 다시 SELECT 하지 않도록 만료를 끈다.
+    db.expire_on_commit = False
 
     now = datetime.utcnow()
 
     try:
         alerts = db.execute(select(Alert).where(Alert.is_active == True)).scalars().all()
-        sent_count = 0
-
-        for alert in alerts:
-            if not alert.destination_value:
-                continue
+        alerts = [alert for alert in alerts if alert.destination_value]
+        if not alerts:
+            logger.info("알림 발송 완료. sent=0")
+            return
 
-            try:
-                destination_value = decrypt_value(alert.destination_value)
-            except Exception as exc:
-                if is_invalid_token(exc):
-                    # 기존 평문 데이터일 수 있어 그대로 사용
-                    destination_value = alert.destination_value
-                else:
-                    raise
+        max_before = max(alert.notify_before_minutes for alert in alerts)
+        slot_index = load_upcoming_slots(db, now, now + timedelta(minutes=max_before))
 
+        matched: list[tuple[Alert, list[UpcomingSlot]]] = []
+        for alert in alerts:
             window_end = now + timedelta(minutes=alert.notify_before_minutes)
-
-            # 채널 조건
-            channel_ids = db.execute(
-                select(Channel.id).where(Channel.channel_code.in_(alert.target_channel_codes))
-            ).scalars().all()
-
-            if not channel_ids:
-                continue
-
-            broadcasts = (
-                db.execute(
-                    select(BroadcastSlot)
-                    .where(BroadcastSlot.channel_id.in_(channel_ids))
-                    .where(BroadcastSlot.start_at >= now)
-                    .where(BroadcastSlot.start_at <= window_end)
-                )
-                .scalars()
-                .all()
-            )
-
-            for broadcast in broadcasts:
-                if not _match_keywords(broadcast.normalized_title, alert.keyword_list):
-                    continue
-
-                message = (
-                    f"[{alert.alert_name}] 곧 시작하는 방송: {broadcast.raw_title}\n"
-                    f"시작: {broadcast.start_at.isoformat()} (UTC)\n"
-                    f"가격: {broadcast.price_text or '정보없음'}"
-                )
-                if alert.destination_type == DestinationType.SLACK:
-                    send_slack_message(destination_value, message)
-                    sent_count += 1
-                elif alert.destination_type == DestinationType.EMAIL:
-                    subject = f"[BroadcastBoard] {alert.alert_name}"
-                    send_email_message(destination_value, subject, message)
-                    sent_count += 1
-                else:
-                    continue
-
-        logger.info("알림 발송 완료. sent=%s", sent_count)
+            broadcasts = slot_index.find(alert.target_channel_codes, now, window_end)
+            broadcasts = [
+                broadcast
+                for broadcast in broadcasts
+                if _match_keywords(broadcast.normalized_title, alert.keyword_list)
+            ]
+            if broadcasts:
+                matched.append((alert, broadcasts))
+
+        stats = deliver_alert_matches(db, settings, matched, now)
+
+        logger.info(
+            "알림 발송 완료. sent=%s failed=%s skipped=%s alerts=%s candidates=%s",
+            stats.sent,
+            stats.failed,
+            stats.skipped,
+            len(alerts),
+            len(slot_index),
+        )
     finally:
         db.close()
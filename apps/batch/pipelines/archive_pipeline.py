@@ -0,0 +1,220 @@
+# why: 끝난 지 오래된 방송 슬롯과 가격 이력을 보관 테이블로 옮겨 원본 테이블/인덱스가 계속 커지지 않게 하기 위한 파이프라인
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Callable
+
+from sqlalchemy import delete, insert, select, text
+from sqlalchemy.orm import Session
+
+from common.models import (
+    AlertDelivery,
+    BroadcastPriceHistory,
+    BroadcastPriceHistoryArchive,
+    BroadcastSlot,
+    BroadcastSlotArchive,
+)
+
+
+logger = logging.getLogger("batch.archive")
+
+PRICE_HISTORY_TABLE = "broadcast_price_history"
+_PARTITION_NAME = re.compile(r"^p(\d{4})(\d{2})$")
+
+
+@dataclass
+class ArchiveResult:
+    slots: int = 0
+    price_history: int = 0
+    chunks: int = 0
+    added_partitions: list[str] = field(default_factory=list)
+    dropped_partitions: list[str] = field(default_factory=list)
+
+
+def archive_ended_slots(
+    db: Session,
+    cutoff: datetime,
+    chunk_size: int,
+    sleep_sec: float,
+    sleep: Callable[[float], None] = time.sleep,
+) -> ArchiveResult:
+    """cutoff 이전에 끝난 슬롯과 그 가격 이력을 chunk_size개씩 보관 테이블로 옮긴다.
+
+    - 청크마다 INSERT ... SELECT로 복사하고 원본을 기본키로 지운 뒤 바로 커밋해, 잠금은 옮기는 행에만 짧게 걸린다.
+      오래 전에 끝난 슬롯은 편성표 수집/가격 반영이 더 이상 건드리지 않는 행이다.
+    - end_at 인덱스 순으로 앞에서부터 가져오고, 옮긴 행은 원본에서 사라지므로 별도 커서 없이 이어진다.
+      (중간에 멈춰도 커밋된 청크는 끝난 것이라 다시 실행하면 남은 행부터 처리)
+    - 청크 사이에 sleep_sec만큼 쉬어 복제 지연과 운영 쿼리 영향을 줄인다.
+    - `products.broadcast_count`는 누적 편성 수라 줄이지 않는다. 상품 상세 API가 보관 테이블도 함께 읽는다.
+    """
+
+    started = time.monotonic()
+    result = ArchiveResult()
+    slot_columns = _copy_columns(BroadcastSlot, BroadcastSlotArchive)
+    history_columns = _copy_columns(BroadcastPriceHistory, BroadcastPriceHistoryArchive)
+
+    while True:
+        slot_ids = db.scalars(
+            select(BroadcastSlot.id)
+            .where(BroadcastSlot.end_at < cutoff)
+            .order_by(BroadcastSlot.end_at, BroadcastSlot.id)
+            .limit(chunk_size)
+        ).all()
+        if not slot_ids:
+            break
+
+        db.execute(
+            insert(BroadcastSlotArchive).from_select(
+                slot_columns,
+                select(*[BroadcastSlot.__table__.c[name] for name in slot_columns]).where(
+                    BroadcastSlot.id.in_(slot_ids)
+                ),
+            )
+        )
+        db.execute(
+            insert(BroadcastPriceHistoryArchive).from_select(
+                history_columns,
+                select(*[BroadcastPriceHistory.__table__.c[name] for name in history_columns]).where(
+                    BroadcastPriceHistory.broadcast_slot_id.in_(slot_ids)
+                ),
+            )
+        )
+        history_count = db.execute(
+            delete(BroadcastPriceHistory).where(BroadcastPriceHistory.broadcast_slot_id.in_(slot_ids))
+        ).rowcount
+        # 발송 로그는 FK ON DELETE CASCADE지만, FK가 꺼진 환경에서도 남지 않도록 직접 지운다.
+        db.execute(delete(AlertDelivery).where(AlertDelivery.broadcast_slot_id.in_(slot_ids)))
+        db.execute(delete(BroadcastSlot).where(BroadcastSlot.id.in_(slot_ids)))
+        db.commit()
+
+        result.chunks += 1
+        result.slots += len(slot_ids)
+        result.price_history += history_count
+        logger.info(
+            "보관 청크 완료. chunk=%s slots=%s price_history=%s",
+            result.chunks,
+            len(slot_ids),
+            history_count,
+        )
+
+        if len(slot_ids) < chunk_size:
+            break
+        if sleep_sec > 0:
+            sleep(sleep_sec)
+
+    logger.info(
+        "보관 완료. cutoff=%s slots=%s price_history=%s chunks=%s elapsed=%.1fs",
+        cutoff.isoformat(),
+        result.slots,
+        result.price_history,
+        result.chunks,
+        time.monotonic() - started,
+    )
+    return result
+
+
+def maintain_price_history_partitions(
+    db: Session, cutoff: datetime, months_ahead: int, today: date | None = None
+) -> tuple[list[str], list[str]]:
+    """가격 이력 월 파티션 유지 (MySQL에서 파티션된 경우만).
+
+    - 이번 달부터 months_ahead개월 뒤까지 빠진 파티션을 pmax에서 나눠 미리 만든다.
+    - cutoff 이전 달 파티션 중 보관으로 비워진 것은 DROP PARTITION으로 공간을 돌려준다.
+      (비었는지 확인하고 지우므로 아직 옮기지 않은 이력은 지우지 않는다)
+
+    - return: (추가한 파티션 이름, 삭제한 파티션 이름)
+    """
+
+    if db.get_bind().dialect.name != "mysql":
+        return [], []
+
+    names = db.scalars(
+        text(
+            "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND PARTITION_NAME IS NOT NULL"
+        ),
+        {"table": PRICE_HISTORY_TABLE},
+    ).all()
+    if not names:
+        return [], []
+
+    existing = partition_months(names)
+    this_month = (today or date.today()).replace(day=1)
+    added = []
+    missing = missing_partition_months(existing, this_month, months_ahead)
+    if missing and "pmax" in names:
+        definitions = [
+            f"PARTITION {_partition_name(month)} VALUES LESS THAN ('{_add_months(month, 1):%Y-%m-%d}')"
+            for month in missing
+        ]
+        definitions.append("PARTITION pmax VALUES LESS THAN (MAXVALUE)")
+        db.execute(
+            text(
+                f"ALTER TABLE {PRICE_HISTORY_TABLE} REORGANIZE PARTITION pmax INTO ("
+                + ", ".join(definitions)
+                + ")"
+            )
+        )
+        added = [_partition_name(month) for month in missing]
+
+    dropped = []
+    for month in expired_partition_months(existing, cutoff.date()):
+        name = _partition_name(month)
+        remaining = db.execute(
+            text(f"SELECT 1 FROM {PRICE_HISTORY_TABLE} PARTITION ({name}) LIMIT 1")
+        ).first()
+        if remaining is None:
+            db.execute(text(f"ALTER TABLE {PRICE_HISTORY_TABLE} DROP PARTITION {name}"))
+            dropped.append(name)
+
+    if added or dropped:
+        logger.info("가격 이력 파티션 정리. added=%s dropped=%s", added, dropped)
+    return added, dropped
+
+
+def partition_months(names: list[str]) -> list[date]:
+    """pYYYYMM 형식 파티션 이름을 월 시작일로 (pmax 등은 제외)."""
+
+    months = []
+    for name in names:
+        matched = _PARTITION_NAME.match(name)
+        if matched:
+            months.append(date(int(matched.group(1)), int(matched.group(2)), 1))
+    return sorted(months)
+
+
+def missing_partition_months(existing: list[date], this_month: date, months_ahead: int) -> list[date]:
+    """마지막 월 파티션 다음 달부터 this_month + months_ahead까지.
+
+    - REORGANIZE는 pmax(맨 위 구간)만 나눌 수 있으므로 마지막 파티션 이후 달만 추가한다.
+    """
+
+    month = _add_months(existing[-1], 1) if existing else this_month
+    last = _add_months(this_month, months_ahead)
+    months = []
+    while month <= last:
+        months.append(month)
+        month = _add_months(month, 1)
+    return months
+
+
+def expired_partition_months(existing: list[date], cutoff: date) -> list[date]:
+    """구간 전체가 cutoff 이전인 월 파티션 (맨 마지막 월 파티션은 남긴다)."""
+
+    return [month for month in existing[:-1] if _add_months(month, 1) <= cutoff]
+
+
+def _partition_name(month: date) -> str:
+    return f"p{month:%Y%m}"
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _copy_columns(source, target) -> list[str]:
+    # 보관 테이블 컬럼 중 원본에 있는 컬럼만 복사 (archived_at 등은 기본값)
+    return [column.name for column in target.__table__.columns if column.name in source.__table__.columns]
@@ -0,0 +1,63 @@
+# why: 카테고리 룰이 바뀌었을 때 과거 방송 슬롯까지 새 룰로 일괄 재분류하기 위한 파이프라인
+import logging
+import time
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from common.classifier import CategoryClassifier
+from common.models import BroadcastSlot
+
+
+logger = logging.getLogger("batch.classifier")
+
+
+def reclassify_slots(
+    db: Session, classifier: CategoryClassifier, batch_size: int
+) -> tuple[int, int]:
+    """모든 슬롯을 id 순 배치로 읽어 카테고리가 달라진 행만 갱신.
+
+    - 저장된 normalized_title을 그대로 분류하므로 상품명 재정규화 비용이 없다.
+    - id 기준 키셋 페이지로 읽고, 바뀐 행만 기본키 일괄 UPDATE 후 배치마다 커밋한다.
+      (중간에 멈춰도 다시 실행하면 이미 맞는 행은 건너뛰므로 이어서 처리된다)
+
+    - return: (검사한 슬롯 수, 갱신한 슬롯 수)
+    """
+
+    started = time.monotonic()
+    last_id = 0
+    scanned = 0
+    changed = 0
+
+    while True:
+        rows = db.execute(
+            select(BroadcastSlot.id, BroadcastSlot.normalized_title, BroadcastSlot.category)
+            .where(BroadcastSlot.id > last_id)
+            .order_by(BroadcastSlot.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+
+        updates = []
+        for slot_id, normalized_title, category in rows:
+            new_category = classifier.classify(normalized_title)
+            if new_category != category:
+                updates.append({"id": slot_id, "category": new_category})
+
+        if updates:
+            db.execute(update(BroadcastSlot), updates)
+            db.commit()
+
+        scanned += len(rows)
+        changed += len(updates)
+        last_id = rows[-1].id
+
+    logger.info(
+        "카테고리 재분류 완료. version=%s scanned=%s changed=%s elapsed=%.1fs",
+        classifier.fingerprint,
+        scanned,
+        changed,
+        time.monotonic() - started,
+    )
+    return scanned, changed
@@ -0,0 +1,182 @@
+# why: 가격 수집 큐를 시간 예산 안에서 우선순위대로 처리하고, 남은 작업은 다음 주기로 넘기기 위한 파이프라인
+from datetime import datetime, timedelta
+import logging
+import time
+
+from sqlalchemy.orm import Session
+
+from common.config import BatchSettings
+from common.models import PriceFetchTask
+from common.price_priority import HTTP_COST, PriorityWeights
+from common.price_queue import (
+    Prices,
+    claim_tasks,
+    complete_task,
+    defer_task,
+    fail_task,
+    release_task,
+)
+from common.run_report import add, count, stage
+from common.runtime import run_async
+from sources.host_guard import log_host_guards
+from sources.product_price import (
+    ProductPriceFetcher,
+    fetch_product_prices_batch_browser,
+    refresh_session_pool,
+    should_force_browser,
+)
+
+
+logger = logging.getLogger("batch.price_queue")
+
+
+def drain_price_queue(
+    db: Session, settings: BatchSettings, worker_id: str, budget_sec: float
+) -> dict[str, Prices]:
+    """예산(초) 안에서 큐를 우선순위 점수 순 배치 단위로 비운다.
+
+    - 건수 제한 대신 시간 예산을 쓰므로, 곧 방송할 상품부터 처리하고 남은 작업은 다음 주기로 넘긴다.
+
+    - return: 이번 호출에서 가격을 확보한 URL → (정가, 할인가)
+    """
+
+    deadline = time.monotonic() + budget_sec
+    weights = PriorityWeights.from_settings(settings)
+    fetcher = ProductPriceFetcher(settings)
+    results: dict[str, Prices] = {}
+    counts = {"done": 0, "failed": 0, "carried": 0, "skipped": 0, "browser": 0}
+
+    if settings.product_price_fetch_browser_fallback and fetcher.api.sessions.needs_refresh():
+        # HTTP/API 요청에도 세션 쿠키를 싣도록 만료/폐기된 세션을 먼저 채운다.
+        run_async(refresh_session_pool(settings))
+
+    while time.monotonic() < deadline:
+        tasks = claim_tasks(
+            db, worker_id, settings.price_queue_batch_size, settings.price_queue_lock_sec, weights
+        )
+        if not tasks:
+            break
+
+        held = _process_tasks(db, settings, fetcher, tasks, deadline, results, counts)
+        if held:
+            # 예산을 다 써서 넘겼거나 차단기가 열려 미룬 작업이 있으면 다음 배치를 잡지 않는다.
+            break
+
+    for name, value in counts.items():
+        count(f"price_queue_{name}", value)
+    logger.info(
+        "가격 큐 처리 완료. done=%s failed=%s carried=%s skipped=%s",
+        counts["done"],
+        counts["failed"],
+        counts["carried"],
+        counts["skipped"],
+    )
+    price_stats = fetcher.stats()
+    logger.info(
+        "상품 가격 크롤링 통계: requested=%s success=%s api=%s/%s(%.0f%%) browser=%s",
+        price_stats["requested"],
+        price_stats["success"],
+        price_stats["api_hit"],
+        price_stats["api_requested"],
+        price_stats["api_hit_rate"] * 100,
+        counts["browser"],
+    )
+    session_stats = fetcher.api.sessions.summary()
+    logger.info(
+        "브라우저 세션 풀: sessions=%s created=%s retired=%s success_rate=%s",
+        session_stats["sessions"],
+        session_stats["created"],
+        session_stats["retired"],
+        session_stats["success_rate"],
+    )
+    log_host_guards()
+    fetcher.api.save()
+    return results
+
+
+def _process_tasks(
+    db: Session,
+    settings: BatchSettings,
+    fetcher: ProductPriceFetcher,
+    tasks: list[PriceFetchTask],
+    deadline: float,
+    results: dict[str, Prices],
+    counts: dict[str, int],
+) -> int:
+    """배치 하나를 수집해 작업 상태를 갱신한다.
+
+    - return: 이번 주기에 처리하지 못하고 넘긴(carried) + 차단기 때문에 미룬(skipped) 작업 수
+    """
+
+    urls = [task.url for task in tasks]
+    # 가격 API 빠른 경로 → HTML 순으로 시도
+    http_rejected: dict[str, float] = {}
+    with stage("price_http"):
+        http_map = run_async(fetcher.fetch_batch(urls, http_rejected))
+    fetched = {url: prices for url, prices in http_map.items() if prices != (None, None)}
+    add("price_http", items=len(urls), success=len(fetched))
+
+    browser_targets: list[str] = []
+    browser_map: dict[str, Prices] = {}
+    browser_rejected: dict[str, float] = {}
+    if settings.product_price_fetch_browser_fallback:
+        # 브라우저 fallback은 G마켓 계열만 대상
+        browser_targets = [url for url in urls if url not in fetched and should_force_browser(url)]
+        remaining = deadline - time.monotonic()
+        if browser_targets and remaining > 0:
+            counts["browser"] += len(browser_targets)
+            with stage("price_browser"):
+                browser_map = run_async(
+                    fetch_product_prices_batch_browser(
+                        browser_targets, settings, timeout_sec=remaining, rejected=browser_rejected
+                    )
+                )
+            add(
+                "price_browser",
+                items=len(browser_targets),
+                success=sum(1 for prices in browser_map.values() if prices != (None, None)),
+            )
+
+    # 브라우저 결과가 없는 URL은 예산을 다 쓴 경우에만 넘기고, 아니면(Playwright 미설치 등) 실패로 기록
+    out_of_time = time.monotonic() >= deadline
+    browser_cost = settings.price_priority_browser_cost
+    carried = 0
+    skipped = 0
+    now = datetime.utcnow()
+    browser_target_set = set(browser_targets)
+    for task in tasks:
+        prices = fetched.get(task.url) or browser_map.get(task.url)
+        # 브라우저까지 간 URL은 다음 주기 우선순위에서 비용이 큰 작업으로 취급
+        cost = browser_cost if task.url in browser_target_set else HTTP_COST
+        # 마지막으로 거친 경로의 차단기가 열려 요청 자체를 못 보낸 경우
+        rejected = browser_rejected if task.url in browser_target_set else http_rejected
+        if prices and prices != (None, None):
+            complete_task(task, prices, now, cost)
+            results[task.url] = prices
+            counts["done"] += 1
+        elif task.url in browser_target_set and task.url not in browser_map and out_of_time:
+            # 시간 예산 안에 브라우저 처리를 못 한 URL은 시도 횟수를 늘리지 않고 넘긴다.
+            release_task(task)
+            carried += 1
+        elif task.url in rejected:
+            # 차단기 때문에 요청하지 못한 작업은 실패가 아니므로 시도 횟수를 늘리지 않고 다시 열리는 시각으로 미룬다.
+            defer_task(task, now + timedelta(seconds=rejected[task.url]))
+            skipped += 1
+        else:
+            error = (
+                "브라우저 가격 추출 실패" if task.url in browser_target_set else "HTTP 가격 추출 실패"
+            )
+            fail_task(
+                task,
+                error,
+                now,
+                settings.price_queue_max_attempts,
+                settings.price_queue_retry_base_sec,
+                cost,
+            )
+            counts["failed"] += 1
+
+    counts["carried"] += carried
+    counts["skipped"] += skipped
+    db.commit()
+    return carried + skipped
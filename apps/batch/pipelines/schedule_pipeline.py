@@ -1,29 +1,31 @@
 # why: 모듈 역할과 책임을 명확히 하기 위한 진입 주석
-from datetime import datetime
-import asyncio
+from datetime import datetime, timedelta
 import logging
 import re
+from typing import Callable
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from common.config import get_batch_settings
-from common.models import BroadcastSlot, BroadcastStatus, Channel
+from common.channel_registry import ChannelRegistry, ChannelSpec
+from common.classifier import CategoryClassifier, get_classifier
+from common.config import BatchSettings, get_batch_settings
+from common.leases import claim_shards, default_worker_id, partition
+from common.models import BroadcastSlot, BroadcastStatus, Channel, Product
 from common.normalize import (
     calculate_discount_rate,
-    infer_category,
     make_slot_hash,
-    normalize_product_title,
-    parse_price_info,
+    normalize_slot,
 )
 from common.models import BroadcastPriceHistory
+from common.price_queue import enqueue_price_urls, load_fetched_price_entries
+from common.products import ProductResolver, fresh_product_prices, record_product_price
+from common.run_report import add, count, stage
+from common.slot_events import SlotEvent, SlotEventQueue, SlotEventType
 from parsers.gmarket_schedule_parser import parse_schedule
 from sources.gmarket_schedule import fetch_schedule_html, extract_vendor_list
-from sources.product_price import (
-    ProductPriceFetcher,
-    fetch_product_prices_batch,
-    fetch_product_prices_batch_browser,
-)
+from pipelines.price_queue_pipeline import drain_price_queue
+from sources.product_price import ProductPriceFetcher, extract_goodscode
 
 
 logger = logging.getLogger("batch.schedule")
@@ -94,43 +96,34 @@ def _normalize_channel_code(channel_name: str) -> str:
     return sanitized or "unknown"
 
 
-def ensure_channel(
-    db: Session, channel_code: str, channel_name: str, logo_url: str | None = None
-) -> Channel:
-    """채널이 없으면 생성.
+def channel_spec(channel_code: str, channel_name: str, logo_url: str | None = None) -> ChannelSpec:
+    """코드별 라이브/스트림 URL 매핑을 채운 채널 정보."""
+
+    return ChannelSpec(
+        code=channel_code,
+        name=channel_name,
+        logo_url=logo_url,
+        live_url=CHANNEL_LIVE_URL_OVERRIDE.get(channel_code)
+        or CHANNEL_LIVE_URL_MAP.get(channel_code),
+        stream_url=CHANNEL_STREAM_URL_MAP.get(channel_code),
+    )
+
+
+def ensure_channels(db: Session, specs: list[ChannelSpec]) -> dict[str, Channel]:
+    """채널이 없으면 생성하고 URL이 바뀐 채널만 갱신 (채널 조회 1회, 커밋 최대 1회).
 
     - why: 크롤링 소스가 늘어나면 자동으로 채널이 준비되어야 함.
     """
 
-    channel = db.execute(select(Channel).where(Channel.channel_code == channel_code)).scalar_one_or_none()
-    live_url = CHANNEL_LIVE_URL_OVERRIDE.get(channel_code) or CHANNEL_LIVE_URL_MAP.get(
-        channel_code
-    )
-    stream_url = CHANNEL_STREAM_URL_MAP.get(channel_code)
-
-    if channel:
-        # live URL이 없거나 변경되면 업데이트
-        if live_url and channel.channel_live_url != live_url:
-            channel.channel_live_url = live_url
-        if stream_url and channel.channel_stream_url != stream_url:
-            channel.channel_stream_url = stream_url
-        if logo_url and channel.channel_logo_url != logo_url:
-            channel.channel_logo_url = logo_url
-        db.commit()
-        db.refresh(channel)
-        return channel
-
-    channel = Channel(
-        channel_code=channel_code,
-        channel_name=channel_name,
-        channel_live_url=live_url,
-        channel_stream_url=stream_url,
-        channel_logo_url=logo_url,
-    )
-    db.add(channel)
-    db.commit()
-    db.refresh(channel)
-    return channel
+    return ChannelRegistry(db).sync(specs)
+
+
+def ensure_channel(
+    db: Session, channel_code: str, channel_name: str, logo_url: str | None = None
+) -> Channel:
+    """채널 하나만 준비할 때 쓰는 ensure_channels 래퍼."""
+
+    return ensure_channels(db, [channel_spec(channel_code, channel_name, logo_url)])[channel_code]
 
 
 def resolve_status(start_at: datetime, end_at: datetime) -> BroadcastStatus:
@@ -149,34 +142,38 @@ def upsert_slots(
     items: list[dict],
     price_fetcher: ProductPriceFetcher | None = None,
     price_map: dict[str, tuple[int | None, int | None]] | None = None,
+    events: SlotEventQueue | None = None,
+    classifier: CategoryClassifier | None = None,
+    products: ProductResolver | None = None,
+    price_fetched_at: dict[str, datetime] | None = None,
 ) -> tuple[int, int]:
     """슬롯 업서트 처리.
 
     - return: (created_count, updated_count)
+    - events가 주어지면 생성/변경된 슬롯을 이벤트로 발행해 알림 평가기가 증분 매칭하도록 한다.
+    - classifier가 없으면 CATEGORY_RULES 순서 매칭으로 카테고리를 정한다.
+    - products가 주어지면 슬롯을 상품(products)에 연결하고, price_fetched_at에 있는 URL(상세 가격을
+      실제로 수집한 URL → 수집 시각)의 가격을 그 수집 시각으로 상품에도 반영한다.
     """
 
+    classify = classifier.classify if classifier else None
+
     created = 0
     updated = 0
 
     seen_hashes: set[str] = set()
 
     for item in items:
-        normalized_title = normalize_product_title(item["raw_title"])
-        category = infer_category(item["raw_title"])
+        normalized = normalize_slot(item["raw_title"], item.get("price_text"), classify)
+        normalized_title = normalized.title
+        category = normalized.category
         slot_hash = make_slot_hash(channel.id, item["start_at"], normalized_title)
-        original_price, sale_price, discount_rate = parse_price_info(item.get("price_text"))
+        original_price, sale_price = normalized.original_price, normalized.sale_price
 
         if price_map and item.get("product_url") in price_map:
-            mapped_original, mapped_sale = price_map[item.get("product_url")]
-
-            if mapped_sale is not None:
-                # 쿠폰/최종가는 방송 화면가보다 낮을 수 있으므로 우선 반영
-                if sale_price is None or mapped_sale < sale_price:
-                    sale_price = mapped_sale
-
-            if mapped_original is not None:
-                if original_price is None or mapped_original > original_price:
-                    original_price = mapped_original
+            original_price, sale_price = _merge_mapped_prices(
+                original_price, sale_price, price_map[item.get("product_url")]
+            )
 
         if price_fetcher and item.get("product_url") and (
             original_price is None or sale_price is None
@@ -220,7 +217,28 @@ def upsert_slots(
             select(BroadcastSlot).where(BroadcastSlot.slot_hash == slot_hash)
         ).scalar_one_or_none()
 
+        product = None
+        if products is not None:
+            product_url = item.get("product_url")
+            product = products.resolve(
+                extract_goodscode(product_url) if product_url else None,
+                normalized_title,
+                category,
+                item["start_at"],
+            )
+            fetched_at = (price_fetched_at or {}).get(product_url)
+            if product is not None and fetched_at is not None:
+                # 상세 페이지에서 수집한 가격만 수집 시각 그대로 상품 가격으로 공유한다.
+                # 방송 화면가나 상품에서 재사용한 가격으로 갱신하면 상품 가격이 계속 새것으로 보여 재수집되지 않는다.
+                record_product_price(product, original_price, sale_price, discount_rate, fetched_at)
+
         if existing:
+            changed = (
+                existing.end_at != item["end_at"]
+                or existing.raw_title != item["raw_title"]
+                or existing.price_text != item.get("price_text")
+                or existing.sale_price != sale_price
+            )
             existing.end_at = item["end_at"]
             existing.raw_title = item["raw_title"]
             existing.normalized_title = normalized_title
@@ -233,9 +251,18 @@ def upsert_slots(
             existing.price_text = item.get("price_text")
             existing.image_url = item.get("image_url")
             existing.status = resolve_status(item["start_at"], item["end_at"])
+            if product is not None and existing.product_id != product.id:
+                # 슬롯이 다른 상품으로 다시 묶이면 이전 상품의 방송 수를 옮긴다.
+                previous = db.get(Product, existing.product_id) if existing.product_id else None
+                if previous is not None:
+                    previous.broadcast_count = max(previous.broadcast_count - 1, 0)
+                product.broadcast_count += 1
+                existing.product_id = product.id
             updated += 1
 
             _record_price_history(db, existing.id, sale_price, original_price, discount_rate)
+            if events is not None and changed:
+                events.publish(_slot_event(SlotEventType.CHANGED, existing, channel))
         else:
             new_slot = BroadcastSlot(
                 channel_id=channel.id,
@@ -254,160 +281,364 @@ def upsert_slots(
                 image_url=item.get("image_url"),
                 status=resolve_status(item["start_at"], item["end_at"]),
                 slot_hash=slot_hash,
+                product_id=product.id if product is not None else None,
             )
+            if product is not None:
+                product.broadcast_count += 1
             db.add(new_slot)
             db.flush()
             _record_price_history(db, new_slot.id, sale_price, original_price, discount_rate)
             created += 1
+            if events is not None:
+                events.publish(_slot_event(SlotEventType.CREATED, new_slot, channel))
 
     db.commit()
     return created, updated
 
 
+def _air_windows(
+    grouped: dict[str, list[dict]], now: datetime
+) -> dict[str, tuple[datetime, datetime]]:
+    """상품 URL별 우선순위 기준 방송 (시작, 종료).
+
+    - 아직 끝나지 않은 방송 중 가장 이른 것을, 모두 끝났으면 가장 최근 방송을 사용한다.
+    """
+
+    windows: dict[str, tuple[datetime, datetime]] = {}
+    for items in grouped.values():
+        for item in items:
+            url = item.get("product_url")
+            if not url:
+                continue
+            window = (item["start_at"], item["end_at"])
+            current = windows.get(url)
+            if current is None:
+                windows[url] = window
+                continue
+
+            window_open = window[1] >= now
+            current_open = current[1] >= now
+            if window_open and (not current_open or window[0] < current[0]):
+                windows[url] = window
+            elif not window_open and not current_open and window[0] > current[0]:
+                windows[url] = window
+    return windows
+
+
+def _merge_mapped_prices(
+    original_price: int | None,
+    sale_price: int | None,
+    mapped: tuple[int | None, int | None],
+) -> tuple[int | None, int | None]:
+    mapped_original, mapped_sale = mapped
+
+    if mapped_sale is not None:
+        # 쿠폰/최종가는 방송 화면가보다 낮을 수 있으므로 우선 반영
+        if sale_price is None or mapped_sale < sale_price:
+            sale_price = mapped_sale
+
+    if mapped_original is not None:
+        if original_price is None or mapped_original > original_price:
+            original_price = mapped_original
+
+    return original_price, sale_price
+
+
+def apply_fetched_prices(db: Session, price_map: dict[str, tuple[int | None, int | None]]) -> int:
+    """큐에서 뒤늦게 확보한 가격을 아직 끝나지 않은 슬롯에 반영.
+
+    - why: 수집 시점에 가격을 못 구한 상품도 다음 주기에 채워지도록 한다.
+    - return: 가격이 바뀐 슬롯 수
+    """
+
+    if not price_map:
+        return 0
+
+    now = datetime.utcnow()
+    slots = db.execute(
+        select(BroadcastSlot)
+        .where(BroadcastSlot.product_url.in_(list(price_map)))
+        .where(BroadcastSlot.end_at >= now)
+    ).scalars()
+
+    updated = 0
+    for slot in slots:
+        original_price, sale_price = _merge_mapped_prices(
+            slot.original_price, slot.sale_price, price_map[slot.product_url]
+        )
+        if original_price is not None and sale_price is not None and original_price < sale_price:
+            original_price, sale_price = sale_price, original_price
+        if (original_price, sale_price) == (slot.original_price, slot.sale_price):
+            continue
+
+        slot.original_price = original_price
+        slot.sale_price = sale_price
+        slot.discount_rate = calculate_discount_rate(original_price, sale_price)
+        _record_price_history(db, slot.id, sale_price, original_price, slot.discount_rate)
+        if slot.product_id is not None:
+            product = db.get(Product, slot.product_id)
+            if product is not None:
+                record_product_price(product, original_price, sale_price, slot.discount_rate, now)
+        updated += 1
+
+    db.commit()
+    return updated
+
+
+def _slot_event(event_type: SlotEventType, slot: BroadcastSlot, channel: Channel) -> SlotEvent:
+    return SlotEvent(
+        event_type=event_type,
+        id=slot.id,
+        channel_code=channel.channel_code,
+        start_at=slot.start_at,
+        raw_title=slot.raw_title,
+        normalized_title=slot.normalized_title,
+        price_text=slot.price_text,
+    )
+
+
 def _record_price_history(
     db: Session, slot_id: int, sale_price: int | None, original_price: int | None, discount_rate: float | None
 ) -> None:
     if not slot_id:
         return
 
-    last = (
-        db.query(BroadcastPriceHistory)
-        .filter(BroadcastPriceHistory.broadcast_slot_id == slot_id)
-        .order_by(BroadcastPriceHistory.collected_at.desc())
-        .first()
-    )
+    with stage("history"):
+        last = (
+            db.query(BroadcastPriceHistory)
+            .filter(BroadcastPriceHistory.broadcast_slot_id == slot_id)
+            .order_by(BroadcastPriceHistory.collected_at.desc())
+            .first()
+        )
+        add("history", items=1)
 
-    if last and last.sale_price == sale_price and last.original_price == original_price:
-        return
+        if last and last.sale_price == sale_price and last.original_price == original_price:
+            return
 
-    history = BroadcastPriceHistory(
-        broadcast_slot_id=slot_id,
-        collected_at=datetime.utcnow(),
-        sale_price=sale_price,
-        original_price=original_price,
-        discount_rate=discount_rate,
-    )
-    db.add(history)
+        history = BroadcastPriceHistory(
+            broadcast_slot_id=slot_id,
+            collected_at=datetime.utcnow(),
+            sale_price=sale_price,
+            original_price=original_price,
+            discount_rate=discount_rate,
+        )
+        db.add(history)
+        add("history", success=1)
 
 
-def run_schedule_pipeline(db: Session):
+def run_schedule_pipeline(db: Session, events: SlotEventQueue | None = None):
     """편성표 수집 파이프라인 전체 실행."""
 
-    source_code = "gmarket_schedule"
     settings = get_batch_settings()
-    price_fetcher = ProductPriceFetcher(settings)
 
     html = fetch_schedule_html()
-    vendors = extract_vendor_list(html)
-
-    grouped: dict[str, list[dict]] = {}
-    channel_names: dict[str, str] = {}
-    channel_logos: dict[str, str | None] = {}
+    vendors = _parse_vendors(html)
 
     if vendors:
         # 채널별로 편성표를 재요청하여 전체 방송사를 누락 없이 수집
-        for vendor in vendors:
-            vendor_url = (
-                vendor["href"]
-                if vendor["href"].startswith("http")
-                else f"https://mobile.gmarket.co.kr{vendor['href']}"
-            )
-            vendor_html = fetch_schedule_html(vendor_url)
-            items = parse_schedule(vendor_html)
-            if not items:
-                continue
+        grouped, channel_names, channel_logos = _collect_vendor_items(vendors)
+    else:
+        # fallback: 전체 페이지 파싱
+        grouped, channel_names, channel_logos = _collect_page_items(html)
+        if not grouped:
+            logger.warning("파싱 결과가 비어 있습니다. HTML 구조를 확인하세요.")
+            return
+
+    _store_grouped_items(db, settings, grouped, channel_names, channel_logos, events)
+
 
-            channel_name = vendor.get("channel_name") or vendor.get("company_id")
-            channel_code = _normalize_channel_code(channel_name)
-            channel_names[channel_code] = channel_name
-            channel_logos[channel_code] = vendor.get("logo_url")
+def run_sharded_schedule_pipeline(
+    db: Session,
+    session_factory: Callable[[], Session],
+    worker_id: str,
+    events: SlotEventQueue | None = None,
+):
+    """채널(vendor)을 N개 샤드로 나눠 여러 워커가 나눠 수집.
+
+    - 채널은 company_id 해시로 샤드에 고정되고, 상품 가격 URL도 채널을 따라가므로 함께 분산된다.
+    - 워커는 자기 샤드부터 임대를 시도하고, 남은 샤드나 죽은 워커의 샤드(임대 만료)를 이어서 처리한다.
+    - 채널이 샤드로 나뉘므로 워커끼리 같은 slot_hash를 동시에 INSERT하지 않는다.
+    """
+
+    settings = get_batch_settings()
+    shard_count = max(1, settings.batch_shard_count)
 
-            for item in items:
-                item["channel_name"] = channel_name
-                grouped.setdefault(channel_code, []).append(item)
+    html = fetch_schedule_html()
+    vendors = _parse_vendors(html)
+    if vendors:
+        shards = partition(
+            vendors, lambda vendor: vendor.get("company_id") or vendor["href"], shard_count
+        )
     else:
-        # fallback: 전체 페이지 파싱
+        # fallback 페이지는 나눌 수 없으므로 0번 샤드를 가져간 워커가 전부 처리
+        shards = [[] for _ in range(shard_count)]
+
+    claimed: list[int] = []
+    for shard in claim_shards(
+        session_factory,
+        "fetch_schedule",
+        worker_id,
+        shard_count,
+        settings.batch_lease_ttl_sec,
+        settings.batch_shard_cycle_minutes,
+    ):
+        claimed.append(shard)
+        if vendors:
+            grouped, channel_names, channel_logos = _collect_vendor_items(shards[shard])
+        elif shard == 0:
+            grouped, channel_names, channel_logos = _collect_page_items(html)
+        else:
+            continue
+        if grouped:
+            _store_grouped_items(db, settings, grouped, channel_names, channel_logos, events)
+
+    logger.info(
+        "샤드 수집 완료. worker=%s claimed=%s shards=%s vendors=%s",
+        worker_id,
+        claimed,
+        shard_count,
+        len(vendors),
+    )
+
+
+def _parse_vendors(html: str) -> list[dict]:
+    with stage("parse"):
+        return extract_vendor_list(html)
+
+
+def _parse_items(html: str) -> list[dict]:
+    with stage("parse"):
         items = parse_schedule(html)
+    add("parse", items=len(items), bytes=len(html.encode("utf-8")))
+    return items
+
+
+def _collect_vendor_items(
+    vendors: list[dict],
+) -> tuple[dict[str, list[dict]], dict[str, str], dict[str, str | None]]:
+    grouped: dict[str, list[dict]] = {}
+    channel_names: dict[str, str] = {}
+    channel_logos: dict[str, str | None] = {}
 
+    for vendor in vendors:
+        vendor_url = (
+            vendor["href"]
+            if vendor["href"].startswith("http")
+            else f"https://mobile.gmarket.co.kr{vendor['href']}"
+        )
+        vendor_html = fetch_schedule_html(vendor_url)
+        items = _parse_items(vendor_html)
         if not items:
-            logger.warning("파싱 결과가 비어 있습니다. HTML 구조를 확인하세요.")
-            return
+            continue
+
+        channel_name = vendor.get("channel_name") or vendor.get("company_id")
+        channel_code = _normalize_channel_code(channel_name)
+        channel_names[channel_code] = channel_name
+        channel_logos[channel_code] = vendor.get("logo_url")
 
         for item in items:
-            channel_name = item.get("channel_name") or "G마켓"
-            channel_code = _normalize_channel_code(channel_name)
-            channel_names[channel_code] = channel_name
+            item["channel_name"] = channel_name
             grouped.setdefault(channel_code, []).append(item)
 
+    return grouped, channel_names, channel_logos
+
+
+def _collect_page_items(
+    html: str,
+) -> tuple[dict[str, list[dict]], dict[str, str], dict[str, str | None]]:
+    grouped: dict[str, list[dict]] = {}
+    channel_names: dict[str, str] = {}
+
+    for item in _parse_items(html):
+        channel_name = item.get("channel_name") or "G마켓"
+        channel_code = _normalize_channel_code(channel_name)
+        channel_names[channel_code] = channel_name
+        grouped.setdefault(channel_code, []).append(item)
+
+    return grouped, channel_names, {}
+
+
+def _store_grouped_items(
+    db: Session,
+    settings: BatchSettings,
+    grouped: dict[str, list[dict]],
+    channel_names: dict[str, str],
+    channel_logos: dict[str, str | None],
+    events: SlotEventQueue | None,
+) -> None:
+    """채널별로 모은 항목의 가격을 보강하고 슬롯으로 업서트."""
+
+    source_code = "gmarket_schedule"
+
     created_total = 0
     updated_total = 0
     price_map: dict[str, tuple[int | None, int | None]] = {}
+    price_fetched_at: dict[str, datetime] = {}
+    classifier = get_classifier(settings)
+    products = ProductResolver(db, settings.product_simhash_max_distance)
 
     if settings.product_price_fetch_enabled:
-        product_urls = [
-            item.get("product_url")
-            for items in grouped.values()
-            for item in items
-            if item.get("product_url")
-        ]
-        # 중복 제거
-        product_urls = list(dict.fromkeys(product_urls))
-        if product_urls:
-            try:
-                price_map = asyncio.run(fetch_product_prices_batch(product_urls, settings))
-            except RuntimeError:
-                # 이미 이벤트 루프가 있을 때를 대비한 fallback
-                loop = asyncio.new_event_loop()
-                price_map = loop.run_until_complete(fetch_product_prices_batch(product_urls, settings))
-                loop.close()
-
-            # 브라우저 fallback 병렬 처리 (G마켓 계열만)
-            missing_urls = [
-                url
-                for url in product_urls
-                if url and (url not in price_map or price_map[url] == (None, None))
-            ]
-            if missing_urls and settings.product_price_fetch_browser_fallback:
-                try:
-                    browser_map = asyncio.run(
-                        fetch_product_prices_batch_browser(missing_urls, settings)
-                    )
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
-                    browser_map = loop.run_until_complete(
-                        fetch_product_prices_batch_browser(missing_urls, settings)
-                    )
-                    loop.close()
-                if browser_map:
-                    price_map.update(browser_map)
-
-    for channel_code, channel_items in grouped.items():
-        channel = ensure_channel(
-            db,
-            channel_code=channel_code,
-            channel_name=channel_names.get(channel_code, channel_code),
-            logo_url=channel_logos.get(channel_code),
-        )
-        created, updated = upsert_slots(
-            db, channel, source_code, channel_items, price_fetcher, price_map
-        )
-        created_total += created
-        updated_total += updated
-
-    if price_fetcher:
-        price_stats = price_fetcher.stats()
-        logger.info(
-            "상품 가격 크롤링 통계: requested=%s success=%s cache=%s browser=%s skipped=%s",
-            price_stats["requested"],
-            price_stats["success"],
-            price_stats["cache_size"],
-            price_stats["browser_requested"],
-            price_stats.get("browser_skipped", 0),
+        # URL별 현재/다음 방송 시각을 큐에 넣고, 예산 안에서 곧 방송할 상품부터 처리
+        now = datetime.utcnow()
+        refresh_after = timedelta(minutes=settings.price_queue_refresh_minutes)
+        air_windows = _air_windows(grouped, now)
+
+        # 다른 날짜/채널 방송에서 최근에 가격을 확인한 상품은 다시 수집하지 않고 상품 가격을 공유
+        goodscodes = {url: extract_goodscode(url) for url in air_windows}
+        shared = fresh_product_prices(
+            db, [code for code in goodscodes.values() if code], now - refresh_after
         )
+        shared_map = {url: shared[code] for url, code in goodscodes.items() if code in shared}
+        pending = {url: window for url, window in air_windows.items() if url not in shared_map}
+
+        if pending:
+            enqueue_price_urls(db, pending, refresh_after)
+            worker_id = settings.batch_worker_id or default_worker_id()
+            drain_price_queue(db, settings, worker_id, settings.price_queue_drain_budget_sec)
+        # 이번 실행에서 못 끝낸 URL은 큐에 남아 다음 주기(drain_price_queue 잡)에서 이어서 처리
+        entries = load_fetched_price_entries(db, air_windows)
+        price_fetched_at = {
+            url: fetched_at
+            for url, (_, fetched_at) in entries.items()
+            if fetched_at is not None and url not in shared_map
+        }
+        price_map = {**{url: prices for url, (prices, _) in entries.items()}, **shared_map}
+
+    channels = ensure_channels(
+        db,
+        [
+            channel_spec(
+                channel_code,
+                channel_names.get(channel_code, channel_code),
+                channel_logos.get(channel_code),
+            )
+            for channel_code in grouped
+        ],
+    )
+    # upsert 단계 시간에는 그 안에서 기록하는 가격 이력(history) 시간도 포함된다.
+    with stage("upsert"):
+        for channel_code, channel_items in grouped.items():
+            created, updated = upsert_slots(
+                db,
+                channels[channel_code],
+                source_code,
+                channel_items,
+                price_map=price_map,
+                events=events,
+                classifier=classifier,
+                products=products,
+                price_fetched_at=price_fetched_at,
+            )
+            created_total += created
+            updated_total += updated
+    total = sum(len(items) for items in grouped.values())
+    add("upsert", items=total, success=created_total + updated_total)
+    count("slots_created", created_total)
+    count("slots_updated", updated_total)
 
     logger.info(
         "편성표 수집 완료. created=%s updated=%s total=%s",
         created_total,
         updated_total,
-        len(items),
+        total,
     )
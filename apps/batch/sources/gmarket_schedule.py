@@ -7,6 +7,8 @@ import httpx
 from bs4 import BeautifulSoup
 
 from common.config import get_batch_settings
+from common.http import get_http_client
+from common.run_report import add, stage
 
 
 def fetch_schedule_html(url: Optional[str] = None) -> str:
@@ -20,16 +22,16 @@ def fetch_schedule_html(url: Optional[str] = None) -> str:
 
     headers = {"User-Agent": settings.user_agent}
 
-    # 요청 간 랜덤 딜레이 (서비스 부하 완화 목적)
-    time.sleep(random.uniform(0.3, 1.0))
+    with stage("fetch"):
+        # 요청 간 랜덤 딜레이 (서비스 부하 완화 목적)
+        time.sleep(random.uniform(0.3, 1.0))
 
-    retry = 0
-    backoff = 1.0
+        retry = 0
+        backoff = 1.0
 
-    while True:
-        try:
-            with httpx.Client(timeout=10.0, headers=headers) as client:
-                response = client.get(target_url)
+        while True:
+            try:
+                response = get_http_client().get(target_url, headers=headers, timeout=10.0)
                 if response.status_code in (429, 500, 502, 503, 504):
                     raise httpx.HTTPStatusError(
                         f"temporary error: {response.status_code}",
@@ -37,19 +39,24 @@ def fetch_schedule_html(url: Optional[str] = None) -> str:
                         response=response,
                     )
                 response.raise_for_status()
+                add("fetch", items=1, success=1, bytes=len(response.content), retries=retry)
                 return response.text
-        except httpx.HTTPStatusError:
-            retry += 1
-            if retry > 3:
-                raise
-            time.sleep(backoff)
-            backoff *= 2
-        except httpx.HTTPError:
-            retry += 1
-            if retry > 3:
-                raise
-            time.sleep(backoff)
-            backoff *= 2
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code in (403, 429):
+                    add("fetch", blocked=1)
+                retry += 1
+                if retry > 3:
+                    add("fetch", items=1, errors=1, retries=retry - 1)
+                    raise
+                time.sleep(backoff)
+                backoff *= 2
+            except httpx.HTTPError:
+                retry += 1
+                if retry > 3:
+                    add("fetch", items=1, errors=1, retries=retry - 1)
+                    raise
+                time.sleep(backoff)
+                backoff *= 2
 
 
 def extract_vendor_list(html: str) -> list[dict]:
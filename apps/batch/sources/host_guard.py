@@ -0,0 +1,355 @@
+# why: 상품 페이지 크롤링에서 호스트별로 동시성을 자동 조절하고, 차단이 심한 호스트는 잠시 쉬도록 하기 위한 모듈
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+import enum
+import logging
+import threading
+import time
+from typing import AsyncIterator
+from urllib.parse import urlparse
+
+import httpx
+
+from common.config import BatchSettings
+from common.run_report import record_outcome
+
+
+logger = logging.getLogger("batch.host_guard")
+
+
+class Outcome(str, enum.Enum):
+    OK = "OK"
+    # 403/429 또는 차단 페이지
+    BLOCKED = "BLOCKED"
+    TIMEOUT = "TIMEOUT"
+    # 5xx/연결 오류 등 차단으로 보기 어려운 실패
+    ERROR = "ERROR"
+
+
+class BreakerState(str, enum.Enum):
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+
+class AdaptiveLimiter:
+    """AIMD 방식 동시성 제한.
+
+    - 성공하면 한 윈도(limit개 요청)마다 1씩 늘리고, 차단/타임아웃이면 절반으로 줄인다.
+    - 동시에 여러 요청이 실패해도 한 번만 줄이도록 decrease_interval_sec 동안은 다시 줄이지 않는다.
+    - why: 배치는 호출마다 이벤트 루프가 바뀔 수 있어 Condition은 루프별로 새로 만든다.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        decrease_interval_sec: float = 1.0,
+    ) -> None:
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self.peak = self.limit
+        self.in_flight = 0
+        self.decrease_interval_sec = decrease_interval_sec
+        self._last_decrease = float("-inf")
+        self._cond: asyncio.Condition | None = None
+        self._cond_loop: asyncio.AbstractEventLoop | None = None
+
+    def _condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._cond is None or self._cond_loop is not loop:
+            self._cond = asyncio.Condition()
+            self._cond_loop = loop
+        return self._cond
+
+    async def acquire(self) -> None:
+        cond = self._condition()
+        async with cond:
+            while self.in_flight >= int(self.limit):
+                await cond.wait()
+            self.in_flight += 1
+
+    async def release(self, outcome: Outcome) -> None:
+        cond = self._condition()
+        async with cond:
+            self.in_flight -= 1
+            self._adjust(outcome)
+            cond.notify_all()
+
+    def _adjust(self, outcome: Outcome) -> None:
+        if outcome == Outcome.OK:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self.peak = max(self.peak, self.limit)
+            return
+        if outcome in (Outcome.BLOCKED, Outcome.TIMEOUT):
+            now = time.monotonic()
+            if now - self._last_decrease < self.decrease_interval_sec:
+                return
+            self._last_decrease = now
+            self.limit = max(self.min_limit, self.limit / 2)
+
+
+class CircuitBreaker:
+    """최근 요청 중 차단 비율이 임계치를 넘으면 cooldown 동안 호스트를 건너뛴다.
+
+    - cooldown이 지나면 한 요청만 시험적으로 보내(HALF_OPEN) 성공 시 닫고, 차단이면 다시 연다.
+    """
+
+    def __init__(self, threshold: float, min_requests: int, window: int, cooldown_sec: float) -> None:
+        self.threshold = threshold
+        self.min_requests = min_requests
+        self.cooldown_sec = cooldown_sec
+        self.state = BreakerState.CLOSED
+        self.trips = 0
+        self._window: deque[bool] = deque(maxlen=max(window, min_requests))
+        self._opened_at = 0.0
+        self._probing = False
+
+    def allow(self, now: float | None = None) -> bool:
+        now = time.monotonic() if now is None else now
+        if self.state == BreakerState.CLOSED:
+            return True
+        if self.state == BreakerState.OPEN:
+            if now - self._opened_at < self.cooldown_sec:
+                return False
+            self.state = BreakerState.HALF_OPEN
+        # HALF_OPEN: 시험 요청은 하나만 허용
+        if self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def record(self, outcome: Outcome, now: float | None = None) -> bool:
+        """결과를 기록하고, 이번 기록으로 차단기가 열렸으면 True."""
+
+        now = time.monotonic() if now is None else now
+        blocked = outcome == Outcome.BLOCKED
+
+        if self.state == BreakerState.HALF_OPEN:
+            self._probing = False
+            if blocked:
+                return self._trip(now)
+            if outcome == Outcome.OK:
+                self.state = BreakerState.CLOSED
+                self._window.clear()
+            return False
+
+        if self.state == BreakerState.OPEN:
+            return False
+
+        self._window.append(blocked)
+        if len(self._window) < self.min_requests:
+            return False
+        if sum(self._window) / len(self._window) >= self.threshold:
+            return self._trip(now)
+        return False
+
+    def retry_after(self, now: float | None = None) -> float:
+        """열린 차단기가 시험 요청을 다시 받기까지 남은 초 (닫혀 있으면 0)."""
+
+        now = time.monotonic() if now is None else now
+        if self.state != BreakerState.OPEN:
+            return 0.0
+        return max(0.0, self.cooldown_sec - (now - self._opened_at))
+
+    def is_open(self, now: float | None = None) -> bool:
+        now = time.monotonic() if now is None else now
+        return self.state == BreakerState.OPEN and now - self._opened_at < self.cooldown_sec
+
+    def block_rate(self) -> float:
+        return sum(self._window) / len(self._window) if self._window else 0.0
+
+    def _trip(self, now: float) -> bool:
+        self.state = BreakerState.OPEN
+        self._opened_at = now
+        self._window.clear()
+        self.trips += 1
+        return True
+
+
+@dataclass
+class HostState:
+    limiter: AdaptiveLimiter
+    breaker: CircuitBreaker
+    # 결과별 요청 수 + 차단기가 열려 보내지 않은 SKIPPED 수
+    counts: dict[str, int] = field(
+        default_factory=lambda: {**{outcome.value: 0 for outcome in Outcome}, "SKIPPED": 0}
+    )
+
+
+class HostRejected(Exception):
+    """차단기가 열려 요청을 보내지 않은 경우 (retry_after: 다시 시도할 수 있을 때까지 남은 초)."""
+
+    def __init__(self, host: str, retry_after: float = 0.0) -> None:
+        super().__init__(host)
+        self.host = host
+        self.retry_after = retry_after
+
+
+class HostGuard:
+    """호스트별 제한기/차단기 레지스트리."""
+
+    def __init__(self, settings: BatchSettings, initial_concurrency: int, name: str = "") -> None:
+        self.settings = settings
+        self.name = name
+        self.initial_concurrency = initial_concurrency
+        self._hosts: dict[str, HostState] = {}
+
+    def _state(self, host: str) -> HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            settings = self.settings
+            state = HostState(
+                limiter=AdaptiveLimiter(
+                    self.initial_concurrency,
+                    min_limit=settings.crawl_host_min_concurrency,
+                    max_limit=settings.crawl_host_max_concurrency,
+                ),
+                breaker=CircuitBreaker(
+                    threshold=settings.crawl_breaker_block_rate,
+                    min_requests=settings.crawl_breaker_min_requests,
+                    window=settings.crawl_breaker_window,
+                    cooldown_sec=settings.crawl_breaker_cooldown_sec,
+                ),
+            )
+            self._hosts[host] = state
+        return state
+
+    def allow(self, url: str) -> bool:
+        host = _host_of(url)
+        state = self._state(host)
+        if state.breaker.allow():
+            return True
+        state.counts["SKIPPED"] += 1
+        return False
+
+    def retry_after(self, url: str) -> float:
+        """url 호스트의 차단기가 다시 요청을 받기까지 남은 초."""
+
+        return self._state(_host_of(url)).breaker.retry_after()
+
+    def record(self, url: str, outcome: Outcome) -> None:
+        """제한기를 거치지 않는 요청(브라우저 등)의 결과를 차단기에만 기록."""
+
+        host = _host_of(url)
+        state = self._state(host)
+        state.counts[outcome.value] += 1
+        record_outcome(self.name, outcome.value)
+        if state.breaker.record(outcome):
+            self._log_trip(host, state)
+
+    @asynccontextmanager
+    async def request(self, url: str) -> AsyncIterator["RequestSlot"]:
+        """호스트 슬롯을 잡고 요청 결과를 기록하는 컨텍스트.
+
+        - 차단기가 열려 있으면 HostRejected를 던져 호출 측이 다음 후보로 넘어가게 한다.
+        - 결과를 지정하지 않고 예외로 빠져나가면 타임아웃은 TIMEOUT, 나머지는 ERROR로 기록한다.
+        """
+
+        host = _host_of(url)
+        state = self._state(host)
+        if not state.breaker.allow():
+            state.counts["SKIPPED"] += 1
+            raise HostRejected(host, state.breaker.retry_after())
+
+        slot = RequestSlot()
+        await state.limiter.acquire()
+        if state.breaker.is_open():
+            # 슬롯을 기다리는 사이 차단기가 열렸으면 요청을 보내지 않는다.
+            await state.limiter.release(Outcome.ERROR)
+            state.counts["SKIPPED"] += 1
+            raise HostRejected(host, state.breaker.retry_after())
+        try:
+            yield slot
+        except Exception as exc:
+            if slot.outcome is None:
+                timed_out = isinstance(exc, (httpx.TimeoutException, asyncio.TimeoutError))
+                slot.outcome = Outcome.TIMEOUT if timed_out else Outcome.ERROR
+            raise
+        finally:
+            outcome = slot.outcome or Outcome.ERROR
+            state.counts[outcome.value] += 1
+            record_outcome(self.name, outcome.value)
+            await state.limiter.release(outcome)
+            if state.breaker.record(outcome):
+                self._log_trip(host, state)
+
+    def summary(self) -> dict[str, dict[str, object]]:
+        return {
+            host: {
+                "limit": round(state.limiter.limit, 1),
+                "peak": round(state.limiter.peak, 1),
+                "state": state.breaker.state.value,
+                "trips": state.breaker.trips,
+                **{key.lower(): value for key, value in state.counts.items()},
+            }
+            for host, state in self._hosts.items()
+        }
+
+    def log_summary(self, label: str) -> None:
+        for host, info in self.summary().items():
+            logger.info(
+                "호스트 제한 상태(%s): host=%s limit=%s peak=%s state=%s trips=%s ok=%s blocked=%s timeout=%s error=%s skipped=%s",
+                label,
+                host,
+                info["limit"],
+                info["peak"],
+                info["state"],
+                info["trips"],
+                info["ok"],
+                info["blocked"],
+                info["timeout"],
+                info["error"],
+                info["skipped"],
+            )
+
+    def _log_trip(self, host: str, state: HostState) -> None:
+        logger.warning(
+            "차단 비율 초과로 호스트를 %s초 동안 건너뜁니다. host=%s trips=%s limit=%s",
+            self.settings.crawl_breaker_cooldown_sec,
+            host,
+            state.breaker.trips,
+            round(state.limiter.limit, 1),
+        )
+
+
+class RequestSlot:
+    def __init__(self) -> None:
+        self.outcome: Outcome | None = None
+
+
+def _host_of(url: str) -> str:
+    return urlparse(url).hostname or url
+
+
+_guards: dict[str, HostGuard] = {}
+_guards_lock = threading.Lock()
+
+
+def get_host_guard(name: str, settings: BatchSettings, initial_concurrency: int) -> HostGuard:
+    """프로세스 단위로 공유되는 HostGuard.
+
+    - why: 한 실행 안의 여러 배치(큐 drain 반복)와 상주 실행의 다음 회차가 학습한 한도를 이어받는다.
+    """
+
+    with _guards_lock:
+        guard = _guards.get(name)
+        if guard is None:
+            guard = HostGuard(settings, initial_concurrency, name)
+            _guards[name] = guard
+        return guard
+
+
+def log_host_guards() -> None:
+    """실행 요약 로그용: 공유 HostGuard의 호스트별 한도/차단기 상태를 남긴다."""
+
+    with _guards_lock:
+        guards = list(_guards.items())
+    for name, guard in guards:
+        guard.log_summary(name)
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import AsyncExitStack
 import json
 import logging
 import os
@@ -14,7 +15,12 @@ import httpx
 from bs4 import BeautifulSoup
 
 from common.config import BatchSettings
+from common.http import get_http_client
 from common.normalize import parse_price_text
+from common.run_report import add
+from common.runtime import get_shared_browser
+from sources.host_guard import HostRejected, Outcome, get_host_guard
+from sources.session_pool import BrowserSession, get_session_pool
 
 
 logger = logging.getLogger("batch.product_price")
@@ -39,6 +45,14 @@ ORIGINAL_KEYWORDS = {
     "wasprice",
 }
 
+# API 응답 전용 할인가 키 (쿠폰/혜택 적용가 포함, 옵션가와 섞이는 일반 price 키 제외)
+API_SALE_KEYWORDS = (SALE_KEYWORDS - {"price"}) | {
+    "couponprice",
+    "couponappliedprice",
+    "benefitprice",
+    "finaldiscountprice",
+}
+
 SALE_LABELS = [
     "할인가",
     "할인판매가",
@@ -83,6 +97,12 @@ class ProductPriceFetcher:
         self._browser_count = 0
         self._browser_skipped = 0
         self._browser_limit_logged = False
+        self._api_requested = 0
+        self._api_hit = 0
+        # 순환 import 방지: API 모듈이 이 모듈의 파서를 사용
+        from sources.product_price_api import get_price_api
+
+        self.api = get_price_api(settings)
 
     def fetch(self, url: str | None) -> tuple[int | None, int | None] | None:
         if not self.enabled or not url:
@@ -97,8 +117,15 @@ class ProductPriceFetcher:
         try:
             self._count += 1
 
+            # 발견해 둔 가격 API가 있으면 HTML/브라우저보다 먼저 시도
+            api_prices = self._fetch_via_api(url)
+            if api_prices:
+                self._cache[url] = api_prices
+                self._success += 1
+                return api_prices
+
             # G마켓 계열은 봇 차단 빈도가 높아서 브라우저 렌더링만 사용
-            if _should_force_browser(url):
+            if should_force_browser(url):
                 if not self.browser_fallback:
                     logger.warning("브라우저 비활성화로 G마켓 상품 크롤링 스킵: %s", url)
                     self._cache[url] = (None, None)
@@ -167,15 +194,66 @@ class ProductPriceFetcher:
         self._cache[url] = (None, None)
         return None
 
-    def stats(self) -> dict[str, int]:
+    async def fetch_batch(
+        self, urls: list[str], rejected: dict[str, float] | None = None
+    ) -> dict[str, tuple[int | None, int | None]]:
+        """여러 URL을 병렬 수집. 가격 API → HTML 순으로 시도하고 통계를 누적한다.
+
+        - 브라우저 fallback은 호출 측(가격 큐)이 시간 예산에 맞춰 따로 수행한다.
+        - rejected: 차단기 때문에 HTML 요청을 하나도 보내지 못한 URL → 다시 시도할 수 있을 때까지 남은 초
+        """
+
+        if not urls:
+            return {}
+
+        results: dict[str, tuple[int | None, int | None]] = {}
+        api_targets: list[str] = []
+        if self.api.enabled and self.api.templates():
+            api_targets = [url for url in urls if extract_goodscode(url)]
+        if api_targets:
+            guard = get_host_guard("http", self.settings, self.settings.product_price_fetch_concurrency)
+            async with httpx.AsyncClient(
+                timeout=httpx.Timeout(4.0, connect=3.0), follow_redirects=True
+            ) as client:
+                api_results = await asyncio.gather(
+                    *(self.api.fetch_async(client, url, guard) for url in api_targets)
+                )
+            self._api_requested += len(api_targets)
+            for url, prices in zip(api_targets, api_results):
+                if prices:
+                    results[url] = prices
+                    self._api_hit += 1
+
+        remaining = [url for url in urls if url not in results]
+        results.update(await fetch_product_prices_batch(remaining, self.settings, rejected))
+
+        self._count += len(urls)
+        self._success += sum(1 for prices in results.values() if prices != (None, None))
+        return results
+
+    def stats(self) -> dict[str, int | float]:
         return {
             "requested": self._count,
             "success": self._success,
             "cache_size": len(self._cache),
             "browser_requested": self._browser_count,
             "browser_skipped": self._browser_skipped,
+            "api_requested": self._api_requested,
+            "api_hit": self._api_hit,
+            "api_hit_rate": round(self._api_hit / self._api_requested, 3)
+            if self._api_requested
+            else 0.0,
         }
 
+    def _fetch_via_api(self, url: str) -> tuple[int | None, int | None] | None:
+        if not self.api.enabled or not self.api.templates():
+            return None
+        self._api_requested += 1
+        prices = self.api.fetch_sync(url)
+        if prices:
+            self._api_hit += 1
+        return prices
+
     def _should_use_browser(self) -> bool:
         if not self.browser_fallback:
             return False
@@ -220,19 +298,20 @@ def fetch_product_html(url: str, user_agent: str) -> str:
 
     while True:
         try:
-            with httpx.Client(timeout=6.0, headers=headers, follow_redirects=True) as client:
-                response = client.get(url)
-                if response.status_code == 403:
-                    # why: 봇 차단일 가능성이 높아 HTTP 재시도를 중단하고 브라우저로 넘긴다.
-                    return ""
-                if response.status_code in (429, 500, 502, 503, 504):
-                    raise httpx.HTTPStatusError(
-                        f"temporary error: {response.status_code}",
-                        request=response.request,
-                        response=response,
-                    )
-                response.raise_for_status()
-                return response.text
+            response = get_http_client().get(
+                url, headers=headers, timeout=6.0, follow_redirects=True
+            )
+            if response.status_code == 403:
+                # why: 봇 차단일 가능성이 높아 HTTP 재시도를 중단하고 브라우저로 넘긴다.
+                return ""
+            if response.status_code in (429, 500, 502, 503, 504):
+                raise httpx.HTTPStatusError(
+                    f"temporary error: {response.status_code}",
+                    request=response.request,
+                    response=response,
+                )
+            response.raise_for_status()
+            return response.text
         except httpx.HTTPStatusError:
             retry += 1
             if retry > 1:
@@ -263,7 +342,7 @@ def fetch_product_html_with_browser(
         return None
 
     url_list = [urls] if isinstance(urls, str) else urls
-    storage_state = _resolve_storage_state(settings)
+    storage_state = resolve_storage_state(settings)
 
     with sync_playwright() as p:
         browser = p.chromium.launch(
@@ -568,16 +647,20 @@ def _extract_from_raw_json(
 
 
 def _walk_json(
-    data: Any, original_candidates: list[int], sale_candidates: list[int]
+    data: Any,
+    original_candidates: list[int],
+    sale_candidates: list[int],
+    original_keys: frozenset[str] | set[str] = ORIGINAL_KEYWORDS,
+    sale_keys: frozenset[str] | set[str] = SALE_KEYWORDS,
 ) -> None:
     if isinstance(data, dict):
         for key, value in data.items():
             key_lower = str(key).lower()
-            if key_lower in ORIGINAL_KEYWORDS:
+            if key_lower in original_keys:
                 price = _coerce_price(value)
                 if price:
                     original_candidates.append(price)
-            if key_lower in SALE_KEYWORDS:
+            if key_lower in sale_keys:
                 price = _coerce_price(value)
                 if price:
                     sale_candidates.append(price)
@@ -585,13 +668,28 @@ def _walk_json(
             if key_lower == "pricespecification":
                 _extract_from_price_spec(value, original_candidates, sale_candidates)
 
-            if key_lower == "offers":
-                _walk_json(value, original_candidates, sale_candidates)
-            else:
-                _walk_json(value, original_candidates, sale_candidates)
+            _walk_json(value, original_candidates, sale_candidates, original_keys, sale_keys)
     elif isinstance(data, list):
         for item in data:
-            _walk_json(item, original_candidates, sale_candidates)
+            _walk_json(item, original_candidates, sale_candidates, original_keys, sale_keys)
+
+
+def parse_api_prices(data: Any) -> tuple[int | None, int | None]:
+    """상품 API(JSON) 응답에서 정가/할인가를 추출.
+
+    - why: 구조화된 응답은 키 이름만으로 가격을 고를 수 있어 HTML 휴리스틱보다 정확하고 싸다.
+    - 옵션가 등 잡음이 많은 일반 키(`price`)는 제외하고 쿠폰 적용가 키를 추가로 본다.
+    """
+
+    original_candidates: list[int] = []
+    sale_candidates: list[int] = []
+    _walk_json(data, original_candidates, sale_candidates, ORIGINAL_KEYWORDS, API_SALE_KEYWORDS)
+
+    original = _select_original_price(original_candidates)
+    sale = _select_sale_price(sale_candidates)
+    if original and sale and original < sale:
+        original, sale = sale, original
+    return original, sale
 
 
 def _extract_from_price_spec(
@@ -640,7 +738,7 @@ def _is_blocked_html(html: str) -> bool:
     return "error404" in lowered or "access denied" in lowered
 
 
-def _should_force_browser(url: str) -> bool:
+def should_force_browser(url: str) -> bool:
     try:
         return any(host in url for host in FORCE_BROWSER_HOSTS)
     except Exception:
@@ -667,7 +765,7 @@ async def _async_wait_for_price_selectors(page, timeout_ms: int) -> None:
             continue
 
 
-def _resolve_storage_state(settings: BatchSettings) -> str | None:
+def resolve_storage_state(settings: BatchSettings) -> str | None:
     path = settings.product_price_playwright_storage_state_path
     if not path:
         return None
@@ -677,7 +775,7 @@ def _resolve_storage_state(settings: BatchSettings) -> str | None:
     return None
 
 
-def _extract_goodscode(url: str) -> str | None:
+def extract_goodscode(url: str) -> str | None:
     match = re.search(r"/vi/product/(\d+)", url)
     if match:
         return match.group(1)
@@ -692,7 +790,7 @@ def _extract_goodscode(url: str) -> str | None:
 
 def _build_browser_urls(url: str) -> list[str]:
     urls = [url]
-    goodscode = _extract_goodscode(url)
+    goodscode = extract_goodscode(url)
     if not goodscode:
         return urls
 
@@ -716,7 +814,7 @@ def _build_http_urls(url: str) -> list[str]:
     """
 
     urls: list[str] = []
-    goodscode = _extract_goodscode(url)
+    goodscode = extract_goodscode(url)
     if goodscode:
         urls.extend(
             [
@@ -731,11 +829,12 @@ def _build_http_urls(url: str) -> list[str]:
 
 
 async def fetch_product_prices_batch(
-    urls: list[str], settings: BatchSettings
+    urls: list[str], settings: BatchSettings, rejected: dict[str, float] | None = None
 ) -> dict[str, tuple[int | None, int | None]]:
     """상품 상세 페이지 가격을 비동기로 병렬 수집.
 
     - why: 상품 URL이 많을 때 순차 크롤링이 느려 UI 업데이트가 지연됨.
+    - rejected: 모든 후보 호스트의 차단기가 열려 요청을 보내지 못한 URL → 다시 시도할 수 있을 때까지 남은 초
     """
 
     if not urls:
@@ -749,90 +848,165 @@ async def fetch_product_prices_batch(
     }
 
     timeout = httpx.Timeout(6.0, connect=3.0)
-    sem = asyncio.Semaphore(settings.product_price_fetch_concurrency)
+    # 고정 세마포어 대신 호스트별 AIMD 제한기로 동시성을 조절하고, 차단이 심한 호스트는 건너뛴다.
+    guard = get_host_guard("http", settings, settings.product_price_fetch_concurrency)
+    # 브라우저로 워밍업한 세션의 쿠키를 실어 보내 봇 판정을 줄인다.
+    pool = get_session_pool(settings, resolve_storage_state(settings))
     results: dict[str, tuple[int | None, int | None]] = {}
 
-    async def fetch_one(target_url: str) -> None:
+    async def fetch_one(client: httpx.AsyncClient, target_url: str) -> None:
         candidate_urls = [target_url]
-        if _should_force_browser(target_url):
+        if should_force_browser(target_url):
             # 브라우저 전용 도메인이라도 HTTP 대체 URL을 먼저 시도한다.
             candidate_urls = _build_http_urls(target_url)
+        session = pool.acquire()
+        waits: list[float] = []
 
-        async with sem:
-            try:
-                async with httpx.AsyncClient(
-                    timeout=timeout, headers=headers, follow_redirects=True
-                ) as client:
-                    for candidate in candidate_urls:
-                        resp = await client.get(candidate)
-                        if resp.status_code == 403:
+        try:
+            for candidate in candidate_urls:
+                cookie = session.cookie_header(candidate) if session else None
+                slot = None
+                try:
+                    async with guard.request(candidate) as slot:
+                        resp = await client.get(
+                            candidate, headers={"Cookie": cookie} if cookie else None
+                        )
+                        if resp.status_code in (403, 429):
+                            slot.outcome = Outcome.BLOCKED
                             continue
-                        if resp.status_code in (429, 500, 502, 503, 504):
+                        if resp.status_code in (500, 502, 503, 504):
+                            slot.outcome = Outcome.ERROR
                             continue
                         html = resp.text
+                        add("price_http", bytes=len(resp.content))
                         if _is_blocked_html(html):
+                            slot.outcome = Outcome.BLOCKED
                             continue
-                        results[target_url] = parse_product_price(html)
-                        return
-                    results[target_url] = (None, None)
-            except Exception:
-                results[target_url] = (None, None)
+                        slot.outcome = Outcome.OK
+                except HostRejected as exc:
+                    waits.append(exc.retry_after)
+                    continue
+                finally:
+                    if slot is not None and slot.outcome is not None:
+                        pool.record(session, slot.outcome)
+                results[target_url] = parse_product_price(html)
+                return
+            results[target_url] = (None, None)
+            if rejected is not None and len(waits) == len(candidate_urls):
+                rejected[target_url] = min(waits)
+        except Exception:
+            results[target_url] = (None, None)
 
-    await asyncio.gather(*(fetch_one(url) for url in urls))
+    async with httpx.AsyncClient(timeout=timeout, headers=headers, follow_redirects=True) as client:
+        await asyncio.gather(*(fetch_one(client, url) for url in urls))
     return results
 
 
+async def _acquire_browser(stack: AsyncExitStack, settings: BatchSettings) -> Any:
+    """상주 실행의 공유 브라우저, 없으면 이번 호출 동안만 쓸 브라우저를 반환.
+
+    - 공유 브라우저가 있으면 Playwright 드라이버를 새로 띄우지 않는다.
+    - 직접 띄운 브라우저/드라이버는 stack이 닫힐 때 정리된다.
+    """
+
+    shared_browser = await get_shared_browser(settings)
+    if shared_browser is not None:
+        return shared_browser
+
+    from playwright.async_api import async_playwright
+
+    playwright = await stack.enter_async_context(async_playwright())
+    browser = await playwright.chromium.launch(
+        headless=not settings.product_price_playwright_headful,
+        args=["--disable-blink-features=AutomationControlled"],
+    )
+    stack.push_async_callback(browser.close)
+    return browser
+
+
 async def fetch_product_prices_batch_browser(
-    urls: list[str], settings: BatchSettings
+    urls: list[str],
+    settings: BatchSettings,
+    timeout_sec: float | None = None,
+    rejected: dict[str, float] | None = None,
 ) -> dict[str, tuple[int | None, int | None]]:
     """브라우저 기반 가격 크롤링을 병렬로 수행.
 
     - why: G마켓 계열은 403 빈도가 높아 브라우저 기반 크롤링의 병렬화가 필요.
+    - 시간 안에 끝나지 않은 URL은 결과에 포함하지 않는다(호출 측이 다음 주기로 넘김).
+    - rejected: 모든 후보 호스트의 차단기가 열려 열어 보지 못한 URL → 다시 시도할 수 있을 때까지 남은 초
     """
 
     if not urls or not settings.product_price_fetch_browser_fallback:
         return {}
 
-    target_urls = [url for url in urls if _should_force_browser(url)]
+    target_urls = [url for url in urls if should_force_browser(url)]
     if not target_urls:
         return {}
 
     chunk_size = settings.product_price_fetch_browser_max
     if chunk_size <= 0:
         chunk_size = len(target_urls)
+    # 브라우저는 로컬 자원(페이지 수)이 한계라 동시성은 고정하고, 차단이 심한 호스트만 건너뛴다.
     sem = asyncio.Semaphore(settings.product_price_fetch_browser_concurrency)
+    browser_guard = get_host_guard(
+        "browser", settings, settings.product_price_fetch_browser_concurrency
+    )
+    from sources.product_price_api import get_price_api
+
+    price_api = get_price_api(settings)
     results: dict[str, tuple[int | None, int | None]] = {}
 
     try:
-        from playwright.async_api import async_playwright
+        import playwright.async_api  # noqa: F401
     except Exception:
         logger.warning("Playwright가 설치되지 않아 브라우저 병렬 크롤링을 건너뜁니다.")
         return {}
 
-    storage_state = _resolve_storage_state(settings)
-
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=not settings.product_price_playwright_headful,
-            args=["--disable-blink-features=AutomationControlled"],
-        )
-        context = await browser.new_context(
-            user_agent=settings.user_agent,
-            locale="ko-KR",
-            timezone_id="Asia/Seoul",
-            viewport={"width": 1280, "height": 720},
-            storage_state=storage_state,
-        )
-        await context.add_init_script(
-            "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
-        )
-
-        async def fetch_one(target_url: str) -> None:
+    if timeout_sec is None:
+        timeout_sec = settings.product_price_fetch_browser_timeout_sec
+    deadline = time.monotonic() + timeout_sec
+
+    storage_state = resolve_storage_state(settings)
+    pool = get_session_pool(settings, storage_state)
+
+    async with AsyncExitStack() as stack:
+        # 상주 실행 중이면 이미 떠 있는 브라우저를 재사용하고 컨텍스트만 새로 만든다.
+        browser = await _acquire_browser(stack, settings)
+        # 만료/폐기된 세션 자리를 워밍업한 새 세션으로 채우고, 세션마다 컨텍스트를 하나씩 연다.
+        if pool.needs_refresh():
+            await pool.refresh(browser, settings.user_agent)
+        sessions: list[BrowserSession | None] = list(pool.healthy()) or [None]
+        contexts = []
+        for session in sessions:
+            context = await browser.new_context(
+                user_agent=settings.user_agent,
+                locale="ko-KR",
+                timezone_id="Asia/Seoul",
+                viewport={"width": 1280, "height": 720},
+                storage_state=str(session.path) if session else storage_state,
+            )
+            await context.add_init_script(
+                "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+            )
+            contexts.append(context)
+
+        async def fetch_one(index: int, target_url: str) -> None:
             async with sem:
-                page = await context.new_page()
+                # 세션(컨텍스트)을 돌아가며 써서 한 세션에 요청이 몰리지 않게 한다.
+                session = sessions[index % len(sessions)]
+                page = await contexts[index % len(contexts)].new_page()
+                goodscode = extract_goodscode(target_url)
+                if goodscode and price_api.claim_discovery():
+                    # 페이지가 호출하는 가격 JSON API를 네트워크 로그로 찾아 다음부터 httpx로 바로 호출
+                    page.on("response", lambda response: price_api.observe(response, goodscode))
                 try:
                     candidate_urls = _build_browser_urls(target_url)
+                    waits: list[float] = []
                     for candidate in candidate_urls:
+                        if not browser_guard.allow(candidate):
+                            waits.append(browser_guard.retry_after(candidate))
+                            continue
                         try:
                             await page.goto(
                                 candidate, wait_until="domcontentloaded", timeout=6000
@@ -841,48 +1015,85 @@ async def fetch_product_prices_batch_browser(
                             await page.wait_for_timeout(300)
                             prices = await _async_extract_prices_from_playwright_page(page)
                             if prices and (prices[0] is not None or prices[1] is not None):
+                                browser_guard.record(candidate, Outcome.OK)
+                                pool.record(session, Outcome.OK)
                                 results[target_url] = prices
                                 return
 
                             html = await page.content()
-                            if not _is_blocked_html(html):
-                                parsed = parse_product_price(html)
-                                if parsed and (parsed[0] is not None or parsed[1] is not None):
-                                    results[target_url] = parsed
-                                    return
+                            if _is_blocked_html(html):
+                                browser_guard.record(candidate, Outcome.BLOCKED)
+                                pool.record(session, Outcome.BLOCKED)
+                                continue
+                            browser_guard.record(candidate, Outcome.OK)
+                            pool.record(session, Outcome.OK)
+                            parsed = parse_product_price(html)
+                            if parsed and (parsed[0] is not None or parsed[1] is not None):
+                                results[target_url] = parsed
+                                return
                         except Exception as exc:
+                            browser_guard.record(candidate, Outcome.ERROR)
                             logger.warning(
                                 "브라우저 병렬 이동 실패: %s (%s)", candidate, exc
                             )
                             continue
                     results[target_url] = (None, None)
+                    if rejected is not None and len(waits) == len(candidate_urls):
+                        rejected[target_url] = min(waits)
                 finally:
                     await page.close()
 
-        deadline = time.monotonic() + settings.product_price_fetch_browser_timeout_sec
-
         for start in range(0, len(target_urls), chunk_size):
             remaining = deadline - time.monotonic()
             if remaining <= 0:
                 logger.warning(
                     "브라우저 병렬 크롤링 타임아웃(%s초). 일부 결과만 반영합니다.",
-                    settings.product_price_fetch_browser_timeout_sec,
+                    round(timeout_sec),
                 )
                 break
 
             batch_urls = target_urls[start : start + chunk_size]
             try:
                 await asyncio.wait_for(
-                    asyncio.gather(*(fetch_one(url) for url in batch_urls)),
+                    asyncio.gather(
+                        *(fetch_one(start + idx, url) for idx, url in enumerate(batch_urls))
+                    ),
                     timeout=remaining,
                 )
             except asyncio.TimeoutError:
                 logger.warning(
                     "브라우저 병렬 크롤링 타임아웃(%s초). 일부 결과만 반영합니다.",
-                    settings.product_price_fetch_browser_timeout_sec,
+                    round(timeout_sec),
                 )
                 break
-        await context.close()
-        await browser.close()
+        for context in contexts:
+            await context.close()
 
     return results
+
+
+async def refresh_session_pool(settings: BatchSettings) -> int:
+    """세션 풀의 빈 자리를 브라우저로 워밍업해 채운다.
+
+    - why: HTTP/API 경로도 세션 쿠키를 쓰므로 브라우저 fallback 전에 미리 채워 둔다.
+    - return: 새로 만든 세션 수
+    """
+
+    pool = get_session_pool(settings, resolve_storage_state(settings))
+    if not pool.needs_refresh():
+        return 0
+
+    try:
+        import playwright.async_api  # noqa: F401
+    except Exception:
+        logger.warning("Playwright가 설치되지 않아 세션 워밍업을 건너뜁니다.")
+        return 0
+
+    async with AsyncExitStack() as stack:
+        try:
+            browser = await _acquire_browser(stack, settings)
+        except Exception as exc:
+            # 워밍업은 보조 수단이므로 브라우저를 못 띄워도 가격 수집은 쿠키 없이 계속한다.
+            logger.warning("세션 워밍업용 브라우저 실행 실패: %s", exc)
+            return 0
+        return await pool.refresh(browser, settings.user_agent)
@@ -0,0 +1,270 @@
+# why: 상품 페이지가 내부적으로 호출하는 가격 JSON API를 찾아 두고 httpx로 바로 호출해 HTML/브라우저 크롤링을 줄이기 위한 모듈
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+import json
+import logging
+import os
+from pathlib import Path
+import re
+import threading
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+
+from common.config import BatchSettings
+from common.http import get_http_client
+from common.run_report import add
+from sources.host_guard import HostGuard, HostRejected, Outcome
+from sources.product_price import extract_goodscode, parse_api_prices, resolve_storage_state
+from sources.session_pool import BrowserSession, get_session_pool
+
+
+logger = logging.getLogger("batch.product_price_api")
+
+Prices = tuple[int | None, int | None]
+
+GOODSCODE_PLACEHOLDER = "{goodscode}"
+# 이 횟수만큼 시도한 뒤 적중률이 기준 미만이면 엔드포인트를 더 쓰지 않는다.
+MIN_SAMPLES = 20
+MIN_HIT_RATE = 0.2
+# 캐시 무력화용 타임스탬프 파라미터(10자리 이상 숫자)는 템플릿에서 제거
+_TIMESTAMP_VALUE = re.compile(r"^\d{10,}$")
+
+
+@dataclass
+class EndpointTemplate:
+    template: str
+    hits: int = 0
+    misses: int = 0
+
+    def usable(self) -> bool:
+        total = self.hits + self.misses
+        return total < MIN_SAMPLES or self.hits / total >= MIN_HIT_RATE
+
+
+class PriceApiClient:
+    """발견한 가격 API 엔드포인트 저장소 겸 호출기.
+
+    - 발견: 브라우저 렌더링 중 XHR/fetch 응답에 상품 코드와 가격 키가 있으면 URL을 템플릿으로 저장.
+    - 호출: 상품 코드를 템플릿에 넣어 httpx로 호출하고, 엔드포인트별 적중률을 기록한다.
+    - 저장: product_price_api_endpoints_path(JSON)에 보관해 다음 실행에서도 재사용한다.
+    """
+
+    def __init__(self, settings: BatchSettings) -> None:
+        self.settings = settings
+        self.enabled = settings.product_price_api_enabled
+        self.path = settings.product_price_api_endpoints_path
+        self._templates: dict[str, EndpointTemplate] = {}
+        self._discovery_left = settings.product_price_api_discovery_max
+        self._lock = threading.Lock()
+        self._dirty = False
+        # 워밍업한 브라우저 세션 쿠키를 API 호출에도 실어 보낸다.
+        self.sessions = get_session_pool(settings, resolve_storage_state(settings))
+        self._load()
+
+    def templates(self) -> list[EndpointTemplate]:
+        with self._lock:
+            usable = [template for template in self._templates.values() if template.usable()]
+        return sorted(usable, key=lambda template: template.hits, reverse=True)
+
+    def claim_discovery(self) -> bool:
+        """이번 실행에서 네트워크 로깅을 붙일 페이지 수를 제한."""
+
+        with self._lock:
+            if not self.enabled or self._discovery_left <= 0:
+                return False
+            self._discovery_left -= 1
+            return True
+
+    def learn(self, url: str, goodscode: str) -> bool:
+        template = _to_template(url, goodscode)
+        if template is None:
+            return False
+        with self._lock:
+            if template in self._templates:
+                return False
+            self._templates[template] = EndpointTemplate(template)
+            self._dirty = True
+        logger.info("가격 API 엔드포인트 발견: %s", template)
+        return True
+
+    async def observe(self, response: Any, goodscode: str) -> None:
+        """Playwright response 이벤트 핸들러: 가격이 담긴 JSON 응답이면 엔드포인트로 등록."""
+
+        try:
+            if response.request.resource_type not in ("xhr", "fetch"):
+                return
+            if goodscode not in response.url:
+                return
+            if "json" not in (response.headers.get("content-type") or ""):
+                return
+            data = await response.json()
+        except Exception:
+            # 페이지가 닫힌 뒤 도착한 응답 등은 무시
+            return
+
+        if parse_api_prices(data) != (None, None):
+            self.learn(response.url, goodscode)
+
+    def fetch_sync(self, url: str) -> Prices | None:
+        session = self.sessions.acquire()
+        for template, api_url in self._candidates(url):
+            try:
+                response = get_http_client().get(
+                    api_url,
+                    headers=self._headers(url, api_url, session),
+                    timeout=4.0,
+                    follow_redirects=True,
+                )
+                prices = self._parse(response)
+                self.sessions.record(session, _outcome_of(response.status_code))
+            except httpx.HTTPError:
+                prices = None
+            self._record(template, prices is not None)
+            if prices is not None:
+                return prices
+        return None
+
+    async def fetch_async(
+        self, client: httpx.AsyncClient, url: str, guard: HostGuard | None = None
+    ) -> Prices | None:
+        """비동기 호출. guard(HostGuard)가 주어지면 호스트별 제한/차단기를 함께 적용."""
+
+        session = self.sessions.acquire()
+        for template, api_url in self._candidates(url):
+            prices = None
+            headers = self._headers(url, api_url, session)
+            try:
+                if guard is None:
+                    response = await client.get(api_url, headers=headers)
+                    prices = self._parse(response)
+                else:
+                    async with guard.request(api_url) as slot:
+                        response = await client.get(api_url, headers=headers)
+                        add("price_http", bytes=len(response.content))
+                        prices = self._parse(response)
+                        slot.outcome = _outcome_of(response.status_code)
+                self.sessions.record(session, _outcome_of(response.status_code))
+            except HostRejected:
+                continue
+            except httpx.HTTPError:
+                prices = None
+            self._record(template, prices is not None)
+            if prices is not None:
+                return prices
+        return None
+
+    def save(self) -> None:
+        """발견/적중 기록을 파일에 원자적으로 저장."""
+
+        if not self.path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = [asdict(template) for template in self._templates.values()]
+            self._dirty = False
+
+        target = Path(os.path.expanduser(self.path))
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_suffix(target.suffix + ".tmp")
+            tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+            os.replace(tmp, target)
+        except OSError:
+            logger.exception("가격 API 엔드포인트 저장 실패: %s", target)
+
+    def _load(self) -> None:
+        if not self.path:
+            return
+        target = Path(os.path.expanduser(self.path))
+        if not target.exists():
+            return
+        try:
+            payload = json.loads(target.read_text(encoding="utf-8"))
+            for entry in payload:
+                template = EndpointTemplate(**entry)
+                self._templates[template.template] = template
+        except (OSError, ValueError, TypeError):
+            logger.warning("가격 API 엔드포인트 파일을 읽지 못했습니다: %s", target)
+
+    def _candidates(self, url: str) -> list[tuple[EndpointTemplate, str]]:
+        if not self.enabled:
+            return []
+        goodscode = extract_goodscode(url)
+        if not goodscode:
+            return []
+        return [
+            (template, template.template.replace(GOODSCODE_PLACEHOLDER, goodscode))
+            for template in self.templates()
+        ]
+
+    def _record(self, template: EndpointTemplate, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                template.hits += 1
+            else:
+                template.misses += 1
+            self._dirty = True
+
+    def _headers(
+        self, url: str, api_url: str, session: BrowserSession | None = None
+    ) -> dict[str, str]:
+        headers = {
+            "User-Agent": self.settings.user_agent,
+            "Accept": "application/json, text/plain, */*",
+            "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+            "Referer": url,
+            "X-Requested-With": "XMLHttpRequest",
+        }
+        cookie = session.cookie_header(api_url) if session else None
+        if cookie:
+            headers["Cookie"] = cookie
+        return headers
+
+    @staticmethod
+    def _parse(response: httpx.Response) -> Prices | None:
+        if response.status_code != 200:
+            return None
+        try:
+            prices = parse_api_prices(response.json())
+        except ValueError:
+            return None
+        return prices if prices != (None, None) else None
+
+
+def _outcome_of(status_code: int) -> Outcome:
+    if status_code in (403, 429):
+        return Outcome.BLOCKED
+    if status_code >= 500:
+        return Outcome.ERROR
+    return Outcome.OK
+
+
+def _to_template(url: str, goodscode: str) -> str | None:
+    parts = urlsplit(url)
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if goodscode in value or not _TIMESTAMP_VALUE.match(value)
+    ]
+    rebuilt = urlunsplit(parts._replace(query=urlencode(query)))
+    if goodscode not in rebuilt:
+        return None
+    return rebuilt.replace(goodscode, GOODSCODE_PLACEHOLDER)
+
+
+_client: PriceApiClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_price_api(settings: BatchSettings) -> PriceApiClient:
+    """프로세스 단위 공유 클라이언트 (브라우저 발견과 HTTP 호출이 같은 저장소를 쓰도록)."""
+
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = PriceApiClient(settings)
+        return _client
@@ -0,0 +1,242 @@
+# why: 브라우저로 데운 세션(쿠키/스토리지)을 여러 개 돌려 쓰며 HTTP 요청에도 쿠키를 실어 봇 차단을 줄이기 위한 세션 풀
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any
+from urllib.parse import urlsplit
+import uuid
+
+from common.config import BatchSettings
+from sources.host_guard import Outcome
+
+
+logger = logging.getLogger("batch.session_pool")
+
+# 세션을 만들 때 사람처럼 거쳐 가는 페이지 (쿠키/봇 판정 토큰 발급)
+WARMUP_URLS = (
+    "https://m.gmarket.co.kr/",
+    "https://mobile.gmarket.co.kr/HomeShopping/BroadcastSchedule",
+)
+
+
+@dataclass
+class BrowserSession:
+    id: str
+    path: Path
+    created_at: datetime
+    cookies: list[dict[str, Any]] = field(default_factory=list)
+    successes: int = 0
+    failures: int = 0
+
+    @property
+    def requests(self) -> int:
+        return self.successes + self.failures
+
+    def success_rate(self) -> float:
+        return self.successes / self.requests if self.requests else 1.0
+
+    def cookie_header(self, url: str) -> str | None:
+        """URL 호스트/경로에 해당하는 쿠키를 Cookie 헤더 문자열로 변환."""
+
+        parts = urlsplit(url)
+        host = parts.hostname or ""
+        path = parts.path or "/"
+        now = time.time()
+        pairs = []
+        for cookie in self.cookies:
+            domain = (cookie.get("domain") or "").lstrip(".")
+            if not domain or not (host == domain or host.endswith("." + domain)):
+                continue
+            if not path.startswith(cookie.get("path") or "/"):
+                continue
+            expires = cookie.get("expires")
+            if expires is not None and 0 < expires < now:
+                continue
+            pairs.append(f"{cookie['name']}={cookie['value']}")
+        return "; ".join(pairs) or None
+
+
+class SessionPool:
+    """storage_state 파일 여러 개를 돌려 쓰는 세션 풀.
+
+    - 세션 파일은 product_price_session_dir에 저장하고, TTL이 지나거나 성공률이 낮으면 폐기한다.
+    - 빈 자리는 브라우저로 워밍업 페이지를 거쳐 새 세션을 만들어 채운다.
+    - 수동으로 만든 storage_state 파일(scripts/save_gmarket_storage_state.py)이 있으면 새 세션의 출발점으로 쓴다.
+    """
+
+    def __init__(self, settings: BatchSettings, seed_state: str | None = None) -> None:
+        self.settings = settings
+        self.size = max(0, settings.product_price_session_pool_size)
+        self.ttl = timedelta(minutes=settings.product_price_session_ttl_minutes)
+        self.directory = Path(os.path.expanduser(settings.product_price_session_dir))
+        self.seed_state = seed_state
+        self.retired = 0
+        self.created = 0
+        self._sessions: list[BrowserSession] = []
+        self._cursor = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0
+
+    def healthy(self, now: datetime | None = None) -> list[BrowserSession]:
+        now = now or datetime.utcnow()
+        with self._lock:
+            return [session for session in self._sessions if now - session.created_at < self.ttl]
+
+    def needs_refresh(self, now: datetime | None = None) -> bool:
+        return self.enabled and len(self.healthy(now)) < self.size
+
+    def acquire(self) -> BrowserSession | None:
+        """건강한 세션을 라운드로빈으로 하나 고른다."""
+
+        sessions = self.healthy()
+        if not sessions:
+            return None
+        with self._lock:
+            session = sessions[self._cursor % len(sessions)]
+            self._cursor += 1
+        return session
+
+    def record(self, session: BrowserSession | None, outcome: Outcome) -> None:
+        """세션별 성공/차단을 기록하고, 충분히 쓴 뒤 성공률이 기준 미만이면 폐기.
+
+        - 타임아웃/5xx는 세션 탓이 아니므로 OK/BLOCKED만 센다.
+        """
+
+        if session is None or outcome not in (Outcome.OK, Outcome.BLOCKED):
+            return
+        with self._lock:
+            if outcome == Outcome.OK:
+                session.successes += 1
+            else:
+                session.failures += 1
+            bad = (
+                session.requests >= self.settings.product_price_session_min_requests
+                and session.success_rate() < self.settings.product_price_session_min_success_rate
+            )
+            if not bad or session not in self._sessions:
+                return
+            self._sessions.remove(session)
+            self.retired += 1
+        logger.warning(
+            "성공률이 낮아 세션을 폐기합니다. session=%s success=%s/%s",
+            session.id,
+            session.successes,
+            session.requests,
+        )
+        session.path.unlink(missing_ok=True)
+
+    async def refresh(self, browser: Any, user_agent: str) -> int:
+        """만료된 세션을 정리하고 빈 자리를 브라우저로 워밍업한 새 세션으로 채운다.
+
+        - return: 새로 만든 세션 수
+        """
+
+        if not self.enabled:
+            return 0
+
+        now = datetime.utcnow()
+        with self._lock:
+            expired = [session for session in self._sessions if now - session.created_at >= self.ttl]
+            for session in expired:
+                self._sessions.remove(session)
+        for session in expired:
+            session.path.unlink(missing_ok=True)
+
+        created = 0
+        while len(self.healthy(now)) < self.size:
+            session = await self._warm_up(browser, user_agent)
+            if session is None:
+                break
+            with self._lock:
+                self._sessions.append(session)
+            created += 1
+        self.created += created
+        return created
+
+    def summary(self) -> dict[str, Any]:
+        sessions = self.healthy()
+        return {
+            "sessions": len(sessions),
+            "created": self.created,
+            "retired": self.retired,
+            "success_rate": round(
+                sum(session.successes for session in sessions)
+                / max(1, sum(session.requests for session in sessions)),
+                3,
+            ),
+        }
+
+    async def _warm_up(self, browser: Any, user_agent: str) -> BrowserSession | None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        session_id = uuid.uuid4().hex[:12]
+        path = self.directory / f"{session_id}.json"
+        context = await browser.new_context(
+            user_agent=user_agent,
+            locale="ko-KR",
+            timezone_id="Asia/Seoul",
+            viewport={"width": 1280, "height": 720},
+            storage_state=self.seed_state,
+        )
+        try:
+            await context.add_init_script(
+                "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+            )
+            page = await context.new_page()
+            for url in WARMUP_URLS:
+                await page.goto(url, wait_until="domcontentloaded", timeout=10000)
+                await page.wait_for_timeout(800)
+            state = await context.storage_state(path=str(path))
+        except Exception as exc:
+            logger.warning("세션 워밍업 실패: %s", exc)
+            return None
+        finally:
+            await context.close()
+
+        logger.info("새 브라우저 세션 생성. session=%s cookies=%s", session_id, len(state["cookies"]))
+        return BrowserSession(
+            id=session_id, path=path, created_at=datetime.utcnow(), cookies=state["cookies"]
+        )
+
+    def _load(self) -> None:
+        if not self.enabled or not self.directory.exists():
+            return
+        for path in sorted(self.directory.glob("*.json")):
+            try:
+                state = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                path.unlink(missing_ok=True)
+                continue
+            self._sessions.append(
+                BrowserSession(
+                    id=path.stem,
+                    path=path,
+                    # 파일 수정 시각을 생성 시각으로 사용 (naive UTC)
+                    created_at=datetime.utcfromtimestamp(path.stat().st_mtime),
+                    cookies=state.get("cookies", []),
+                )
+            )
+
+
+_pool: SessionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_session_pool(settings: BatchSettings, seed_state: str | None = None) -> SessionPool:
+    """프로세스 단위 공유 세션 풀 (HTTP/브라우저 경로가 같은 세션과 통계를 공유)."""
+
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SessionPool(settings, seed_state)
+        return _pool
@@ -2,6 +2,39 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 root_dir = Path(__file__).resolve().parents[1]
 if str(root_dir) not in sys.path:
     sys.path.insert(0, str(root_dir))
+
+
+@pytest.fixture
+def batch_settings():
+    """개발자 로컬 `.env`를 읽지 않는 BatchSettings 팩토리 (테스트에 필요한 값만 덮어쓴다)."""
+
+    from common.config import BatchSettings
+
+    def factory(**overrides):
+        return BatchSettings(_env_file=None, **overrides)
+
+    return factory
+
+
+@pytest.fixture
+def db_session():
+    """전체 배치 스키마를 만든 메모리 sqlite 세션 (테스트마다 새 DB)."""
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from common.models import Base
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        yield db
+    finally:
+        db.close()
+        engine.dispose()
@@ -0,0 +1,217 @@
+# why: 실제 Slack/SMTP 없이 디스패처를 검증하고 처리량을 측정하기 위한 로컬 가짜 서버
+"""로컬 가짜 Slack 웹훅 / SMTP 서버.
+
+처리량 측정:
+    cd apps/batch && python -m tests.fake_notify_servers --messages 200 --destinations 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeSlackServer:
+    """Slack 웹훅 흉내 서버.
+
+    - `rate_limit_first`만큼 처음 요청에 429 + Retry-After를 돌려준다.
+    """
+
+    def __init__(self, rate_limit_first: int = 0, retry_after: str = "0", delay: float = 0.0):
+        self.payloads: list[dict] = []
+        self.request_count = 0
+        self.rate_limit_first = rate_limit_first
+        self.retry_after = retry_after
+        self.delay = delay
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):  # noqa: N802
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length)
+                with server._lock:
+                    server.request_count += 1
+                    limited = server.request_count <= server.rate_limit_first
+                    if not limited:
+                        server.payloads.append(json.loads(body or b"{}"))
+                if server.delay:
+                    time.sleep(server.delay)
+                if limited:
+                    self.send_response(429)
+                    self.send_header("Retry-After", server.retry_after)
+                else:
+                    self.send_response(200)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"ok")
+
+            def log_message(self, format, *args):  # noqa: A002
+                return
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/services/fake"
+
+    def __enter__(self) -> "FakeSlackServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class FakeSmtpServer:
+    """AUTH PLAIN/LOGIN만 지원하는 최소 SMTP 서버 (STARTTLS 미지원)."""
+
+    def __init__(self, delay: float = 0.0):
+        self.messages: list[str] = []
+        self.login_count = 0
+        self.connection_count = 0
+        self.delay = delay
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def _reply(self, line: str) -> None:
+                self.wfile.write((line + "\r\n").encode("utf-8"))
+
+            def handle(self):
+                with server._lock:
+                    server.connection_count += 1
+                self._reply("220 fake-smtp ready")
+                while True:
+                    raw = self.rfile.readline()
+                    if not raw:
+                        return
+                    command = raw.decode("utf-8", "replace").strip()
+                    verb = command.split(" ", 1)[0].upper()
+                    if verb == "EHLO":
+                        self._reply("250-fake-smtp")
+                        self._reply("250 AUTH PLAIN LOGIN")
+                    elif verb == "HELO":
+                        self._reply("250 fake-smtp")
+                    elif verb == "AUTH":
+                        parts = command.split()
+                        if parts[1].upper() == "LOGIN":
+                            self._reply("334 VXNlcm5hbWU6")
+                            self.rfile.readline()
+                            self._reply("334 UGFzc3dvcmQ6")
+                            self.rfile.readline()
+                        with server._lock:
+                            server.login_count += 1
+                        self._reply("235 2.7.0 Authentication successful")
+                    elif verb in ("MAIL", "RCPT", "RSET", "NOOP"):
+                        self._reply("250 OK")
+                    elif verb == "DATA":
+                        self._reply("354 End data with <CR><LF>.<CR><LF>")
+                        lines: list[str] = []
+                        while True:
+                            data_line = self.rfile.readline()
+                            if not data_line or data_line in (b".\r\n", b".\n"):
+                                break
+                            lines.append(data_line.decode("utf-8", "replace"))
+                        if server.delay:
+                            time.sleep(server.delay)
+                        with server._lock:
+                            server.messages.append("".join(lines))
+                        self._reply("250 OK queued")
+                    elif verb == "QUIT":
+                        self._reply("221 Bye")
+                        return
+                    else:
+                        self._reply("502 Command not implemented")
+
+        class Server(socketserver.ThreadingTCPServer):
+            allow_reuse_address = True
+            daemon_threads = True
+
+        self._server = Server(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def __enter__(self) -> "FakeSmtpServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def make_settings(smtp_port: int, **overrides):
+    from common.config import BatchSettings
+
+    values = {
+        "smtp_host": "127.0.0.1",
+        "smtp_port": smtp_port,
+        "smtp_user": "tester",
+        "smtp_password": "secret",
+        "smtp_use_tls": False,
+        "smtp_use_ssl": False,
+        "notify_retry_after_max_sec": 1,
+    }
+    values.update(overrides)
+    return BatchSettings(_env_file=None, **values)
+
+
+def _measure(messages: int, destinations: int, delay: float) -> None:
+    from common.email import send_email_message
+    from common.models import DestinationType
+    from common.notify import Notification, NotificationDispatcher
+    from common.slack import send_slack_message
+
+    with FakeSlackServer(delay=delay) as slack, FakeSmtpServer(delay=delay) as smtp:
+        settings = make_settings(smtp.port)
+
+        started = time.perf_counter()
+        for idx in range(messages):
+            send_slack_message(slack.url, f"message {idx}")
+            send_email_message(f"user{idx % destinations}@example.com", "subject", "body", settings)
+        sequential = time.perf_counter() - started
+        sequential_logins = smtp.login_count
+
+        smtp.login_count = 0
+        dispatcher = NotificationDispatcher(settings)
+        for idx in range(messages):
+            dispatcher.add(
+                Notification(DestinationType.SLACK, f"{slack.url}/{idx % destinations}", "s", f"m{idx}")
+            )
+            dispatcher.add(
+                Notification(
+                    DestinationType.EMAIL, f"user{idx % destinations}@example.com", "s", f"m{idx}"
+                )
+            )
+        started = time.perf_counter()
+        results = dispatcher.dispatch_sync()
+        dispatched = time.perf_counter() - started
+
+    print(f"sequential: {messages * 2} sends in {sequential:.3f}s (smtp logins={sequential_logins})")
+    print(
+        f"dispatcher: {messages * 2} notifications -> {len(results)} digests "
+        f"in {dispatched:.3f}s (smtp logins={smtp.login_count})"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="알림 디스패처 처리량 측정")
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--destinations", type=int, default=20)
+    parser.add_argument("--delay", type=float, default=0.005, help="가짜 서버 응답 지연(초)")
+    args = parser.parse_args()
+    _measure(args.messages, args.destinations, args.delay)
@@ -0,0 +1,73 @@
+# why: 발송 로그 기반 중복 방지/재시도 판단 규칙을 검증
+from datetime import datetime, timedelta
+
+from common.alert_delivery import destination_hash, is_deliverable, record_failure, record_success
+from common.models import DeliveryStatus
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.added: list = []
+
+    def add(self, obj) -> None:
+        self.added.append(obj)
+
+
+def test_sent_delivery_is_not_sent_again():
+    now = datetime(2026, 2, 3, 9, 0, 0)
+    db = _FakeSession()
+    deliveries: dict = {}
+    key = (1, 10, destination_hash("https://hooks.slack.com/a"))
+
+    record_success(db, deliveries, key, now)
+
+    assert deliveries[key].status == DeliveryStatus.SENT
+    assert not is_deliverable(deliveries[key], now, max_attempts=5)
+    assert len(db.added) == 1
+
+
+def test_failed_delivery_retries_after_backoff_until_max_attempts():
+    now = datetime(2026, 2, 3, 9, 0, 0)
+    db = _FakeSession()
+    deliveries: dict = {}
+    key = (1, 10, destination_hash("user@example.com"))
+
+    delivery = record_failure(db, deliveries, key, now, "429", retry_base_sec=60)
+    assert not is_deliverable(delivery, now, max_attempts=2)
+    assert is_deliverable(delivery, now + timedelta(seconds=60), max_attempts=2)
+
+    delivery = record_failure(db, deliveries, key, now, "429", retry_base_sec=60)
+    assert delivery.next_retry_at == now + timedelta(seconds=120)
+    assert not is_deliverable(delivery, now + timedelta(days=1), max_attempts=2)
+
+
+def test_new_delivery_is_deliverable():
+    assert is_deliverable(None, datetime(2026, 2, 3), max_attempts=5)
+
+
+def test_pending_retry_is_reported_with_its_next_attempt_time(batch_settings, monkeypatch):
+    from types import SimpleNamespace
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from common.models import AlertDelivery, DestinationType
+    from jobs.send_alerts_job import deliver_alert_matches
+
+    monkeypatch.setattr("jobs.send_alerts_job.decrypt_values", lambda values: values)
+    now = datetime(2026, 2, 3, 9, 0, 0)
+    engine = create_engine("sqlite://")
+    AlertDelivery.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+    key = (1, 10, destination_hash("hook"))
+    record_failure(db, {}, key, now, "429", retry_base_sec=60)
+    db.commit()
+
+    alert = SimpleNamespace(
+        id=1, alert_name="a", destination_type=DestinationType.SLACK, destination_value="hook"
+    )
+    slot = SimpleNamespace(id=10, raw_title="t", start_at=now, price_text=None)
+    stats = deliver_alert_matches(db, batch_settings(), [(alert, [slot])], now)
+
+    assert stats.skipped == 1
+    assert stats.retry_at == {key: now + timedelta(seconds=60)}
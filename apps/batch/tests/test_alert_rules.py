@@ -0,0 +1,164 @@
+# why: 알림 규칙 색인/타이머 휠/슬롯 이벤트 큐의 증분 평가 동작을 검증
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from common.alert_rules import AlertRule, AlertRuleIndex, TimerWheel
+from common.models import Alert, Base, BroadcastSlot, BroadcastStatus, Channel, DestinationType
+from common.slot_events import SlotEvent, SlotEventQueue, SlotEventType
+from jobs.alert_evaluator import AlertEvaluator
+from jobs.send_alerts_job import DeliveryStats
+
+
+def _rule(rule_id: int, channel_codes: tuple[str, ...], keywords: tuple[str, ...]) -> AlertRule:
+    return AlertRule(
+        id=rule_id,
+        alert_name=f"rule {rule_id}",
+        channel_codes=channel_codes,
+        keywords=keywords,
+        notify_before_minutes=30,
+        destination_type=DestinationType.SLACK,
+        destination_value="hook",
+    )
+
+
+def test_rule_index_matches_by_channel_and_keyword():
+    index = AlertRuleIndex(
+        [
+            _rule(1, ("lotte",), ("침구",)),
+            _rule(2, ("lotte", "gsshop"), ("침구", "이불")),
+            _rule(3, ("gsshop",), ("한우",)),
+        ]
+    )
+
+    assert {rule.id for rule in index.match("lotte", "프리미엄 침구 이불 세트")} == {1, 2}
+    assert [rule.id for rule in index.match("gsshop", "한우 선물세트")] == [3]
+    assert index.match("ns", "침구") == []
+
+
+def test_timer_wheel_fires_items_in_order_including_far_future():
+    start = datetime(2026, 2, 3, 9, 0, 0)
+    wheel = TimerWheel(start, tick=timedelta(minutes=1), size=8)
+    wheel.schedule(start + timedelta(minutes=20), "far")
+    wheel.schedule(start + timedelta(minutes=3), "soon")
+    wheel.schedule(start - timedelta(minutes=5), "overdue")
+
+    assert wheel.advance(start) == ["overdue"]
+    assert wheel.advance(start + timedelta(minutes=2)) == []
+    assert wheel.advance(start + timedelta(minutes=3)) == ["soon"]
+    assert wheel.advance(start + timedelta(minutes=19)) == []
+    assert wheel.advance(start + timedelta(minutes=20)) == ["far"]
+    assert len(wheel) == 0
+
+
+def test_slot_event_queue_keeps_latest_event_per_slot():
+    start = datetime(2026, 2, 3, 9, 0, 0)
+    queue = SlotEventQueue()
+    queue.publish(SlotEvent(SlotEventType.CREATED, 1, "lotte", start, "a", "a"))
+    queue.publish(SlotEvent(SlotEventType.CHANGED, 1, "lotte", start, "a", "a", "9,900원"))
+    queue.publish(SlotEvent(SlotEventType.CHANGED, 2, "lotte", start, "b", "b"))
+
+    events = queue.drain()
+
+    assert [(event.id, event.event_type) for event in events] == [
+        (1, SlotEventType.CREATED),
+        (2, SlotEventType.CHANGED),
+    ]
+    assert events[0].price_text == "9,900원"
+    assert queue.drain() == []
+
+
+
+def _evaluator_db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    channel = Channel(channel_code="lotte", channel_name="롯데홈쇼핑")
+    alert = Alert(
+        alert_name="침구",
+        target_channel_codes=["lotte"],
+        keyword_list=["침구"],
+        notify_before_minutes=30,
+        destination_type=DestinationType.SLACK,
+        destination_value="hook",
+        is_active=True,
+    )
+    db.add_all([channel, alert])
+    db.commit()
+    return db, channel, alert
+
+
+def _add_slot(db, channel: Channel, slot_hash: str, start: datetime, title: str) -> BroadcastSlot:
+    slot = BroadcastSlot(
+        channel_id=channel.id,
+        source_code=slot_hash,
+        start_at=start,
+        end_at=start + timedelta(hours=1),
+        raw_title=title,
+        normalized_title=title,
+        status=BroadcastStatus.SCHEDULED,
+        slot_hash=slot_hash,
+    )
+    db.add(slot)
+    db.commit()
+    return slot
+
+
+def test_evaluator_reloads_window_and_sends_each_match_once(batch_settings, monkeypatch):
+    now = datetime(2026, 2, 3, 9, 0, 0)
+    db, channel, alert = _evaluator_db()
+    sent: list[tuple[datetime, list[int]]] = []
+
+    def deliver(db, settings, matched, at):
+        sent.extend((at, [event.id for event in events]) for _, events in matched)
+        return DeliveryStats(sent=sum(len(events) for _, events in matched))
+
+    monkeypatch.setattr("jobs.alert_evaluator.deliver_alert_matches", deliver)
+    evaluator = AlertEvaluator(batch_settings(), now=now)
+
+    # 다른 워커가 수집해 이벤트 없이 DB에만 있는 슬롯은 발송 구간에 들어올 때 예약된다.
+    later = _add_slot(db, channel, "later", now + timedelta(minutes=50), "침구 세트")
+    assert evaluator.tick(db, now)[0] == 0
+    # 수집 이벤트는 발송 구간 밖이어도 바로 매칭한다.
+    soon = now + timedelta(minutes=45)
+    created = SlotEvent(SlotEventType.CREATED, 99, "lotte", soon, "침구", "침구")
+    assert evaluator.tick(db, now + timedelta(minutes=10), [created])[0] == 1
+    # 이후 제목이 바뀐 슬롯의 이전 예약은 보내지 않는다.
+    changed = SlotEvent(SlotEventType.CHANGED, 99, "lotte", soon, "한우", "한우")
+    assert evaluator.tick(db, now + timedelta(minutes=11), [changed])[0] == 0
+
+    scheduled, stats = evaluator.tick(db, now + timedelta(minutes=20))
+    assert (scheduled, stats.sent) == (1, 1)
+    assert evaluator.tick(db, now + timedelta(minutes=21)) == (0, DeliveryStats())
+    assert sent == [(now + timedelta(minutes=20), [later.id])]
+
+    # 규칙이 바뀌면 예약을 버리고 새 규칙으로 다시 만든다.
+    alert.is_active = False
+    db.commit()
+    assert evaluator.tick(db, now + timedelta(minutes=22))[0] == 0
+    assert len(evaluator.wheel) == 0
+
+
+def test_evaluator_reschedules_failed_delivery_at_retry_time(batch_settings, monkeypatch):
+    now = datetime(2026, 2, 3, 9, 0, 0)
+    db, channel, alert = _evaluator_db()
+    slot = _add_slot(db, channel, "a", now + timedelta(minutes=20), "침구 세트")
+    attempts: list[datetime] = []
+
+    def deliver(db, settings, matched, at):
+        if not matched:
+            return DeliveryStats()
+        attempts.append(at)
+        if len(attempts) == 1:
+            retry_at = {(alert.id, slot.id, "hash"): at + timedelta(minutes=2)}
+            return DeliveryStats(failed=1, retry_at=retry_at)
+        return DeliveryStats(sent=1)
+
+    monkeypatch.setattr("jobs.alert_evaluator.deliver_alert_matches", deliver)
+    evaluator = AlertEvaluator(batch_settings(), now=now)
+
+    assert evaluator.tick(db, now)[1].failed == 1
+    evaluator.tick(db, now + timedelta(minutes=1))
+    assert evaluator.tick(db, now + timedelta(minutes=2))[1].sent == 1
+    assert attempts == [now, now + timedelta(minutes=2)]
@@ -0,0 +1,76 @@
+# why: 보관 잡이 오래된 슬롯/가격 이력만 청크 단위로 옮기고, 월 파티션 계획이 맞는지 sqlite로 검증
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import func, select
+
+from common.models import (
+    BroadcastPriceHistory,
+    BroadcastPriceHistoryArchive,
+    BroadcastSlot,
+    BroadcastSlotArchive,
+    BroadcastStatus,
+)
+from pipelines.archive_pipeline import (
+    archive_ended_slots,
+    expired_partition_months,
+    missing_partition_months,
+    partition_months,
+)
+
+
+def _slot(index: int, end_at: datetime) -> BroadcastSlot:
+    return BroadcastSlot(
+        channel_id=1,
+        source_code="test",
+        start_at=end_at - timedelta(hours=1),
+        end_at=end_at,
+        raw_title=f"상품 {index}",
+        normalized_title=f"상품 {index}",
+        status=BroadcastStatus.ENDED,
+        slot_hash=f"hash-{index}",
+    )
+
+
+def test_archive_moves_old_slots_and_history_in_chunks(db_session):
+    db = db_session
+    cutoff = datetime(2026, 1, 1)
+    old = [_slot(index, cutoff - timedelta(days=index + 1)) for index in range(5)]
+    recent = _slot(99, cutoff + timedelta(days=1))
+    db.add_all([*old, recent])
+    db.flush()
+    for slot in [*old, recent]:
+        db.add(BroadcastPriceHistory(broadcast_slot_id=slot.id, collected_at=slot.start_at, sale_price=1000))
+    db.commit()
+    old_ids = sorted(slot.id for slot in old)
+    recent_id = recent.id
+
+    sleeps = []
+    result = archive_ended_slots(db, cutoff, chunk_size=2, sleep_sec=0.1, sleep=sleeps.append)
+
+    assert (result.slots, result.price_history, result.chunks) == (5, 5, 3)
+    assert sleeps == [0.1, 0.1]
+    assert db.scalars(select(BroadcastSlot.id)).all() == [recent_id]
+    assert db.scalars(select(BroadcastPriceHistory.broadcast_slot_id)).all() == [recent_id]
+    assert sorted(db.scalars(select(BroadcastSlotArchive.id)).all()) == old_ids
+    archived = db.get(BroadcastSlotArchive, old_ids[0])
+    assert archived.slot_hash == "hash-0" and archived.archived_at is not None
+    assert db.scalar(select(func.count()).select_from(BroadcastPriceHistoryArchive)) == 5
+
+    # 다시 실행해도 옮길 행이 없으면 아무것도 하지 않는다.
+    assert archive_ended_slots(db, cutoff, chunk_size=2, sleep_sec=0.1, sleep=sleeps.append).slots == 0
+
+
+def test_partition_plan_adds_future_months_and_expires_old_ones():
+    existing = partition_months(["p202510", "p202511", "p202512", "pmax"])
+    assert existing == [date(2025, 10, 1), date(2025, 11, 1), date(2025, 12, 1)]
+
+    assert missing_partition_months(existing, date(2026, 1, 1), 2) == [
+        date(2026, 1, 1),
+        date(2026, 2, 1),
+        date(2026, 3, 1),
+    ]
+    assert missing_partition_months([], date(2026, 1, 1), 0) == [date(2026, 1, 1)]
+
+    # 구간 전체가 cutoff 이전인 달만, 마지막 월 파티션은 남긴다.
+    assert expired_partition_months(existing, date(2025, 12, 1)) == [date(2025, 10, 1), date(2025, 11, 1)]
+    assert expired_partition_months(existing, date(2025, 11, 15)) == [date(2025, 10, 1)]
@@ -0,0 +1,31 @@
+# why: 채널 레지스트리가 바뀐 채널만 저장하고 변경이 없으면 커밋하지 않는지 sqlite로 검증
+from sqlalchemy import event
+
+from common.channel_registry import ChannelRegistry, ChannelSpec
+from common.models import Channel
+
+
+def test_sync_creates_missing_and_updates_only_changed_channels(db_session):
+    db = db_session
+    specs = [
+        ChannelSpec("lotte", "롯데홈쇼핑", live_url="https://live/lotte"),
+        ChannelSpec("gsshop", "GS SHOP", stream_url="https://stream/gs.m3u8"),
+    ]
+    channels = ChannelRegistry(db).sync(specs)
+    assert channels["lotte"].id and channels["gsshop"].id
+
+    commits = []
+    event.listen(db, "after_commit", lambda session: commits.append(session))
+    registry = ChannelRegistry(db)
+    registry.sync(specs)
+    assert commits == []
+
+    # URL이 None이면 기존 값을 지우지 않고, 바뀐 값만 반영한다.
+    registry.sync([ChannelSpec("lotte", "롯데홈쇼핑", live_url=None, logo_url="https://logo/lotte.png")])
+    assert len(commits) == 1
+    lotte = db.get(Channel, channels["lotte"].id)
+    assert (lotte.channel_live_url, lotte.channel_logo_url) == ("https://live/lotte", "https://logo/lotte.png")
+
+    assert registry.update_stream_urls({"gsshop": "https://stream/gs.m3u8", "unknown": "x"}) == 0
+    assert registry.update_stream_urls({"gsshop": "https://stream/gs2.m3u8"}) == 1
+    assert registry.code_by_name() == {"롯데홈쇼핑": "lotte", "GS SHOP": "gsshop"}
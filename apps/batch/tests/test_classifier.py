@@ -0,0 +1,97 @@
+# why: 가중치 룰 분류기의 점수/우선순위 규칙과 과거 슬롯 일괄 재분류를 검증
+from datetime import datetime
+import json
+from pathlib import Path
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from common.classifier import CategoryClassifier, CategoryRule
+from common.models import BroadcastSlot, BroadcastStatus
+from common.normalize import infer_category, normalize_product_title
+from pipelines.category_pipeline import reclassify_slots
+from tests.test_normalize import sample_titles
+
+
+WEIGHTED_RULES = Path(__file__).resolve().parents[1] / "category_rules.weighted.json"
+
+
+def test_weighted_rules_pick_highest_score_and_longest_keyword():
+    classifier = CategoryClassifier(
+        [
+            CategoryRule("리빙", "청소"),
+            CategoryRule("가전", "청소기"),
+            CategoryRule("가전", "TV", 2.0),
+            CategoryRule("리빙", "거실"),
+            CategoryRule("리빙", "수납"),
+            CategoryRule("가전", "무선 청소기", 3.0),
+        ]
+    )
+
+    # 긴 키워드 우선: "청소기"는 리빙("청소")이 아니라 가전
+    assert classifier.classify("다이슨 청소기") == "가전"
+    # 대문자 키워드도 소문자로 정규화된 상품명과 매칭
+    assert classifier.classify("거실 tv 수납장") == "리빙"
+    assert classifier.classify("거실용 tv") == "가전"
+    # 두 단어 구문 가중치
+    assert classifier.classify("거실 수납 무선 청소기") == "가전"
+    assert classifier.classify("프리미엄 세트") == "기타"
+
+
+def test_default_classifier_matches_infer_category():
+    classifier = CategoryClassifier.from_category_rules()
+
+    for title in sample_titles(5000) + ["", "무선 청소기 특가", "로봇청소기", "삼성 TV"]:
+        assert classifier.classify(normalize_product_title(title)) == infer_category(title), title
+    # 기본 룰은 선언 순서 우선: 리빙("청소")이 가전("청소기")보다 먼저
+    assert classifier.classify(normalize_product_title("로봇청소기")) == "리빙"
+
+
+def test_shipped_weighted_rules_prefer_longest_keyword():
+    classifier = CategoryClassifier.from_file(WEIGHTED_RULES)
+
+    assert classifier.mode == "score"
+    assert classifier.classify(normalize_product_title("무선 청소기 특가")) == "가전"
+    assert classifier.classify(normalize_product_title("프리미엄 침구 세트")) == "리빙"
+
+
+def test_rule_file_and_bulk_reclassify(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text(
+        json.dumps(
+            {
+                "default": "기타",
+                "rules": [
+                    {"category": "식품", "keyword": "한우", "weight": 1},
+                    {"category": "주방", "keyword": "프라이팬", "weight": 1},
+                ],
+            },
+            ensure_ascii=False,
+        ),
+        encoding="utf-8",
+    )
+    classifier = CategoryClassifier.from_file(path)
+
+    engine = create_engine("sqlite://")
+    BroadcastSlot.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+    titles = ["한우 세트", "코팅 프라이팬", "무선 청소기", "한우 불고기"]
+    for idx, title in enumerate(titles):
+        db.add(
+            BroadcastSlot(
+                channel_id=1,
+                source_code="test",
+                start_at=datetime(2026, 2, 3, idx),
+                end_at=datetime(2026, 2, 3, idx + 1),
+                raw_title=title,
+                normalized_title=title,
+                category="식품" if idx == 0 else "리빙",
+                status=BroadcastStatus.ENDED,
+                slot_hash=f"hash-{idx}",
+            )
+        )
+    db.commit()
+
+    assert reclassify_slots(db, classifier, batch_size=3) == (4, 3)
+    categories = db.execute(select(BroadcastSlot.category).order_by(BroadcastSlot.id)).scalars().all()
+    assert categories == ["식품", "주방", "기타", "식품"]
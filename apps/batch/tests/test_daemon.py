@@ -0,0 +1,122 @@
+# why: 상주 스케줄러의 cron 계산/중복 실행 방지/상태 기록을 검증
+import json
+import threading
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from common.scheduler import BatchDaemon, CronSchedule, IntervalSchedule, parse_schedule
+
+
+KST = ZoneInfo("Asia/Seoul")
+
+
+def test_cron_next_after_uses_daemon_timezone():
+    schedule = CronSchedule("0 9 * * *", KST)
+
+    # 2026-02-03 00:30 UTC = 09:30 KST → 다음 09:00 KST는 2026-02-04 00:00 UTC
+    assert schedule.next_after(datetime(2026, 2, 3, 0, 30)) == datetime(2026, 2, 4, 0, 0)
+
+
+def test_cron_steps_ranges_and_weekdays():
+    schedule = CronSchedule("*/15 9-10 * * 1-5", KST)
+
+    # 2026-02-07은 토요일 → 다음 평일(월) 09:00 KST
+    assert schedule.next_after(datetime(2026, 2, 6, 2, 0)) == datetime(2026, 2, 9, 0, 0)
+    assert schedule.next_after(datetime(2026, 2, 9, 0, 0)) == datetime(2026, 2, 9, 0, 15)
+
+
+def test_parse_schedule_interval_and_invalid_cron():
+    interval = parse_schedule("@every 5m", KST)
+    assert isinstance(interval, IntervalSchedule) and interval.seconds == 300
+    with pytest.raises(ValueError):
+        parse_schedule("61 * * * *", KST)
+
+
+def test_daemon_skips_overlapping_runs_and_writes_status(batch_settings, tmp_path):
+    release = threading.Event()
+    calls: list[str] = []
+
+    def slow_job():
+        calls.append("run")
+        release.wait(5)
+
+    settings = batch_settings(
+        daemon_schedules={"slow": "@every 1s"},
+        daemon_jitter_sec=0,
+        daemon_status_path=str(tmp_path / "status.json"),
+    )
+    daemon = BatchDaemon(settings, {"slow": slow_job})
+    job = daemon.jobs[0]
+    now = datetime(2026, 2, 3, 9, 0, 0)
+    job.next_run_at = now
+
+    assert daemon.tick(now) == ["slow"]
+    job.next_run_at = now
+    assert daemon.tick(now) == []
+    assert job.skipped_overlap_count == 1
+
+    release.set()
+    daemon.shutdown()
+
+    status = json.loads((tmp_path / "status.json").read_text(encoding="utf-8"))
+    assert calls == ["run"]
+    assert status["jobs"]["slow"]["run_count"] == 1
+    assert status["jobs"]["slow"]["last_success_at"] is not None
+
+
+def test_concurrent_status_writes_do_not_clobber_temp_file(batch_settings, tmp_path, caplog):
+    settings = batch_settings(
+        daemon_schedules={"noop": "@every 1s"},
+        daemon_status_path=str(tmp_path / "status.json"),
+    )
+    daemon = BatchDaemon(settings, {"noop": lambda: None})
+
+    def write_many():
+        for _ in range(5):
+            daemon.write_status()
+
+    # 잡 완료 콜백처럼 여러 풀 스레드가 동시에 상태 파일을 쓴다.
+    threads = [threading.Thread(target=write_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    daemon.shutdown()
+
+    assert not [record for record in caplog.records if record.name == "batch.scheduler"]
+    assert "noop" in json.loads((tmp_path / "status.json").read_text(encoding="utf-8"))["jobs"]
+
+
+def test_shared_browser_skips_playwright_driver_startup(batch_settings, monkeypatch):
+    import playwright.async_api
+    from contextlib import AsyncExitStack
+
+    from common import runtime
+    from common.runtime import run_async, start_background_loop, stop_background_loop
+    from sources.product_price import _acquire_browser
+
+    class FakeBrowser:
+        def is_connected(self):
+            return True
+
+        async def close(self):
+            pass
+
+    def no_driver():
+        raise AssertionError("공유 브라우저가 있으면 Playwright 드라이버를 띄우지 않아야 한다")
+
+    monkeypatch.setattr(playwright.async_api, "async_playwright", no_driver)
+    shared = FakeBrowser()
+
+    async def acquire():
+        async with AsyncExitStack() as stack:
+            return await _acquire_browser(stack, batch_settings())
+
+    start_background_loop()
+    try:
+        runtime._browser = shared
+        assert run_async(acquire()) is shared
+    finally:
+        stop_background_loop()
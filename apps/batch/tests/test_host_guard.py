@@ -0,0 +1,70 @@
+# why: 호스트별 AIMD 제한기와 차단기의 상태 전이를 검증
+import asyncio
+
+import httpx
+
+from sources.host_guard import (
+    AdaptiveLimiter,
+    BreakerState,
+    CircuitBreaker,
+    HostGuard,
+    HostRejected,
+    Outcome,
+)
+
+
+def test_limiter_grows_on_success_and_halves_on_block():
+    limiter = AdaptiveLimiter(4, min_limit=1, max_limit=8)
+    for _ in range(8):
+        limiter._adjust(Outcome.OK)
+    assert 5 < limiter.limit < 6
+
+    limiter._adjust(Outcome.BLOCKED)
+    halved = limiter.limit
+    # 같은 순간의 연쇄 실패는 한 번만 줄인다.
+    limiter._adjust(Outcome.TIMEOUT)
+    assert limiter.limit == halved < 3
+
+
+def test_breaker_trips_on_block_rate_and_probes_after_cooldown():
+    breaker = CircuitBreaker(threshold=0.5, min_requests=4, window=4, cooldown_sec=60)
+    for outcome in (Outcome.OK, Outcome.BLOCKED, Outcome.OK):
+        assert not breaker.record(outcome, now=0)
+    assert breaker.record(Outcome.BLOCKED, now=0)
+    assert not breaker.allow(now=30)
+    assert breaker.retry_after(now=30) == 30
+
+    assert breaker.allow(now=61)
+    # 시험 요청이 진행 중이면 다른 요청은 막는다.
+    assert not breaker.allow(now=61)
+    breaker.record(Outcome.OK, now=62)
+    assert breaker.state == BreakerState.CLOSED and breaker.trips == 1
+
+
+def test_guard_skips_tripped_host_and_reports_summary(batch_settings):
+    settings = batch_settings(
+        crawl_breaker_min_requests=2, crawl_breaker_window=2, crawl_breaker_cooldown_sec=60
+    )
+    guard = HostGuard(settings, initial_concurrency=2)
+
+    async def run() -> None:
+        for _ in range(2):
+            async with guard.request("https://item.example.com/a") as slot:
+                slot.outcome = Outcome.BLOCKED
+        try:
+            async with guard.request("https://item.example.com/b"):
+                raise AssertionError("차단기가 열려 있어야 함")
+        except HostRejected as exc:
+            assert exc.host == "item.example.com" and 0 < exc.retry_after <= 60
+        try:
+            async with guard.request("https://other.example.com/a"):
+                raise httpx.ReadTimeout("slow")
+        except httpx.ReadTimeout:
+            pass
+
+    asyncio.run(run())
+    summary = guard.summary()
+
+    assert summary["item.example.com"]["state"] == "OPEN"
+    assert summary["item.example.com"]["skipped"] == 1
+    assert summary["other.example.com"]["timeout"] == 1
@@ -0,0 +1,71 @@
+# why: 임대 획득/만료 인계/샤드 분배 규칙을 sqlite로 검증
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from common.leases import (
+    acquire_lease,
+    claim_shards,
+    job_lease,
+    partition,
+    release_lease,
+    shard_claim_order,
+)
+from common.models import JobLease
+
+
+def _session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'leases.db'}")
+    JobLease.__table__.create(engine)
+    return sessionmaker(bind=engine)
+
+
+def test_lease_is_exclusive_until_expired_or_released(tmp_path):
+    db = _session_factory(tmp_path)()
+    now = datetime(2026, 2, 3, 9, 0, 0)
+
+    assert acquire_lease(db, "job:fetch_schedule", "a", ttl_sec=60, now=now)
+    assert not acquire_lease(db, "job:fetch_schedule", "b", ttl_sec=60, now=now)
+    # 죽은 워커의 임대는 만료 후 다른 워커가 가져간다.
+    assert acquire_lease(db, "job:fetch_schedule", "b", ttl_sec=60, now=now + timedelta(seconds=61))
+
+    release_lease(db, "job:fetch_schedule", "b")
+    assert acquire_lease(db, "job:fetch_schedule", "a", ttl_sec=60)
+
+
+
+def test_job_lease_is_exclusive_between_runs_of_one_process(tmp_path):
+    factory = _session_factory(tmp_path)
+
+    with job_lease(factory, "job:send_alerts", "host:1", ttl_sec=60) as outer:
+        # 같은 worker_id의 다른 잡 실행은 임대를 잡지 못하고, 끝나도 바깥 임대를 반납하지 않는다.
+        with job_lease(factory, "job:send_alerts", "host:1", ttl_sec=60) as inner:
+            assert outer and not inner
+        assert not acquire_lease(factory(), "job:send_alerts", "host:2", ttl_sec=60)
+
+    assert acquire_lease(factory(), "job:send_alerts", "host:2", ttl_sec=60)
+
+def test_workers_split_shards_and_completed_shards_are_not_rerun(tmp_path):
+    factory = _session_factory(tmp_path)
+    now = datetime.utcnow()
+
+    first = claim_shards(factory, "fetch_schedule", "worker-a", 3, 60, 60, now=now)
+    owned = next(first)
+    # 다른 워커는 임대 중인 샤드를 건너뛰고 나머지를 가져간다(work stealing).
+    stolen = list(claim_shards(factory, "fetch_schedule", "worker-b", 3, 60, 60, now=now))
+    rest = list(first)
+
+    assert owned not in stolen
+    assert sorted([owned, *stolen, *rest]) == [0, 1, 2]
+    assert list(claim_shards(factory, "fetch_schedule", "worker-c", 3, 60, 60, now=now)) == []
+
+
+def test_partition_is_stable_and_claim_order_covers_all_shards():
+    vendors = [{"company_id": f"vendor{idx}"} for idx in range(20)]
+
+    shards = partition(vendors, lambda vendor: vendor["company_id"], 4)
+
+    assert shards == partition(vendors, lambda vendor: vendor["company_id"], 4)
+    assert sum(len(shard) for shard in shards) == 20
+    assert sorted(shard_claim_order("host:1", 4)) == [0, 1, 2, 3]
@@ -1,7 +1,19 @@
 # why: 모듈 역할과 책임을 명확히 하기 위한 진입 주석
 from datetime import datetime
 
-from common.normalize import infer_category, make_slot_hash, normalize_product_title, parse_price_text
+from common.normalize import (
+    infer_category,
+    make_slot_hash,
+    normalize_product_title,
+    normalize_slot,
+    parse_price_info,
+    parse_price_text,
+)
+from common.normalize_reference import (
+    legacy_infer_category,
+    legacy_normalize_product_title,
+    sample_titles,
+)
 
 
 def test_normalize_product_title_removes_noise():
@@ -22,3 +34,20 @@ def test_make_slot_hash_changes_by_channel():
 
 def test_infer_category_rule_based():
     assert infer_category("프리미엄 침구 세트") == "리빙"
+
+
+def test_compiled_normalize_matches_legacy_functions():
+    for title in sample_titles(5000) + ["", "   ", "청소기", "특단독가 침구", "ＴＶ 오디오"]:
+        assert normalize_product_title(title) == legacy_normalize_product_title(title), title
+        assert infer_category(title) == legacy_infer_category(title), title
+
+
+def test_normalize_slot_combines_title_category_and_price():
+    slot = normalize_slot("[단독] 무선 청소기 세트!!", "49,900원 39,900원")
+
+    assert slot.title == "무선 청소기 세트"
+    # 리빙("청소")이 가전("청소기")보다 먼저 선언되어 있어 리빙이 우선
+    assert slot.category == "리빙"
+    assert (slot.original_price, slot.sale_price, slot.discount_rate) == parse_price_info(
+        "49,900원 39,900원"
+    )
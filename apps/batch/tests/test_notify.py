@@ -0,0 +1,58 @@
+# why: 알림 디스패처의 다이제스트/재시도/세션 재사용 동작을 가짜 서버로 검증
+from common.models import DestinationType
+from common.notify import Notification, NotificationDispatcher
+from tests.fake_notify_servers import FakeSlackServer, FakeSmtpServer, make_settings
+
+
+def test_slack_messages_for_same_destination_are_coalesced():
+    with FakeSlackServer() as slack, FakeSmtpServer() as smtp:
+        dispatcher = NotificationDispatcher(make_settings(smtp.port))
+        for idx in range(3):
+            dispatcher.add(Notification(DestinationType.SLACK, slack.url, "s", f"방송 {idx}", key=idx))
+
+        results = dispatcher.dispatch_sync()
+
+    assert len(results) == 1
+    assert results[0].ok and results[0].keys == [0, 1, 2]
+    assert len(slack.payloads) == 1
+    assert "방송 0" in slack.payloads[0]["text"] and "방송 2" in slack.payloads[0]["text"]
+
+
+def test_slack_429_is_retried_after_retry_after():
+    with FakeSlackServer(rate_limit_first=2) as slack, FakeSmtpServer() as smtp:
+        dispatcher = NotificationDispatcher(make_settings(smtp.port))
+        dispatcher.add(Notification(DestinationType.SLACK, slack.url, "s", "body"))
+
+        results = dispatcher.dispatch_sync()
+
+    assert results[0].ok
+    assert slack.request_count == 3
+
+
+def test_slack_gives_up_after_max_retries():
+    with FakeSlackServer(rate_limit_first=10) as slack, FakeSmtpServer() as smtp:
+        dispatcher = NotificationDispatcher(make_settings(smtp.port, notify_slack_max_retries=1))
+        dispatcher.add(Notification(DestinationType.SLACK, slack.url, "s", "body", key="k"))
+
+        reported = []
+        results = dispatcher.dispatch_sync(reported.append)
+
+    assert not results[0].ok and results[0].error
+    assert reported == results
+    assert slack.request_count == 2
+
+
+def test_emails_share_one_smtp_login():
+    with FakeSmtpServer() as smtp:
+        dispatcher = NotificationDispatcher(make_settings(smtp.port))
+        for idx in range(5):
+            dispatcher.add(
+                Notification(DestinationType.EMAIL, f"user{idx}@example.com", "subject", "body")
+            )
+
+        results = dispatcher.dispatch_sync()
+
+    assert all(result.ok for result in results)
+    assert len(smtp.messages) == 5
+    assert smtp.login_count == 1
+    assert smtp.connection_count == 1
@@ -0,0 +1,155 @@
+# why: 가격 수집 큐의 우선순위/잠금/재시도/재수집 규칙을 sqlite로 검증
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from common.models import PriceFetchStatus, PriceFetchTask
+from common.price_priority import PriorityWeights, priority_score
+from common.price_queue import (
+    claim_tasks,
+    complete_task,
+    defer_task,
+    enqueue_price_urls,
+    fail_task,
+    load_fetched_prices,
+    release_task,
+)
+from pipelines.price_queue_pipeline import _process_tasks
+
+
+NOW = datetime(2026, 2, 3, 9, 0, 0)
+REFRESH = timedelta(hours=3)
+WEIGHTS = PriorityWeights(horizon_minutes=60, live_weight=2.0, ended_weight=0.05, refresh_minutes=180)
+HOUR = timedelta(hours=1)
+
+
+def _window(start: datetime) -> tuple[datetime, datetime]:
+    return start, start + HOUR
+
+
+def test_live_and_upcoming_broadcasts_are_claimed_first_and_locked(db_session):
+    db = db_session
+    enqueue_price_urls(
+        db,
+        {
+            "https://a/aired": _window(NOW - 2 * HOUR),
+            "https://a/later": _window(NOW + 2 * HOUR),
+            "https://a/live": _window(NOW - timedelta(minutes=10)),
+            "https://a/soon": _window(NOW + timedelta(minutes=10)),
+        },
+        REFRESH,
+        now=NOW,
+    )
+
+    claimed = claim_tasks(db, "worker-a", limit=3, lock_sec=600, weights=WEIGHTS, now=NOW)
+
+    assert [task.url for task in claimed] == ["https://a/live", "https://a/soon", "https://a/later"]
+    # 잠긴 작업은 다른 워커가 가져가지 않는다.
+    others = claim_tasks(db, "worker-b", 5, 600, WEIGHTS, now=NOW)
+    assert [task.url for task in others] == ["https://a/aired"]
+
+
+
+def test_concurrent_claims_from_one_process_do_not_share_tasks(monkeypatch, db_session):
+    import common.price_queue as price_queue
+
+    db = db_session
+    enqueue_price_urls(
+        db, {"https://a/1": _window(NOW), "https://a/2": _window(NOW)}, REFRESH, now=NOW
+    )
+    nlargest = price_queue.heapq.nlargest
+    other: list = []
+
+    def racing_nlargest(limit, scores, key):
+        picked = nlargest(limit, scores, key=key)
+        if not racing.started:
+            # 후보를 고른 직후 같은 프로세스의 다른 스레드가 한 건을 먼저 잠근 상황
+            racing.started = True
+            other.extend(claim_tasks(db, "host:1", 1, 600, WEIGHTS, now=NOW))
+        return picked
+
+    racing = SimpleNamespace(started=False, nlargest=racing_nlargest)
+    monkeypatch.setattr(price_queue, "heapq", racing)
+    mine = claim_tasks(db, "host:1", 5, 600, WEIGHTS, now=NOW)
+
+    assert len(other) == 1
+    assert {task.id for task in mine}.isdisjoint({task.id for task in other})
+    assert all(task.locked_by.startswith("host:1:") for task in mine + other)
+
+def test_priority_prefers_stale_and_cheap_fetches():
+    start = NOW + timedelta(minutes=30)
+    fresh = priority_score(start, start + HOUR, NOW - timedelta(minutes=5), 1.0, NOW, WEIGHTS)
+    stale = priority_score(start, start + HOUR, NOW - REFRESH, 1.0, NOW, WEIGHTS)
+    costly = priority_score(start, start + HOUR, NOW - REFRESH, 8.0, NOW, WEIGHTS)
+
+    assert stale > fresh > costly
+
+
+def test_failures_back_off_and_carried_tasks_keep_attempts(db_session):
+    db = db_session
+    enqueue_price_urls(
+        db, {"https://a/1": _window(NOW), "https://a/2": _window(NOW)}, REFRESH, now=NOW
+    )
+    first, second = claim_tasks(db, "w", 5, 600, WEIGHTS, now=NOW)
+
+    fail_task(first, "HTTP 가격 추출 실패", NOW, max_attempts=2, retry_base_sec=300, cost=1.0)
+    release_task(second)
+    db.commit()
+
+    assert first.next_attempt_at == NOW + timedelta(seconds=300)
+    assert second.attempts == 0
+    assert [task.url for task in claim_tasks(db, "w", 5, 600, WEIGHTS, now=NOW)] == ["https://a/2"]
+
+    (retried,) = claim_tasks(db, "w", 5, 600, WEIGHTS, now=NOW + timedelta(seconds=300))
+    fail_task(retried, "HTTP 가격 추출 실패", NOW, max_attempts=2, retry_base_sec=300, cost=1.0)
+    db.commit()
+    assert retried.status == PriceFetchStatus.FAILED
+
+
+def test_deferred_tasks_keep_attempts_until_breaker_reopens(db_session):
+    db = db_session
+    enqueue_price_urls(db, {"https://a/1": _window(NOW)}, REFRESH, now=NOW)
+    (task,) = claim_tasks(db, "w", 5, 600, WEIGHTS, now=NOW)
+
+    defer_task(task, NOW + timedelta(seconds=90))
+    db.commit()
+
+    assert task.attempts == 0 and task.locked_by is None
+    assert claim_tasks(db, "w", 5, 600, WEIGHTS, now=NOW) == []
+    assert len(claim_tasks(db, "w", 5, 600, WEIGHTS, now=NOW + timedelta(seconds=90))) == 1
+
+
+class _RejectingFetcher:
+    """모든 URL이 열린 차단기에 막힌 것처럼 응답하는 가짜 수집기."""
+
+    async def fetch_batch(self, urls, rejected=None):
+        rejected.update({url: 120.0 for url in urls})
+        return {url: (None, None) for url in urls}
+
+
+def test_breaker_skipped_tasks_are_deferred_not_failed(batch_settings, db_session):
+    db = db_session
+    enqueue_price_urls(db, {"https://a/1": _window(NOW)}, REFRESH, now=NOW)
+    tasks = claim_tasks(db, "w", 5, 600, WEIGHTS, now=NOW)
+    settings = batch_settings(product_price_fetch_browser_fallback=False)
+    counts = {"done": 0, "failed": 0, "carried": 0, "skipped": 0, "browser": 0}
+
+    held = _process_tasks(db, settings, _RejectingFetcher(), tasks, float("inf"), {}, counts)
+
+    (task,) = tasks
+    assert held == 1 and counts["skipped"] == 1 and counts["failed"] == 0
+    assert task.status == PriceFetchStatus.PENDING and task.attempts == 0
+    assert task.next_attempt_at > datetime.utcnow() + timedelta(seconds=100)
+
+
+def test_done_prices_are_loaded_and_refreshed_after_interval(db_session):
+    db = db_session
+    enqueue_price_urls(db, {"https://a/1": _window(NOW)}, REFRESH, now=NOW)
+    (task,) = claim_tasks(db, "w", 5, 600, WEIGHTS, now=NOW)
+    complete_task(task, (20000, 15000), NOW, cost=8.0)
+    db.commit()
+
+    assert load_fetched_prices(db, ["https://a/1"]) == {"https://a/1": (20000, 15000)}
+    assert task.fetch_cost > 1.0
+    window = {"https://a/1": _window(NOW)}
+    assert enqueue_price_urls(db, window, REFRESH, now=NOW + HOUR) == 0
+    assert enqueue_price_urls(db, window, REFRESH, now=NOW + REFRESH) == 1
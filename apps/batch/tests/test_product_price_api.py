@@ -0,0 +1,59 @@
+# why: 가격 API 엔드포인트 템플릿화/재호출/저장 규칙을 검증
+import asyncio
+
+import httpx
+
+from sources.product_price import parse_api_prices
+from sources.product_price_api import MIN_SAMPLES, PriceApiClient
+
+
+ITEM_URL = "https://item.gmarket.co.kr/Item?goodscode=1234567890"
+
+
+def _client(batch_settings, tmp_path) -> PriceApiClient:
+    settings = batch_settings(product_price_api_endpoints_path=str(tmp_path / "endpoints.json"))
+    return PriceApiClient(settings)
+
+
+def test_api_payload_prefers_coupon_price_over_option_prices():
+    payload = {
+        "item": {"originPrice": 39000, "sellPrice": 29000, "couponPrice": 25900},
+        "options": [{"name": "추가구성", "price": 500}],
+    }
+
+    assert parse_api_prices(payload) == (39000, 25900)
+
+
+def test_learned_endpoint_is_replayed_for_other_products_and_persisted(batch_settings, tmp_path):
+    api = _client(batch_settings, tmp_path)
+    assert api.learn(
+        "https://item.gmarket.co.kr/api/price?goodsCode=1234567890&_=1760000000000", "1234567890"
+    )
+
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        return httpx.Response(200, json={"originPrice": 20000, "discountPrice": 15000})
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await api.fetch_async(client, "https://item.gmarket.co.kr/Item?goodscode=555")
+
+    assert asyncio.run(run()) == (20000, 15000)
+    assert requested == ["https://item.gmarket.co.kr/api/price?goodsCode=555"]
+
+    api.save()
+    reloaded = _client(batch_settings, tmp_path)
+    assert [template.hits for template in reloaded.templates()] == [1]
+
+
+def test_endpoint_with_low_hit_rate_is_retired(batch_settings, tmp_path):
+    api = _client(batch_settings, tmp_path)
+    api.learn("https://item.gmarket.co.kr/api/price/1234567890", "1234567890")
+    (template,) = api.templates()
+
+    for _ in range(MIN_SAMPLES):
+        api._record(template, hit=False)
+
+    assert api.templates() == []
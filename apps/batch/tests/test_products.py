@@ -0,0 +1,128 @@
+# why: 상품 식별(상품 코드/SimHash 근사 중복)과 상품 단위 가격 공유 규칙을 sqlite로 검증
+from datetime import datetime, timedelta
+
+from common.models import Product
+from common.products import (
+    ProductResolver,
+    fresh_product_prices,
+    hamming,
+    record_product_price,
+    simhash,
+)
+
+
+NOW = datetime(2026, 2, 3, 9, 0, 0)
+
+
+def test_simhash_is_close_for_spacing_variants_and_far_for_other_products():
+    base = simhash("국내산 한우 불고기 세트 10팩")
+
+    assert hamming(base, simhash("국내산 한우불고기 세트 10팩")) <= 3
+    assert hamming(base, simhash("다이슨 무선 청소기 v15")) > 10
+
+
+def test_resolver_links_by_goodscode_then_by_title_fingerprint(db_session):
+    db = db_session
+    resolver = ProductResolver(db, max_distance=3)
+
+    first = resolver.resolve("123", "다이슨 무선 청소기", "가전", NOW)
+    # 상품 코드가 같으면 상품명이 달라도 같은 상품, 다르면 상품명이 같아도 다른 상품
+    assert ProductResolver(db, 3).resolve("123", "다이슨 청소기 특별구성", "가전", NOW + timedelta(days=1)).id == first.id
+    assert ProductResolver(db, 3).resolve("456", "다이슨 무선 청소기", "가전", NOW).id != first.id
+
+    titled = resolver.resolve(None, "국내산 한우 불고기 세트 10팩", "식품", NOW)
+    again = ProductResolver(db, 3).resolve(None, "국내산 한우불고기 세트 10팩", "식품", NOW - timedelta(days=2))
+    assert again.id == titled.id
+    assert titled.product_key.startswith("fp:")
+    assert (again.first_seen_at, again.last_seen_at) == (NOW - timedelta(days=2), NOW)
+    assert first.last_seen_at == NOW + timedelta(days=1)
+
+
+def test_recent_product_price_is_shared_by_goodscode(db_session):
+    db = db_session
+    product = ProductResolver(db, 3).resolve("123", "다이슨 무선 청소기", "가전", NOW)
+    record_product_price(product, 899000, 699000, 22.2, NOW)
+    db.commit()
+
+    assert fresh_product_prices(db, ["123", "999"], NOW - timedelta(hours=3)) == {"123": (899000, 699000)}
+    assert fresh_product_prices(db, ["123"], NOW + timedelta(minutes=1)) == {}
+
+
+def test_reused_prices_do_not_keep_product_fresh(batch_settings, db_session, tmp_path):
+    from common.models import PriceFetchStatus, PriceFetchTask
+    from common.price_queue import url_hash
+    from pipelines.schedule_pipeline import _store_grouped_items
+
+    db = db_session
+    settings = batch_settings(
+        price_queue_refresh_minutes=60,
+        price_queue_drain_budget_sec=0,
+        product_price_fetch_browser_fallback=False,
+        product_price_api_endpoints_path=str(tmp_path / "endpoints.json"),
+        run_report_dir=str(tmp_path),
+    )
+    url = "https://item.gmarket.co.kr/Item?goodscode=123"
+    now = datetime.utcnow()
+    db.add(
+        PriceFetchTask(
+            url_hash=url_hash(url),
+            url=url,
+            goodscode="123",
+            priority_at=now,
+            status=PriceFetchStatus.DONE,
+            attempts=1,
+            next_attempt_at=now,
+            original_price=20000,
+            sale_price=15000,
+            fetched_at=now - timedelta(minutes=50),
+        )
+    )
+    db.commit()
+    grouped = {
+        "lotte": [
+            {
+                "raw_title": "다이슨 무선 청소기",
+                "start_at": now + timedelta(hours=1),
+                "end_at": now + timedelta(hours=2),
+                "product_url": url,
+            }
+        ]
+    }
+
+    def crawl():
+        _store_grouped_items(db, settings, grouped, {"lotte": "롯데홈쇼핑"}, {}, None)
+        db.commit()
+
+    # 1회차: 큐에서 수집한 가격을 수집 시각으로 상품에 반영, 2회차: 상품 가격을 재사용(시각은 그대로)
+    crawl()
+    crawl()
+    product = db.query(Product).one()
+    assert product.price_updated_at == now - timedelta(minutes=50)
+
+    # 15분이 지나 재수집 주기(60분)를 넘기면 URL이 다시 대기열에 들어간다.
+    task = db.query(PriceFetchTask).one()
+    product.price_updated_at -= timedelta(minutes=15)
+    task.fetched_at -= timedelta(minutes=15)
+    db.commit()
+    crawl()
+    assert task.status == PriceFetchStatus.PENDING
+
+
+def test_relinked_slot_moves_broadcast_count_to_new_product(db_session):
+    from pipelines.schedule_pipeline import ensure_channel, upsert_slots
+
+    db = db_session
+    channel = ensure_channel(db, "lotte", "롯데홈쇼핑")
+    item = {
+        "raw_title": "다이슨 무선 청소기",
+        "start_at": NOW,
+        "end_at": NOW + timedelta(hours=1),
+        "product_url": "https://item.gmarket.co.kr/Item?goodscode=123",
+    }
+    upsert_slots(db, channel, "test", [item], products=ProductResolver(db, 3))
+    # 같은 슬롯(채널/시각/제목)의 상품 코드가 바뀌면 다른 상품으로 다시 묶인다.
+    item["product_url"] = "https://item.gmarket.co.kr/Item?goodscode=456"
+    upsert_slots(db, channel, "test", [item], products=ProductResolver(db, 3))
+
+    counts = {product.goodscode: product.broadcast_count for product in db.query(Product)}
+    assert counts == {"123": 0, "456": 1}
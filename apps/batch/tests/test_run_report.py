@@ -0,0 +1,64 @@
+# why: 실행 리포트가 단계 지표를 모아 JSON/Prometheus로 남기고, 상주 루프 코루틴의 기록도 같은 리포트로 모이는지 검증
+import json
+
+from common.run_report import add, count, record_outcome, run_report, stage
+from common.runtime import run_async, start_background_loop, stop_background_loop
+
+
+def test_run_report_writes_stage_metrics(batch_settings, tmp_path):
+    settings = batch_settings(run_report_dir=str(tmp_path), run_report_prometheus=True)
+
+    with run_report("fetch_schedule", settings):
+        with stage("fetch"):
+            add("fetch", items=3, success=2, bytes=1024, retries=1)
+        record_outcome("http", "BLOCKED")
+        record_outcome("browser", "TIMEOUT")
+        record_outcome("http", "OK")
+        count("slots_created", 5)
+
+    # 리포트 밖에서의 기록은 무시된다
+    add("fetch", items=100)
+
+    report = json.loads((tmp_path / "run_report_fetch_schedule.json").read_text(encoding="utf-8"))
+    assert report["status"] == "ok"
+    assert report["stages"]["fetch"]["calls"] == 1
+    assert report["stages"]["fetch"]["items"] == 3
+    assert report["stages"]["fetch"]["bytes"] == 1024
+    assert report["stages"]["price_http"]["blocked"] == 1
+    assert report["stages"]["price_browser"]["errors"] == 1
+    assert report["counters"] == {"slots_created": 5}
+
+    prom = (tmp_path / "run_report_fetch_schedule.prom").read_text(encoding="utf-8")
+    assert 'batch_run_success{job="fetch_schedule"} 1' in prom
+    assert 'batch_run_stage_items{job="fetch_schedule",stage="fetch"} 3' in prom
+    assert 'batch_run_counter{job="fetch_schedule",name="slots_created"} 5' in prom
+
+
+def test_run_report_marks_failure(batch_settings, tmp_path):
+    settings = batch_settings(run_report_dir=str(tmp_path))
+
+    try:
+        with run_report("archive", settings):
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+
+    report = json.loads((tmp_path / "run_report_archive.json").read_text(encoding="utf-8"))
+    assert report["status"] == "failed"
+    assert not (tmp_path / "run_report_archive.prom").exists()
+
+
+def test_background_loop_records_into_caller_report(batch_settings, tmp_path):
+    settings = batch_settings(run_report_dir=str(tmp_path))
+
+    async def fetch():
+        add("price_http", items=1, success=1)
+
+    start_background_loop()
+    try:
+        with run_report("drain_price_queue", settings) as report:
+            run_async(fetch())
+    finally:
+        stop_background_loop()
+
+    assert report.stages["price_http"].success == 1
@@ -0,0 +1,32 @@
+# why: 알림 후보 슬롯 인덱스가 DB 재조회 없이 동일한 구간 결과를 내는지 검증
+from datetime import datetime, timedelta
+
+from jobs.send_alerts_job import UpcomingSlot, UpcomingSlotIndex
+
+
+def _slot(slot_id: int, channel_code: str, start_at: datetime) -> UpcomingSlot:
+    return UpcomingSlot(slot_id, channel_code, start_at, f"title {slot_id}", f"title {slot_id}", None)
+
+
+def test_upcoming_slot_index_filters_by_channel_and_window():
+    now = datetime(2026, 2, 3, 9, 0, 0)
+    index = UpcomingSlotIndex(
+        [
+            _slot(1, "lotte", now + timedelta(minutes=40)),
+            _slot(2, "lotte", now + timedelta(minutes=10)),
+            _slot(3, "gsshop", now + timedelta(minutes=5)),
+            _slot(4, "ns", now + timedelta(minutes=1)),
+        ]
+    )
+
+    found = index.find(["lotte", "gsshop"], now, now + timedelta(minutes=30))
+
+    assert [slot.id for slot in found] == [3, 2]
+
+
+def test_upcoming_slot_index_ignores_unknown_and_duplicate_codes():
+    now = datetime(2026, 2, 3, 9, 0, 0)
+    index = UpcomingSlotIndex([_slot(1, "lotte", now)])
+
+    assert [slot.id for slot in index.find(["lotte", "lotte", "none"], now, now)] == [1]
+    assert index.find([], now, now) == []
@@ -0,0 +1,70 @@
+# why: 세션 풀의 쿠키 변환/라운드로빈/성공률 기반 폐기/TTL 만료 규칙을 검증
+from datetime import datetime, timedelta
+import json
+import os
+import time
+
+from sources.host_guard import Outcome
+from sources.session_pool import BrowserSession, SessionPool
+
+
+def _pool(batch_settings, tmp_path, **overrides) -> SessionPool:
+    settings = batch_settings(
+        product_price_session_dir=str(tmp_path / "sessions"),
+        product_price_session_min_requests=4,
+        **overrides,
+    )
+    return SessionPool(settings)
+
+
+def _write_session(tmp_path, session_id: str, cookies: list[dict]) -> None:
+    directory = tmp_path / "sessions"
+    directory.mkdir(exist_ok=True)
+    (directory / f"{session_id}.json").write_text(json.dumps({"cookies": cookies, "origins": []}))
+
+
+def test_cookie_header_matches_domain_path_and_expiry():
+    session = BrowserSession(
+        id="s1",
+        path=None,
+        created_at=datetime.utcnow(),
+        cookies=[
+            {"name": "pcid", "value": "a", "domain": ".gmarket.co.kr", "path": "/", "expires": -1},
+            {"name": "item", "value": "b", "domain": "item.gmarket.co.kr", "path": "/Item"},
+            {"name": "old", "value": "c", "domain": ".gmarket.co.kr", "path": "/", "expires": time.time() - 10},
+            {"name": "other", "value": "d", "domain": ".example.com", "path": "/"},
+        ],
+    )
+
+    assert session.cookie_header("https://item.gmarket.co.kr/Item?goodscode=1") == "pcid=a; item=b"
+    assert session.cookie_header("https://m.gmarket.co.kr/") == "pcid=a"
+    assert session.cookie_header("https://shop.example.org/") is None
+
+
+def test_sessions_rotate_and_low_success_session_is_retired(batch_settings, tmp_path):
+    _write_session(tmp_path, "a", [])
+    _write_session(tmp_path, "b", [])
+    pool = _pool(batch_settings, tmp_path)
+
+    assert [pool.acquire().id for _ in range(4)] == ["a", "b", "a", "b"]
+
+    bad = pool.healthy()[0]
+    for outcome in (Outcome.OK, Outcome.BLOCKED, Outcome.BLOCKED, Outcome.TIMEOUT, Outcome.BLOCKED):
+        pool.record(bad, outcome)
+
+    # 타임아웃은 세지 않으므로 4번째 기록(OK 1/4)에서 폐기되고 파일도 지워진다.
+    assert [session.id for session in pool.healthy()] == ["b"]
+    assert not bad.path.exists()
+    assert pool.summary()["retired"] == 1
+
+
+def test_expired_sessions_need_refresh(batch_settings, tmp_path):
+    _write_session(tmp_path, "old", [])
+    stale = time.time() - timedelta(hours=3).total_seconds()
+    os.utime(tmp_path / "sessions" / "old.json", (stale, stale))
+
+    pool = _pool(batch_settings, tmp_path, product_price_session_pool_size=1, product_price_session_ttl_minutes=120)
+
+    assert pool.healthy() == []
+    assert pool.acquire() is None
+    assert pool.needs_refresh()
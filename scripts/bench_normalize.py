@@ -0,0 +1,68 @@
+"""상품명 정규화/카테고리 추정 마이크로 벤치마크.
+
+왜 필요한가:
+- 편성표 수집은 슬롯마다 정규화를 수행하므로, 정규식 컴파일 전후 성능과 결과 일치를 함께 확인합니다.
+
+사용법:
+- python scripts/bench_normalize.py                 # 합성 상품명 100,000건
+- python scripts/bench_normalize.py titles.txt      # 한 줄에 상품명 하나 (예: broadcast_slots.raw_title 덤프)
+"""
+
+import sys
+import time
+from pathlib import Path
+
+BATCH_DIR = Path(__file__).resolve().parents[1] / "apps" / "batch"
+sys.path.insert(0, str(BATCH_DIR))
+
+from common.normalize import infer_category, match_category, normalize_product_title  # noqa: E402
+from common.normalize_reference import (  # noqa: E402
+    legacy_infer_category,
+    legacy_normalize_product_title,
+    sample_titles,
+)
+
+COUNT = 100_000
+
+
+def _load_titles() -> list[str]:
+    if len(sys.argv) < 2:
+        return sample_titles(COUNT)
+    lines = Path(sys.argv[1]).read_text(encoding="utf-8").splitlines()
+    titles = [line for line in lines if line.strip()]
+    # 파일이 작으면 반복해서 COUNT건을 채운다.
+    return (titles * (COUNT // max(1, len(titles)) + 1))[:COUNT]
+
+
+def _measure(label: str, func, titles: list[str]) -> float:
+    started = time.perf_counter()
+    for title in titles:
+        func(title)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} {elapsed * 1000:8.1f}ms  ({elapsed / len(titles) * 1e9:6.0f}ns/건)")
+    return elapsed
+
+
+def main() -> None:
+    titles = _load_titles()
+    mismatches = sum(
+        1
+        for title in titles
+        if normalize_product_title(title) != legacy_normalize_product_title(title)
+        or infer_category(title) != legacy_infer_category(title)
+    )
+    print(f"상품명 {len(titles):,}건, 기존 구현과 불일치 {mismatches}건")
+
+    before = _measure("normalize (기존)", legacy_normalize_product_title, titles)
+    after = _measure("normalize (컴파일)", normalize_product_title, titles)
+    print(f"  → {before / after:.1f}배")
+
+    normalized = [normalize_product_title(title) for title in titles]
+    before = _measure("infer_category (기존)", legacy_infer_category, titles)
+    # 파이프라인은 normalize_slot에서 정규화한 상품명을 그대로 넘기므로 재정규화 비용이 없다.
+    after = _measure("match_category (정규화 재사용)", match_category, normalized)
+    print(f"  → {before / after:.1f}배")
+
+
+if __name__ == "__main__":
+    main()
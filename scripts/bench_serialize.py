@@ -0,0 +1,106 @@
+"""방송 목록 응답 직렬화 벤치마크 (ORM + pydantic vs 튜플 행 + orjson).
+
+왜 필요한가:
+- /api/v1/broadcasts는 하루 편성(수천 건)을 한 번에 내려주므로, 조회/직렬화 경로별 시간을 나눠 확인합니다.
+
+사용법:
+- python scripts/bench_serialize.py          # sqlite 메모리 DB에 슬롯 5,000건
+- python scripts/bench_serialize.py 20000    # 슬롯 건수 지정
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+API_DIR = Path(__file__).resolve().parents[1] / "apps" / "api"
+sys.path.insert(0, str(API_DIR))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.core.fast_json import rows_response  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.models import BroadcastSlot, BroadcastStatus, Channel  # noqa: E402
+from app.schemas.broadcast import BroadcastOut  # noqa: E402
+from app.schemas.common import ApiResponse, ResponseMeta  # noqa: E402
+from app.services.broadcast_service import BROADCAST_COLUMNS, BroadcastService  # noqa: E402
+
+ROUNDS = 5
+DAY = datetime(2026, 2, 3, 0, 0, 0)
+
+
+def _seed(count: int):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    channels = [Channel(channel_code=f"ch{idx}", channel_name=f"채널 {idx}") for idx in range(12)]
+    db.add_all(channels)
+    db.flush()
+    step = timedelta(seconds=max(1, 15 * 3600 // count))
+    db.add_all(
+        BroadcastSlot(
+            channel_id=channels[idx % len(channels)].id,
+            source_code="gmarket_schedule",
+            start_at=DAY + step * idx,
+            end_at=DAY + step * idx + timedelta(hours=1),
+            raw_title=f"[방송특가] 국내산 한우 불고기 세트 {idx}팩",
+            normalized_title=f"국내산 한우 불고기 세트 {idx}팩",
+            category="식품",
+            product_url=f"https://item.gmarket.co.kr/Item?goodscode={idx}",
+            sale_price=39900,
+            original_price=59900,
+            discount_rate=33.4,
+            price_text="39,900원",
+            status=BroadcastStatus.SCHEDULED,
+            slot_hash=f"hash-{idx}",
+        )
+        for idx in range(count)
+    )
+    db.commit()
+    return db
+
+
+def _pydantic_path(service: BroadcastService, db, meta: ResponseMeta) -> bytes:
+    # 라우트의 response_model 처리와 같은 순서: ORM 조회 → 스키마 검증 → JSON 인코딩
+    slots = service.list_broadcasts(db, DAY.date(), None, None, None, None)
+    response = ApiResponse(data=slots, meta=meta)
+    validated = TypeAdapter(ApiResponse[list[BroadcastOut]]).validate_python(
+        response.model_dump(), from_attributes=True
+    )
+    return JSONResponse(jsonable_encoder(validated)).body
+
+
+def _fast_path(service: BroadcastService, db, meta: ResponseMeta) -> bytes:
+    rows = service.list_broadcast_rows(db, DAY.date(), None, None, None, None)
+    return rows_response(BROADCAST_COLUMNS, rows, meta).body
+
+
+def _measure(label: str, func, *args) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        args[1].expunge_all()
+        started = time.perf_counter()
+        body = func(*args)
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:<26} {best * 1000:8.1f}ms  ({len(body) / 1024:,.0f}KB)")
+    return best
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    db = _seed(count)
+    service = BroadcastService()
+    meta = ResponseMeta(count=count, time_policy="UTC")
+    print(f"슬롯 {count:,}건, {ROUNDS}회 중 최솟값 (조회 + 직렬화)")
+
+    before = _measure("ORM + pydantic", _pydantic_path, service, db, meta)
+    after = _measure("튜플 행 + orjson", _fast_path, service, db, meta)
+    print(f"  → {before / after:.1f}배")
+
+
+if __name__ == "__main__":
+    main()